@@ -6,7 +6,9 @@ de procesamiento de datos y normalización de texto.
 """
 
 # Importar funciones de carga de datos
-from .carga_datos import cargar_csv, cargar_parquet, cargar_xlsx, cargar_archivo
+from .carga_datos import cargar_csv, cargar_parquet, cargar_xlsx, cargar_feather, cargar_ancho_fijo, cargar_jsonl
+from .carga_datos import cargar_archivo
+from .carga_datos import RegistroEsquemas, EsquemaCsv, inferir_esquema
 
 # Importar funciones de normalización de texto
 from .normalizacion_texto import (
@@ -15,9 +17,22 @@ from .normalizacion_texto import (
     convertir_a_mayusculas,
     limpiar_espacios,
     normalizar_caracteres,
-    normalizar_texto
+    normalizar_texto,
+    normalizar_serie,
+    normalizar_dataframe,
+    normalizar_arrow,
+    normalizar_tabla_arrow,
+    normalizar_array,
+    normalizar_lote,
+    Normalizador,
+    configurar_cache,
+    limpiar_cache,
+    estadisticas_cache
 )
 
+# Hooks de trazas para cargas y normalizaciones
+from .hooks import registrar_hook, eliminar_hook
+
 __version__ = "0.2.0"
 __author__ = "Jarko"
 
@@ -27,12 +42,32 @@ __all__ = [
     "cargar_csv",
     "cargar_parquet",
     "cargar_xlsx",
+    "cargar_feather",
+    "cargar_ancho_fijo",
+    "cargar_jsonl",
     "cargar_archivo",
+    # Esquemas de CSV
+    "RegistroEsquemas",
+    "EsquemaCsv",
+    "inferir_esquema",
     # Funciones de normalización de texto
     "quitar_acentos",
     "convertir_a_minusculas",
     "convertir_a_mayusculas",
     "limpiar_espacios",
     "normalizar_caracteres",
-    "normalizar_texto"
+    "normalizar_texto",
+    "normalizar_serie",
+    "normalizar_dataframe",
+    "normalizar_arrow",
+    "normalizar_tabla_arrow",
+    "normalizar_array",
+    "normalizar_lote",
+    "Normalizador",
+    "configurar_cache",
+    "limpiar_cache",
+    "estadisticas_cache",
+    # Hooks de trazas
+    "registrar_hook",
+    "eliminar_hook"
 ]
\ No newline at end of file
@@ -0,0 +1,6 @@
+"""
+Benchmarks de rendimiento de la librería Jarko.
+
+No forman parte de la librería publicada: se ejecutan como scripts, por
+ejemplo python benchmarks/benchmark_carga.py.
+"""
@@ -0,0 +1,375 @@
+"""
+Benchmark de las funciones de carga.
+
+Genera archivos sintéticos CSV, XLSX y Parquet, mide cargar_csv,
+cargar_xlsx, cargar_parquet y cargar_archivo con sus distintos motores y
+modos de salida, y guarda los resultados en JSON. Si se indica una línea
+base, compara la mediana de cada caso y termina con código 1 si alguno es
+más lento de lo tolerado.
+
+Uso:
+    python benchmarks/benchmark_carga.py
+    python benchmarks/benchmark_carga.py --filas 1000000 --compresion gzip xz
+    python benchmarks/benchmark_carga.py --salida linea_base.json
+    python benchmarks/benchmark_carga.py --comparar linea_base.json --tolerancia 0.2
+"""
+
+import argparse
+import functools
+import importlib.util
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+# Agregar el directorio raíz al path para importar los módulos
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from carga_datos import cargar_csv, cargar_xlsx, cargar_parquet, cargar_archivo
+from carga_datos.utils import SALIDAS
+from benchmarks.generadores import generar_dataframe, generar_csv, generar_parquet, generar_xlsx
+
+
+class CasoBenchmark(NamedTuple):
+    """
+    Una carga a medir.
+
+    Atributos:
+    ---------
+    nombre : str
+        Identificador estable del caso, por ejemplo
+        'cargar_csv[salida=arrow,compresion=gzip]'. Es la clave con la que
+        se compara contra la línea base.
+    ruta : Path
+        Archivo que se carga.
+    filas : int
+        Filas del archivo, para calcular el rendimiento.
+    cargar : Callable[[], Any]
+        Función sin argumentos que realiza la carga.
+    """
+    nombre: str
+    ruta: Path
+    filas: int
+    cargar: Callable[[], Any]
+
+
+class Regresion(NamedTuple):
+    """Caso más lento que en la línea base por encima de la tolerancia."""
+    nombre: str
+    segundos_base: float
+    segundos_actual: float
+    ratio: float
+
+
+def nombre_caso(funcion: str, **parametros: Any) -> str:
+    """
+    Construye el nombre de un caso a partir de la función y sus parámetros.
+
+    Ejemplos:
+    --------
+    >>> nombre_caso('cargar_csv', salida='arrow', compresion='gzip')
+    'cargar_csv[salida=arrow,compresion=gzip]'
+    """
+    return f"{funcion}[{','.join(f'{clave}={valor}' for clave, valor in parametros.items())}]"
+
+
+def motores_xlsx() -> List[str]:
+    """Motores de Excel instalados entre los que admite cargar_xlsx."""
+    motores = ['openpyxl']
+    if importlib.util.find_spec('python_calamine') is not None:
+        motores.append('calamine')
+    return motores
+
+
+def preparar_casos(directorio: Path, filas: int = 200_000, filas_xlsx: int = 20_000,
+                   columnas: int = 10, proporcion_texto: float = 0.3,
+                   compresiones_csv: Sequence[str] = ('gzip',),
+                   compresion_parquet: Optional[str] = 'snappy',
+                   formatos: Sequence[str] = ('csv', 'xlsx', 'parquet')) -> List[CasoBenchmark]:
+    """
+    Genera los archivos sintéticos en el directorio y construye los casos.
+
+    Cada formato se mide con cada modo de salida (y cada motor en Excel)
+    y una vez más a través de cargar_archivo. Los CSV se generan sin
+    comprimir y con cada compresión de compresiones_csv; las que necesitan
+    una librería no instalada se omiten con un aviso.
+
+    Retorna:
+    -------
+    List[CasoBenchmark]
+        Los casos en un orden estable.
+    """
+    casos: List[CasoBenchmark] = []
+
+    if 'csv' in formatos:
+        df = generar_dataframe(filas, columnas, proporcion_texto)
+        for compresion in [None, *compresiones_csv]:
+            try:
+                ruta = generar_csv(directorio, df, compresion)
+            except (ImportError, RuntimeError) as e:
+                print(f"Aviso: se omite el CSV con compresión '{compresion}': {e}", file=sys.stderr)
+                continue
+            etiqueta = compresion or 'ninguna'
+            for salida in SALIDAS:
+                casos.append(CasoBenchmark(
+                    nombre_caso('cargar_csv', salida=salida, compresion=etiqueta), ruta, filas,
+                    functools.partial(cargar_csv, ruta, salida=salida)
+                ))
+            casos.append(CasoBenchmark(
+                nombre_caso('cargar_archivo', formato='csv', compresion=etiqueta), ruta, filas,
+                functools.partial(cargar_archivo, ruta)
+            ))
+
+    if 'parquet' in formatos:
+        df = generar_dataframe(filas, columnas, proporcion_texto)
+        ruta = generar_parquet(directorio, df, compresion_parquet)
+        etiqueta = compresion_parquet or 'ninguna'
+        for salida in SALIDAS:
+            casos.append(CasoBenchmark(
+                nombre_caso('cargar_parquet', salida=salida, compresion=etiqueta), ruta, filas,
+                functools.partial(cargar_parquet, ruta, salida=salida)
+            ))
+        casos.append(CasoBenchmark(
+            nombre_caso('cargar_archivo', formato='parquet', compresion=etiqueta), ruta, filas,
+            functools.partial(cargar_archivo, ruta)
+        ))
+
+    if 'xlsx' in formatos:
+        df = generar_dataframe(filas_xlsx, columnas, proporcion_texto)
+        ruta = generar_xlsx(directorio, df)
+        for motor in motores_xlsx():
+            for salida in ('pandas', 'arrow'):
+                casos.append(CasoBenchmark(
+                    nombre_caso('cargar_xlsx', engine=motor, salida=salida), ruta, filas_xlsx,
+                    functools.partial(cargar_xlsx, ruta, engine=motor, salida=salida)
+                ))
+        casos.append(CasoBenchmark(
+            nombre_caso('cargar_archivo', formato='xlsx'), ruta, filas_xlsx,
+            functools.partial(cargar_archivo, ruta)
+        ))
+
+    return casos
+
+
+def consumir(resultado: Any) -> None:
+    """Recorre los resultados perezosos (lotes o fragmentos) para medirlos enteros."""
+    if hasattr(resultado, 'read_next_batch') or hasattr(resultado, '__next__'):
+        for _ in resultado:
+            pass
+
+
+def medir_caso(caso: CasoBenchmark, repeticiones: int = 5, calentamiento: int = 1) -> Dict[str, Any]:
+    """
+    Mide un caso varias veces y resume los tiempos.
+
+    Parámetros:
+    ----------
+    caso : CasoBenchmark
+        Caso a medir.
+    repeticiones : int, opcional
+        Número de mediciones. Por defecto es 5.
+    calentamiento : int, opcional
+        Ejecuciones previas que no se miden (caché del sistema de archivos,
+        imports perezosos). Por defecto es 1.
+
+    Retorna:
+    -------
+    Dict[str, Any]
+        Mediana, mínimo y máximo en segundos, filas por segundo y MB por
+        segundo (sobre la mediana), filas y tamaño del archivo.
+    """
+    for _ in range(calentamiento):
+        consumir(caso.cargar())
+
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        consumir(caso.cargar())
+        tiempos.append(time.perf_counter() - inicio)
+
+    mediana = statistics.median(tiempos)
+    bytes_archivo = caso.ruta.stat().st_size
+    return {
+        'segundos_mediana': mediana,
+        'segundos_min': min(tiempos),
+        'segundos_max': max(tiempos),
+        'repeticiones': repeticiones,
+        'filas': caso.filas,
+        'bytes_archivo': bytes_archivo,
+        'filas_por_segundo': caso.filas / mediana if mediana > 0 else None,
+        'mb_por_segundo': bytes_archivo / 1e6 / mediana if mediana > 0 else None,
+    }
+
+
+def ejecutar_benchmark(casos: Sequence[CasoBenchmark], repeticiones: int = 5,
+                       parametros: Optional[Dict[str, Any]] = None,
+                       mostrar: bool = True) -> Dict[str, Any]:
+    """
+    Mide todos los casos y devuelve el documento de resultados.
+
+    Retorna:
+    -------
+    Dict[str, Any]
+        {'metadatos': {...}, 'resultados': {nombre_caso: medidas}}, listo
+        para guardarse como JSON.
+    """
+    resultados = {}
+    for caso in casos:
+        resultados[caso.nombre] = medir_caso(caso, repeticiones)
+        if mostrar:
+            medidas = resultados[caso.nombre]
+            print(f"{caso.nombre:<60} {medidas['segundos_mediana'] * 1000:>10.1f} ms "
+                  f"{medidas['filas_por_segundo']:>14,.0f} filas/s {medidas['mb_por_segundo']:>8.1f} MB/s")
+
+    return {'metadatos': metadatos_entorno(parametros), 'resultados': resultados}
+
+
+def metadatos_entorno(parametros: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Fecha, versiones y máquina en que se ejecuta el benchmark, y sus parámetros."""
+    import pandas as pd
+    import pyarrow as pa
+
+    return {
+        'fecha': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'pyarrow': pa.__version__,
+        'plataforma': platform.platform(),
+        'procesador': platform.processor() or platform.machine(),
+        'parametros': parametros or {},
+    }
+
+
+def comparar_con_linea_base(actual: Dict[str, Any], linea_base: Dict[str, Any],
+                            tolerancia: float = 0.25) -> List[Regresion]:
+    """
+    Compara la mediana de cada caso con la de la línea base.
+
+    Solo se comparan los casos presentes en ambos documentos, de modo que
+    añadir o quitar casos no rompe la comparación.
+
+    Parámetros:
+    ----------
+    actual : Dict[str, Any]
+        Resultados de ejecutar_benchmark().
+    linea_base : Dict[str, Any]
+        Resultados guardados anteriormente.
+    tolerancia : float, opcional
+        Fracción de lentitud admitida: con 0.25 un caso es regresión si
+        tarda más de 1.25 veces lo que tardaba. Por defecto es 0.25.
+
+    Retorna:
+    -------
+    List[Regresion]
+        Los casos que superan la tolerancia, del más lento al menos lento.
+
+    Ejemplos:
+    --------
+    >>> comparar_con_linea_base(actual, linea_base, tolerancia=0.2)
+    [Regresion(nombre='cargar_csv[salida=pandas,compresion=gzip]', ...)]
+    """
+    regresiones = []
+    base = linea_base.get('resultados', {})
+    for nombre, medidas in actual.get('resultados', {}).items():
+        if nombre not in base:
+            continue
+        segundos_base = base[nombre]['segundos_mediana']
+        segundos_actual = medidas['segundos_mediana']
+        ratio = segundos_actual / segundos_base if segundos_base > 0 else float('inf')
+        if ratio > 1 + tolerancia:
+            regresiones.append(Regresion(nombre, segundos_base, segundos_actual, ratio))
+    return sorted(regresiones, key=lambda regresion: regresion.ratio, reverse=True)
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    """Parser de la línea de comandos del benchmark."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark de cargar_csv, cargar_xlsx, cargar_parquet y cargar_archivo "
+                    "sobre archivos sintéticos."
+    )
+    parser.add_argument('--filas', type=int, default=200_000,
+                        help="Filas de los CSV y Parquet generados (por defecto 200000)")
+    parser.add_argument('--filas-xlsx', type=int, default=20_000,
+                        help="Filas del Excel generado (por defecto 20000)")
+    parser.add_argument('--columnas', type=int, default=10,
+                        help="Columnas de los archivos generados (por defecto 10)")
+    parser.add_argument('--proporcion-texto', type=float, default=0.3,
+                        help="Fracción de columnas de texto entre 0 y 1 (por defecto 0.3)")
+    parser.add_argument('--compresion', nargs='*', default=['gzip'],
+                        choices=['gzip', 'bz2', 'xz', 'zstd'],
+                        help="Compresiones de CSV a medir además del CSV sin comprimir")
+    parser.add_argument('--compresion-parquet', default='snappy',
+                        choices=['snappy', 'zstd', 'gzip', 'ninguna'],
+                        help="Compresión del Parquet generado (por defecto snappy)")
+    parser.add_argument('--formatos', nargs='+', default=['csv', 'xlsx', 'parquet'],
+                        choices=['csv', 'xlsx', 'parquet'], help="Formatos a medir")
+    parser.add_argument('--repeticiones', type=int, default=5,
+                        help="Mediciones por caso (por defecto 5)")
+    parser.add_argument('--salida', type=Path, default=None,
+                        help="Archivo JSON donde guardar los resultados")
+    parser.add_argument('--comparar', type=Path, default=None,
+                        help="JSON de línea base con el que comparar")
+    parser.add_argument('--tolerancia', type=float, default=0.25,
+                        help="Lentitud admitida respecto a la línea base (por defecto 0.25 = 25%%)")
+    parser.add_argument('--directorio', type=Path, default=None,
+                        help="Directorio para los archivos generados (por defecto uno temporal)")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Ejecuta el benchmark desde la línea de comandos.
+
+    Retorna:
+    -------
+    int
+        0 si no hay regresiones (o no se comparó), 1 si las hay.
+    """
+    argumentos = crear_parser().parse_args(argv)
+    parametros = {
+        'filas': argumentos.filas,
+        'filas_xlsx': argumentos.filas_xlsx,
+        'columnas': argumentos.columnas,
+        'proporcion_texto': argumentos.proporcion_texto,
+        'compresiones_csv': list(argumentos.compresion),
+        'compresion_parquet': None if argumentos.compresion_parquet == 'ninguna' else argumentos.compresion_parquet,
+        'formatos': list(argumentos.formatos),
+    }
+
+    with tempfile.TemporaryDirectory() as temporal:
+        directorio = argumentos.directorio or Path(temporal)
+        directorio.mkdir(parents=True, exist_ok=True)
+        casos = preparar_casos(directorio, **parametros)
+        resultados = ejecutar_benchmark(casos, argumentos.repeticiones,
+                                        {**parametros, 'repeticiones': argumentos.repeticiones})
+
+    if argumentos.salida is not None:
+        argumentos.salida.write_text(json.dumps(resultados, indent=2, ensure_ascii=False), encoding='utf-8')
+        print(f"Resultados guardados en {argumentos.salida}")
+
+    if argumentos.comparar is None:
+        return 0
+
+    linea_base = json.loads(argumentos.comparar.read_text(encoding='utf-8'))
+    parametros_base = linea_base.get('metadatos', {}).get('parametros', {})
+    if {k: v for k, v in parametros_base.items() if k != 'repeticiones'} != parametros:
+        print("Aviso: la línea base se generó con otros parámetros; solo se comparan los casos comunes.")
+
+    regresiones = comparar_con_linea_base(resultados, linea_base, argumentos.tolerancia)
+    if not regresiones:
+        print(f"Sin regresiones respecto a {argumentos.comparar} (tolerancia {argumentos.tolerancia:.0%}).")
+        return 0
+
+    print(f"Regresiones respecto a {argumentos.comparar} (tolerancia {argumentos.tolerancia:.0%}):")
+    for regresion in regresiones:
+        print(f"  {regresion.nombre:<60} {regresion.segundos_base * 1000:>10.1f} ms -> "
+              f"{regresion.segundos_actual * 1000:>10.1f} ms (x{regresion.ratio:.2f})")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
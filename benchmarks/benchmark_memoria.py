@@ -0,0 +1,408 @@
+"""
+Benchmark de memoria de las funciones de carga y de normalizar_texto.
+
+Genera archivos sintéticos y mide el pico de memoria de cada cargador y
+de normalizar_texto sobre un texto largo de dos formas: con tracemalloc
+(más el pool de pyarrow) en este proceso, y como incremento del RSS
+máximo del sistema operativo en un subproceso nuevo por caso. Informa del
+ratio entre memoria y tamaño del archivo y termina con código 1 si algún
+caso supera su presupuesto.
+
+Uso:
+    python benchmarks/benchmark_memoria.py
+    python benchmarks/benchmark_memoria.py --ratio-maximo 10
+    python benchmarks/benchmark_memoria.py --presupuestos presupuestos.json --salida memoria.json
+"""
+
+import argparse
+import importlib
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Agregar el directorio raíz al path para importar los módulos
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from carga_datos.estadisticas import MedidorCarga
+from carga_datos.utils import SALIDAS
+from benchmarks.benchmark_carga import consumir, metadatos_entorno, nombre_caso
+from benchmarks.generadores import (
+    generar_dataframe, generar_csv, generar_parquet, generar_feather, generar_xlsx, generar_texto
+)
+
+
+# Módulo de cada función medida
+MODULOS = {
+    'cargar_csv': 'carga_datos',
+    'cargar_parquet': 'carga_datos',
+    'cargar_feather': 'carga_datos',
+    'cargar_xlsx': 'carga_datos',
+    'cargar_archivo': 'carga_datos',
+    'normalizar_texto': 'normalizacion_texto',
+}
+
+# Módulos que los cargadores importan al usarse por primera vez; el
+# subproceso los importa antes de tomar la referencia de RSS para no
+# contarlos como memoria de la carga
+MODULOS_PEREZOSOS = ('pyarrow.csv', 'pyarrow.parquet', 'pyarrow.feather', 'openpyxl')
+
+
+class CasoMemoria(NamedTuple):
+    """
+    Una llamada cuya memoria se mide.
+
+    Atributos:
+    ---------
+    nombre : str
+        Identificador estable del caso, por ejemplo
+        'cargar_csv[salida=lotes]'. Es la clave de los presupuestos.
+    funcion : str
+        Nombre de la función medida (una clave de MODULOS).
+    ruta : Path
+        Archivo que se carga; para normalizar_texto, el texto a normalizar.
+    parametros : Dict[str, Any]
+        Parámetros con nombre de la llamada (serializables en JSON, para
+        repetirla en el subproceso).
+    """
+    nombre: str
+    funcion: str
+    ruta: Path
+    parametros: Dict[str, Any]
+
+
+class PresupuestoExcedido(NamedTuple):
+    """Caso cuya memoria supera su presupuesto (ratio sobre el tamaño del archivo)."""
+    nombre: str
+    ratio: float
+    presupuesto: float
+
+
+def preparar_casos(directorio: Path, filas: int = 200_000, filas_xlsx: int = 20_000,
+                   columnas: int = 10, proporcion_texto: float = 0.3,
+                   caracteres_texto: int = 10_000_000,
+                   formatos: Sequence[str] = ('csv', 'xlsx', 'parquet', 'feather', 'texto')
+                   ) -> List[CasoMemoria]:
+    """
+    Genera los archivos sintéticos en el directorio y construye los casos.
+
+    CSV y Parquet se miden con cada modo de salida (los lotes son el caso
+    en streaming, que no debería crecer con el archivo), Feather con
+    'pandas' y 'arrow', Excel con su motor por defecto, el CSV una vez más
+    a través de cargar_archivo, y normalizar_texto sobre un texto de
+    caracteres_texto caracteres.
+
+    Retorna:
+    -------
+    List[CasoMemoria]
+        Los casos en un orden estable.
+    """
+    casos: List[CasoMemoria] = []
+    df = None
+    if {'csv', 'parquet', 'feather'} & set(formatos):
+        df = generar_dataframe(filas, columnas, proporcion_texto)
+
+    if 'csv' in formatos:
+        ruta = generar_csv(directorio, df)
+        for salida in SALIDAS:
+            casos.append(CasoMemoria(nombre_caso('cargar_csv', salida=salida), 'cargar_csv',
+                                     ruta, {'salida': salida}))
+        casos.append(CasoMemoria(nombre_caso('cargar_archivo', formato='csv'), 'cargar_archivo',
+                                 ruta, {}))
+
+    if 'parquet' in formatos:
+        ruta = generar_parquet(directorio, df)
+        for salida in SALIDAS:
+            casos.append(CasoMemoria(nombre_caso('cargar_parquet', salida=salida), 'cargar_parquet',
+                                     ruta, {'salida': salida}))
+
+    if 'feather' in formatos:
+        ruta = generar_feather(directorio, df)
+        for salida in ('pandas', 'arrow'):
+            casos.append(CasoMemoria(nombre_caso('cargar_feather', salida=salida), 'cargar_feather',
+                                     ruta, {'salida': salida}))
+
+    if 'xlsx' in formatos:
+        ruta = generar_xlsx(directorio, generar_dataframe(filas_xlsx, columnas, proporcion_texto))
+        casos.append(CasoMemoria(nombre_caso('cargar_xlsx', salida='pandas'), 'cargar_xlsx',
+                                 ruta, {'salida': 'pandas'}))
+
+    if 'texto' in formatos:
+        ruta = generar_texto(directorio, caracteres_texto)
+        casos.append(CasoMemoria(nombre_caso('normalizar_texto', caracteres=caracteres_texto),
+                                 'normalizar_texto', ruta, {}))
+
+    return casos
+
+
+def preparar_llamada(caso: CasoMemoria) -> Callable[[], Any]:
+    """
+    Devuelve una función sin argumentos que ejecuta el caso.
+
+    El texto de normalizar_texto se lee aquí, fuera de la medición, para
+    que solo cuente la memoria de la normalización.
+    """
+    funcion = getattr(importlib.import_module(MODULOS[caso.funcion]), caso.funcion)
+    if caso.funcion == 'normalizar_texto':
+        texto = caso.ruta.read_text(encoding='utf-8')
+        return lambda: funcion(texto, **caso.parametros)
+    return lambda: funcion(caso.ruta, **caso.parametros)
+
+
+def medir_tracemalloc(caso: CasoMemoria) -> int:
+    """
+    Pico de memoria del caso en este proceso, en bytes: lo que registra
+    tracemalloc (Python y NumPy) más lo que crece el pool de pyarrow.
+    """
+    llamada = preparar_llamada(caso)
+    medidor = MedidorCarga(caso.funcion)
+    with medidor.memoria():
+        consumir(llamada())
+    return medidor.memoria_pico
+
+
+def medir_rss(caso: CasoMemoria) -> Optional[int]:
+    """
+    Incremento del RSS máximo del proceso al ejecutar el caso, en bytes,
+    medido en un subproceso nuevo para que no influya lo ejecutado antes.
+
+    Retorna:
+    -------
+    Optional[int]
+        El incremento, o None si el sistema no ofrece el módulo resource
+        (Windows).
+
+    Errores:
+    -------
+    - Lanza RuntimeError si el subproceso falla.
+    """
+    if resource is None:
+        return None
+
+    especificacion = json.dumps({'nombre': caso.nombre, 'funcion': caso.funcion,
+                                 'ruta': str(caso.ruta), 'parametros': caso.parametros})
+    proceso = subprocess.run(
+        [sys.executable, str(Path(__file__).resolve()), '--subproceso', especificacion],
+        capture_output=True, text=True
+    )
+    if proceso.returncode != 0:
+        raise RuntimeError(f"Error al medir el RSS de {caso.nombre}: {proceso.stderr.strip()}")
+
+    medidas = json.loads(proceso.stdout.strip().splitlines()[-1])
+    return max(medidas['rss_pico'] - medidas['rss_antes'], 0)
+
+
+def _rss_maximo() -> int:
+    """RSS máximo del proceso hasta ahora, en bytes."""
+    # En Linux ru_maxrss hereda el máximo del proceso padre al crear el
+    # subproceso; VmHWM es el de la memoria propia tras el exec
+    try:
+        with open('/proc/self/status', encoding='ascii') as estado:
+            for linea in estado:
+                if linea.startswith('VmHWM:'):
+                    return int(linea.split()[1]) * 1024
+    except OSError:
+        pass
+
+    maximo = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux lo da en kilobytes y macOS en bytes
+    return maximo if sys.platform == 'darwin' else maximo * 1024
+
+
+def _ejecutar_subproceso(especificacion: str) -> None:
+    """Ejecuta un caso en este proceso e imprime su RSS antes y después, en JSON."""
+    datos = json.loads(especificacion)
+    caso = CasoMemoria(datos['nombre'], datos['funcion'], Path(datos['ruta']), datos['parametros'])
+
+    for modulo in MODULOS_PEREZOSOS:
+        try:
+            importlib.import_module(modulo)
+        except ImportError:
+            pass
+
+    llamada = preparar_llamada(caso)
+    rss_antes = _rss_maximo()
+    consumir(llamada())
+    print(json.dumps({'rss_antes': rss_antes, 'rss_pico': _rss_maximo()}))
+
+
+def medir_caso(caso: CasoMemoria, rss: bool = True) -> Dict[str, Any]:
+    """
+    Mide la memoria de un caso con tracemalloc y, si se pide, con el RSS.
+
+    Retorna:
+    -------
+    Dict[str, Any]
+        Función, tamaño del archivo, picos en bytes y su ratio sobre el
+        tamaño del archivo. 'rss' y 'ratio_rss' son None si no se midió el
+        RSS o el sistema no lo permite.
+    """
+    bytes_archivo = caso.ruta.stat().st_size
+    pico_tracemalloc = medir_tracemalloc(caso)
+    incremento_rss = medir_rss(caso) if rss else None
+    return {
+        'funcion': caso.funcion,
+        'bytes_archivo': bytes_archivo,
+        'tracemalloc': pico_tracemalloc,
+        'ratio_tracemalloc': pico_tracemalloc / bytes_archivo,
+        'rss': incremento_rss,
+        'ratio_rss': incremento_rss / bytes_archivo if incremento_rss is not None else None,
+    }
+
+
+def ejecutar_benchmark(casos: Sequence[CasoMemoria], rss: bool = True,
+                       parametros: Optional[Dict[str, Any]] = None,
+                       mostrar: bool = True) -> Dict[str, Any]:
+    """
+    Mide todos los casos y devuelve el documento de resultados.
+
+    Retorna:
+    -------
+    Dict[str, Any]
+        {'metadatos': {...}, 'resultados': {nombre_caso: medidas}}, listo
+        para guardarse como JSON.
+    """
+    resultados = {}
+    for caso in casos:
+        resultados[caso.nombre] = medir_caso(caso, rss)
+        if mostrar:
+            medidas = resultados[caso.nombre]
+            texto_rss = (f"{medidas['rss'] / 1e6:>9.1f} MB RSS (x{medidas['ratio_rss']:.2f})"
+                         if medidas['rss'] is not None else "")
+            print(f"{caso.nombre:<40} {medidas['bytes_archivo'] / 1e6:>8.1f} MB "
+                  f"{medidas['tracemalloc'] / 1e6:>9.1f} MB tracemalloc "
+                  f"(x{medidas['ratio_tracemalloc']:.2f}) {texto_rss}")
+
+    return {'metadatos': metadatos_entorno(parametros), 'resultados': resultados}
+
+
+def comprobar_presupuestos(resultados: Dict[str, Any], presupuestos: Dict[str, float],
+                           ratio_maximo: Optional[float] = None) -> List[PresupuestoExcedido]:
+    """
+    Compara el ratio de memoria de cada caso con su presupuesto.
+
+    Se usa el ratio del RSS si se midió (es el límite real del proceso) y
+    si no el de tracemalloc. El presupuesto de un caso es el de su nombre
+    exacto, si no el de su función y si no ratio_maximo.
+
+    Parámetros:
+    ----------
+    resultados : Dict[str, Any]
+        Resultados de ejecutar_benchmark().
+    presupuestos : Dict[str, float]
+        Ratio máximo de memoria sobre el tamaño del archivo por nombre de
+        caso ('cargar_csv[salida=lotes]') o de función ('cargar_csv').
+    ratio_maximo : Optional[float], opcional
+        Presupuesto de los casos que no aparecen en presupuestos. Si es
+        None, esos casos no se comprueban.
+
+    Retorna:
+    -------
+    List[PresupuestoExcedido]
+        Los casos que superan su presupuesto, del que más lo supera al que
+        menos.
+
+    Ejemplos:
+    --------
+    >>> comprobar_presupuestos(resultados, {'cargar_csv': 6, 'cargar_csv[salida=lotes]': 1.5})
+    [PresupuestoExcedido(nombre='cargar_csv[salida=lotes]', ratio=2.1, presupuesto=1.5)]
+    """
+    excedidos = []
+    for nombre, medidas in resultados.get('resultados', {}).items():
+        presupuesto = presupuestos.get(nombre, presupuestos.get(medidas['funcion'], ratio_maximo))
+        if presupuesto is None:
+            continue
+        ratio = medidas['ratio_rss'] if medidas['ratio_rss'] is not None else medidas['ratio_tracemalloc']
+        if ratio > presupuesto:
+            excedidos.append(PresupuestoExcedido(nombre, ratio, presupuesto))
+    return sorted(excedidos, key=lambda excedido: excedido.ratio / excedido.presupuesto, reverse=True)
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    """Parser de la línea de comandos del benchmark de memoria."""
+    parser = argparse.ArgumentParser(
+        description="Pico de memoria de los cargadores y de normalizar_texto sobre archivos sintéticos."
+    )
+    parser.add_argument('--filas', type=int, default=200_000,
+                        help="Filas de los CSV, Parquet y Feather generados (por defecto 200000)")
+    parser.add_argument('--filas-xlsx', type=int, default=20_000,
+                        help="Filas del Excel generado (por defecto 20000)")
+    parser.add_argument('--columnas', type=int, default=10,
+                        help="Columnas de los archivos generados (por defecto 10)")
+    parser.add_argument('--proporcion-texto', type=float, default=0.3,
+                        help="Fracción de columnas de texto entre 0 y 1 (por defecto 0.3)")
+    parser.add_argument('--caracteres-texto', type=int, default=10_000_000,
+                        help="Longitud del texto para normalizar_texto (por defecto 10000000)")
+    parser.add_argument('--formatos', nargs='+', default=['csv', 'xlsx', 'parquet', 'feather', 'texto'],
+                        choices=['csv', 'xlsx', 'parquet', 'feather', 'texto'], help="Casos a medir")
+    parser.add_argument('--sin-rss', action='store_true',
+                        help="Medir solo con tracemalloc, sin subprocesos")
+    parser.add_argument('--presupuestos', type=Path, default=None,
+                        help="JSON con el ratio máximo de memoria por caso o por función")
+    parser.add_argument('--ratio-maximo', type=float, default=None,
+                        help="Ratio máximo para los casos sin presupuesto propio")
+    parser.add_argument('--salida', type=Path, default=None,
+                        help="Archivo JSON donde guardar los resultados")
+    parser.add_argument('--directorio', type=Path, default=None,
+                        help="Directorio para los archivos generados (por defecto uno temporal)")
+    parser.add_argument('--subproceso', default=None, help=argparse.SUPPRESS)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Ejecuta el benchmark de memoria desde la línea de comandos.
+
+    Retorna:
+    -------
+    int
+        0 si ningún caso supera su presupuesto, 1 si alguno lo supera.
+    """
+    argumentos = crear_parser().parse_args(argv)
+    if argumentos.subproceso is not None:
+        _ejecutar_subproceso(argumentos.subproceso)
+        return 0
+
+    parametros = {
+        'filas': argumentos.filas,
+        'filas_xlsx': argumentos.filas_xlsx,
+        'columnas': argumentos.columnas,
+        'proporcion_texto': argumentos.proporcion_texto,
+        'caracteres_texto': argumentos.caracteres_texto,
+        'formatos': list(argumentos.formatos),
+    }
+    presupuestos = {}
+    if argumentos.presupuestos is not None:
+        presupuestos = json.loads(argumentos.presupuestos.read_text(encoding='utf-8'))
+
+    if not argumentos.sin_rss and resource is None:
+        print("Aviso: este sistema no ofrece el RSS máximo; se mide solo con tracemalloc.")
+
+    with tempfile.TemporaryDirectory() as temporal:
+        directorio = argumentos.directorio or Path(temporal)
+        directorio.mkdir(parents=True, exist_ok=True)
+        casos = preparar_casos(directorio, **parametros)
+        resultados = ejecutar_benchmark(casos, not argumentos.sin_rss, parametros)
+
+    if argumentos.salida is not None:
+        argumentos.salida.write_text(json.dumps(resultados, indent=2, ensure_ascii=False), encoding='utf-8')
+        print(f"Resultados guardados en {argumentos.salida}")
+
+    excedidos = comprobar_presupuestos(resultados, presupuestos, argumentos.ratio_maximo)
+    if not excedidos:
+        return 0
+
+    print("Casos que superan su presupuesto de memoria:")
+    for excedido in excedidos:
+        print(f"  {excedido.nombre:<40} x{excedido.ratio:.2f} > x{excedido.presupuesto:.2f}")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
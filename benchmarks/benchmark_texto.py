@@ -0,0 +1,119 @@
+"""
+Benchmark de las funciones de normalización de texto.
+
+Genera un corpus de direcciones postales con espacios sucios, comprueba
+que limpiar_espacios da exactamente el mismo resultado que la
+implementación de referencia (las cuatro pasadas de re.sub que hacía
+antes) y mide ambas. Termina con código 1 si alguna dirección da un
+resultado distinto.
+
+Uso:
+    python benchmarks/benchmark_texto.py
+    python benchmarks/benchmark_texto.py --direcciones 5000000 --repeticiones 3
+"""
+
+import argparse
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+# Agregar el directorio raíz al path para importar los módulos
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from normalizacion_texto import limpiar_espacios
+from normalizacion_texto.limpiar_espacios import aplicar_limpiar_espacios
+from benchmarks.generadores import generar_direcciones
+
+
+def limpiar_espacios_referencia(texto: str) -> str:
+    """limpiar_espacios tal como se implementaba con cuatro pasadas de re.sub."""
+    texto_limpio = texto.strip()
+    texto_limpio = re.sub(r'\s+', ' ', texto_limpio)
+    texto_limpio = re.sub(r'\s+([,.;:!?)\]}])', r'\1', texto_limpio)
+    texto_limpio = re.sub(r'([(\[{])\s+', r'\1', texto_limpio)
+    texto_limpio = re.sub(r' {2,}', ' ', texto_limpio)
+    return texto_limpio
+
+
+# Implementaciones que se miden sobre el corpus
+IMPLEMENTACIONES: Dict[str, Callable[[str], str]] = {
+    'referencia': limpiar_espacios_referencia,
+    'limpiar_espacios': limpiar_espacios,
+    'aplicar_limpiar_espacios': aplicar_limpiar_espacios,
+}
+
+
+def buscar_diferencias(textos: Sequence[str], funcion: Callable[[str], str],
+                       referencia: Callable[[str], str] = limpiar_espacios_referencia) -> List[str]:
+    """Textos para los que funcion no da el mismo resultado que referencia."""
+    return [texto for texto in textos if funcion(texto) != referencia(texto)]
+
+
+def medir(funcion: Callable[[str], str], textos: Sequence[str], repeticiones: int = 5) -> Dict[str, Any]:
+    """
+    Aplica la función a todos los textos varias veces y resume los tiempos.
+
+    Retorna:
+    -------
+    Dict[str, Any]
+        Mediana y mínimo en segundos y textos por segundo sobre la mediana.
+    """
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        for texto in textos:
+            funcion(texto)
+        tiempos.append(time.perf_counter() - inicio)
+
+    mediana = statistics.median(tiempos)
+    return {
+        'segundos_mediana': mediana,
+        'segundos_min': min(tiempos),
+        'textos_por_segundo': len(textos) / mediana if mediana > 0 else None,
+    }
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    """Parser de la línea de comandos del benchmark de texto."""
+    parser = argparse.ArgumentParser(
+        description="Equivalencia y rendimiento de limpiar_espacios sobre direcciones sintéticas."
+    )
+    parser.add_argument('--direcciones', type=int, default=1_000_000,
+                        help="Número de direcciones del corpus (por defecto 1000000)")
+    parser.add_argument('--semilla', type=int, default=0,
+                        help="Semilla del corpus (por defecto 0)")
+    parser.add_argument('--repeticiones', type=int, default=5,
+                        help="Mediciones por implementación (por defecto 5)")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Ejecuta el benchmark desde la línea de comandos.
+
+    Retorna:
+    -------
+    int
+        0 si todas las implementaciones coinciden con la referencia, 1 si
+        alguna da un resultado distinto.
+    """
+    argumentos = crear_parser().parse_args(argv)
+    textos = generar_direcciones(argumentos.direcciones, argumentos.semilla)
+
+    diferentes = 0
+    for nombre, funcion in IMPLEMENTACIONES.items():
+        diferencias = buscar_diferencias(textos, funcion)
+        medidas = medir(funcion, textos, argumentos.repeticiones)
+        print(f"{nombre:<28} {medidas['segundos_mediana'] * 1000:>10.1f} ms "
+              f"{medidas['textos_por_segundo']:>14,.0f} textos/s {len(diferencias):>8} diferencias")
+        for texto in diferencias[:5]:
+            print(f"    {texto!r}: {funcion(texto)!r} != {limpiar_espacios_referencia(texto)!r}")
+        diferentes += len(diferencias)
+
+    return 1 if diferentes else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
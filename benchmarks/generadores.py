@@ -0,0 +1,259 @@
+"""
+Generadores de archivos sintéticos para los benchmarks.
+
+Este módulo contiene funciones que generan DataFrames y archivos CSV,
+XLSX y Parquet deterministas (con semilla) de un número configurable de
+filas y columnas, proporción de columnas de texto y compresión, y textos
+para los benchmarks de normalización.
+"""
+
+from pathlib import Path
+from typing import List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+
+# Palabras con las que se construyen las columnas de texto (con acentos,
+# como los datos reales que se cargan y normalizan)
+VOCABULARIO = (
+    'José', 'María', 'Córdoba', 'Málaga', 'Ángel', 'Núñez', 'camión', 'pingüino',
+    'cliente', 'pedido', 'factura', 'almacén', 'dirección', 'teléfono', 'São Paulo',
+    'Zürich', 'Åbo', 'niño', 'acción', 'mañana', 'región', 'período', 'artículo',
+)
+
+# Compresiones admitidas para los CSV generados y su extensión
+EXTENSIONES_CSV = {
+    None: '.csv',
+    'gzip': '.csv.gz',
+    'bz2': '.csv.bz2',
+    'xz': '.csv.xz',
+    'zstd': '.csv.zst',
+}
+
+
+def generar_dataframe(filas: int = 100_000, columnas: int = 10,
+                      proporcion_texto: float = 0.3, semilla: int = 0) -> pd.DataFrame:
+    """
+    Genera un DataFrame sintético con columnas de texto, enteros y decimales.
+
+    Parámetros:
+    ----------
+    filas : int, opcional
+        Número de filas. Por defecto es 100_000.
+    columnas : int, opcional
+        Número de columnas. Por defecto es 10.
+    proporcion_texto : float, opcional
+        Fracción de columnas de texto, entre 0 y 1. El resto alterna
+        enteros y decimales. Por defecto es 0.3.
+    semilla : int, opcional
+        Semilla del generador, para obtener siempre los mismos datos.
+
+    Retorna:
+    -------
+    pd.DataFrame
+        El DataFrame generado.
+
+    Errores:
+    -------
+    - Lanza ValueError si filas o columnas no son positivos o
+      proporcion_texto no está entre 0 y 1.
+
+    Ejemplos:
+    --------
+    >>> df = generar_dataframe(filas=1000, columnas=4, proporcion_texto=0.5)
+    >>> list(df.columns)
+    ['texto_0', 'texto_1', 'entero_2', 'decimal_3']
+    """
+    if filas < 1 or columnas < 1:
+        raise ValueError("Los parámetros 'filas' y 'columnas' deben ser positivos")
+    if not 0 <= proporcion_texto <= 1:
+        raise ValueError("El parámetro 'proporcion_texto' debe estar entre 0 y 1")
+
+    rng = np.random.default_rng(semilla)
+    columnas_texto = round(columnas * proporcion_texto)
+
+    datos = {}
+    for i in range(columnas):
+        if i < columnas_texto:
+            palabras = pd.Series(rng.choice(VOCABULARIO, size=filas))
+            numeros = pd.Series(rng.integers(0, 10_000, size=filas)).astype(str)
+            datos[f'texto_{i}'] = palabras + ' ' + numeros
+        elif i % 2 == 0:
+            datos[f'entero_{i}'] = rng.integers(0, 1_000_000, size=filas)
+        else:
+            datos[f'decimal_{i}'] = rng.random(size=filas) * 1000
+    return pd.DataFrame(datos)
+
+
+def generar_csv(directorio: Union[str, Path], df: pd.DataFrame,
+                compresion: Optional[str] = None) -> Path:
+    """
+    Escribe el DataFrame como CSV, comprimido si se indica.
+
+    Parámetros:
+    ----------
+    directorio : Union[str, Path]
+        Directorio donde se crea el archivo.
+    df : pd.DataFrame
+        Datos a escribir.
+    compresion : Optional[str], opcional
+        None, 'gzip', 'bz2', 'xz' o 'zstd' ('zstd' requiere zstandard).
+
+    Retorna:
+    -------
+    Path
+        Ruta del archivo creado (datos.csv, datos.csv.gz...).
+    """
+    if compresion not in EXTENSIONES_CSV:
+        raise ValueError(
+            f"Compresión de CSV no soportada: '{compresion}'. "
+            f"Opciones: {', '.join(str(c) for c in EXTENSIONES_CSV)}"
+        )
+    ruta = Path(directorio) / f"datos{EXTENSIONES_CSV[compresion]}"
+    df.to_csv(ruta, index=False, compression=compresion)
+    return ruta
+
+
+def generar_parquet(directorio: Union[str, Path], df: pd.DataFrame,
+                    compresion: Optional[str] = 'snappy') -> Path:
+    """
+    Escribe el DataFrame como Parquet con la compresión indicada
+    ('snappy', 'zstd', 'gzip' o None).
+
+    Retorna:
+    -------
+    Path
+        Ruta del archivo creado (datos_<compresion>.parquet).
+    """
+    ruta = Path(directorio) / f"datos_{compresion or 'sin_compresion'}.parquet"
+    df.to_parquet(ruta, index=False, compression=compresion)
+    return ruta
+
+
+def generar_xlsx(directorio: Union[str, Path], df: pd.DataFrame) -> Path:
+    """
+    Escribe el DataFrame como libro Excel con una sola hoja.
+
+    Retorna:
+    -------
+    Path
+        Ruta del archivo creado (datos.xlsx).
+    """
+    ruta = Path(directorio) / "datos.xlsx"
+    df.to_excel(ruta, index=False, engine='openpyxl')
+    return ruta
+
+
+def generar_feather(directorio: Union[str, Path], df: pd.DataFrame) -> Path:
+    """
+    Escribe el DataFrame como Feather (Arrow IPC) sin comprimir.
+
+    Retorna:
+    -------
+    Path
+        Ruta del archivo creado (datos.feather).
+    """
+    ruta = Path(directorio) / "datos.feather"
+    df.to_feather(ruta, compression='uncompressed')
+    return ruta
+
+
+def generar_texto(directorio: Union[str, Path], caracteres: int = 10_000_000,
+                  semilla: int = 0) -> Path:
+    """
+    Escribe un texto largo con acentos, mayúsculas y espacios repetidos,
+    como el que recibe normalizar_texto.
+
+    Parámetros:
+    ----------
+    directorio : Union[str, Path]
+        Directorio donde se crea el archivo.
+    caracteres : int, opcional
+        Longitud del texto. Por defecto es 10_000_000.
+    semilla : int, opcional
+        Semilla del generador, para obtener siempre el mismo texto.
+
+    Retorna:
+    -------
+    Path
+        Ruta del archivo creado (texto.txt, en UTF-8).
+    """
+    if caracteres < 1:
+        raise ValueError("El parámetro 'caracteres' debe ser positivo")
+
+    rng = np.random.default_rng(semilla)
+    # Cada palabra ocupa al menos 4 caracteres con su separador
+    palabras = rng.choice(VOCABULARIO, size=caracteres // 4 + 1)
+    separadores = rng.choice([' ', ' ', ' ', '  ', '\t', '\n'], size=len(palabras))
+    texto = ''.join((palabra.upper() if i % 7 == 0 else palabra) + separador
+                    for i, (palabra, separador) in enumerate(zip(palabras, separadores)))
+
+    ruta = Path(directorio) / "texto.txt"
+    ruta.write_text(texto[:caracteres], encoding='utf-8')
+    return ruta
+
+
+# Piezas de las direcciones sintéticas
+TIPOS_VIA = ('Calle', 'C/', 'Avda.', 'Avenida', 'Plaza', 'Pº', 'Camino', 'Ronda', 'Travesía')
+CIUDADES = ('Madrid', 'Córdoba', 'Málaga', 'A Coruña', 'Cádiz', 'Logroño', 'València', 'Lleida')
+# Espacios en blanco con que se separan: repetidos, tabuladores, saltos de
+# línea y espacios Unicode (no separable, fino...)
+ESPACIOS_SUCIOS = (' ', ' ', ' ', '  ', '   ', '\t', '\n', ' \r\n', '\u00a0', '\u2009', '\u3000', '\x0b')
+
+
+def generar_direcciones(cantidad: int = 1_000_000, semilla: int = 0) -> List[str]:
+    """
+    Genera direcciones postales con espacios sucios: repetidos, mezclados
+    con tabuladores y saltos de línea, espacios Unicode, espacios antes de
+    la puntuación y dentro de los paréntesis y corchetes, y espacios al
+    principio y al final. Es el texto que recibe limpiar_espacios.
+
+    Parámetros:
+    ----------
+    cantidad : int, opcional
+        Número de direcciones. Por defecto es 1_000_000.
+    semilla : int, opcional
+        Semilla del generador, para obtener siempre las mismas direcciones.
+
+    Retorna:
+    -------
+    List[str]
+        Las direcciones generadas.
+
+    Ejemplos:
+    --------
+    >>> direcciones = generar_direcciones(100_000, semilla=1)
+    >>> len(direcciones)
+    100000
+    """
+    if cantidad < 1:
+        raise ValueError("El parámetro 'cantidad' debe ser positivo")
+
+    rng = np.random.default_rng(semilla)
+    espacios = rng.choice(ESPACIOS_SUCIOS, size=(cantidad, 12))
+    tipos = rng.choice(TIPOS_VIA, size=cantidad)
+    nombres = rng.choice(VOCABULARIO, size=(cantidad, 2))
+    numeros = rng.integers(1, 300, size=cantidad)
+    pisos = rng.integers(0, 12, size=cantidad)
+    letras = rng.choice(list('ABCDI'), size=cantidad)
+    ciudades = rng.choice(CIUDADES, size=cantidad)
+    codigos = rng.integers(1000, 53000, size=cantidad)
+    formatos = rng.integers(0, 4, size=cantidad)
+
+    direcciones = []
+    for i in range(cantidad):
+        e = espacios[i]
+        if formatos[i] == 0:
+            partes = [e[0], tipos[i], e[1], nombres[i, 0], e[2], nombres[i, 1], e[3], ',', e[4], str(numeros[i]),
+                      e[5], '(', e[6], f"{pisos[i]}º", e[7], letras[i], e[8], ')', e[9], ';', e[10], ciudades[i], e[11]]
+        elif formatos[i] == 1:
+            partes = [tipos[i], e[0], nombres[i, 0], e[1], str(numeros[i]), e[2], '[', e[3], f"{codigos[i]:05d}",
+                      e[4], ']', e[5], ciudades[i], e[6], '.']
+        elif formatos[i] == 2:
+            partes = [e[0], nombres[i, 0], e[1], ':', e[2], tipos[i], e[3], nombres[i, 1], e[4], '!', e[5], '?',
+                      e[6], '{', e[7], ciudades[i], e[8], '}', e[9]]
+        else:
+            partes = [tipos[i], ' ', nombres[i, 0], ', ', str(numeros[i]), ' - ', ciudades[i]]
+        direcciones.append(''.join(partes))
+    return direcciones
@@ -5,12 +5,24 @@ Este módulo contiene funciones para cargar datos desde diferentes formatos:
 - CSV
 - Excel (.xlsx)
 - Parquet
+- Feather / Arrow IPC
+- Texto de ancho fijo
+- JSON Lines (.jsonl, .ndjson)
 - Detección automática de formato
+- Hooks de trazas (registrar_hook)
+- Registro de esquemas de CSV (RegistroEsquemas)
 """
 
 from .cargar_csv import cargar_csv
 from .cargar_parquet import cargar_parquet
 from .cargar_xlsx import cargar_xlsx
+from .cargar_feather import cargar_feather
+from .cargar_ancho_fijo import cargar_ancho_fijo
+from .cargar_jsonl import cargar_jsonl
 from .cargar_archivo import cargar_archivo
+from .hooks import registrar_hook, eliminar_hook
+from .esquemas import RegistroEsquemas, EsquemaCsv, inferir_esquema
 
-__all__ = ["cargar_csv", "cargar_parquet", "cargar_xlsx", "cargar_archivo"] 
\ No newline at end of file
+__all__ = ["cargar_csv", "cargar_parquet", "cargar_xlsx", "cargar_feather", "cargar_ancho_fijo", "cargar_jsonl",
+           "cargar_archivo",
+           "registrar_hook", "eliminar_hook", "RegistroEsquemas", "EsquemaCsv", "inferir_esquema"] 
\ No newline at end of file
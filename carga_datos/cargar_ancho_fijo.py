@@ -0,0 +1,484 @@
+"""
+Módulo para cargar archivos de texto de ancho fijo.
+
+Este módulo contiene funciones específicas para la carga de archivos de
+ancho fijo (extractos de mainframe, layouts COBOL...), en los que cada
+columna ocupa siempre las mismas posiciones de cada línea. Las columnas se
+recortan de forma vectorizada con NumPy sobre los bytes del archivo
+mapeado en memoria, sin partir las líneas en Python.
+"""
+
+import codecs
+import functools
+import itertools
+import numpy as np
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Literal, NoReturn, Optional, Tuple, Union
+from .utils import (
+    manejar_excepcion_inesperada, validar_limite_memoria, validar_salida, validar_progreso, es_buffer,
+    validar_devolver_estadisticas, resolver_origen, es_tabla_vacia, OrigenDatos, ResultadoCarga
+)
+from .memoria import (
+    estimar_memoria_ancho_fijo, supera_limite_memoria, error_limite_memoria, filas_por_fragmento
+)
+from .progreso import SeguimientoProgreso, CallbackProgreso, tamano_origen
+from .estadisticas import MedidorCarga, medir_fase, medir_memoria, con_estadisticas
+from .hooks import trazar
+
+
+# Líneas que se recortan de una vez; acota la memoria temporal del recorte
+FILAS_BLOQUE_ANCHO_FIJO: int = 100_000
+
+# Bytes que se examinan de una vez al buscar los saltos de línea
+BYTES_BLOQUE_LINEAS: int = 64 * 1024 * 1024
+
+SALTO_LINEA = ord('\n')
+RETORNO_CARRO = ord('\r')
+ESPACIO = ord(' ')
+
+# Marca en la tabla de decodificación de los bytes que no son un carácter
+CODIGO_INVALIDO = np.uint32(0xFFFFFFFF)
+
+EspecificacionColumnas = Dict[str, Tuple[int, int]]
+
+
+@trazar
+def cargar_ancho_fijo(ruta: OrigenDatos, especificacion_columnas: EspecificacionColumnas,
+                      encoding: str = "utf-8", saltar_filas: int = 0,
+                      limite_memoria: Optional[int] = None,
+                      si_excede_memoria: Literal['error', 'fragmentos'] = 'error',
+                      salida: Literal['pandas', 'arrow', 'lotes'] = 'pandas',
+                      progreso: Optional[CallbackProgreso] = None,
+                      devolver_estadisticas: bool = False
+                      ) -> ResultadoCarga:
+    """
+    Carga un archivo de ancho fijo y lo devuelve como DataFrame.
+
+    Las rutas se mapean en memoria y los flujos se leen enteros. Los saltos
+    de línea se localizan con NumPy y cada columna se recorta para todas
+    las líneas a la vez: si todas las líneas miden lo mismo, como en los
+    extractos de mainframe, el recorte es una vista del archivo mapeado;
+    si no, se rellenan con espacios las líneas más cortas. Los valores se
+    recortan de espacios, los vacíos quedan como nulos y cada columna se
+    convierte a int64 o float64 si todos sus valores lo permiten.
+
+    Parámetros:
+    ----------
+    ruta : OrigenDatos
+        Ruta (str o Path), bytes, memoryview o flujo binario legible
+        (io.BytesIO, archivo abierto en 'rb'...) del archivo que se quiere cargar.
+    especificacion_columnas : Dict[str, Tuple[int, int]]
+        Nombre de cada columna y sus posiciones (inicio, fin) en bytes
+        dentro de la línea, empezando en 0 y sin incluir fin, como los
+        colspecs de pandas.read_fwf. Las columnas se devuelven en este orden.
+    encoding : str, opcional
+        Codificación del archivo: UTF-8 o una de un byte por carácter
+        (latin1, cp1252, cp037 para EBCDIC...). Por defecto es 'utf-8'.
+    saltar_filas : int, opcional
+        Líneas del principio que se ignoran (cabeceras, banners...).
+        Por defecto es 0.
+    limite_memoria : Optional[int], opcional
+        Presupuesto de memoria en bytes. Si se indica, antes de cargar se
+        estima la memoria a partir de la primera línea.
+        Por defecto es None (sin límite).
+    si_excede_memoria : str, opcional
+        Qué hacer si la estimación supera limite_memoria: 'error' lanza
+        ValueError sin llegar a cargar; 'fragmentos' devuelve un iterador
+        de DataFrames dimensionados para caber en el límite.
+        Por defecto es 'error'.
+    salida : str, opcional
+        Tipo de resultado: 'pandas' (DataFrame), 'arrow' (pyarrow.Table) o
+        'lotes' (pyarrow.RecordBatchReader). Con 'lotes' y con fragmentos
+        los tipos se deducen del primer bloque de líneas.
+        Por defecto es 'pandas'.
+    progreso : Optional[Callable[[ProgresoCarga], None]], opcional
+        Función a la que se informa de la carga tras cada bloque de
+        FILAS_BLOQUE_ANCHO_FIJO líneas. Por defecto es None.
+    devolver_estadisticas : bool, opcional
+        Si es True, devuelve una tupla (resultado, EstadisticasCarga).
+        Como el archivo se mapea en memoria, segundos_io es 0 y
+        bytes_leidos el tamaño del archivo. Por defecto es False.
+
+    Retorna:
+    -------
+    ResultadoCarga
+        El contenido del archivo como DataFrame, o un iterador de fragmentos
+        si se superó limite_memoria con si_excede_memoria='fragmentos'.
+        Con salida='arrow' una pyarrow.Table (o un RecordBatchReader si se
+        superó el límite con 'fragmentos') y con salida='lotes' un
+        RecordBatchReader, que no se comprueba contra limite_memoria.
+        Con devolver_estadisticas una tupla (resultado, EstadisticasCarga).
+
+    Errores:
+    -------
+    - Lanza FileNotFoundError si el archivo no existe.
+    - Lanza ValueError si hay problemas de encoding, permisos, memoria
+      insuficiente (real o estimada), el archivo está vacío o, con lotes o
+      fragmentos, un bloque tiene valores que no encajan con el tipo
+      deducido del primero.
+    - Lanza TypeError si los parámetros no son del tipo correcto.
+
+    Ejemplos:
+    --------
+    >>> columnas = {"cuenta": (0, 10), "nombre": (10, 40), "saldo": (40, 52)}
+    >>> df = cargar_ancho_fijo("extracto.txt", columnas)
+    >>> df = cargar_ancho_fijo("extracto.txt", columnas, encoding="cp037")  # EBCDIC
+    >>> for fragmento in cargar_ancho_fijo("enorme.txt", columnas, limite_memoria=512 * 1024**2,
+    ...                                    si_excede_memoria="fragmentos"):
+    ...     procesar(fragmento)
+    """
+    # Validar tipos de entrada
+    if not isinstance(ruta, (str, Path)) and not es_buffer(ruta):
+        raise TypeError(
+            "El parámetro 'ruta' debe ser str o Path, "
+            "o un buffer binario (bytes, memoryview o flujo binario legible)"
+        )
+
+    _validar_especificacion(especificacion_columnas)
+
+    if not isinstance(encoding, str):
+        raise TypeError("El parámetro 'encoding' debe ser str")
+
+    if isinstance(saltar_filas, bool) or not isinstance(saltar_filas, int) or saltar_filas < 0:
+        raise TypeError("El parámetro 'saltar_filas' debe ser un entero mayor o igual que 0")
+
+    validar_limite_memoria(limite_memoria, si_excede_memoria)
+    validar_salida(salida)
+    validar_progreso(progreso)
+    validar_devolver_estadisticas(devolver_estadisticas)
+
+    medidor = MedidorCarga('numpy') if devolver_estadisticas else None
+
+    # Validar la ruta o preparar el buffer en memoria
+    with medir_fase(medidor, 'validacion'):
+        origen, nombre = resolver_origen(ruta)
+
+    filas_bloque = FILAS_BLOQUE_ANCHO_FIJO
+    por_bloques = salida == 'lotes'
+    if limite_memoria is not None and salida != 'lotes':
+        anchos = [fin - inicio for inicio, fin in especificacion_columnas.values()]
+        estimacion = estimar_memoria_ancho_fijo(origen, anchos)
+        if supera_limite_memoria(estimacion, limite_memoria):
+            if si_excede_memoria != 'fragmentos':
+                raise error_limite_memoria(estimacion, limite_memoria, nombre)
+            filas_bloque = filas_por_fragmento(estimacion, limite_memoria)
+            por_bloques = True
+
+    seguimiento = None if progreso is None else SeguimientoProgreso(progreso, tamano_origen(origen))
+
+    try:
+        with medir_fase(medidor, 'lectura'):
+            datos = _mapear_origen(origen)
+            inicios, longitudes = _indexar_lineas(datos, saltar_filas)
+            tabla_codigos = _tabla_decodificacion(encoding)
+    except Exception as e:
+        _traducir_error_ancho_fijo(e, nombre, encoding)
+
+    if len(inicios) == 0:
+        raise ValueError(f"El archivo '{nombre}' está vacío o no contiene datos válidos.")
+
+    if medidor is not None:
+        medidor.bytes_leidos = len(datos)
+
+    if por_bloques:
+        lotes = _iterar_lotes(datos, inicios, longitudes, especificacion_columnas, tabla_codigos,
+                              filas_bloque, nombre, encoding, seguimiento)
+        lector = _lector_de_lotes(lotes, nombre)
+        if salida == 'pandas':
+            return con_estadisticas((lote.to_pandas(split_blocks=True) for lote in lector), medidor)
+        return con_estadisticas(lector, medidor)
+
+    with medir_memoria(medidor):
+        try:
+            with medir_fase(medidor, 'lectura'):
+                textos = _recortar_todo(datos, inicios, longitudes, especificacion_columnas, tabla_codigos,
+                                        filas_bloque, seguimiento)
+            with medir_fase(medidor, 'conversion'):
+                tabla = _tabla_tipada(textos)
+                resultado = tabla if salida == 'arrow' else tabla.to_pandas(split_blocks=True)
+        except Exception as e:
+            _traducir_error_ancho_fijo(e, nombre, encoding)
+
+    vacio = es_tabla_vacia(resultado) if salida == 'arrow' else resultado.empty
+    if vacio:
+        raise ValueError(f"El archivo '{nombre}' está vacío o no contiene datos válidos.")
+
+    if seguimiento is not None:
+        seguimiento.terminar(filas=tabla.num_rows)
+
+    return con_estadisticas(resultado, medidor)
+
+
+def _validar_especificacion(especificacion_columnas: Any) -> None:
+    """Comprueba que la especificación sea un dict no vacío de nombre -> (inicio, fin)."""
+    if not isinstance(especificacion_columnas, dict) or not especificacion_columnas:
+        raise TypeError("El parámetro 'especificacion_columnas' debe ser un dict no vacío")
+
+    for columna, posiciones in especificacion_columnas.items():
+        if not isinstance(columna, str):
+            raise TypeError("Los nombres de 'especificacion_columnas' deben ser strings")
+        if (not isinstance(posiciones, tuple) or len(posiciones) != 2
+                or not all(isinstance(p, int) and not isinstance(p, bool) for p in posiciones)
+                or not 0 <= posiciones[0] < posiciones[1]):
+            raise TypeError(
+                f"Las posiciones de la columna '{columna}' deben ser una tupla (inicio, fin) "
+                f"de enteros con 0 <= inicio < fin"
+            )
+
+
+def _mapear_origen(origen: Union[Path, BinaryIO]) -> np.ndarray:
+    """
+    Expone el contenido del origen como array de bytes. Las rutas se mapean
+    en memoria con pyarrow y los io.BytesIO se leen sin copiar su memoria.
+    """
+    if isinstance(origen, Path):
+        if origen.stat().st_size == 0:
+            return np.empty(0, dtype=np.uint8)
+        import pyarrow as pa
+        with pa.memory_map(str(origen), 'r') as mapa:
+            # El buffer mantiene vivo el mapeo aunque se cierre el archivo
+            return np.frombuffer(mapa.read_buffer(), dtype=np.uint8)
+    if hasattr(origen, 'getbuffer'):
+        return np.frombuffer(origen.getbuffer()[origen.tell():], dtype=np.uint8)
+    return np.frombuffer(origen.read(), dtype=np.uint8)
+
+
+def _indexar_lineas(datos: np.ndarray, saltar_filas: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Localiza el inicio y la longitud (sin salto de línea ni retorno de
+    carro) de cada línea no vacía. Los saltos se buscan por bloques de
+    BYTES_BLOQUE_LINEAS para no crear una máscara del tamaño del archivo.
+    """
+    fines = [np.flatnonzero(datos[desde:desde + BYTES_BLOQUE_LINEAS] == SALTO_LINEA) + desde
+             for desde in range(0, len(datos), BYTES_BLOQUE_LINEAS)]
+    fines = np.concatenate(fines) if fines else np.empty(0, dtype=np.int64)
+    if len(datos) and datos[-1] != SALTO_LINEA:
+        fines = np.append(fines, len(datos))
+
+    inicios = np.zeros(len(fines), dtype=np.int64)
+    inicios[1:] = fines[:-1] + 1
+    longitudes = fines - inicios
+    # Saltos de línea de Windows (\r\n)
+    con_retorno = (longitudes > 0) & (datos[np.maximum(fines - 1, 0)] == RETORNO_CARRO)
+    longitudes -= con_retorno
+
+    inicios, longitudes = inicios[saltar_filas:], longitudes[saltar_filas:]
+    no_vacias = longitudes > 0
+    return inicios[no_vacias], longitudes[no_vacias]
+
+
+@functools.lru_cache(maxsize=None)
+def _tabla_decodificacion(encoding: str) -> Optional[np.ndarray]:
+    """
+    Devuelve None para UTF-8, que valida y decodifica pyarrow, o el código
+    Unicode de cada uno de los 256 bytes para las codificaciones de un byte
+    (CODIGO_INVALIDO si el byte no es un carácter).
+    """
+    if codecs.lookup(encoding).name == 'utf-8':
+        return None
+    if len(bytes(range(256)).decode(encoding, errors='replace')) != 256:
+        raise TypeError(
+            "El parámetro 'encoding' debe ser UTF-8 o una codificación de un byte por carácter "
+            "(latin1, cp1252, cp037...)"
+        )
+
+    tabla = np.full(256, CODIGO_INVALIDO, dtype=np.uint32)
+    for byte in range(256):
+        try:
+            tabla[byte] = ord(bytes([byte]).decode(encoding))
+        except UnicodeDecodeError:
+            continue
+    return tabla
+
+
+def _recortar_columna(datos: np.ndarray, inicios: np.ndarray, longitudes: np.ndarray,
+                      inicio: int, fin: int, tabla_codigos: Optional[np.ndarray]) -> Any:
+    """
+    Recorta las posiciones [inicio, fin) de las líneas indicadas y las
+    devuelve como pyarrow.StringArray sin espacios alrededor y con los
+    valores vacíos como nulos.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    filas, ancho = len(inicios), fin - inicio
+    paso = int(inicios[1] - inicios[0]) if filas > 1 else 0
+    equiespaciadas = filas == 1 or bool(np.all(np.diff(inicios) == paso))
+    if equiespaciadas and longitudes.min() >= fin:
+        # Registros de longitud fija: una vista del archivo, sin índices
+        vista = np.lib.stride_tricks.as_strided(datos[inicios[0]:], shape=(filas, fin),
+                                                strides=(paso, 1), writeable=False)
+        bloque = np.ascontiguousarray(vista[:, inicio:fin])
+    else:
+        # Líneas de distinta longitud: lo que queda fuera de la línea es espacio
+        posiciones = np.arange(inicio, fin)
+        indices = np.minimum(inicios[:, None] + posiciones, len(datos) - 1)
+        bloque = np.where(posiciones < longitudes[:, None], datos[indices], np.uint8(ESPACIO))
+
+    if tabla_codigos is None:
+        binario = pa.FixedSizeBinaryArray.from_buffers(pa.binary(ancho), filas, [None, pa.py_buffer(bloque)])
+        texto = pc.cast(pc.cast(binario, pa.binary()), pa.string())
+    else:
+        codigos = tabla_codigos[bloque]
+        if (codigos == CODIGO_INVALIDO).any():
+            raise UnicodeError(f"hay bytes que no son caracteres válidos en la columna ({inicio}, {fin})")
+        texto = pa.array(codigos.view(np.dtype(('U', ancho))).ravel(), type=pa.string())
+
+    texto = pc.utf8_trim_whitespace(texto)
+    return pc.if_else(pc.equal(texto, ''), pa.scalar(None, pa.string()), texto)
+
+
+def _recortar_bloques(datos: np.ndarray, inicios: np.ndarray, longitudes: np.ndarray,
+                      especificacion_columnas: EspecificacionColumnas, tabla_codigos: Optional[np.ndarray],
+                      filas_bloque: int, seguimiento: Optional[SeguimientoProgreso]) -> Iterator[List[Any]]:
+    """Recorta las columnas de cada bloque de filas_bloque líneas."""
+    for desde in range(0, len(inicios), filas_bloque):
+        bloque_inicios = inicios[desde:desde + filas_bloque]
+        bloque_longitudes = longitudes[desde:desde + filas_bloque]
+        yield [_recortar_columna(datos, bloque_inicios, bloque_longitudes, inicio, fin, tabla_codigos)
+               for inicio, fin in especificacion_columnas.values()]
+        if seguimiento is not None:
+            seguimiento.avanzar(bytes_leidos=int(bloque_inicios[-1] + bloque_longitudes[-1] - bloque_inicios[0]),
+                                filas=len(bloque_inicios))
+
+
+def _recortar_todo(datos: np.ndarray, inicios: np.ndarray, longitudes: np.ndarray,
+                   especificacion_columnas: EspecificacionColumnas, tabla_codigos: Optional[np.ndarray],
+                   filas_bloque: int, seguimiento: Optional[SeguimientoProgreso]) -> Dict[str, Any]:
+    """Recorta todas las líneas y devuelve cada columna como pyarrow.ChunkedArray de texto."""
+    import pyarrow as pa
+
+    trozos = list(_recortar_bloques(datos, inicios, longitudes, especificacion_columnas, tabla_codigos,
+                                    filas_bloque, seguimiento))
+    return {columna: pa.chunked_array([trozo[indice] for trozo in trozos], type=pa.string())
+            for indice, columna in enumerate(especificacion_columnas)}
+
+
+def _convertir_tipo(columna: Any) -> Any:
+    """
+    Convierte una columna de texto a int64 o float64 si todos sus valores
+    lo permiten. Las columnas sin ningún valor se dejan como texto.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if columna.null_count == len(columna):
+        return columna
+    for tipo in (pa.int64(), pa.float64()):
+        try:
+            return pc.cast(columna, tipo)
+        except pa.ArrowInvalid:
+            continue
+    return columna
+
+
+def _tabla_tipada(textos: Dict[str, Any]) -> Any:
+    """Construye la pyarrow.Table con el tipo deducido de cada columna entera."""
+    import pyarrow as pa
+    return pa.table({columna: _convertir_tipo(valores) for columna, valores in textos.items()})
+
+
+def _iterar_lotes(datos: np.ndarray, inicios: np.ndarray, longitudes: np.ndarray,
+                  especificacion_columnas: EspecificacionColumnas, tabla_codigos: Optional[np.ndarray],
+                  filas_bloque: int, ruta: Union[str, Path], encoding: str,
+                  seguimiento: Optional[SeguimientoProgreso]) -> Iterator[Any]:
+    """
+    Genera un pyarrow.RecordBatch por bloque de líneas. Los tipos se
+    deducen del primer bloque y se aplican a los siguientes.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    columnas = list(especificacion_columnas)
+    bloques = _recortar_bloques(datos, inicios, longitudes, especificacion_columnas, tabla_codigos,
+                                filas_bloque, seguimiento)
+    esquema = None
+    filas = 0
+    while True:
+        try:
+            textos = next(bloques, None)
+        except Exception as e:
+            _traducir_error_ancho_fijo(e, ruta, encoding)
+        if textos is None:
+            break
+
+        if esquema is None:
+            lote = pa.RecordBatch.from_arrays([_convertir_tipo(texto) for texto in textos], names=columnas)
+            esquema = lote.schema
+        else:
+            convertidos = []
+            for campo, texto in zip(esquema, textos):
+                try:
+                    convertidos.append(pc.cast(texto, campo.type))
+                except pa.ArrowInvalid as e:
+                    raise ValueError(
+                        f"La columna '{campo.name}' del archivo '{ruta}' tiene valores que no encajan "
+                        f"con el tipo {campo.type} deducido del primer bloque. Error: {str(e)}"
+                    )
+            lote = pa.RecordBatch.from_arrays(convertidos, schema=esquema)
+        filas += lote.num_rows
+        yield lote
+
+    if seguimiento is not None:
+        seguimiento.terminar(filas=filas)
+
+
+def _lector_de_lotes(lotes: Iterator[Any], ruta: Union[str, Path]) -> Any:
+    """
+    Envuelve los lotes en un pyarrow.RecordBatchReader. El primer bloque se
+    recorta ya para conocer el esquema.
+    """
+    import pyarrow as pa
+    primero = next(lotes)
+    return pa.RecordBatchReader.from_batches(primero.schema, itertools.chain([primero], lotes))
+
+
+def _traducir_error_ancho_fijo(e: Exception, ruta: Union[str, Path], encoding: str) -> NoReturn:
+    """
+    Convierte las excepciones al leer un archivo de ancho fijo en errores
+    informativos.
+
+    Las excepciones que no se reconocen se registran y se re-lanzan
+    mediante manejar_excepcion_inesperada.
+    """
+    if isinstance(e, TypeError):
+        # Codificación de varios bytes por carácter (_tabla_decodificacion)
+        raise e
+    elif isinstance(e, ImportError):
+        raise ValueError(
+            f"No se pudo importar la librería necesaria para leer archivos de ancho fijo. "
+            f"Instala 'pyarrow' con: pip install pyarrow. "
+            f"Error: {str(e)}"
+        )
+    elif isinstance(e, MemoryError):
+        raise ValueError(
+            f"El archivo '{ruta}' es demasiado grande para cargar en memoria. "
+            f"Error: {str(e)}"
+        )
+    elif isinstance(e, (UnicodeDecodeError, UnicodeError)):
+        raise ValueError(
+            f"Error de codificación al leer el archivo '{ruta}'. "
+            f"Intenta con un encoding diferente. "
+            f"Error: {str(e)}"
+        )
+    elif isinstance(e, LookupError):
+        # Encoding inexistente
+        raise ValueError(
+            f"La codificación '{encoding}' no es válida o no está disponible. "
+            f"Error: {str(e)}"
+        )
+    elif isinstance(e, (PermissionError, OSError, IOError)):
+        raise ValueError(
+            f"No tienes permisos para leer el archivo '{ruta}'. "
+            f"Error: {str(e)}"
+        )
+
+    # pyarrow rechaza el UTF-8 inválido al convertir los bytes a texto
+    if type(e).__name__ == 'ArrowInvalid' and 'utf8' in str(e).lower():
+        raise ValueError(
+            f"Error de codificación al leer el archivo '{ruta}'. "
+            f"Intenta con un encoding diferente. "
+            f"Error: {str(e)}"
+        )
+    # Excepción inesperada - usar función utilitaria centralizada
+    manejar_excepcion_inesperada(e, 'cargar_ancho_fijo')
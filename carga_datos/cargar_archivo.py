@@ -2,43 +2,92 @@
 Módulo para cargar archivos con detección automática de formato.
 
 Este módulo contiene la función cargar_archivo() que detecta automáticamente 
-el formato del archivo por su extensión y llama a la función correspondiente.
+el formato del archivo por su contenido y su extensión y llama a la función
+correspondiente.
 """
 
-import pandas as pd
+import time
 from pathlib import Path
-from typing import Union
+from typing import Any, Dict, Optional, Tuple
 
 from .cargar_csv import cargar_csv
 from .cargar_xlsx import cargar_xlsx
 from .cargar_parquet import cargar_parquet
-from .utils import procesar_ruta
+from .cargar_feather import cargar_feather
+from .cargar_ancho_fijo import cargar_ancho_fijo
+from .cargar_jsonl import cargar_jsonl
+from .deteccion import detectar_origen, FormatoDetectado, FORMATOS_BINARIOS
+from .utils import procesar_ruta, es_buffer, abrir_buffer, describir_origen, OrigenDatos, ResultadoCarga
+from .hooks import trazar
 
 
-def cargar_archivo(ruta: Union[str, Path]) -> pd.DataFrame:
+# Extensiones soportadas y el formato que les corresponde
+EXTENSIONES_SOPORTADAS = {
+    '.csv': 'csv',
+    '.xlsx': 'xlsx',
+    '.parquet': 'parquet',
+    '.arrow': 'arrow',
+    '.feather': 'arrow',
+    '.ipc': 'arrow',
+    '.fwf': 'ancho_fijo',
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+}
+
+
+@trazar
+def cargar_archivo(ruta: OrigenDatos, **opciones: Any) -> ResultadoCarga:
     """
     Carga un archivo detectando automáticamente el formato por extensión.
     
+    Antes de usar la extensión se leen los primeros bytes del archivo: si
+    su número mágico delata un formato binario (Parquet, Excel o Arrow) o
+    una compresión gzip/zstd, el contenido manda sobre la extensión. Así un
+    Parquet llamado .csv no se intenta parsear como texto, y los archivos
+    binarios o comprimidos sin extensión se cargan igualmente. Si el
+    contenido es texto, se usa la extensión como siempre.
+    
+    También acepta buffers en memoria (bytes, memoryview, io.BytesIO) y flujos
+    binarios legibles, con la misma detección: si el contenido es texto, usa
+    la extensión del atributo name del flujo si es soportada y, si no, lo
+    carga como CSV.
+    
     Analiza la extensión del archivo y llama internamente a:
     - cargar_csv() si es .csv
     - cargar_xlsx() si es .xlsx
     - cargar_parquet() si es .parquet
+    - cargar_feather() si es .arrow, .feather o .ipc
+    - cargar_ancho_fijo() si es .fwf (hay que pasar especificacion_columnas)
+    - cargar_jsonl() si es .jsonl o .ndjson
+    - cargar_csv(compression=...) si el contenido es un CSV comprimido con
+      gzip o zstd (por ejemplo .csv.gz)
     
     Parámetros:
     ----------
-    ruta : Union[str, Path]
-        Ruta del archivo que se quiere cargar.
+    ruta : OrigenDatos
+        Ruta del archivo que se quiere cargar (str o Path), o buffer binario
+        con su contenido.
+    **opciones : Any
+        Parámetros adicionales que se pasan tal cual a la función de carga
+        correspondiente (por ejemplo sep, sheet_name, columns, limite_memoria
+        o salida='arrow' para obtener una pyarrow.Table sin pasar por pandas).
+        Con devolver_estadisticas=True se devuelve (resultado, EstadisticasCarga)
+        y la validación incluye también la detección del formato.
     
     Retorna:
     -------
-    pd.DataFrame
-        El contenido del archivo como DataFrame.
+    ResultadoCarga
+        El contenido del archivo como DataFrame, o lo que indique salida.
     
     Formatos soportados:
     -------------------
     - .csv, .CSV (y variaciones de mayúsculas/minúsculas)
     - .xlsx, .XLSX (y variaciones de mayúsculas/minúsculas)
     - .parquet, .PARQUET (y variaciones de mayúsculas/minúsculas)
+    - .arrow, .feather, .ipc (Arrow IPC / Feather)
+    - .fwf (texto de ancho fijo)
+    - .jsonl, .ndjson (JSON Lines)
+    - Cualquier nombre si el contenido es Parquet, Excel, Arrow o un CSV comprimido
     
     Formatos NO soportados:
     ----------------------
@@ -50,20 +99,39 @@ def cargar_archivo(ruta: Union[str, Path]) -> pd.DataFrame:
     Errores:
     -------
     - Lanza FileNotFoundError si el archivo no existe.
-    - Lanza ValueError si la extensión no es soportada.
+    - Lanza ValueError si ni el contenido ni la extensión permiten reconocer
+      el formato.
     - Lanza TypeError si el parámetro no es del tipo correcto.
-    - Propaga errores de las funciones internas (cargar_csv, cargar_xlsx, cargar_parquet).
+    - Propaga errores de las funciones internas (cargar_csv, cargar_xlsx,
+      cargar_parquet, cargar_feather, cargar_ancho_fijo, cargar_jsonl).
     
     Ejemplos:
     --------
     >>> df = cargar_archivo("datos.csv")        # Llama a cargar_csv()
     >>> df = cargar_archivo("datos.xlsx")       # Llama a cargar_xlsx()
     >>> df = cargar_archivo("datos.parquet")    # Llama a cargar_parquet()
+    >>> df = cargar_archivo("etapa_1.arrow")    # Llama a cargar_feather()
+    >>> df = cargar_archivo("extracto.fwf", especificacion_columnas={"id": (0, 8)})
+    >>> df = cargar_archivo("eventos.ndjson", columns=["tipo"])  # Llama a cargar_jsonl()
     >>> df = cargar_archivo(Path("datos.csv"))  # Funciona con Path objects
+    >>> df = cargar_archivo("datos.csv", sep=";", limite_memoria=1024**3)
+    >>> tabla = cargar_archivo("datos.parquet", salida="arrow")
+    >>> df = cargar_archivo("ventas.csv.gz")     # CSV comprimido con gzip
+    >>> df = cargar_archivo("entrega_0423")      # sin extensión: por contenido
+    >>> df = cargar_archivo(contenido_subido)    # bytes: formato por contenido
+    >>> df, estadisticas = cargar_archivo("datos.csv", devolver_estadisticas=True)
     """
+    inicio = time.perf_counter()
+
     # Validar tipo de entrada
-    if not isinstance(ruta, (str, Path)):
-        raise TypeError("El parámetro 'ruta' debe ser str o Path")
+    if not isinstance(ruta, (str, Path)) and not es_buffer(ruta):
+        raise TypeError(
+            "El parámetro 'ruta' debe ser str o Path, "
+            "o un buffer binario (bytes, memoryview o flujo binario legible)"
+        )
+    
+    if es_buffer(ruta):
+        return _cargar_buffer(ruta, opciones, inicio)
     
     # Crear Path object
     ruta_archivo = procesar_ruta(ruta)
@@ -78,17 +146,96 @@ def cargar_archivo(ruta: Union[str, Path]) -> pd.DataFrame:
     # Obtener extensión en minúsculas para comparación case-insensitive
     extension = ruta_archivo.suffix.lower()
     
-    # Mapear extensiones a funciones
-    if extension == '.csv':
-        return cargar_csv(ruta_archivo)
-    elif extension == '.xlsx':
-        return cargar_xlsx(ruta_archivo)
-    elif extension == '.parquet':
-        return cargar_parquet(ruta_archivo)
-    else:
+    formato, opciones_formato = _resolver_formato(ruta_archivo, extension)
+    if formato is None:
         # Construir mensaje de error informativo
-        formatos_soportados = ['.csv', '.xlsx', '.parquet']
         raise ValueError(
             f"Extensión de archivo no soportada: '{extension}'. "
-            f"Formatos soportados: {', '.join(formatos_soportados)}"
-        ) 
\ No newline at end of file
+            f"Formatos soportados: {', '.join(EXTENSIONES_SOPORTADAS)}"
+        )
+    return _cargar_formato(formato, ruta_archivo, {**opciones_formato, **opciones}, inicio)
+
+
+def _cargar_buffer(buffer: Any, opciones: Dict[str, Any], inicio: float) -> ResultadoCarga:
+    """
+    Carga un buffer en memoria o flujo binario.
+
+    Como con las rutas, un formato binario o un CSV comprimido reconocidos
+    por el contenido mandan; si el contenido es texto, se usa la extensión
+    del atributo name del flujo si es soportada y, si no, se carga como CSV.
+    """
+    origen = abrir_buffer(buffer)
+    nombre = describir_origen(buffer)
+    
+    extension = Path(nombre).suffix.lower()
+    formato, opciones_formato = _resolver_formato(origen, extension, texto_es_csv=True)
+    if formato is None:
+        raise ValueError(
+            f"No se pudo detectar el formato de '{nombre}' por su contenido. "
+            f"Formatos soportados: {', '.join(EXTENSIONES_SOPORTADAS)}"
+        )
+    return _cargar_formato(formato, origen, {**opciones_formato, **opciones}, inicio)
+
+
+def _resolver_formato(origen: Any, extension: str,
+                      texto_es_csv: bool = False) -> Tuple[Optional[str], Dict[str, Any]]:
+    """
+    Decide el formato a partir del contenido y de la extensión.
+
+    Un formato binario o una compresión reconocidos por su número mágico
+    mandan sobre la extensión; si el contenido es texto o no se reconoce,
+    se usa la extensión. Si no hay extensión soportada, el texto solo se
+    toma por CSV cuando texto_es_csv es True (buffers sin nombre).
+
+    Retorna el formato (o None) y las opciones extra para la función de
+    carga (la compresión detectada).
+    """
+    try:
+        deteccion = detectar_origen(origen)
+    except OSError:
+        # Sin permisos de lectura, etc.: la función de carga informará del error
+        deteccion = FormatoDetectado(None, None)
+    
+    if deteccion.compresion is not None:
+        if deteccion.formato == 'csv':
+            return 'csv', {'compression': deteccion.compresion}
+    elif deteccion.formato in FORMATOS_BINARIOS:
+        return deteccion.formato, {}
+    
+    if extension in EXTENSIONES_SOPORTADAS:
+        return EXTENSIONES_SOPORTADAS[extension], {}
+    
+    if texto_es_csv and deteccion == ('csv', None):
+        return 'csv', {}
+    return None, {}
+
+
+def _cargar_formato(formato: str, origen: Any, opciones: Dict[str, Any], inicio: float) -> ResultadoCarga:
+    """
+    Llama a la función de carga correspondiente al formato.
+
+    Si se piden estadísticas, suma a la validación del cargador el tiempo
+    que cargar_archivo pasó validando la ruta y detectando el formato.
+    """
+    segundos_deteccion = time.perf_counter() - inicio
+
+    if formato == 'csv':
+        resultado = cargar_csv(origen, **opciones)
+    elif formato == 'xlsx':
+        resultado = cargar_xlsx(origen, **opciones)
+    elif formato == 'parquet':
+        resultado = cargar_parquet(origen, **opciones)
+    elif formato == 'ancho_fijo':
+        resultado = cargar_ancho_fijo(origen, **opciones)
+    elif formato == 'jsonl':
+        resultado = cargar_jsonl(origen, **opciones)
+    else:
+        resultado = cargar_feather(origen, **opciones)
+
+    if opciones.get('devolver_estadisticas') is True:
+        resultado, estadisticas = resultado
+        return resultado, estadisticas._replace(
+            segundos_validacion=estadisticas.segundos_validacion + segundos_deteccion,
+            segundos_totales=estadisticas.segundos_totales + segundos_deteccion
+        )
+    return resultado
@@ -7,116 +7,527 @@ con manejo robusto de errores y validación de tipos.
 
 import pandas as pd
 from pathlib import Path
-from typing import Union
-from .utils import procesar_ruta, manejar_excepcion_inesperada
+from typing import Any, BinaryIO, Dict, Iterator, Literal, NoReturn, Optional, Union
+from .utils import (
+    manejar_excepcion_inesperada, validar_limite_memoria, validar_salida, validar_progreso, es_buffer,
+    validar_devolver_estadisticas, validar_detectar_fechas, resolver_origen, buffer_arrow, es_tabla_vacia,
+    OrigenDatos, ResultadoCarga
+)
+from .memoria import (
+    estimar_memoria_csv, supera_limite_memoria, error_limite_memoria, filas_por_fragmento,
+    EXTENSIONES_COMPRESION
+)
+from .progreso import (
+    SeguimientoProgreso, CallbackProgreso, abrir_con_progreso, tamano_origen, FILAS_BLOQUE_PROGRESO
+)
+from .estadisticas import MedidorCarga, medir_fase, medir_memoria, abrir_medido, con_estadisticas
+from .esquemas import (
+    EsquemaCsv, leer_cabecera, comprobar_cabecera, comprobar_fechas, es_error_de_conversion, error_conversion
+)
+from .fechas import convertir_fechas, convertir_fechas_arrow
+from .numeros import FormatoNumerico, resolver_formato_numerico, convertir_numeros, convertir_numeros_arrow
+from .hooks import trazar
 
 
-def cargar_csv(ruta: Union[str, Path], sep: str = ",", encoding: str = "utf-8") -> pd.DataFrame:
+@trazar
+def cargar_csv(ruta: OrigenDatos, sep: str = ",", encoding: str = "utf-8",
+               limite_memoria: Optional[int] = None,
+               si_excede_memoria: Literal['error', 'fragmentos'] = 'error',
+               compression: Optional[str] = 'infer',
+               salida: Literal['pandas', 'arrow', 'lotes'] = 'pandas',
+               progreso: Optional[CallbackProgreso] = None,
+               devolver_estadisticas: bool = False,
+               esquema: Optional[EsquemaCsv] = None,
+               detectar_fechas: bool = False,
+               dia_primero: Optional[bool] = None,
+               decimal: Optional[str] = None,
+               miles: Optional[str] = None,
+               locale: Optional[Literal['es', 'de', 'fr', 'en']] = None,
+               detectar_numeros: bool = False
+               ) -> ResultadoCarga:
     """
     Carga un archivo CSV y lo devuelve como DataFrame.
 
     Parámetros:
     ----------
-    ruta : Union[str, Path]
-        Ruta del archivo CSV que se quiere cargar.
+    ruta : OrigenDatos
+        Ruta (str o Path), bytes, memoryview o flujo binario legible
+        (io.BytesIO, archivo abierto en 'rb'...) del archivo CSV que se quiere cargar.
     sep : str, opcional
         Separador del archivo. Por defecto es ','.
     encoding : str, opcional
         Codificación del archivo. Por defecto es 'utf-8'.
+    limite_memoria : Optional[int], opcional
+        Presupuesto de memoria en bytes. Si se indica, antes de cargar se
+        estima la memoria necesaria a partir de una muestra del archivo.
+        Por defecto es None (sin límite).
+    si_excede_memoria : str, opcional
+        Qué hacer si la estimación supera limite_memoria: 'error' lanza
+        ValueError sin llegar a cargar; 'fragmentos' devuelve un iterador
+        de DataFrames dimensionados para caber en el límite.
+        Por defecto es 'error'.
+    compression : Optional[str], opcional
+        Compresión del archivo ('gzip', 'zstd', 'bz2', 'xz', 'zip' o None).
+        Por defecto es 'infer', que la deduce de la extensión de la ruta
+        (.gz, .zst...). cargar_archivo la fija al detectarla por contenido.
+    salida : str, opcional
+        Tipo de resultado: 'pandas' (DataFrame), 'arrow' (pyarrow.Table) o
+        'lotes' (pyarrow.RecordBatchReader que lee el archivo por bloques).
+        'arrow' y 'lotes' parsean con pyarrow.csv sin pasar por pandas, así
+        que los tipos los infiere pyarrow y el separador debe ser de un solo
+        carácter. Por defecto es 'pandas'.
+    progreso : Optional[Callable[[ProgresoCarga], None]], opcional
+        Función a la que se informa durante la carga (como mucho cada medio
+        segundo y una vez al terminar) de los bytes leídos, las filas
+        parseadas y las filas por segundo. Para contar filas sobre la marcha
+        el CSV se parsea en bloques de FILAS_BLOQUE_PROGRESO filas. No se usa
+        con salida='lotes' ni con fragmentos, donde quien itera ya ve el
+        avance. Por defecto es None (sin coste añadido).
+    devolver_estadisticas : bool, opcional
+        Si es True, devuelve una tupla (resultado, EstadisticasCarga) con el
+        tiempo de validación, E/S y parseo, los bytes leídos, las filas y
+        columnas, el pico de memoria y el motor usado. Con fragmentos o
+        salida='lotes' solo cubren la validación y la apertura. Medir añade
+        algo de coste (tracemalloc). Por defecto es False.
+    esquema : Optional[EsquemaCsv], opcional
+        Esquema registrado del feed (ver RegistroEsquemas). Si se indica, se
+        comprueba la cabecera antes de cargar y se leen las columnas con
+        sus tipos y formatos de fecha en lugar de inferirlos. Por defecto
+        es None (inferencia de pandas o pyarrow).
+    detectar_fechas : bool, opcional
+        Si es True, las columnas de texto con fechas se convierten a
+        datetime: el formato ('%d/%m/%Y', ISO 8601...) se detecta una vez por
+        columna sobre una muestra y la columna entera se lee con ese formato.
+        No se aplica con salida='lotes', con fragmentos ni con esquema (que
+        ya fija las fechas). Por defecto es False.
+    dia_primero : Optional[bool], opcional
+        Con detectar_fechas, cómo resolver las fechas ambiguas como
+        03/04/2024: True para día primero, False para mes primero. Con None
+        (por defecto) se avisa con logging.warning y la columna se deja como
+        texto.
+    decimal : Optional[str], opcional
+        Separador decimal de los números (',' en '1.234,56'). Lo aplica el
+        propio parser (pandas o pyarrow.csv), sin pasos posteriores.
+        Por defecto es None ('.').
+    miles : Optional[str], opcional
+        Separador de miles ('.' en '1.234,56'). pyarrow.csv no lo admite:
+        con salida='arrow' las columnas que lo usan se convierten tras leer
+        con pyarrow.compute, y con salida='lotes' no se aplica.
+        Por defecto es None (sin separador de miles).
+    locale : Optional[str], opcional
+        Atajo para decimal y miles: 'es' y 'de' (1.234,56), 'fr' (1 234,56)
+        o 'en' (1,234.56). decimal y miles, si se indican, tienen
+        prioridad. No cambia sep. Por defecto es None.
+    detectar_numeros : bool, opcional
+        Si es True, las columnas de texto cuyos valores son números con
+        formato regional se detectan sobre una muestra y se convierten a
+        int o float con pyarrow.compute. Sirve para archivos que mezclan
+        formatos o cuyo formato no se conoce; los formatos ambiguos
+        ('1,234') se resuelven con locale o se avisan con logging.warning.
+        No se aplica con salida='lotes' ni con fragmentos. Por defecto es
+        False.
 
     Retorna:
     -------
-    pd.DataFrame
-        El contenido del CSV como DataFrame.
+    ResultadoCarga
+        El contenido del CSV como DataFrame, o un iterador de fragmentos
+        si se superó limite_memoria con si_excede_memoria='fragmentos'.
+        Con salida='arrow' una pyarrow.Table (o un RecordBatchReader si se
+        superó el límite con 'fragmentos') y con salida='lotes' un
+        RecordBatchReader, que no se comprueba contra limite_memoria porque
+        nunca tiene más de un bloque en memoria. Con devolver_estadisticas
+        una tupla (resultado, EstadisticasCarga).
 
     Errores:
     -------
     - Lanza FileNotFoundError si el archivo no existe.
     - Lanza ValueError si el encoding no es válido, el CSV no se puede parsear,
-      hay problemas de permisos, memoria insuficiente o el archivo está vacío.
+      hay problemas de permisos, memoria insuficiente (real o estimada), el
+      archivo está vacío o no coincide con el esquema indicado.
     - Lanza TypeError si los parámetros no son del tipo correcto.
 
     Ejemplos:
     --------
     >>> df = cargar_csv("datos.csv")
     >>> df = cargar_csv("datos.csv", sep=";", encoding="latin1")
+    >>> df = cargar_csv("exportacion.dat", compression="gzip")
+    >>> df = cargar_csv(peticion.files["archivo"].read())  # bytes de una subida HTTP
+    >>> for fragmento in cargar_csv("enorme.csv", limite_memoria=512 * 1024**2,
+    ...                             si_excede_memoria="fragmentos"):
+    ...     procesar(fragmento)
+    >>> tabla = cargar_csv("datos.csv", salida="arrow")  # pyarrow.Table, sin pandas
+    >>> for lote in cargar_csv("enorme.csv", salida="lotes"):
+    ...     escritor.write_batch(lote)
+    >>> df = cargar_csv("enorme.csv", progreso=lambda p: print(p.filas, p.filas_por_segundo))
+    >>> df, estadisticas = cargar_csv("datos.csv", devolver_estadisticas=True)
+    >>> estadisticas.segundos_parseo, estadisticas.memoria_pico
+    >>> esquema = RegistroEsquemas("esquemas.json").esquema_para("ventas.csv", clave="ventas")
+    >>> df = cargar_csv("ventas.csv", esquema=esquema)  # sin inferir tipos
+    >>> df = cargar_csv("altas.csv", sep=";", detectar_fechas=True, dia_primero=True)
+    >>> df = cargar_csv("ventas_es.csv", sep=";", locale="es")  # 1.234,56 como float
     """
-    # Validar tipos de entrada
-    if not isinstance(ruta, (str, Path)):
-        raise TypeError("El parámetro 'ruta' debe ser str o Path")
-    
+    _validar_opciones_csv(ruta, sep, encoding, compression, salida, detectar_numeros, esquema)
+    validar_limite_memoria(limite_memoria, si_excede_memoria)
+    validar_salida(salida)
+    validar_progreso(progreso)
+    validar_devolver_estadisticas(devolver_estadisticas)
+    validar_detectar_fechas(detectar_fechas, dia_primero)
+    formato_numerico = resolver_formato_numerico(decimal, miles, locale)
+
+    medidor = None
+    if devolver_estadisticas:
+        medidor = MedidorCarga('pandas' if salida == 'pandas' else 'pyarrow.csv')
+
+    # Validar la ruta o preparar el buffer en memoria
+    with medir_fase(medidor, 'validacion'):
+        origen, nombre = resolver_origen(ruta)
+        if esquema is not None:
+            _comprobar_cabecera_csv(origen, nombre, sep, encoding, compression, esquema)
+
+    if salida == 'lotes':
+        lotes = _abrir_lotes_csv(origen, nombre, sep, encoding, compression, esquema=esquema,
+                                 formato_numerico=formato_numerico)
+        return con_estadisticas(lotes, medidor)
+
+    # Comprobar el presupuesto de memoria antes de cargar
+    if limite_memoria is not None:
+        fragmentos = _fragmentos_si_excede(origen, nombre, sep, encoding, compression, limite_memoria,
+                                           si_excede_memoria, salida, esquema, formato_numerico)
+        if fragmentos is not None:
+            return con_estadisticas(fragmentos, medidor)
+
+    if medidor is not None:
+        # El origen se lee envuelto para medir la E/S y el envoltorio no
+        # tiene extensión de la que inferir la compresión
+        compression = _resolver_compresion(origen, compression)
+
+    with medir_memoria(medidor):
+        try:
+            resultado = _leer_csv(origen, sep, encoding, compression, salida, progreso, medidor,
+                                  esquema, formato_numerico)
+        except Exception as e:
+            _traducir_error_csv(e, nombre, sep, encoding, esquema)
+
+    with medir_fase(medidor, 'conversion'):
+        resultado = _procesar_resultado(resultado, nombre, salida, esquema, detectar_fechas, dia_primero,
+                                        formato_numerico, detectar_numeros)
+
+    return con_estadisticas(resultado, medidor)
+
+
+def _validar_opciones_csv(ruta: OrigenDatos, sep: str, encoding: str, compression: Optional[str],
+                          salida: str, detectar_numeros: bool, esquema: Optional[EsquemaCsv]) -> None:
+    """Valida los tipos de los parámetros propios de cargar_csv."""
+    if not isinstance(ruta, (str, Path)) and not es_buffer(ruta):
+        raise TypeError(
+            "El parámetro 'ruta' debe ser str o Path, "
+            "o un buffer binario (bytes, memoryview o flujo binario legible)"
+        )
+
     if not isinstance(sep, str):
         raise TypeError("El parámetro 'sep' debe ser str")
-    
+
     if not isinstance(encoding, str):
         raise TypeError("El parámetro 'encoding' debe ser str")
 
-    # Crear Path object y validar archivo
-    ruta_archivo = procesar_ruta(ruta)
-    
-    if not ruta_archivo.exists():
-        raise FileNotFoundError(f"El archivo '{ruta}' no existe.")
-    
-    if not ruta_archivo.is_file():
-        raise ValueError(f"La ruta '{ruta}' no es un archivo válido.")
+    if compression is not None and not isinstance(compression, str):
+        raise TypeError("El parámetro 'compression' debe ser str o None")
+
+    if not isinstance(detectar_numeros, bool):
+        raise TypeError("El parámetro 'detectar_numeros' debe ser bool")
+
+    if esquema is not None and not isinstance(esquema, EsquemaCsv):
+        raise TypeError("El parámetro 'esquema' debe ser EsquemaCsv o None")
+
+    if salida != 'pandas' and len(sep) != 1:
+        raise ValueError(
+            f"Con salida='{salida}' el separador debe ser de un solo carácter (recibido '{sep}'). "
+            f"Usa salida='pandas' para separadores de varios caracteres o expresiones regulares."
+        )
+
+
+def _comprobar_cabecera_csv(origen: Union[Path, BinaryIO], nombre: Union[str, Path], sep: str, encoding: str,
+                            compression: Optional[str], esquema: EsquemaCsv) -> None:
+    """Lee solo la cabecera y comprueba que tiene las columnas del esquema."""
+    try:
+        columnas = leer_cabecera(origen, sep, encoding, compression)
+    except Exception as e:
+        _traducir_error_csv(e, nombre, sep, encoding)
+    comprobar_cabecera(esquema, columnas, nombre)
+
+
+def _fragmentos_si_excede(origen: Union[Path, BinaryIO], nombre: Union[str, Path], sep: str, encoding: str,
+                          compression: Optional[str], limite_memoria: int, si_excede_memoria: str,
+                          salida: str, esquema: Optional[EsquemaCsv],
+                          formato_numerico: Optional[FormatoNumerico]) -> Optional[Any]:
+    """
+    Estima la memoria de la carga. Si cabe en limite_memoria devuelve None;
+    si no, devuelve los fragmentos (o lotes con salida='arrow') o lanza el
+    error, según si_excede_memoria.
+    """
+    estimacion = estimar_memoria_csv(origen, sep=sep, encoding=encoding, compression=compression)
+    if not supera_limite_memoria(estimacion, limite_memoria):
+        return None
+    if si_excede_memoria != 'fragmentos':
+        raise error_limite_memoria(estimacion, limite_memoria, nombre)
+    if salida == 'arrow':
+        # Bloques de CSV de una cuarta parte del límite, como los fragmentos
+        return _abrir_lotes_csv(origen, nombre, sep, encoding, compression,
+                                bytes_bloque=max(1, limite_memoria // 4), esquema=esquema,
+                                formato_numerico=formato_numerico)
+    filas = filas_por_fragmento(estimacion, limite_memoria)
+    return _iterar_fragmentos_csv(origen, nombre, sep, encoding, compression, filas, esquema, formato_numerico)
+
+
+def _leer_csv(origen: Union[Path, BinaryIO], sep: str, encoding: str, compression: Optional[str],
+              salida: str, progreso: Optional[CallbackProgreso], medidor: Optional[MedidorCarga],
+              esquema: Optional[EsquemaCsv], formato_numerico: Optional[FormatoNumerico]) -> Any:
+    """Lee el CSV completo con pandas o pyarrow.csv, en bloques si se pide progreso."""
+    if progreso is not None:
+        return _leer_csv_con_progreso(origen, sep, encoding, compression, salida,
+                                      progreso, medidor, esquema, formato_numerico)
+    if salida == 'arrow':
+        import pyarrow.csv as pv
+        lectura, parseo, conversion = _opciones_arrow_csv(sep, encoding, esquema=esquema,
+                                                          formato_numerico=formato_numerico)
+        with abrir_medido(origen, medidor) as entrada, medir_fase(medidor, 'lectura'):
+            return pv.read_csv(_entrada_arrow_csv(entrada, compression), read_options=lectura,
+                               parse_options=parseo, convert_options=conversion)
+    with abrir_medido(origen, medidor) as entrada, medir_fase(medidor, 'lectura'):
+        return pd.read_csv(entrada, sep=sep, encoding=encoding, compression=compression,
+                           **_opciones_pandas(esquema, formato_numerico))
+
+
+def _resolver_compresion(origen: Union[Path, BinaryIO], compression: Optional[str]) -> Optional[str]:
+    """
+    Resuelve compression='infer' a partir de la extensión de la ruta, para
+    leer el origen a través de un envoltorio que no la tiene.
+    """
+    if compression != 'infer':
+        return compression
+    return EXTENSIONES_COMPRESION.get(origen.suffix.lower()) if isinstance(origen, Path) else None
+
+
+def _leer_csv_con_progreso(origen: Union[Path, BinaryIO], sep: str, encoding: str,
+                           compression: Optional[str], salida: str,
+                           progreso: CallbackProgreso, medidor: Optional[MedidorCarga] = None,
+                           esquema: Optional[EsquemaCsv] = None,
+                           formato_numerico: Optional[FormatoNumerico] = None) -> Any:
+    """
+    Lee el CSV completo a través de un LectorConProgreso, en bloques, para
+    informar al callback de bytes y filas mientras avanza la carga.
+    """
+    # El lector envuelto no tiene extensión de la que inferir la compresión
+    compression = _resolver_compresion(origen, compression)
+
+    seguimiento = SeguimientoProgreso(progreso, tamano_origen(origen))
+    with abrir_con_progreso(origen, seguimiento, medidor) as lector, medir_fase(medidor, 'lectura'):
+        if salida == 'arrow':
+            import pyarrow as pa
+            import pyarrow.csv as pv
+            lectura, parseo, conversion = _opciones_arrow_csv(sep, encoding, esquema=esquema,
+                                                              formato_numerico=formato_numerico)
+            lector_lotes = pv.open_csv(pa.input_stream(lector, compression=compression),
+                                       read_options=lectura, parse_options=parseo,
+                                       convert_options=conversion)
+            lotes = []
+            for lote in lector_lotes:
+                lotes.append(lote)
+                seguimiento.avanzar(filas=lote.num_rows)
+            resultado = pa.Table.from_batches(lotes, schema=lector_lotes.schema)
+        else:
+            fragmentos = []
+            with pd.read_csv(lector, sep=sep, encoding=encoding, compression=compression,
+                             chunksize=FILAS_BLOQUE_PROGRESO,
+                             **_opciones_pandas(esquema, formato_numerico)) as lector_csv:
+                for fragmento in lector_csv:
+                    fragmentos.append(fragmento)
+                    seguimiento.avanzar(filas=len(fragmento))
+            resultado = pd.concat(fragmentos) if len(fragmentos) > 1 else fragmentos[0]
+
+    seguimiento.terminar()
+    return resultado
+
+
+def _opciones_arrow_csv(sep: str, encoding: str, bytes_bloque: Optional[int] = None,
+                        esquema: Optional[EsquemaCsv] = None,
+                        formato_numerico: Optional[FormatoNumerico] = None) -> Any:
+    """
+    Construye las opciones de lectura, parseo y conversión de pyarrow.csv
+    equivalentes a sep, encoding, el esquema y el separador decimal.
+    """
+    import pyarrow.csv as pv
+    lectura = pv.ReadOptions(encoding=encoding)
+    if bytes_bloque is not None:
+        lectura.block_size = bytes_bloque
+    conversion = esquema.opciones_arrow() if esquema is not None else pv.ConvertOptions()
+    if formato_numerico is not None:
+        conversion.decimal_point = formato_numerico.decimal
+    return lectura, pv.ParseOptions(delimiter=sep), conversion
+
 
+def _opciones_pandas(esquema: Optional[EsquemaCsv],
+                     formato_numerico: Optional[FormatoNumerico] = None) -> Dict[str, Any]:
+    """Parámetros de pd.read_csv del esquema y del formato de los números."""
+    opciones = esquema.opciones_pandas() if esquema is not None else {}
+    if formato_numerico is not None:
+        opciones['decimal'] = formato_numerico.decimal
+        opciones['thousands'] = formato_numerico.miles
+    return opciones
+
+
+def _procesar_resultado(resultado: Any, nombre: Union[str, Path], salida: str, esquema: Optional[EsquemaCsv],
+                        detectar_fechas: bool, dia_primero: Optional[bool],
+                        formato_numerico: Optional[FormatoNumerico], detectar_numeros: bool) -> Any:
+    """
+    Comprueba que la carga completa no está vacía ni incumple las fechas
+    del esquema y convierte las columnas de fechas y números.
+    """
+    vacio = es_tabla_vacia(resultado) if salida == 'arrow' else resultado.empty
+    if vacio:
+        raise ValueError(f"El archivo '{nombre}' está vacío o no contiene datos válidos.")
+    if esquema is not None and salida == 'pandas':
+        comprobar_fechas(esquema, resultado, nombre)
+    return _convertir_columnas(resultado, salida, detectar_fechas and esquema is None, dia_primero,
+                               formato_numerico, detectar_numeros)
+
+
+def _convertir_columnas(resultado: Any, salida: str, detectar_fechas: bool, dia_primero: Optional[bool],
+                        formato_numerico: Optional[FormatoNumerico], detectar_numeros: bool) -> Any:
+    """Convierte las columnas de texto con fechas o números regionales tras la lectura."""
+    arrow = salida == 'arrow'
+    if detectar_fechas:
+        resultado, _ = (convertir_fechas_arrow if arrow else convertir_fechas)(resultado, dia_primero)
+
+    # pyarrow.csv no admite separador de miles: esas columnas llegan como texto
+    miles_en_arrow = arrow and formato_numerico is not None and formato_numerico.miles is not None
+    if detectar_numeros or miles_en_arrow:
+        resultado, _ = (convertir_numeros_arrow if arrow else convertir_numeros)(resultado, formato_numerico)
+    return resultado
+
+
+def _entrada_arrow_csv(origen: Union[Path, BinaryIO], compression: Optional[str]) -> Any:
+    """
+    Abre el origen como flujo de entrada de pyarrow, descomprimiéndolo si
+    hace falta. Con 'infer' la compresión se deduce de la extensión de la
+    ruta, igual que en pandas.
+    """
+    import pyarrow as pa
+    if isinstance(origen, Path):
+        compresion = 'detect' if compression == 'infer' else compression
+        return pa.input_stream(str(origen), compression=compresion)
+    compresion = None if compression == 'infer' else compression
+    return pa.input_stream(buffer_arrow(origen), compression=compresion)
+
+
+def _abrir_lotes_csv(origen: Union[Path, BinaryIO], ruta: Union[str, Path], sep: str, encoding: str,
+                     compression: Optional[str], bytes_bloque: Optional[int] = None,
+                     esquema: Optional[EsquemaCsv] = None,
+                     formato_numerico: Optional[FormatoNumerico] = None) -> Any:
+    """
+    Abre el CSV como pyarrow.RecordBatchReader. La cabecera y el primer
+    bloque se leen al abrir, de modo que los errores de formato se traducen
+    aquí; los de bloques posteriores los lanza pyarrow al iterar.
+    """
     try:
-        df = pd.read_csv(ruta_archivo, sep=sep, encoding=encoding)
-    except pd.errors.EmptyDataError:
+        import pyarrow.csv as pv
+        lectura, parseo, conversion = _opciones_arrow_csv(sep, encoding, bytes_bloque, esquema, formato_numerico)
+        return pv.open_csv(_entrada_arrow_csv(origen, compression), read_options=lectura,
+                           parse_options=parseo, convert_options=conversion)
+    except Exception as e:
+        _traducir_error_csv(e, ruta, sep, encoding, esquema)
+
+
+def _iterar_fragmentos_csv(origen: Union[Path, BinaryIO], ruta: Union[str, Path], sep: str,
+                           encoding: str, compression: Optional[str],
+                           filas: int, esquema: Optional[EsquemaCsv] = None,
+                           formato_numerico: Optional[FormatoNumerico] = None) -> Iterator[pd.DataFrame]:
+    """
+    Lee el CSV en fragmentos de `filas` filas, traduciendo los errores
+    igual que la carga completa.
+    """
+    try:
+        with pd.read_csv(origen, sep=sep, encoding=encoding, compression=compression,
+                         chunksize=filas, **_opciones_pandas(esquema, formato_numerico)) as lector:
+            for fragmento in lector:
+                yield fragmento
+    except Exception as e:
+        _traducir_error_csv(e, ruta, sep, encoding, esquema)
+
+
+def _traducir_error_csv(e: Exception, ruta: Union[str, Path], sep: str, encoding: str,
+                        esquema: Optional[EsquemaCsv] = None) -> NoReturn:
+    """
+    Convierte las excepciones de pandas al leer un CSV en errores informativos.
+
+    Las excepciones que no se reconocen se registran y se re-lanzan
+    mediante manejar_excepcion_inesperada.
+    """
+    if esquema is not None and es_error_de_conversion(e):
+        raise error_conversion(e, ruta)
+    if isinstance(e, pd.errors.EmptyDataError):
         raise ValueError(f"El archivo '{ruta}' está vacío o no contiene datos válidos.")
-    except (UnicodeDecodeError, UnicodeError) as e:
+    elif isinstance(e, (UnicodeDecodeError, UnicodeError)):
         raise ValueError(
             f"Error de codificación al leer el archivo '{ruta}'. "
             f"Intenta con un encoding diferente. "
             f"Error: {str(e)}"
         )
-    except LookupError as e:
+    elif isinstance(e, LookupError):
         # Encoding inexistente
         raise ValueError(
             f"La codificación '{encoding}' no es válida o no está disponible. "
             f"Error: {str(e)}"
         )
-    except pd.errors.ParserError as e:
+    elif isinstance(e, pd.errors.ParserError):
         raise ValueError(
             f"No se pudo parsear el archivo '{ruta}'. "
             f"Revisa el separador ('{sep}') o el contenido del archivo. "
             f"Error: {str(e)}"
         )
-    except (PermissionError, OSError, IOError) as e:
+    elif isinstance(e, (PermissionError, OSError, IOError)):
         raise ValueError(
             f"No tienes permisos para leer el archivo '{ruta}'. "
             f"Error: {str(e)}"
         )
-    except MemoryError as e:
+    elif isinstance(e, MemoryError):
         raise ValueError(
             f"El archivo '{ruta}' es demasiado grande para cargar en memoria. "
             f"Error: {str(e)}"
         )
-    except Exception as e:
-        # Manejar excepciones específicas conocidas de pandas/CSV
-        # Convertir a errores informativos, re-lanzar las inesperadas
-        exception_name = type(e).__name__
-        error_msg = str(e).lower()
-        
-        # Excepciones específicas de pandas que podemos manejar
-        if exception_name == 'ParserError' or "parse" in error_msg or "separator" in error_msg:
-            raise ValueError(
-                f"Error al parsear el archivo '{ruta}'. "
-                f"Verifica el separador o formato del archivo. "
-                f"Error: {str(e)}"
-            )
-        elif exception_name == 'EmptyDataError' or "empty" in error_msg:
-            raise ValueError(
-                f"El archivo '{ruta}' está vacío o no contiene datos válidos. "
-                f"Error: {str(e)}"
-            )
-        elif "not found" in error_msg or "does not exist" in error_msg:
-            raise FileNotFoundError(f"El archivo '{ruta}' no existe.")
-        else:
-            # Excepción inesperada - usar función utilitaria centralizada
-            manejar_excepcion_inesperada(e, 'cargar_csv')
 
-    if df.empty:
-        raise ValueError(f"El archivo '{ruta}' está vacío o no contiene datos válidos.")
+    _traducir_error_por_mensaje_csv(e, ruta)
+
+
+def _traducir_error_por_mensaje_csv(e: Exception, ruta: Union[str, Path]) -> NoReturn:
+    """Convierte las excepciones de pyarrow.csv y de pandas que solo se reconocen por su nombre y mensaje."""
+    # Manejar excepciones específicas conocidas de pandas/CSV
+    # Convertir a errores informativos, re-lanzar las inesperadas
+    exception_name = type(e).__name__
+    error_msg = str(e).lower()
+
+    # Errores de pyarrow.csv (salida='arrow' o 'lotes')
+    if exception_name == 'ArrowInvalid' and "utf8" in error_msg:
+        raise ValueError(
+            f"Error de codificación al leer el archivo '{ruta}'. "
+            f"Intenta con un encoding diferente. "
+            f"Error: {str(e)}"
+        )
 
-    return df 
\ No newline at end of file
+    # Excepciones específicas de pandas que podemos manejar
+    if exception_name == 'ParserError' or "parse" in error_msg or "separator" in error_msg:
+        raise ValueError(
+            f"Error al parsear el archivo '{ruta}'. "
+            f"Verifica el separador o formato del archivo. "
+            f"Error: {str(e)}"
+        )
+    elif exception_name == 'EmptyDataError' or "empty" in error_msg:
+        raise ValueError(
+            f"El archivo '{ruta}' está vacío o no contiene datos válidos. "
+            f"Error: {str(e)}"
+        )
+    elif "not found" in error_msg or "does not exist" in error_msg:
+        raise FileNotFoundError(f"El archivo '{ruta}' no existe.")
+    else:
+        # Excepción inesperada - usar función utilitaria centralizada
+        manejar_excepcion_inesperada(e, 'cargar_csv')
@@ -0,0 +1,256 @@
+"""
+Módulo para cargar archivos Feather / Arrow IPC.
+
+Este módulo contiene funciones específicas para la carga de archivos
+Feather y Arrow IPC (.arrow, .feather, .ipc) mapeados en memoria, con
+manejo robusto de errores y validación de tipos.
+"""
+
+import pandas as pd
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, List, Literal, NoReturn, Optional, Union
+from .utils import (
+    manejar_excepcion_inesperada, validar_limite_memoria, validar_salida, validar_progreso, es_buffer,
+    validar_devolver_estadisticas, resolver_origen, abrir_tabla_arrow, abrir_lotes_arrow, es_tabla_vacia,
+    OrigenDatos, ResultadoCarga
+)
+from .memoria import (
+    estimar_memoria_feather, supera_limite_memoria, error_limite_memoria, filas_por_fragmento
+)
+from .progreso import SeguimientoProgreso, CallbackProgreso, tamano_origen
+from .estadisticas import MedidorCarga, medir_fase, medir_memoria, con_estadisticas
+from .hooks import trazar
+
+
+@trazar
+def cargar_feather(ruta: OrigenDatos, columns: Optional[List[str]] = None,
+                   limite_memoria: Optional[int] = None,
+                   si_excede_memoria: Literal['error', 'fragmentos'] = 'error',
+                   salida: Literal['pandas', 'arrow', 'lotes'] = 'pandas',
+                   progreso: Optional[CallbackProgreso] = None,
+                   devolver_estadisticas: bool = False
+                   ) -> ResultadoCarga:
+    """
+    Carga un archivo Feather o Arrow IPC y lo devuelve como DataFrame.
+
+    El archivo se mapea en memoria (pyarrow.memory_map) y se lee sin
+    deserializarlo: si no está comprimido, las columnas Arrow apuntan
+    directamente al archivo y solo se copian al construir el DataFrame.
+    Acepta Feather V2 / formato de archivo IPC, formato de flujo IPC y
+    Feather V1.
+
+    Parámetros:
+    ----------
+    ruta : OrigenDatos
+        Ruta (str o Path), bytes, memoryview o flujo binario legible
+        (io.BytesIO, archivo abierto en 'rb'...) del archivo que se quiere cargar.
+        Los buffers en memoria se leen sin copia mediante pyarrow.BufferReader.
+    columns : Optional[List[str]], opcional
+        Lista de nombres de columnas específicas a cargar. Si es None, carga todas las columnas.
+    limite_memoria : Optional[int], opcional
+        Presupuesto de memoria en bytes. Si se indica, antes de construir
+        el DataFrame se estima la memoria a partir del tamaño sin comprimir
+        de los buffers Arrow que figura en los metadatos de cada lote, sin
+        descomprimir los datos. Por defecto es None (sin límite).
+    si_excede_memoria : str, opcional
+        Qué hacer si la estimación supera limite_memoria: 'error' lanza
+        ValueError sin llegar a cargar; 'fragmentos' devuelve un iterador
+        de DataFrames dimensionados para caber en el límite, leyendo y
+        descomprimiendo cada lote del archivo al llegar a él.
+        Por defecto es 'error'.
+    salida : str, opcional
+        Tipo de resultado: 'pandas' (DataFrame), 'arrow' (pyarrow.Table) o
+        'lotes' (pyarrow.RecordBatchReader). Con 'arrow' y 'lotes' la tabla
+        sigue apuntando al archivo mapeado, sin ninguna copia.
+        Por defecto es 'pandas'.
+    progreso : Optional[Callable[[ProgresoCarga], None]], opcional
+        Función a la que se informa de la carga. Como el archivo se mapea
+        en memoria no hay lectura progresiva: se recibe un único aviso
+        final con el tamaño del archivo y las filas. Se admite para que
+        todos los cargadores acepten los mismos parámetros.
+        Por defecto es None.
+    devolver_estadisticas : bool, opcional
+        Si es True, devuelve una tupla (resultado, EstadisticasCarga). Al
+        estar mapeado, la E/S ocurre como fallos de página durante la
+        conversión: segundos_io es 0 y bytes_leidos el tamaño del archivo.
+        Por defecto es False.
+
+    Retorna:
+    -------
+    ResultadoCarga
+        El contenido del archivo como DataFrame, o un iterador de fragmentos
+        si se superó limite_memoria con si_excede_memoria='fragmentos'.
+        Con salida='arrow' una pyarrow.Table (o un RecordBatchReader si se
+        superó el límite con 'fragmentos') y con salida='lotes' un
+        RecordBatchReader, que no se comprueba contra limite_memoria.
+        Con devolver_estadisticas una tupla (resultado, EstadisticasCarga).
+
+    Errores:
+    -------
+    - Lanza FileNotFoundError si el archivo no existe.
+    - Lanza ValueError si el archivo no es un Arrow IPC/Feather válido, las
+      columnas especificadas no existen, hay problemas de permisos, memoria
+      insuficiente (real o estimada) o el archivo está vacío.
+    - Lanza TypeError si los parámetros no son del tipo correcto.
+
+    Ejemplos:
+    --------
+    >>> df = cargar_feather("etapa_1.feather")
+    >>> df = cargar_feather("etapa_1.arrow", columns=["id", "importe"])
+    >>> df = cargar_feather(io.BytesIO(contenido))  # se lee sin copiar el buffer
+    >>> tabla = cargar_feather("etapa_1.arrow", salida="arrow")  # sin copias
+    """
+    # Validar tipos de entrada
+    if not isinstance(ruta, (str, Path)) and not es_buffer(ruta):
+        raise TypeError(
+            "El parámetro 'ruta' debe ser str o Path, "
+            "o un buffer binario (bytes, memoryview o flujo binario legible)"
+        )
+
+    if columns is not None and not isinstance(columns, list):
+        raise TypeError("El parámetro 'columns' debe ser lista o None")
+
+    if columns is not None and not all(isinstance(col, str) for col in columns):
+        raise TypeError("Todos los elementos de 'columns' deben ser strings")
+
+    validar_limite_memoria(limite_memoria, si_excede_memoria)
+    validar_salida(salida)
+    validar_progreso(progreso)
+    validar_devolver_estadisticas(devolver_estadisticas)
+
+    medidor = MedidorCarga('pyarrow.ipc') if devolver_estadisticas else None
+
+    # Validar la ruta o preparar el buffer en memoria
+    with medir_fase(medidor, 'validacion'):
+        origen, nombre = resolver_origen(ruta)
+
+    if salida == 'lotes':
+        return con_estadisticas(_abrir_lotes_feather(origen, nombre, columns), medidor)
+
+    # Comprobar el presupuesto de memoria antes de construir el DataFrame
+    if limite_memoria is not None:
+        estimacion = estimar_memoria_feather(origen, columns=columns)
+        if supera_limite_memoria(estimacion, limite_memoria):
+            if si_excede_memoria == 'fragmentos':
+                filas = filas_por_fragmento(estimacion, limite_memoria)
+                if salida == 'arrow':
+                    return con_estadisticas(_abrir_lotes_feather(origen, nombre, columns, filas), medidor)
+                return con_estadisticas(_iterar_fragmentos_feather(origen, nombre, columns, filas), medidor)
+            raise error_limite_memoria(estimacion, limite_memoria, nombre)
+
+    seguimiento = None if progreso is None else SeguimientoProgreso(progreso, tamano_origen(origen))
+
+    with medir_memoria(medidor):
+        try:
+            with medir_fase(medidor, 'lectura'):
+                tabla = _leer_tabla(origen, columns)
+            with medir_fase(medidor, 'conversion'):
+                # split_blocks evita consolidar columnas en bloques 2D (una copia más)
+                resultado = tabla if salida == 'arrow' else tabla.to_pandas(split_blocks=True)
+        except Exception as e:
+            _traducir_error_feather(e, nombre, columns)
+
+    vacio = es_tabla_vacia(resultado) if salida == 'arrow' else resultado.empty
+    if vacio:
+        raise ValueError(f"El archivo '{nombre}' está vacío o no contiene datos válidos.")
+
+    if seguimiento is not None:
+        seguimiento.avanzar(bytes_leidos=seguimiento.bytes_totales or 0)
+        seguimiento.terminar(filas=tabla.num_rows)
+
+    if medidor is not None:
+        medidor.bytes_leidos = tamano_origen(origen) or 0
+
+    return con_estadisticas(resultado, medidor)
+
+
+def _leer_tabla(origen: Union[Path, BinaryIO], columns: Optional[List[str]]) -> Any:
+    """
+    Abre el archivo como pyarrow.Table y selecciona las columnas pedidas
+    (la selección no copia datos).
+    """
+    tabla = abrir_tabla_arrow(origen)
+    if columns is not None:
+        tabla = tabla.select(columns)
+    return tabla
+
+
+def _abrir_lotes_feather(origen: Union[Path, BinaryIO], ruta: Union[str, Path],
+                         columns: Optional[List[str]], filas: Optional[int] = None) -> Any:
+    """
+    Expone el archivo como pyarrow.RecordBatchReader de como máximo
+    `filas` filas por lote. Los lotes del archivo se leen (y descomprimen)
+    de uno en uno al pedirlos.
+    """
+    try:
+        return abrir_lotes_arrow(origen, columns, filas)
+    except Exception as e:
+        _traducir_error_feather(e, ruta, columns)
+
+
+def _iterar_fragmentos_feather(origen: Union[Path, BinaryIO], ruta: Union[str, Path],
+                               columns: Optional[List[str]], filas: int) -> Iterator[pd.DataFrame]:
+    """
+    Convierte el archivo a DataFrames de como máximo `filas` filas. Cada
+    lote del archivo se lee y descomprime al llegar a él, así que solo el
+    lote en curso y su fragmento ocupan memoria propia, también en los
+    archivos comprimidos con LZ4 (lo que escribe DataFrame.to_feather).
+    """
+    try:
+        for lote in abrir_lotes_arrow(origen, columns, filas):
+            yield lote.to_pandas(split_blocks=True)
+    except Exception as e:
+        _traducir_error_feather(e, ruta, columns)
+
+
+def _traducir_error_feather(e: Exception, ruta: Union[str, Path],
+                            columns: Optional[List[str]]) -> NoReturn:
+    """
+    Convierte las excepciones de pyarrow al leer un Arrow IPC/Feather en
+    errores informativos.
+
+    Las excepciones que no se reconocen se registran y se re-lanzan
+    mediante manejar_excepcion_inesperada.
+    """
+    if isinstance(e, ImportError):
+        raise ValueError(
+            f"No se pudo importar la librería necesaria para leer archivos Feather/Arrow. "
+            f"Instala 'pyarrow' con: pip install pyarrow. "
+            f"Error: {str(e)}"
+        )
+    elif isinstance(e, MemoryError):
+        raise ValueError(
+            f"El archivo '{ruta}' es demasiado grande para cargar en memoria. "
+            f"Error: {str(e)}"
+        )
+    elif isinstance(e, KeyError):
+        # pyarrow.Table.select con una columna inexistente
+        raise ValueError(
+            f"Una o más columnas especificadas no existen en el archivo '{ruta}'. "
+            f"Columnas solicitadas: {columns}. "
+            f"Error: {str(e)}"
+        )
+    elif isinstance(e, (PermissionError, OSError, IOError)):
+        raise ValueError(
+            f"No tienes permisos para leer el archivo '{ruta}'. "
+            f"Error: {str(e)}"
+        )
+
+    # Manejar excepciones específicas conocidas de pyarrow
+    # Convertir a errores informativos, re-lanzar las inesperadas
+    exception_name = type(e).__name__
+    error_msg = str(e).lower()
+
+    if "file is too small: 0" in error_msg or "was null or length 0" in error_msg:
+        raise ValueError(
+            f"El archivo '{ruta}' está vacío o no contiene datos válidos. "
+            f"Error: {str(e)}"
+        )
+    elif exception_name == 'ArrowInvalid':
+        raise ValueError(
+            f"El archivo '{ruta}' no es un archivo Arrow IPC/Feather válido. "
+            f"Error: {str(e)}"
+        )
+    else:
+        # Excepción inesperada - usar función utilitaria centralizada
+        manejar_excepcion_inesperada(e, 'cargar_feather')
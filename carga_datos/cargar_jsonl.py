@@ -0,0 +1,362 @@
+"""
+Módulo para cargar archivos JSON Lines.
+
+Este módulo contiene funciones específicas para la carga de archivos JSON
+Lines / NDJSON (.jsonl, .ndjson), con un objeto JSON por línea, como las
+exportaciones de eventos de los servicios. El parseo lo hace pyarrow.json
+en paralelo sobre bloques alineados a salto de línea, y las columnas que
+no se piden (también los campos anidados) no se llegan a construir.
+"""
+
+import itertools
+import pandas as pd
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Literal, NoReturn, Optional, Union
+from .utils import (
+    manejar_excepcion_inesperada, validar_limite_memoria, validar_salida, validar_progreso, es_buffer,
+    validar_devolver_estadisticas, resolver_origen, buffer_arrow, es_tabla_vacia, leer_muestra_lineas,
+    OrigenDatos, ResultadoCarga
+)
+from .memoria import (
+    estimar_memoria_jsonl, supera_limite_memoria, error_limite_memoria, filas_por_fragmento,
+    BYTES_MUESTRA_CSV
+)
+from .progreso import SeguimientoProgreso, CallbackProgreso, abrir_con_progreso, tamano_origen
+from .estadisticas import MedidorCarga, medir_fase, medir_memoria, abrir_medido, con_estadisticas
+from .hooks import trazar
+
+
+# Bytes de cada bloque que se lee y parsea de una vez al iterar por lotes;
+# pyarrow.json lo reparte entre sus hilos en sub-bloques de 1 MB
+BYTES_BLOQUE_JSON: int = 16 * 1024 * 1024
+
+
+@trazar
+def cargar_jsonl(ruta: OrigenDatos, columns: Optional[List[str]] = None,
+                 limite_memoria: Optional[int] = None,
+                 si_excede_memoria: Literal['error', 'fragmentos'] = 'error',
+                 salida: Literal['pandas', 'arrow', 'lotes'] = 'pandas',
+                 progreso: Optional[CallbackProgreso] = None,
+                 devolver_estadisticas: bool = False
+                 ) -> ResultadoCarga:
+    """
+    Carga un archivo JSON Lines (un objeto JSON por línea) y lo devuelve
+    como DataFrame.
+
+    El archivo se parsea con pyarrow.json, que reparte bloques alineados a
+    salto de línea entre varios hilos. Los objetos anidados quedan como
+    columnas de tipo struct (dict en pandas) y las listas como listas.
+
+    Parámetros:
+    ----------
+    ruta : OrigenDatos
+        Ruta (str o Path), bytes, memoryview o flujo binario legible
+        (io.BytesIO, archivo abierto en 'rb'...) del archivo que se quiere cargar.
+    columns : Optional[List[str]], opcional
+        Columnas que se cargan. Los campos anidados se indican con puntos
+        ('usuario.id'): del struct solo se construyen los campos pedidos.
+        El resto de campos se descartan al parsear, sin llegar a
+        construirse. Los tipos de las columnas pedidas se deducen de las
+        primeras líneas del archivo. Si es None, carga todas las columnas.
+    limite_memoria : Optional[int], opcional
+        Presupuesto de memoria en bytes. Si se indica, antes de cargar se
+        estima la memoria a partir de una muestra del principio del archivo.
+        Por defecto es None (sin límite).
+    si_excede_memoria : str, opcional
+        Qué hacer si la estimación supera limite_memoria: 'error' lanza
+        ValueError sin llegar a cargar; 'fragmentos' devuelve un iterador
+        de DataFrames dimensionados para caber en el límite.
+        Por defecto es 'error'.
+    salida : str, opcional
+        Tipo de resultado: 'pandas' (DataFrame), 'arrow' (pyarrow.Table) o
+        'lotes' (pyarrow.RecordBatchReader). Con 'lotes' y con fragmentos el
+        archivo se lee por bloques de BYTES_BLOQUE_JSON bytes y los tipos se
+        deducen del primero. Por defecto es 'pandas'.
+    progreso : Optional[Callable[[ProgresoCarga], None]], opcional
+        Función a la que se informa de la carga tras cada bloque.
+        Por defecto es None.
+    devolver_estadisticas : bool, opcional
+        Si es True, devuelve una tupla (resultado, EstadisticasCarga).
+        Por defecto es False.
+
+    Retorna:
+    -------
+    ResultadoCarga
+        El contenido del archivo como DataFrame, o un iterador de fragmentos
+        si se superó limite_memoria con si_excede_memoria='fragmentos'.
+        Con salida='arrow' una pyarrow.Table (o un RecordBatchReader si se
+        superó el límite con 'fragmentos') y con salida='lotes' un
+        RecordBatchReader, que no se comprueba contra limite_memoria.
+        Con devolver_estadisticas una tupla (resultado, EstadisticasCarga).
+
+    Errores:
+    -------
+    - Lanza FileNotFoundError si el archivo no existe.
+    - Lanza ValueError si el archivo no es JSON Lines válido, una columna
+      cambia de tipo entre líneas, las columnas especificadas no existen,
+      hay problemas de permisos, memoria insuficiente (real o estimada) o el
+      archivo está vacío.
+    - Lanza TypeError si los parámetros no son del tipo correcto.
+
+    Ejemplos:
+    --------
+    >>> df = cargar_jsonl("eventos.jsonl")
+    >>> df = cargar_jsonl("eventos.ndjson", columns=["tipo", "usuario.id"])
+    >>> for lote in cargar_jsonl("eventos.jsonl", salida="lotes"):
+    ...     procesar(lote)
+    """
+    # Validar tipos de entrada
+    if not isinstance(ruta, (str, Path)) and not es_buffer(ruta):
+        raise TypeError(
+            "El parámetro 'ruta' debe ser str o Path, "
+            "o un buffer binario (bytes, memoryview o flujo binario legible)"
+        )
+
+    if columns is not None and not isinstance(columns, list):
+        raise TypeError("El parámetro 'columns' debe ser lista o None")
+
+    if columns is not None and not all(isinstance(col, str) for col in columns):
+        raise TypeError("Todos los elementos de 'columns' deben ser strings")
+
+    validar_limite_memoria(limite_memoria, si_excede_memoria)
+    validar_salida(salida)
+    validar_progreso(progreso)
+    validar_devolver_estadisticas(devolver_estadisticas)
+
+    medidor = MedidorCarga('pyarrow.json') if devolver_estadisticas else None
+
+    # Validar la ruta o preparar el buffer en memoria
+    with medir_fase(medidor, 'validacion'):
+        origen, nombre = resolver_origen(ruta)
+        esquema = None if columns is None else _esquema_proyectado(origen, nombre, columns)
+
+    seguimiento = None if progreso is None else SeguimientoProgreso(progreso, tamano_origen(origen))
+
+    if salida == 'lotes':
+        return con_estadisticas(_abrir_lotes_json(origen, nombre, esquema, BYTES_BLOQUE_JSON, seguimiento),
+                                medidor)
+
+    # Comprobar el presupuesto de memoria antes de cargar
+    if limite_memoria is not None:
+        estimacion = estimar_memoria_jsonl(origen, esquema)
+        if supera_limite_memoria(estimacion, limite_memoria):
+            if si_excede_memoria == 'fragmentos':
+                # Bloques de JSON de una cuarta parte del límite, como los fragmentos
+                lotes = _abrir_lotes_json(origen, nombre, esquema, max(1, limite_memoria // 4), seguimiento)
+                if salida == 'arrow':
+                    return con_estadisticas(lotes, medidor)
+                filas = filas_por_fragmento(estimacion, limite_memoria)
+                return con_estadisticas(_iterar_fragmentos_json(lotes, filas), medidor)
+            raise error_limite_memoria(estimacion, limite_memoria, nombre)
+
+    with medir_memoria(medidor):
+        if seguimiento is not None:
+            # Por bloques, para avisar al callback tras cada uno
+            with medir_fase(medidor, 'lectura'):
+                tabla = _abrir_lotes_json(origen, nombre, esquema, BYTES_BLOQUE_JSON, seguimiento,
+                                          medidor).read_all()
+        else:
+            try:
+                import pyarrow.json as pj
+                with abrir_medido(origen, medidor) as entrada, medir_fase(medidor, 'lectura'):
+                    tabla = pj.read_json(buffer_arrow(entrada), parse_options=_opciones_parseo(esquema))
+            except Exception as e:
+                _traducir_error_jsonl(e, nombre, columns)
+        with medir_fase(medidor, 'conversion'):
+            resultado = tabla if salida == 'arrow' else tabla.to_pandas(split_blocks=True)
+
+    vacio = es_tabla_vacia(resultado) if salida == 'arrow' else resultado.empty
+    if vacio:
+        raise ValueError(f"El archivo '{nombre}' está vacío o no contiene datos válidos.")
+
+    return con_estadisticas(resultado, medidor)
+
+
+def _opciones_parseo(esquema: Optional[Any]) -> Any:
+    """
+    Opciones de pyarrow.json: con esquema, los campos que no están en él se
+    descartan al parsear; sin esquema se infieren todos.
+    """
+    import pyarrow.json as pj
+    if esquema is None:
+        return pj.ParseOptions()
+    return pj.ParseOptions(explicit_schema=esquema, unexpected_field_behavior='ignore')
+
+
+def _esquema_proyectado(origen: Union[Path, BinaryIO], ruta: Union[str, Path], columns: List[str]) -> Any:
+    """
+    Deduce el esquema de las primeras líneas y lo reduce a las columnas
+    pedidas, bajando por los struct en las columnas con puntos.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.json as pj
+        muestra = leer_muestra_lineas(origen, BYTES_MUESTRA_CSV)
+        esquema = pj.read_json(pa.BufferReader(muestra)).schema
+    except Exception as e:
+        _traducir_error_jsonl(e, ruta, columns)
+
+    try:
+        return pa.schema(_proyectar_campos(list(esquema), [columna.split('.') for columna in columns]))
+    except KeyError as e:
+        _traducir_error_jsonl(e, ruta, columns)
+
+
+def _proyectar_campos(campos: List[Any], rutas: List[List[str]]) -> List[Any]:
+    """
+    Devuelve los campos pedidos, en el orden en que se piden. Una ruta de
+    un solo nombre toma el campo entero; una más larga toma solo esa parte
+    del struct.
+    """
+    import pyarrow as pa
+
+    por_nombre = {campo.name: campo for campo in campos}
+    subrutas: Dict[str, Optional[List[List[str]]]] = {}
+    for ruta in rutas:
+        if ruta[0] not in por_nombre:
+            raise KeyError('.'.join(ruta))
+        if len(ruta) == 1:
+            subrutas[ruta[0]] = None
+        elif subrutas.get(ruta[0], []) is not None:
+            if not pa.types.is_struct(por_nombre[ruta[0]].type):
+                raise KeyError('.'.join(ruta))
+            subrutas.setdefault(ruta[0], []).append(ruta[1:])
+
+    proyectados = []
+    for nombre, resto in subrutas.items():
+        campo = por_nombre[nombre]
+        if resto is not None:
+            campo = campo.with_type(pa.struct(_proyectar_campos(list(campo.type), resto)))
+        proyectados.append(campo)
+    return proyectados
+
+
+def _bloques_de_lineas(lector: BinaryIO, bytes_bloque: int) -> Iterator[bytes]:
+    """
+    Lee el flujo en bloques de unos bytes_bloque bytes que terminan en un
+    salto de línea. Una línea más larga que el bloque se alarga hasta su
+    final.
+    """
+    resto = b''
+    while True:
+        trozo = lector.read(bytes_bloque)
+        if not trozo:
+            if resto.strip():
+                yield resto
+            return
+        datos = resto + trozo
+        corte = datos.rfind(b'\n')
+        if corte < 0:
+            resto = datos
+            continue
+        yield datos[:corte + 1]
+        resto = datos[corte + 1:]
+
+
+def _abrir_lotes_json(origen: Union[Path, BinaryIO], ruta: Union[str, Path], esquema: Optional[Any],
+                      bytes_bloque: int, seguimiento: Optional[SeguimientoProgreso] = None,
+                      medidor: Optional[MedidorCarga] = None) -> Any:
+    """
+    Abre el archivo como pyarrow.RecordBatchReader que parsea un bloque
+    alineado a salto de línea cada vez. El primer bloque se parsea al abrir
+    para conocer el esquema, que se impone a los siguientes; así los
+    errores del primero se traducen aquí y los de los siguientes al iterar.
+    """
+    import pyarrow as pa
+
+    lector = abrir_con_progreso(origen, seguimiento, medidor)
+    tablas = _iterar_tablas_json(lector, ruta, esquema, bytes_bloque, seguimiento)
+    try:
+        primera = next(tablas)
+    except StopIteration:
+        lector.close()
+        raise ValueError(f"El archivo '{ruta}' está vacío o no contiene datos válidos.")
+    lotes = itertools.chain.from_iterable(tabla.to_batches() for tabla in itertools.chain([primera], tablas))
+    return pa.RecordBatchReader.from_batches(primera.schema, lotes)
+
+
+def _iterar_tablas_json(lector: BinaryIO, ruta: Union[str, Path], esquema: Optional[Any],
+                        bytes_bloque: int, seguimiento: Optional[SeguimientoProgreso]) -> Iterator[Any]:
+    """Parsea cada bloque de líneas como pyarrow.Table con el esquema del primero."""
+    import pyarrow as pa
+    import pyarrow.json as pj
+
+    filas = 0
+    with lector:
+        try:
+            for bloque in _bloques_de_lineas(lector, bytes_bloque):
+                tabla = pj.read_json(pa.BufferReader(bloque), parse_options=_opciones_parseo(esquema))
+                esquema = tabla.schema
+                filas += tabla.num_rows
+                if seguimiento is not None:
+                    seguimiento.avanzar(filas=tabla.num_rows)
+                yield tabla
+        except Exception as e:
+            _traducir_error_jsonl(e, ruta, None)
+
+    if seguimiento is not None:
+        seguimiento.terminar(filas=filas)
+
+
+def _iterar_fragmentos_json(lotes: Any, filas: int) -> Iterator[pd.DataFrame]:
+    """Convierte los lotes a DataFrames de como máximo `filas` filas."""
+    for lote in lotes:
+        for desde in range(0, lote.num_rows, filas):
+            yield lote.slice(desde, filas).to_pandas(split_blocks=True)
+
+
+def _traducir_error_jsonl(e: Exception, ruta: Union[str, Path], columns: Optional[List[str]]) -> NoReturn:
+    """
+    Convierte las excepciones de pyarrow al leer un JSON Lines en errores
+    informativos.
+
+    Las excepciones que no se reconocen se registran y se re-lanzan
+    mediante manejar_excepcion_inesperada.
+    """
+    if isinstance(e, ImportError):
+        raise ValueError(
+            f"No se pudo importar la librería necesaria para leer archivos JSON Lines. "
+            f"Instala 'pyarrow' con: pip install pyarrow. "
+            f"Error: {str(e)}"
+        )
+    elif isinstance(e, MemoryError):
+        raise ValueError(
+            f"El archivo '{ruta}' es demasiado grande para cargar en memoria. "
+            f"Error: {str(e)}"
+        )
+    elif isinstance(e, KeyError):
+        # Columna pedida que no está en las primeras líneas
+        raise ValueError(
+            f"Una o más columnas especificadas no existen en el archivo '{ruta}'. "
+            f"Columnas solicitadas: {columns}. "
+            f"Error: {str(e)}"
+        )
+    elif isinstance(e, (PermissionError, OSError, IOError)):
+        raise ValueError(
+            f"No tienes permisos para leer el archivo '{ruta}'. "
+            f"Error: {str(e)}"
+        )
+
+    # Manejar excepciones específicas conocidas de pyarrow
+    # Convertir a errores informativos, re-lanzar las inesperadas
+    exception_name = type(e).__name__
+    error_msg = str(e).lower()
+
+    if "empty json file" in error_msg:
+        raise ValueError(
+            f"El archivo '{ruta}' está vacío o no contiene datos válidos. "
+            f"Error: {str(e)}"
+        )
+    elif "changed from" in error_msg:
+        raise ValueError(
+            f"Una columna del archivo '{ruta}' cambia de tipo entre líneas. "
+            f"Error: {str(e)}"
+        )
+    elif exception_name == 'ArrowInvalid':
+        raise ValueError(
+            f"El archivo '{ruta}' no es un archivo JSON Lines válido. "
+            f"Error: {str(e)}"
+        )
+    else:
+        # Excepción inesperada - usar función utilitaria centralizada
+        manejar_excepcion_inesperada(e, 'cargar_jsonl')
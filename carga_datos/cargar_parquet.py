@@ -7,41 +7,98 @@ con manejo robusto de errores y validación de tipos.
 
 import pandas as pd
 from pathlib import Path
-from typing import Union, Optional, List
-from .utils import procesar_ruta, manejar_excepcion_inesperada
+from typing import Any, BinaryIO, Iterator, List, Literal, NoReturn, Optional, Union
+from .utils import (
+    manejar_excepcion_inesperada, validar_limite_memoria, validar_salida, validar_progreso, es_buffer,
+    validar_devolver_estadisticas, resolver_origen, buffer_arrow, es_tabla_vacia, OrigenDatos, ResultadoCarga
+)
+from .memoria import (
+    estimar_memoria_parquet, supera_limite_memoria, error_limite_memoria, filas_por_fragmento
+)
+from .progreso import SeguimientoProgreso, CallbackProgreso
+from .estadisticas import MedidorCarga, medir_fase, medir_memoria, abrir_medido, con_estadisticas
+from .hooks import trazar
 
 
-def cargar_parquet(ruta: Union[str, Path], columns: Optional[List[str]] = None) -> pd.DataFrame:
+@trazar
+def cargar_parquet(ruta: OrigenDatos, columns: Optional[List[str]] = None,
+                   limite_memoria: Optional[int] = None,
+                   si_excede_memoria: Literal['error', 'fragmentos'] = 'error',
+                   salida: Literal['pandas', 'arrow', 'lotes'] = 'pandas',
+                   progreso: Optional[CallbackProgreso] = None,
+                   devolver_estadisticas: bool = False
+                   ) -> ResultadoCarga:
     """
     Carga un archivo Parquet y lo devuelve como DataFrame.
 
     Parámetros:
     ----------
-    ruta : Union[str, Path]
-        Ruta del archivo Parquet que se quiere cargar.
+    ruta : OrigenDatos
+        Ruta (str o Path), bytes, memoryview o flujo binario legible
+        (io.BytesIO, archivo abierto en 'rb'...) del archivo Parquet que se quiere cargar.
+        Los buffers en memoria se leen sin copia mediante pyarrow.BufferReader.
     columns : Optional[List[str]], opcional
         Lista de nombres de columnas específicas a cargar. Si es None, carga todas las columnas.
+    limite_memoria : Optional[int], opcional
+        Presupuesto de memoria en bytes. Si se indica, antes de cargar se
+        estima la memoria necesaria a partir del tamaño sin comprimir que
+        figura en el pie del archivo. Por defecto es None (sin límite).
+    si_excede_memoria : str, opcional
+        Qué hacer si la estimación supera limite_memoria: 'error' lanza
+        ValueError sin llegar a cargar; 'fragmentos' devuelve un iterador
+        de DataFrames dimensionados para caber en el límite.
+        Por defecto es 'error'.
+    salida : str, opcional
+        Tipo de resultado: 'pandas' (DataFrame), 'arrow' (pyarrow.Table) o
+        'lotes' (pyarrow.RecordBatchReader que lee el archivo por lotes).
+        'arrow' y 'lotes' no pasan por pandas. Por defecto es 'pandas'.
+    progreso : Optional[Callable[[ProgresoCarga], None]], opcional
+        Función a la que se informa durante la carga (como mucho cada medio
+        segundo y una vez al terminar) de los bytes leídos, las filas y las
+        filas por segundo. Con progreso el archivo se lee grupo de filas a
+        grupo de filas; los bytes son los comprimidos de las columnas
+        leídas. No se usa con salida='lotes' ni con fragmentos.
+        Por defecto es None (sin coste añadido).
+    devolver_estadisticas : bool, opcional
+        Si es True, devuelve una tupla (resultado, EstadisticasCarga). Para
+        separar la decodificación de la conversión a pandas, el archivo se
+        lee con pyarrow.parquet.read_table y la tabla se convierte después.
+        Con fragmentos o salida='lotes' solo cubren la validación y la
+        apertura. Por defecto es False.
 
     Retorna:
     -------
-    pd.DataFrame
-        El contenido del archivo Parquet como DataFrame.
+    ResultadoCarga
+        El contenido del archivo Parquet como DataFrame, o un iterador de
+        fragmentos si se superó limite_memoria con si_excede_memoria='fragmentos'.
+        Con salida='arrow' una pyarrow.Table (o un RecordBatchReader si se
+        superó el límite con 'fragmentos') y con salida='lotes' un
+        RecordBatchReader, que no se comprueba contra limite_memoria.
+        Con devolver_estadisticas una tupla (resultado, EstadisticasCarga).
 
     Errores:
     -------
     - Lanza FileNotFoundError si el archivo no existe.
     - Lanza ValueError si el archivo no es un Parquet válido, las columnas especificadas no existen,
-      hay problemas de permisos, memoria insuficiente o el archivo está vacío.
+      hay problemas de permisos, memoria insuficiente (real o estimada) o el
+      archivo está vacío.
     - Lanza TypeError si los parámetros no son del tipo correcto.
 
     Ejemplos:
     --------
     >>> df = cargar_parquet("datos.parquet")
     >>> df = cargar_parquet("datos.parquet", columns=["nombre", "edad"])
+    >>> df = cargar_parquet(io.BytesIO(contenido))  # se lee sin copiar el buffer
+    >>> df = cargar_parquet("enorme.parquet", limite_memoria=2 * 1024**3)
+    >>> tabla = cargar_parquet("datos.parquet", salida="arrow")  # para DuckDB/Polars
+    >>> df, estadisticas = cargar_parquet("datos.parquet", devolver_estadisticas=True)
     """
     # Validar tipos de entrada
-    if not isinstance(ruta, (str, Path)):
-        raise TypeError("El parámetro 'ruta' debe ser str o Path")
+    if not isinstance(ruta, (str, Path)) and not es_buffer(ruta):
+        raise TypeError(
+            "El parámetro 'ruta' debe ser str o Path, "
+            "o un buffer binario (bytes, memoryview o flujo binario legible)"
+        )
     
     if columns is not None and not isinstance(columns, list):
         raise TypeError("El parámetro 'columns' debe ser lista o None")
@@ -49,79 +106,213 @@ def cargar_parquet(ruta: Union[str, Path], columns: Optional[List[str]] = None)
     if columns is not None and not all(isinstance(col, str) for col in columns):
         raise TypeError("Todos los elementos de 'columns' deben ser strings")
 
-    # Crear Path object y validar archivo
-    ruta_archivo = procesar_ruta(ruta)
-    
-    if not ruta_archivo.exists():
-        raise FileNotFoundError(f"El archivo '{ruta}' no existe.")
-    
-    if not ruta_archivo.is_file():
-        raise ValueError(f"La ruta '{ruta}' no es un archivo válido.")
+    validar_limite_memoria(limite_memoria, si_excede_memoria)
+    validar_salida(salida)
+    validar_progreso(progreso)
+    validar_devolver_estadisticas(devolver_estadisticas)
+
+    medidor = MedidorCarga('pyarrow.parquet') if devolver_estadisticas else None
+
+    # Validar la ruta o preparar el buffer en memoria
+    with medir_fase(medidor, 'validacion'):
+        origen, nombre = resolver_origen(ruta)
+
+    if salida == 'lotes':
+        return con_estadisticas(_abrir_lotes_parquet(origen, nombre, columns), medidor)
+
+    # Comprobar el presupuesto de memoria antes de cargar
+    if limite_memoria is not None:
+        estimacion = estimar_memoria_parquet(origen, columns=columns)
+        if supera_limite_memoria(estimacion, limite_memoria):
+            if si_excede_memoria == 'fragmentos':
+                filas = filas_por_fragmento(estimacion, limite_memoria)
+                if salida == 'arrow':
+                    return con_estadisticas(_abrir_lotes_parquet(origen, nombre, columns, filas), medidor)
+                return con_estadisticas(_iterar_fragmentos_parquet(origen, nombre, columns, filas), medidor)
+            raise error_limite_memoria(estimacion, limite_memoria, nombre)
+
+    with medir_memoria(medidor):
+        try:
+            if progreso is None and medidor is None:
+                if salida == 'arrow':
+                    import pyarrow.parquet as pq
+                    resultado = pq.read_table(buffer_arrow(origen), columns=columns)
+                else:
+                    resultado = pd.read_parquet(buffer_arrow(origen), columns=columns)
+            else:
+                with abrir_medido(origen, medidor) as entrada, medir_fase(medidor, 'lectura'):
+                    if progreso is not None:
+                        tabla = _leer_parquet_con_progreso(entrada, columns, salida, progreso)
+                    else:
+                        import pyarrow.parquet as pq
+                        # Como pd.read_parquet, con pandas se recuperan también las columnas del índice
+                        tabla = pq.read_table(buffer_arrow(entrada), columns=columns,
+                                              use_pandas_metadata=salida != 'arrow')
+                with medir_fase(medidor, 'conversion'):
+                    resultado = tabla if salida == 'arrow' else tabla.to_pandas()
+        except Exception as e:
+            _traducir_error_parquet(e, nombre, columns)
+
+    vacio = es_tabla_vacia(resultado) if salida == 'arrow' else resultado.empty
+    if vacio:
+        raise ValueError(f"El archivo '{nombre}' está vacío o no contiene datos válidos.")
+
+    return con_estadisticas(resultado, medidor)
+
+
+def _leer_parquet_con_progreso(origen: Union[Path, BinaryIO], columns: Optional[List[str]],
+                               salida: str, progreso: CallbackProgreso) -> Any:
+    """
+    Lee el Parquet grupo de filas a grupo de filas para informar al
+    callback de bytes y filas mientras avanza la carga. Devuelve la
+    pyarrow.Table; la conversión a pandas la hace quien llama.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
 
+    archivo_parquet = pq.ParquetFile(buffer_arrow(origen))
+    esquema = archivo_parquet.schema_arrow
+    if columns is not None:
+        # read_row_group ignora en silencio las columnas que no existen
+        esquema = pa.schema([esquema.field(columna) for columna in columns])
+
+    metadatos = archivo_parquet.metadata
+    bytes_por_grupo = []
+    for indice_grupo in range(metadatos.num_row_groups):
+        grupo = metadatos.row_group(indice_grupo)
+        bytes_por_grupo.append(sum(
+            grupo.column(i).total_compressed_size for i in range(grupo.num_columns)
+            if columns is None or grupo.column(i).path_in_schema.split('.')[0] in columns
+        ))
+
+    seguimiento = SeguimientoProgreso(progreso, sum(bytes_por_grupo))
+    tablas = []
+    for indice_grupo, bytes_grupo in enumerate(bytes_por_grupo):
+        # Como pd.read_parquet, con pandas se recuperan también las columnas del índice
+        tabla = archivo_parquet.read_row_group(indice_grupo, columns=columns,
+                                               use_pandas_metadata=salida != 'arrow')
+        tablas.append(tabla)
+        seguimiento.avanzar(bytes_leidos=bytes_grupo, filas=tabla.num_rows)
+
+    tabla = pa.concat_tables(tablas) if tablas else esquema.empty_table()
+    seguimiento.terminar()
+    return tabla
+
+
+def _iterar_fragmentos_parquet(origen: Union[Path, BinaryIO], ruta: Union[str, Path],
+                               columns: Optional[List[str]], filas: int) -> Iterator[pd.DataFrame]:
+    """
+    Lee el Parquet en fragmentos de como máximo `filas` filas, traduciendo
+    los errores igual que la carga completa.
+    """
     try:
-        df = pd.read_parquet(ruta_archivo, columns=columns)
-    except ImportError as e:
+        import pyarrow.parquet as pq
+        archivo_parquet = pq.ParquetFile(buffer_arrow(origen))
+        for lote in archivo_parquet.iter_batches(batch_size=filas, columns=columns):
+            yield lote.to_pandas()
+    except Exception as e:
+        _traducir_error_parquet(e, ruta, columns)
+
+
+def _abrir_lotes_parquet(origen: Union[Path, BinaryIO], ruta: Union[str, Path],
+                         columns: Optional[List[str]], filas: Optional[int] = None) -> Any:
+    """
+    Abre el Parquet como pyarrow.RecordBatchReader. Se lee el primer lote
+    al abrir para obtener el esquema real y traducir aquí los errores de
+    formato o de columnas.
+    """
+    try:
+        import itertools
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        archivo_parquet = pq.ParquetFile(buffer_arrow(origen))
+        esquema = archivo_parquet.schema_arrow
+        if columns is not None:
+            # iter_batches ignora en silencio las columnas que no existen
+            esquema = pa.schema([esquema.field(columna) for columna in columns])
+        opciones = {'columns': columns} if filas is None else {'columns': columns, 'batch_size': filas}
+        lotes = archivo_parquet.iter_batches(**opciones)
+        primero = next(lotes, None)
+        if primero is None:
+            return pa.RecordBatchReader.from_batches(esquema, [])
+        return pa.RecordBatchReader.from_batches(primero.schema, itertools.chain([primero], lotes))
+    except Exception as e:
+        _traducir_error_parquet(e, ruta, columns)
+
+
+def _traducir_error_parquet(e: Exception, ruta: Union[str, Path],
+                            columns: Optional[List[str]]) -> NoReturn:
+    """
+    Convierte las excepciones de pandas/pyarrow al leer un Parquet en errores
+    informativos.
+
+    Las excepciones que no se reconocen se registran y se re-lanzan
+    mediante manejar_excepcion_inesperada.
+    """
+    if isinstance(e, ImportError):
         raise ValueError(
             f"No se pudo importar la librería necesaria para leer archivos Parquet. "
             f"Instala 'pyarrow' con: pip install pyarrow. "
             f"Error: {str(e)}"
         )
-    except MemoryError as e:
+    elif isinstance(e, MemoryError):
         raise ValueError(
             f"El archivo '{ruta}' es demasiado grande para cargar en memoria. "
             f"Error: {str(e)}"
         )
-    except (PermissionError, OSError, IOError) as e:
+    elif isinstance(e, KeyError):
+        # pyarrow.Schema.field con una columna inexistente
+        raise ValueError(
+            f"Una o más columnas especificadas no existen en el archivo '{ruta}'. "
+            f"Columnas solicitadas: {columns}. "
+            f"Error: {str(e)}"
+        )
+    elif isinstance(e, (PermissionError, OSError, IOError)):
         raise ValueError(
             f"No tienes permisos para leer el archivo '{ruta}'. "
             f"Error: {str(e)}"
         )
-    except Exception as e:
-        # Manejar excepciones específicas conocidas de pyarrow/Parquet
-        # Convertir a errores informativos, re-lanzar las inesperadas
-        exception_name = type(e).__name__
-        error_msg = str(e).lower()
-        
-        # Excepciones específicas de pyarrow que podemos manejar
-        if exception_name == 'ArrowInvalid':
-            if "no match for fieldref" in error_msg:
-                raise ValueError(
-                    f"Una o más columnas especificadas no existen en el archivo '{ruta}'. "
-                    f"Columnas solicitadas: {columns}. "
-                    f"Error: {str(e)}"
-                )
-            else:
-                raise ValueError(
-                    f"El archivo '{ruta}' no es un archivo Parquet válido. "
-                    f"Error: {str(e)}"
-                )
-        elif exception_name == 'ArrowIOError':
-            if "column" in error_msg and "does not exist" in error_msg:
-                raise ValueError(
-                    f"Una o más columnas especificadas no existen en el archivo '{ruta}'. "
-                    f"Columnas solicitadas: {columns}. "
-                    f"Error: {str(e)}"
-                )
-            else:
-                raise ValueError(
-                    f"El archivo '{ruta}' no es un archivo Parquet válido. "
-                    f"Error: {str(e)}"
-                )
-        elif "not a parquet file" in error_msg or "invalid parquet file" in error_msg or "magic bytes not found" in error_msg:
+
+    # Manejar excepciones específicas conocidas de pyarrow/Parquet
+    # Convertir a errores informativos, re-lanzar las inesperadas
+    exception_name = type(e).__name__
+    error_msg = str(e).lower()
+
+    # Excepciones específicas de pyarrow que podemos manejar
+    if exception_name == 'ArrowInvalid':
+        if "no match for fieldref" in error_msg:
+            raise ValueError(
+                f"Una o más columnas especificadas no existen en el archivo '{ruta}'. "
+                f"Columnas solicitadas: {columns}. "
+                f"Error: {str(e)}"
+            )
+        else:
             raise ValueError(
                 f"El archivo '{ruta}' no es un archivo Parquet válido. "
                 f"Error: {str(e)}"
             )
-        elif "file size is 0 bytes" in error_msg or "empty" in error_msg:
+    elif exception_name == 'ArrowIOError':
+        if "column" in error_msg and "does not exist" in error_msg:
             raise ValueError(
-                f"El archivo '{ruta}' está vacío o no contiene datos válidos. "
+                f"Una o más columnas especificadas no existen en el archivo '{ruta}'. "
+                f"Columnas solicitadas: {columns}. "
                 f"Error: {str(e)}"
             )
         else:
-            # Excepción inesperada - usar función utilitaria centralizada
-            manejar_excepcion_inesperada(e, 'cargar_parquet')
-
-    if df.empty:
-        raise ValueError(f"El archivo '{ruta}' está vacío o no contiene datos válidos.")
-
-    return df 
\ No newline at end of file
+            raise ValueError(
+                f"El archivo '{ruta}' no es un archivo Parquet válido. "
+                f"Error: {str(e)}"
+            )
+    elif "not a parquet file" in error_msg or "invalid parquet file" in error_msg or "magic bytes not found" in error_msg:
+        raise ValueError(
+            f"El archivo '{ruta}' no es un archivo Parquet válido. "
+            f"Error: {str(e)}"
+        )
+    elif "file size is 0 bytes" in error_msg or "empty" in error_msg:
+        raise ValueError(
+            f"El archivo '{ruta}' está vacío o no contiene datos válidos. "
+            f"Error: {str(e)}"
+        )
+    else:
+        # Excepción inesperada - usar función utilitaria centralizada
+        manejar_excepcion_inesperada(e, 'cargar_parquet')
@@ -7,21 +7,38 @@ con manejo robusto de errores y validación de tipos.
 
 import pandas as pd
 from pathlib import Path
-from typing import Union, Optional, Literal
+from typing import Any, BinaryIO, Literal, NoReturn, Optional, Union
 import zipfile
 
-from .utils import procesar_ruta, manejar_excepcion_inesperada
+from .utils import (
+    manejar_excepcion_inesperada, validar_limite_memoria, validar_salida, validar_progreso, es_buffer,
+    validar_devolver_estadisticas, validar_detectar_fechas, resolver_origen, tabla_a_lotes, OrigenDatos,
+    ResultadoCarga
+)
+from .memoria import estimar_memoria_xlsx, supera_limite_memoria, error_limite_memoria
+from .progreso import SeguimientoProgreso, CallbackProgreso, abrir_con_progreso, tamano_origen
+from .estadisticas import MedidorCarga, medir_fase, medir_memoria, con_estadisticas
+from .fechas import convertir_fechas
+from .hooks import trazar
 
 
-def cargar_xlsx(ruta: Union[str, Path], sheet_name: Union[str, int] = 0, 
-                header: Optional[int] = 0, engine: Literal['xlrd', 'openpyxl', 'odf', 'pyxlsb', 'calamine'] = 'openpyxl') -> pd.DataFrame:
+@trazar
+def cargar_xlsx(ruta: OrigenDatos, sheet_name: Union[str, int] = 0, 
+                header: Optional[int] = 0, engine: Literal['xlrd', 'openpyxl', 'odf', 'pyxlsb', 'calamine'] = 'openpyxl',
+                limite_memoria: Optional[int] = None,
+                salida: Literal['pandas', 'arrow', 'lotes'] = 'pandas',
+                progreso: Optional[CallbackProgreso] = None,
+                devolver_estadisticas: bool = False,
+                detectar_fechas: bool = False,
+                dia_primero: Optional[bool] = None) -> ResultadoCarga:
     """
     Carga un archivo Excel (.xlsx) y lo devuelve como DataFrame.
 
     Parámetros:
     ----------
-    ruta : Union[str, Path]
-        Ruta del archivo Excel que se quiere cargar.
+    ruta : OrigenDatos
+        Ruta (str o Path), bytes, memoryview o flujo binario legible
+        (io.BytesIO, archivo abierto en 'rb'...) del archivo Excel que se quiere cargar.
     sheet_name : Union[str, int], opcional
         Nombre o índice de la hoja a cargar. Por defecto es 0 (primera hoja).
     header : Optional[int], opcional
@@ -29,17 +46,50 @@ def cargar_xlsx(ruta: Union[str, Path], sheet_name: Union[str, int] = 0,
         Si es None, no usa encabezado.
     engine : str, opcional
         Motor de lectura. Por defecto es 'openpyxl' para archivos .xlsx.
+    limite_memoria : Optional[int], opcional
+        Presupuesto de memoria en bytes. Si se indica, antes de cargar se
+        estima la memoria necesaria a partir de una muestra de filas de la
+        hoja y se lanza ValueError si la supera. Por defecto es None.
+    salida : str, opcional
+        Tipo de resultado: 'pandas' (DataFrame), 'arrow' (pyarrow.Table) o
+        'lotes' (pyarrow.RecordBatchReader). No hay lector Excel nativo de
+        Arrow, así que la hoja se lee con pandas y se convierte al final.
+        Por defecto es 'pandas'.
+    progreso : Optional[Callable[[ProgresoCarga], None]], opcional
+        Función a la que se informa durante la carga (como mucho cada medio
+        segundo y una vez al terminar). Mientras se lee la hoja se informa
+        de los bytes leídos del archivo (que avanzan al ritmo de las filas,
+        ya que la hoja se descomprime sobre la marcha); las filas se
+        conocen en el aviso final. Por defecto es None (sin coste añadido).
+    devolver_estadisticas : bool, opcional
+        Si es True, devuelve una tupla (resultado, EstadisticasCarga). El
+        motor es el engine; pandas convierte mientras lee la hoja, así que
+        la conversión solo cuenta el paso a Arrow con salida distinta de
+        'pandas' y la conversión de fechas. Por defecto es False.
+    detectar_fechas : bool, opcional
+        Si es True, las columnas de texto con fechas (las celdas de fecha de
+        Excel ya llegan como datetime) se convierten a datetime con el
+        formato detectado una vez por columna sobre una muestra.
+        Por defecto es False.
+    dia_primero : Optional[bool], opcional
+        Con detectar_fechas, cómo resolver las fechas ambiguas como
+        03/04/2024: True para día primero, False para mes primero. Con None
+        (por defecto) se avisa con logging.warning y la columna se deja como
+        texto.
 
     Retorna:
     -------
-    pd.DataFrame
-        El contenido del archivo Excel como DataFrame.
+    ResultadoCarga
+        El contenido del archivo Excel como DataFrame, pyarrow.Table o
+        RecordBatchReader según salida. Con devolver_estadisticas una tupla
+        (resultado, EstadisticasCarga).
 
     Errores:
     -------
     - Lanza FileNotFoundError si el archivo no existe.
     - Lanza ValueError si el archivo no es un Excel válido, la hoja especificada no existe,
-      hay problemas de permisos, memoria insuficiente o el archivo está vacío.
+      hay problemas de permisos, memoria insuficiente (real o estimada) o el
+      archivo está vacío.
     - Lanza TypeError si los parámetros no son del tipo correcto.
 
     Ejemplos:
@@ -47,122 +97,210 @@ def cargar_xlsx(ruta: Union[str, Path], sheet_name: Union[str, int] = 0,
     >>> df = cargar_xlsx("datos.xlsx")
     >>> df = cargar_xlsx("datos.xlsx", sheet_name="Hoja1")
     >>> df = cargar_xlsx("datos.xlsx", sheet_name=1, header=None)
+    >>> df = cargar_xlsx(open("datos.xlsx", "rb"))
+    >>> tabla = cargar_xlsx("datos.xlsx", salida="arrow")
+    >>> df, estadisticas = cargar_xlsx("datos.xlsx", devolver_estadisticas=True)
+    >>> df = cargar_xlsx("altas.xlsx", detectar_fechas=True)  # fechas guardadas como texto
     """
-    # Validar tipos de entrada
-    if not isinstance(ruta, (str, Path)):
-        raise TypeError("El parámetro 'ruta' debe ser str o Path")
-    
+    _validar_opciones_xlsx(ruta, sheet_name, header, engine)
+    validar_limite_memoria(limite_memoria, 'error')
+    validar_salida(salida)
+    validar_progreso(progreso)
+    validar_devolver_estadisticas(devolver_estadisticas)
+    validar_detectar_fechas(detectar_fechas, dia_primero)
+
+    medidor = MedidorCarga(engine) if devolver_estadisticas else None
+
+    # Validar la ruta o preparar el buffer en memoria
+    with medir_fase(medidor, 'validacion'):
+        origen, nombre = resolver_origen(ruta)
+
+    # Comprobar el presupuesto de memoria antes de cargar
+    if limite_memoria is not None:
+        estimacion = estimar_memoria_xlsx(origen, sheet_name=sheet_name, header=header)
+        if supera_limite_memoria(estimacion, limite_memoria):
+            raise error_limite_memoria(estimacion, limite_memoria, nombre)
+
+    seguimiento = None if progreso is None else SeguimientoProgreso(progreso, tamano_origen(origen))
+
+    with medir_memoria(medidor):
+        df = _leer_xlsx(origen, nombre, sheet_name, header, engine, seguimiento, medidor)
+
+        if df.empty:
+            raise ValueError(f"El archivo '{nombre}' está vacío o no contiene datos válidos.")
+
+        if seguimiento is not None:
+            seguimiento.terminar(filas=len(df))
+
+        if detectar_fechas:
+            with medir_fase(medidor, 'conversion'):
+                df, _ = convertir_fechas(df, dia_primero)
+
+        resultado = df if salida == 'pandas' else _convertir_a_arrow(df, salida, nombre, medidor)
+
+    return con_estadisticas(resultado, medidor)
+
+
+def _validar_opciones_xlsx(ruta: OrigenDatos, sheet_name: Union[str, int], header: Optional[int],
+                           engine: str) -> None:
+    """Valida los tipos de los parámetros propios de cargar_xlsx."""
+    if not isinstance(ruta, (str, Path)) and not es_buffer(ruta):
+        raise TypeError(
+            "El parámetro 'ruta' debe ser str o Path, "
+            "o un buffer binario (bytes, memoryview o flujo binario legible)"
+        )
+
     if not isinstance(sheet_name, (str, int)):
         raise TypeError("El parámetro 'sheet_name' debe ser str o int")
-    
+
     if header is not None and not isinstance(header, int):
         raise TypeError("El parámetro 'header' debe ser int o None")
-    
+
     if engine not in ['xlrd', 'openpyxl', 'odf', 'pyxlsb', 'calamine']:
         raise TypeError("El parámetro 'engine' debe ser uno de: 'xlrd', 'openpyxl', 'odf', 'pyxlsb', 'calamine'")
 
-    # Crear Path object y validar archivo
-    ruta_archivo = procesar_ruta(ruta)
-    
-    if not ruta_archivo.exists():
-        raise FileNotFoundError(f"El archivo '{ruta}' no existe.")
-    
-    if not ruta_archivo.is_file():
-        raise ValueError(f"La ruta '{ruta}' no es un archivo válido.")
 
+def _leer_xlsx(origen: Union[Path, BinaryIO], nombre: Union[str, Path], sheet_name: Union[str, int],
+               header: Optional[int], engine: str, seguimiento: Optional[SeguimientoProgreso],
+               medidor: Optional[MedidorCarga]) -> pd.DataFrame:
+    """
+    Lee la hoja con pandas, a través de un LectorConProgreso si hay que
+    contar bytes, traduciendo los errores con _traducir_error_xlsx.
+    """
+    lectura = origen
     try:
-        df = pd.read_excel(ruta_archivo, sheet_name=sheet_name, header=header, engine=engine)
+        if seguimiento is not None or medidor is not None:
+            lectura = abrir_con_progreso(origen, seguimiento, medidor)
+        with medir_fase(medidor, 'lectura'):
+            return pd.read_excel(lectura, sheet_name=sheet_name, header=header, engine=engine)
+    except Exception as e:
+        _traducir_error_xlsx(e, nombre, sheet_name, engine)
+    finally:
+        if lectura is not origen:
+            lectura.close()
+
+
+def _convertir_a_arrow(df: pd.DataFrame, salida: str, nombre: Union[str, Path],
+                       medidor: Optional[MedidorCarga]) -> Any:
+    """Convierte el DataFrame leído en pyarrow.Table o, con salida='lotes', en RecordBatchReader."""
+    try:
+        import pyarrow as pa
+        with medir_fase(medidor, 'conversion'):
+            tabla = pa.Table.from_pandas(df, preserve_index=False)
     except ImportError as e:
+        raise ValueError(
+            f"No se pudo importar la librería necesaria para salida='{salida}'. "
+            f"Instala 'pyarrow' con: pip install pyarrow. "
+            f"Error: {str(e)}"
+        )
+    except Exception as e:
+        raise ValueError(
+            f"No se pudo convertir el contenido del archivo '{nombre}' a Arrow. "
+            f"Revisa si alguna columna mezcla tipos (por ejemplo números y texto). "
+            f"Error: {str(e)}"
+        )
+    return tabla if salida == 'arrow' else tabla_a_lotes(tabla)
+
+
+def _traducir_error_xlsx(e: Exception, ruta: Union[str, Path], sheet_name: Union[str, int],
+                         engine: str) -> NoReturn:
+    """
+    Convierte las excepciones de pandas y del engine al leer un Excel en
+    errores informativos.
+
+    Las excepciones que no se reconocen se registran y se re-lanzan
+    mediante manejar_excepcion_inesperada.
+    """
+    if isinstance(e, ImportError):
         raise ValueError(
             f"No se pudo importar la librería necesaria para leer archivos Excel. "
             f"Instala 'openpyxl' con: pip install openpyxl. "
             f"Error: {str(e)}"
         )
-    except MemoryError as e:
+    elif isinstance(e, MemoryError):
         raise ValueError(
             f"El archivo '{ruta}' es demasiado grande para cargar en memoria. "
             f"Error: {str(e)}"
         )
-    except zipfile.BadZipFile as e:
+    elif isinstance(e, zipfile.BadZipFile):
         raise ValueError(
             f"El archivo '{ruta}' no es un archivo Excel válido. "
             f"Error: {str(e)}"
         )
-    except PermissionError as e:
+    elif isinstance(e, (PermissionError, OSError, IOError)):
         raise ValueError(
             f"No tienes permisos para leer el archivo '{ruta}'. "
             f"Error: {str(e)}"
         )
-    except (OSError, IOError) as e:
+    elif isinstance(e, (UnicodeDecodeError, UnicodeError)):
         raise ValueError(
-            f"No tienes permisos para leer el archivo '{ruta}'. "
+            f"Error de codificación al leer el archivo '{ruta}'. "
+            f"El archivo podría estar corrupto. "
             f"Error: {str(e)}"
         )
-    except (UnicodeDecodeError, UnicodeError) as e:
+    elif isinstance(e, ValueError):
+        _traducir_valor_xlsx(e, ruta, sheet_name)
+    _traducir_error_engine_xlsx(e, ruta, sheet_name, engine)
+
+
+def _traducir_error_engine_xlsx(e: Exception, ruta: Union[str, Path], sheet_name: Union[str, int],
+                                engine: str) -> NoReturn:
+    """Convierte las excepciones propias de cada engine (openpyxl, xlrd...) por su nombre y mensaje."""
+    # Manejar excepciones específicas conocidas de Excel/pandas
+    # Convertir a errores informativos, re-lanzar las inesperadas
+    exception_name = type(e).__name__
+    error_msg = str(e).lower()
+
+    # Excepciones específicas de Excel/pandas que podemos manejar
+    if exception_name == 'InvalidFileException' or "not a zip file" in error_msg or "invalid file" in error_msg:
         raise ValueError(
-            f"Error de codificación al leer el archivo '{ruta}'. "
-            f"El archivo podría estar corrupto. "
+            f"El archivo '{ruta}' no es un archivo Excel válido. "
             f"Error: {str(e)}"
         )
-    except ValueError as e:
-        # Capturar errores específicos de pandas Excel
-        error_msg = str(e).lower()
-        if "worksheet" in error_msg and ("does not exist" in error_msg or "not found" in error_msg):
-            raise ValueError(
-                f"La hoja '{sheet_name}' no existe en el archivo '{ruta}'. "
-                f"Error: {str(e)}"
-            )
-        elif "worksheet index" in error_msg and "invalid" in error_msg:
-            raise ValueError(
-                f"El índice de hoja '{sheet_name}' no existe en el archivo '{ruta}'. "
-                f"Error: {str(e)}"
-            )
-        elif "excel file format cannot be determined" in error_msg:
-            raise ValueError(
-                f"El archivo '{ruta}' no es un archivo Excel válido. "
-                f"Error: {str(e)}"
-            )
-        elif "unsupported format" in error_msg or "corrupt" in error_msg:
-            raise ValueError(
-                f"El archivo '{ruta}' está corrupto o tiene un formato no soportado. "
-                f"Error: {str(e)}"
-            )
-        else:
-            raise ValueError(
-                f"Error al procesar el archivo '{ruta}': {str(e)}"
-            )
-    except Exception as e:
-        # Manejar excepciones específicas conocidas de Excel/pandas
-        # Convertir a errores informativos, re-lanzar las inesperadas
-        exception_name = type(e).__name__
-        error_msg = str(e).lower()
-        
-        # Excepciones específicas de Excel/pandas que podemos manejar
-        if exception_name == 'InvalidFileException' or "not a zip file" in error_msg or "invalid file" in error_msg:
-            raise ValueError(
-                f"El archivo '{ruta}' no es un archivo Excel válido. "
-                f"Error: {str(e)}"
-            )
-        elif exception_name == 'XLRDError' or "xlrd" in error_msg:
-            raise ValueError(
-                f"Error al leer el archivo Excel '{ruta}' con xlrd. "
-                f"Error: {str(e)}"
-            )
-        elif "not supported" in error_msg or "unsupported" in error_msg:
-            raise ValueError(
-                f"El formato del archivo '{ruta}' no es soportado por el engine '{engine}'. "
-                f"Error: {str(e)}"
-            )
-        elif "sheet" in error_msg and ("not found" in error_msg or "does not exist" in error_msg):
-            raise ValueError(
-                f"La hoja especificada '{sheet_name}' no existe en el archivo '{ruta}'. "
-                f"Error: {str(e)}"
-            )
-        else:
-            # Excepción inesperada - usar función utilitaria centralizada
-            manejar_excepcion_inesperada(e, 'cargar_xlsx')
-
-    if df.empty:
-        raise ValueError(f"El archivo '{ruta}' está vacío o no contiene datos válidos.")
-
-    return df 
\ No newline at end of file
+    elif exception_name == 'XLRDError' or "xlrd" in error_msg:
+        raise ValueError(
+            f"Error al leer el archivo Excel '{ruta}' con xlrd. "
+            f"Error: {str(e)}"
+        )
+    elif "not supported" in error_msg or "unsupported" in error_msg:
+        raise ValueError(
+            f"El formato del archivo '{ruta}' no es soportado por el engine '{engine}'. "
+            f"Error: {str(e)}"
+        )
+    elif "sheet" in error_msg and ("not found" in error_msg or "does not exist" in error_msg):
+        raise ValueError(
+            f"La hoja especificada '{sheet_name}' no existe en el archivo '{ruta}'. "
+            f"Error: {str(e)}"
+        )
+    else:
+        # Excepción inesperada - usar función utilitaria centralizada
+        manejar_excepcion_inesperada(e, 'cargar_xlsx')
+
+
+def _traducir_valor_xlsx(e: ValueError, ruta: Union[str, Path], sheet_name: Union[str, int]) -> NoReturn:
+    """Convierte los ValueError de pandas al leer un Excel (hoja inexistente, formato...)."""
+    error_msg = str(e).lower()
+    if "worksheet" in error_msg and ("does not exist" in error_msg or "not found" in error_msg):
+        raise ValueError(
+            f"La hoja '{sheet_name}' no existe en el archivo '{ruta}'. "
+            f"Error: {str(e)}"
+        )
+    elif "worksheet index" in error_msg and "invalid" in error_msg:
+        raise ValueError(
+            f"El índice de hoja '{sheet_name}' no existe en el archivo '{ruta}'. "
+            f"Error: {str(e)}"
+        )
+    elif "excel file format cannot be determined" in error_msg:
+        raise ValueError(
+            f"El archivo '{ruta}' no es un archivo Excel válido. "
+            f"Error: {str(e)}"
+        )
+    elif "unsupported format" in error_msg or "corrupt" in error_msg:
+        raise ValueError(
+            f"El archivo '{ruta}' está corrupto o tiene un formato no soportado. "
+            f"Error: {str(e)}"
+        )
+    else:
+        raise ValueError(
+            f"Error al procesar el archivo '{ruta}': {str(e)}"
+        )
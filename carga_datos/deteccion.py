@@ -0,0 +1,275 @@
+"""
+Módulo para detectar el formato de un archivo por su contenido.
+
+Este módulo contiene funciones que leen los primeros bytes de un archivo
+o buffer y reconocen su formato por sus números mágicos, para poder cargar
+datos que llegan sin nombre de archivo.
+"""
+
+import codecs
+import zipfile
+import zlib
+from pathlib import Path
+from typing import BinaryIO, NamedTuple, Optional, Union
+
+
+# Bytes que se leen del inicio del origen para detectar el formato
+BYTES_CABECERA: int = 4096
+
+# Números mágicos de los formatos binarios soportados
+MAGIA_PARQUET: bytes = b'PAR1'
+MAGIA_ZIP: bytes = b'PK\x03\x04'
+MAGIA_ARROW: bytes = b'ARROW1'
+MAGIA_FEATHER_V1: bytes = b'FEA1'
+MAGIA_ARROW_STREAM: bytes = b'\xff\xff\xff\xff'
+MAGIA_GZIP: bytes = b'\x1f\x8b'
+MAGIA_ZSTD: bytes = b'\x28\xb5\x2f\xfd'
+
+# Formatos binarios: si el contenido los delata, mandan sobre la extensión
+FORMATOS_BINARIOS = ('parquet', 'xlsx', 'arrow')
+
+
+class FormatoDetectado(NamedTuple):
+    """
+    Resultado de detectar el formato de un archivo por su contenido.
+
+    Atributos:
+    ---------
+    formato : Optional[str]
+        'csv', 'xlsx', 'parquet' o 'arrow', o None si no se reconoce.
+    compresion : Optional[str]
+        'gzip' o 'zstd' si el contenido está comprimido, None si no.
+    """
+    formato: Optional[str]
+    compresion: Optional[str]
+
+
+def leer_cabecera(origen: Union[str, Path, BinaryIO], n: int = BYTES_CABECERA) -> bytes:
+    """
+    Lee los primeros bytes de un archivo o flujo binario posicionable.
+
+    Parámetros:
+    ----------
+    origen : Union[str, Path, BinaryIO]
+        Ruta del archivo o flujo binario. La posición del flujo se restaura.
+    n : int, opcional
+        Número máximo de bytes a leer. Por defecto es BYTES_CABECERA.
+
+    Retorna:
+    -------
+    bytes
+        Los primeros n bytes (o menos si el origen es más corto).
+
+    Ejemplos:
+    --------
+    >>> leer_cabecera("datos.parquet", 4)
+    b'PAR1'
+    """
+    if isinstance(origen, (str, Path)):
+        with open(origen, 'rb') as archivo:
+            return archivo.read(n)
+
+    posicion = origen.tell()
+    try:
+        return origen.read(n)
+    finally:
+        origen.seek(posicion)
+
+
+def es_texto(cabecera: bytes) -> bool:
+    """
+    Indica si unos bytes parecen texto (y por tanto un posible CSV).
+
+    Se considera texto si no contiene bytes nulos y decodifica como UTF-8
+    (tolerando un carácter cortado al final) o, en su defecto, si casi
+    todos sus bytes son imprimibles en una codificación de 8 bits.
+
+    Parámetros:
+    ----------
+    cabecera : bytes
+        Los primeros bytes del origen.
+
+    Retorna:
+    -------
+    bool
+        True si los bytes parecen texto.
+
+    Ejemplos:
+    --------
+    >>> es_texto(b"nombre;edad\\nJos\\xc3\\xa9;25\\n")
+    True
+    >>> es_texto(b"\\x89PNG\\r\\n\\x1a\\n\\x00\\x00")
+    False
+    """
+    if b'\x00' in cabecera:
+        return False
+
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(cabecera, final=False)
+        return True
+    except UnicodeDecodeError:
+        pass
+
+    # Texto en latin1/cp1252: pocos caracteres de control fuera de \t \n \r
+    controles = sum(1 for byte in cabecera if byte < 32 and byte not in (9, 10, 13))
+    return controles <= len(cabecera) * 0.05
+
+
+def detectar_formato(cabecera: bytes) -> Optional[str]:
+    """
+    Detecta el formato de un archivo a partir de sus primeros bytes.
+
+    Parámetros:
+    ----------
+    cabecera : bytes
+        Los primeros bytes del archivo (ver leer_cabecera).
+
+    Retorna:
+    -------
+    Optional[str]
+        'parquet', 'xlsx', 'arrow' o 'csv' según el contenido, o None si no
+        se reconoce el formato. Cualquier zip se considera 'xlsx'; para
+        confirmarlo con sus entradas usa detectar_origen().
+
+    Ejemplos:
+    --------
+    >>> detectar_formato(b"PAR1\\x15\\x04")
+    'parquet'
+    >>> detectar_formato(b"nombre,edad\\nJuan,25\\n")
+    'csv'
+    >>> detectar_formato(b"\\x89PNG\\r\\n\\x1a\\n")
+    """
+    if cabecera.startswith(MAGIA_PARQUET):
+        return 'parquet'
+    if cabecera.startswith(MAGIA_ZIP):
+        return 'xlsx'
+    if (cabecera.startswith(MAGIA_ARROW) or cabecera.startswith(MAGIA_FEATHER_V1)
+            or cabecera.startswith(MAGIA_ARROW_STREAM)):
+        return 'arrow'
+    if detectar_compresion(cabecera) is not None:
+        return None
+    if es_texto(cabecera):
+        return 'csv'
+    return None
+
+
+def detectar_compresion(cabecera: bytes) -> Optional[str]:
+    """
+    Detecta si unos bytes son el inicio de un flujo gzip o zstd.
+
+    Parámetros:
+    ----------
+    cabecera : bytes
+        Los primeros bytes del archivo.
+
+    Retorna:
+    -------
+    Optional[str]
+        'gzip', 'zstd' o None si no está comprimido con ninguno de ellos.
+
+    Ejemplos:
+    --------
+    >>> detectar_compresion(b"\\x1f\\x8b\\x08\\x00")
+    'gzip'
+    >>> detectar_compresion(b"nombre,edad")
+    """
+    if cabecera.startswith(MAGIA_GZIP):
+        return 'gzip'
+    if cabecera.startswith(MAGIA_ZSTD):
+        return 'zstd'
+    return None
+
+
+def es_zip_excel(origen: Union[str, Path, BinaryIO]) -> bool:
+    """
+    Indica si un zip es un libro Excel, es decir, si tiene entradas 'xl/'.
+
+    Parámetros:
+    ----------
+    origen : Union[str, Path, BinaryIO]
+        Ruta del archivo o flujo binario posicionable. La posición del
+        flujo se restaura.
+
+    Retorna:
+    -------
+    bool
+        True si el zip contiene entradas bajo 'xl/'; False si no las tiene
+        o no es un zip válido.
+    """
+    posicion = None if isinstance(origen, (str, Path)) else origen.tell()
+    try:
+        with zipfile.ZipFile(origen) as archivo_zip:
+            return any(nombre.startswith('xl/') for nombre in archivo_zip.namelist())
+    except (zipfile.BadZipFile, OSError):
+        return False
+    finally:
+        if posicion is not None:
+            origen.seek(posicion)
+
+
+def descomprimir_cabecera(cabecera: bytes, compresion: str) -> Optional[bytes]:
+    """
+    Descomprime el inicio de un flujo gzip o zstd para inspeccionar su contenido.
+
+    Parámetros:
+    ----------
+    cabecera : bytes
+        Los primeros bytes comprimidos.
+    compresion : str
+        'gzip' o 'zstd'.
+
+    Retorna:
+    -------
+    Optional[bytes]
+        Los bytes descomprimidos que se pudieron obtener, o None si no se
+        pueden descomprimir (por ejemplo, si 'zstandard' no está instalado).
+    """
+    try:
+        if compresion == 'gzip':
+            return zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(cabecera)
+        import zstandard
+        return zstandard.ZstdDecompressor().decompressobj().decompress(cabecera)
+    except Exception:
+        return None
+
+
+def detectar_origen(origen: Union[str, Path, BinaryIO]) -> FormatoDetectado:
+    """
+    Detecta el formato y la compresión de un archivo o flujo por su contenido.
+
+    Lee solo la cabecera (BYTES_CABECERA bytes). Para los zip comprueba
+    además que tengan entradas 'xl/' y para los archivos comprimidos
+    inspecciona el inicio del contenido descomprimido; dentro de un gzip
+    o zstd solo se reconoce texto (CSV).
+
+    Parámetros:
+    ----------
+    origen : Union[str, Path, BinaryIO]
+        Ruta del archivo o flujo binario posicionable.
+
+    Retorna:
+    -------
+    FormatoDetectado
+        Formato y compresión detectados.
+
+    Ejemplos:
+    --------
+    >>> detectar_origen("ventas.csv.gz")
+    FormatoDetectado(formato='csv', compresion='gzip')
+    >>> detectar_origen("datos_sin_extension")
+    FormatoDetectado(formato='parquet', compresion=None)
+    """
+    cabecera = leer_cabecera(origen)
+
+    compresion = detectar_compresion(cabecera)
+    if compresion is not None:
+        contenido = descomprimir_cabecera(cabecera, compresion)
+        if contenido is None:
+            # No se puede inspeccionar: asumir un CSV comprimido
+            return FormatoDetectado('csv', compresion)
+        return FormatoDetectado('csv' if es_texto(contenido) else None, compresion)
+
+    formato = detectar_formato(cabecera)
+    if formato == 'xlsx' and not es_zip_excel(origen):
+        formato = None
+    return FormatoDetectado(formato, None)
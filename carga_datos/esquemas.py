@@ -0,0 +1,363 @@
+"""
+Módulo de esquemas de CSV para feeds recurrentes.
+
+Este módulo permite inferir una vez el esquema de un CSV (columnas, tipos
+y columnas de fecha) a partir de una muestra, guardarlo en un registro
+JSON por nombre de feed o por huella de la cabecera, y cargar los días
+siguientes con dtype y parse_dates explícitos: pandas no tiene que
+inferir los tipos, éstos no cambian de un día a otro (por ejemplo cuando
+una columna viene entera vacía) y un cambio de esquema se detecta al leer
+la cabecera, antes de cargar el archivo.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, NamedTuple, Optional, Tuple, Union
+
+import pandas as pd
+
+from .utils import resolver_origen, OrigenDatos
+from .fechas import detectar_formato_fecha
+
+
+# Filas que se leen por defecto para inferir el esquema
+FILAS_MUESTRA_ESQUEMA = 10_000
+
+# Versión del formato del archivo del registro
+VERSION_REGISTRO = 1
+
+# Tipo de pyarrow equivalente a cada tipo de pandas de un esquema
+TIPOS_ARROW = {
+    'Int64': 'int64',
+    'float64': 'float64',
+    'boolean': 'bool_',
+    'object': 'string',
+}
+
+
+class EsquemaCsv(NamedTuple):
+    """
+    Esquema de un CSV: columnas, tipo de cada una y columnas de fecha.
+
+    Atributos:
+    ---------
+    columnas : Tuple[str, ...]
+        Nombres de las columnas en el orden de la cabecera.
+    tipos : Dict[str, str]
+        Tipo de pandas de cada columna que no es de fecha: 'Int64' (entero
+        que admite vacíos), 'float64', 'boolean' u 'object'. Las columnas
+        vacías en la muestra se guardan como 'object'.
+    fechas : Dict[str, str]
+        Formato de cada columna de fecha ('ISO8601' o un formato de
+        strftime como '%d/%m/%Y').
+    huella : str
+        Huella de la cabecera (ver huella_cabecera()).
+    """
+    columnas: Tuple[str, ...]
+    tipos: Dict[str, str]
+    fechas: Dict[str, str]
+    huella: str
+
+    def opciones_pandas(self) -> Dict[str, Any]:
+        """Parámetros de pd.read_csv que aplican el esquema sin inferir tipos."""
+        opciones: Dict[str, Any] = {'dtype': dict(self.tipos)}
+        if self.fechas:
+            opciones['parse_dates'] = list(self.fechas)
+            opciones['date_format'] = dict(self.fechas)
+        return opciones
+
+    def opciones_arrow(self) -> Any:
+        """pyarrow.csv.ConvertOptions que aplican el esquema."""
+        import pyarrow as pa
+        import pyarrow.csv as pv
+
+        tipos = {columna: getattr(pa, TIPOS_ARROW[tipo])() for columna, tipo in self.tipos.items()}
+        tipos.update({columna: pa.timestamp('ns') for columna in self.fechas})
+        formatos = sorted({formato for formato in self.fechas.values() if formato != 'ISO8601'})
+        return pv.ConvertOptions(column_types=tipos, timestamp_parsers=[pv.ISO8601, *formatos])
+
+    def a_dict(self) -> Dict[str, Any]:
+        """Representación serializable en JSON."""
+        return {'columnas': list(self.columnas), 'tipos': self.tipos,
+                'fechas': self.fechas, 'huella': self.huella}
+
+    @classmethod
+    def desde_dict(cls, datos: Dict[str, Any]) -> 'EsquemaCsv':
+        """Reconstruye el esquema a partir de a_dict()."""
+        return cls(tuple(datos['columnas']), dict(datos['tipos']), dict(datos['fechas']), datos['huella'])
+
+
+def huella_cabecera(columnas: List[str]) -> str:
+    """
+    Huella estable de una cabecera, para usarla como clave del registro
+    cuando los archivos no tienen un nombre de feed fijo.
+
+    Ejemplos:
+    --------
+    >>> huella_cabecera(['id', 'fecha', 'importe'])
+    '90aece78635d7797'
+    """
+    return hashlib.sha256('\x1f'.join(columnas).encode('utf-8')).hexdigest()[:16]
+
+
+def leer_cabecera(origen: Union[Path, BinaryIO], sep: str = ",", encoding: str = "utf-8",
+                  compression: Optional[str] = 'infer') -> List[str]:
+    """
+    Lee solo la cabecera del CSV. Los buffers se devuelven a su posición
+    para poder cargarlos después.
+    """
+    posicion = None if isinstance(origen, Path) else origen.tell()
+    try:
+        return list(pd.read_csv(origen, sep=sep, encoding=encoding, compression=compression,
+                                nrows=0).columns)
+    finally:
+        if posicion is not None:
+            origen.seek(posicion)
+
+
+def inferir_esquema(ruta: OrigenDatos, sep: str = ",", encoding: str = "utf-8",
+                    compression: Optional[str] = 'infer',
+                    filas_muestra: int = FILAS_MUESTRA_ESQUEMA,
+                    dia_primero: Optional[bool] = None) -> EsquemaCsv:
+    """
+    Infiere el esquema de un CSV a partir de sus primeras filas.
+
+    Los enteros se guardan como 'Int64' para que un día con vacíos no los
+    convierta en decimales, y las columnas sin ningún valor en la muestra
+    como 'object'. Las columnas de texto cuyos valores son todos fechas se
+    marcan como fechas con el formato detectado (ver
+    detectar_formato_fecha()).
+
+    Parámetros:
+    ----------
+    ruta : OrigenDatos
+        Ruta o buffer del CSV de muestra.
+    sep, encoding, compression :
+        Igual que en cargar_csv().
+    filas_muestra : int, opcional
+        Filas que se leen para inferir los tipos. Por defecto es 10_000.
+    dia_primero : Optional[bool], opcional
+        Cómo resolver fechas ambiguas como 03/04/2024. Con None (por
+        defecto) las columnas ambiguas se avisan y se guardan como 'object'.
+
+    Retorna:
+    -------
+    EsquemaCsv
+        El esquema inferido.
+
+    Errores:
+    -------
+    - Lanza FileNotFoundError si el archivo no existe.
+    - Lanza TypeError si filas_muestra no es un entero positivo.
+
+    Ejemplos:
+    --------
+    >>> esquema = inferir_esquema("ventas_2024-05-01.csv", sep=";")
+    >>> esquema.tipos
+    {'id': 'Int64', 'importe': 'float64', 'cliente': 'object'}
+    """
+    if not isinstance(filas_muestra, int) or isinstance(filas_muestra, bool) or filas_muestra < 1:
+        raise TypeError("El parámetro 'filas_muestra' debe ser un entero positivo")
+
+    origen, _ = resolver_origen(ruta)
+    posicion = None if isinstance(origen, Path) else origen.tell()
+    try:
+        muestra = pd.read_csv(origen, sep=sep, encoding=encoding, compression=compression,
+                              nrows=filas_muestra)
+    finally:
+        if posicion is not None:
+            origen.seek(posicion)
+
+    tipos: Dict[str, str] = {}
+    fechas: Dict[str, str] = {}
+    for columna in muestra.columns:
+        serie = muestra[columna]
+        if serie.isna().all():
+            tipos[columna] = 'object'
+        elif pd.api.types.is_bool_dtype(serie):
+            tipos[columna] = 'boolean'
+        elif pd.api.types.is_integer_dtype(serie):
+            tipos[columna] = 'Int64'
+        elif pd.api.types.is_float_dtype(serie):
+            tipos[columna] = 'float64'
+        else:
+            formato = detectar_formato_fecha(serie, dia_primero, filas_muestra)
+            if formato is not None:
+                fechas[columna] = formato
+            else:
+                tipos[columna] = 'object'
+
+    columnas = list(muestra.columns)
+    return EsquemaCsv(tuple(columnas), tipos, fechas, huella_cabecera(columnas))
+
+
+def comprobar_cabecera(esquema: EsquemaCsv, columnas: List[str], nombre: Union[str, Path]) -> None:
+    """
+    Comprueba que la cabecera tiene las columnas del esquema.
+
+    Errores:
+    -------
+    - Lanza ValueError si faltan o sobran columnas.
+    """
+    faltan = [columna for columna in esquema.columnas if columna not in columnas]
+    sobran = [columna for columna in columnas if columna not in esquema.columnas]
+    if faltan or sobran:
+        detalle = []
+        if faltan:
+            detalle.append(f"faltan {faltan}")
+        if sobran:
+            detalle.append(f"sobran {sobran}")
+        raise ValueError(
+            f"El esquema del archivo '{nombre}' no coincide con el registrado: {', '.join(detalle)}. "
+            f"Si el cambio es esperado, vuelve a inferir el esquema."
+        )
+
+
+def comprobar_fechas(esquema: EsquemaCsv, df: pd.DataFrame, nombre: Union[str, Path]) -> None:
+    """
+    Comprueba que las columnas de fecha del esquema se han convertido;
+    pandas deja como texto las que no encajan con el formato.
+
+    Errores:
+    -------
+    - Lanza ValueError si alguna columna de fecha no se pudo convertir.
+    """
+    fallidas = [columna for columna in esquema.fechas
+                if columna in df.columns and not pd.api.types.is_datetime64_any_dtype(df[columna])]
+    if fallidas:
+        raise ValueError(
+            f"El esquema del archivo '{nombre}' no coincide con el registrado: "
+            f"las columnas {fallidas} no tienen fechas con el formato esperado."
+        )
+
+
+def es_error_de_conversion(e: Exception) -> bool:
+    """True si la excepción es de un valor que no encaja con el tipo pedido."""
+    if isinstance(e, (pd.errors.ParserError, pd.errors.EmptyDataError, UnicodeError)):
+        return False
+    if isinstance(e, (ValueError, TypeError)):
+        return True
+    # pyarrow.csv: "CSV conversion error to int64: invalid value 'abc'"
+    return type(e).__name__ == 'ArrowInvalid' and 'conversion error' in str(e).lower()
+
+
+def error_conversion(e: Exception, nombre: Union[str, Path]) -> ValueError:
+    """Construye el error de un valor que no encaja con el esquema registrado."""
+    return ValueError(
+        f"El esquema del archivo '{nombre}' no coincide con el registrado: "
+        f"hay valores que no encajan con su tipo. Error: {str(e)}"
+    )
+
+
+class RegistroEsquemas:
+    """
+    Registro de esquemas de CSV guardado en un archivo JSON.
+
+    Cada esquema se guarda con una clave: el nombre del feed o, si no se
+    indica, la huella de su cabecera. El archivo se relee en cada consulta
+    y se reescribe de forma atómica, de modo que varios procesos pueden
+    compartirlo.
+
+    Ejemplos:
+    --------
+    >>> registro = RegistroEsquemas("esquemas.json")
+    >>> esquema = registro.esquema_para("ventas_2024-05-02.csv", clave="ventas", sep=";")
+    >>> df = cargar_csv("ventas_2024-05-02.csv", sep=";", esquema=esquema)
+    """
+
+    def __init__(self, ruta: Union[str, Path]):
+        if not isinstance(ruta, (str, Path)):
+            raise TypeError("El parámetro 'ruta' debe ser str o Path")
+        self.ruta = Path(ruta)
+
+    def obtener(self, clave: str) -> Optional[EsquemaCsv]:
+        """Esquema registrado con la clave, o None si no hay ninguno."""
+        _validar_clave(clave)
+        datos = self._leer().get(clave)
+        return EsquemaCsv.desde_dict(datos) if datos is not None else None
+
+    def guardar(self, clave: str, esquema: EsquemaCsv) -> None:
+        """Registra el esquema con la clave, sustituyendo el anterior si lo había."""
+        _validar_clave(clave)
+        if not isinstance(esquema, EsquemaCsv):
+            raise TypeError("El parámetro 'esquema' debe ser EsquemaCsv")
+        esquemas = self._leer()
+        esquemas[clave] = esquema.a_dict()
+        self._escribir(esquemas)
+
+    def eliminar(self, clave: str) -> None:
+        """Elimina el esquema de la clave, para que se vuelva a inferir."""
+        _validar_clave(clave)
+        esquemas = self._leer()
+        if esquemas.pop(clave, None) is not None:
+            self._escribir(esquemas)
+
+    def esquema_para(self, ruta: OrigenDatos, clave: Optional[str] = None, sep: str = ",",
+                     encoding: str = "utf-8", compression: Optional[str] = 'infer',
+                     filas_muestra: int = FILAS_MUESTRA_ESQUEMA) -> EsquemaCsv:
+        """
+        Devuelve el esquema registrado para el CSV, infiriéndolo y
+        registrándolo la primera vez.
+
+        Parámetros:
+        ----------
+        ruta : OrigenDatos
+            CSV que se va a cargar.
+        clave : Optional[str], opcional
+            Nombre del feed. Si es None se usa la huella de la cabecera, de
+            modo que un cambio de columnas da lugar a otro esquema en lugar
+            de a un error; con un nombre de feed el cambio se detecta al
+            cargar. Por defecto es None.
+        sep, encoding, compression, filas_muestra :
+            Igual que en inferir_esquema().
+
+        Retorna:
+        -------
+        EsquemaCsv
+            El esquema, listo para pasarlo a cargar_csv(esquema=...).
+        """
+        # Se resuelve una sola vez: un flujo no posicionable se lee entero
+        # al resolverlo y la cabecera y la inferencia usan la copia
+        origen, _ = resolver_origen(ruta)
+        if clave is None:
+            clave = huella_cabecera(leer_cabecera(origen, sep, encoding, compression))
+
+        esquema = self.obtener(clave)
+        if esquema is None:
+            esquema = inferir_esquema(origen, sep=sep, encoding=encoding, compression=compression,
+                                      filas_muestra=filas_muestra)
+            self.guardar(clave, esquema)
+        return esquema
+
+    def _leer(self) -> Dict[str, Any]:
+        """Esquemas del archivo por clave; vacío si el archivo no existe."""
+        if not self.ruta.exists():
+            return {}
+        try:
+            contenido = json.loads(self.ruta.read_text(encoding='utf-8'))
+        except json.JSONDecodeError as e:
+            raise ValueError(f"El registro de esquemas '{self.ruta}' no es un JSON válido. Error: {str(e)}")
+        return contenido.get('esquemas', {})
+
+    def _escribir(self, esquemas: Dict[str, Any]) -> None:
+        """Reescribe el archivo de forma atómica (temporal + os.replace)."""
+        contenido = json.dumps({'version': VERSION_REGISTRO, 'esquemas': esquemas},
+                               indent=2, ensure_ascii=False)
+        self.ruta.parent.mkdir(parents=True, exist_ok=True)
+        descriptor, temporal = tempfile.mkstemp(dir=self.ruta.parent, suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'w', encoding='utf-8') as archivo:
+                archivo.write(contenido)
+            os.replace(temporal, self.ruta)
+        except BaseException:
+            os.unlink(temporal)
+            raise
+
+
+def _validar_clave(clave: Any) -> None:
+    """Lanza TypeError si la clave no es un str no vacío."""
+    if not isinstance(clave, str) or not clave:
+        raise TypeError("El parámetro 'clave' debe ser un str no vacío")
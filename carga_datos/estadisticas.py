@@ -0,0 +1,209 @@
+"""
+Módulo para medir en qué se va el tiempo y la memoria de una carga.
+
+Este módulo contiene el registro EstadisticasCarga que devuelven los
+cargadores con devolver_estadisticas=True, y el MedidorCarga que lo
+rellena fase a fase. Solo se usa si se piden estadísticas, de modo que
+las cargas normales no tienen ningún coste añadido.
+"""
+
+import contextlib
+import io
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, BinaryIO, ContextManager, NamedTuple, Optional, Tuple, Union
+
+from .progreso import abrir_con_progreso, tamano_origen
+
+
+class EstadisticasCarga(NamedTuple):
+    """
+    Desglose de una carga: tiempo por fase, volumen y memoria.
+
+    La fase de lectura se divide en E/S (tiempo esperando a las lecturas
+    del origen) y parseo (el resto: descompresión, parseo e inferencia de
+    tipos del motor). La conversión es el paso del resultado del motor al
+    tipo pedido, por ejemplo de pyarrow.Table a DataFrame; pandas.read_csv
+    y pandas.read_excel convierten mientras parsean, así que con ellos la
+    conversión va incluida en el parseo.
+
+    Atributos:
+    ---------
+    motor : str
+        Librería que leyó el archivo: 'pandas', 'pyarrow.csv',
+        'pyarrow.parquet', 'pyarrow.ipc' o el engine de Excel.
+    segundos_validacion : float
+        Tiempo validando la ruta (procesar_ruta, exists, is_file) o
+        preparando el buffer y, en cargar_archivo, detectando el formato.
+    segundos_io : float
+        Tiempo dentro de las lecturas del origen.
+    segundos_parseo : float
+        Tiempo de lectura que no es E/S.
+    segundos_conversion : float
+        Tiempo convirtiendo el resultado del motor al tipo pedido.
+    segundos_totales : float
+        Tiempo total de la carga, validación incluida.
+    bytes_leidos : int
+        Bytes leídos del origen (comprimidos, si lo está).
+    filas : Optional[int]
+        Filas del resultado, o None si es un iterador o un RecordBatchReader.
+    columnas : Optional[int]
+        Columnas del resultado, o None si es un iterador o un RecordBatchReader.
+    memoria_pico : Optional[int]
+        Pico aproximado de memoria reservada durante la lectura y la
+        conversión, en bytes: lo que registra tracemalloc (Python y NumPy)
+        más el pool de memoria de pyarrow. None si no se llegó a leer.
+    """
+    motor: str
+    segundos_validacion: float
+    segundos_io: float
+    segundos_parseo: float
+    segundos_conversion: float
+    segundos_totales: float
+    bytes_leidos: int
+    filas: Optional[int]
+    columnas: Optional[int]
+    memoria_pico: Optional[int]
+
+
+class MedidorCarga:
+    """
+    Acumula los tiempos, bytes y memoria de una carga para construir su
+    EstadisticasCarga.
+
+    Parámetros:
+    ----------
+    motor : str
+        Librería que va a leer el archivo.
+
+    Ejemplos:
+    --------
+    >>> medidor = MedidorCarga('pandas')
+    >>> with medidor.fase('validacion'):
+    ...     origen, nombre = resolver_origen("datos.csv")
+    >>> with medidor.memoria(), medidor.fase('lectura'):
+    ...     df = pd.read_csv(origen)
+    >>> medidor.estadisticas(df).filas
+    3
+    """
+
+    def __init__(self, motor: str):
+        self.motor = motor
+        self.inicio = time.perf_counter()
+        self.segundos = {'validacion': 0.0, 'lectura': 0.0, 'conversion': 0.0}
+        self.segundos_io = 0.0
+        self.bytes_leidos = 0
+        self.memoria_pico: Optional[int] = None
+
+    @contextlib.contextmanager
+    def fase(self, nombre: str):
+        """Suma a la fase indicada el tiempo de lo que se ejecute dentro."""
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.segundos[nombre] += time.perf_counter() - inicio
+
+    def registrar_lectura(self, bytes_leidos: int, segundos: float) -> None:
+        """Suma una lectura del origen (la llama LectorConProgreso)."""
+        self.bytes_leidos += bytes_leidos
+        self.segundos_io += segundos
+
+    @contextlib.contextmanager
+    def memoria(self):
+        """
+        Mide el pico de memoria de lo que se ejecute dentro con tracemalloc
+        y el pool de pyarrow. Si tracemalloc ya estaba activo se reutiliza
+        (reiniciando su pico) y no se detiene al salir.
+        """
+        pool = _pool_arrow()
+        arrow_antes = pool.bytes_allocated() if pool is not None else 0
+        arrow_maximo_antes = pool.max_memory() if pool is not None else 0
+
+        ya_activo = tracemalloc.is_tracing()
+        if ya_activo:
+            python_antes = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        else:
+            python_antes = 0
+            tracemalloc.start()
+
+        try:
+            yield
+        finally:
+            python_pico = tracemalloc.get_traced_memory()[1] - python_antes
+            if not ya_activo:
+                tracemalloc.stop()
+
+            arrow_pico = 0
+            if pool is not None:
+                # max_memory() es el máximo de todo el proceso y no se puede
+                # reiniciar: si no ha crecido, lo que queda reservado es la
+                # mejor cota disponible
+                arrow_maximo = pool.max_memory()
+                if arrow_maximo > arrow_maximo_antes:
+                    arrow_pico = arrow_maximo - arrow_antes
+                else:
+                    arrow_pico = pool.bytes_allocated() - arrow_antes
+            self.memoria_pico = max(python_pico, 0) + max(arrow_pico, 0)
+
+    def estadisticas(self, resultado: Any) -> EstadisticasCarga:
+        """Construye el registro final a partir del resultado de la carga."""
+        # DataFrame y pyarrow.Table tienen shape; iteradores y lectores no
+        forma = getattr(resultado, 'shape', None)
+        filas, columnas = forma if forma is not None else (None, None)
+        return EstadisticasCarga(
+            motor=self.motor,
+            segundos_validacion=self.segundos['validacion'],
+            segundos_io=self.segundos_io,
+            segundos_parseo=max(self.segundos['lectura'] - self.segundos_io, 0.0),
+            segundos_conversion=self.segundos['conversion'],
+            segundos_totales=time.perf_counter() - self.inicio,
+            bytes_leidos=self.bytes_leidos,
+            filas=filas,
+            columnas=columnas,
+            memoria_pico=self.memoria_pico
+        )
+
+
+def medir_fase(medidor: Optional[MedidorCarga], nombre: str) -> ContextManager[None]:
+    """Mide una fase si hay medidor; si no, no hace nada."""
+    return contextlib.nullcontext() if medidor is None else medidor.fase(nombre)
+
+
+def medir_memoria(medidor: Optional[MedidorCarga]) -> ContextManager[None]:
+    """Mide el pico de memoria si hay medidor; si no, no hace nada."""
+    return contextlib.nullcontext() if medidor is None else medidor.memoria()
+
+
+def abrir_medido(origen: Union[Path, BinaryIO], medidor: Optional[MedidorCarga]) -> ContextManager[Any]:
+    """
+    Abre el origen de modo que el medidor cuente el tiempo y los bytes de
+    cada lectura. Sin medidor devuelve el origen tal cual.
+
+    Un io.BytesIO ya está en memoria: no se envuelve, para no perder la
+    lectura sin copia de pyarrow, y su tamaño cuenta como leído sin E/S.
+    """
+    if medidor is None:
+        return contextlib.nullcontext(origen)
+    if isinstance(origen, io.BytesIO):
+        medidor.bytes_leidos += tamano_origen(origen) or 0
+        return contextlib.nullcontext(origen)
+    return abrir_con_progreso(origen, medidor=medidor)
+
+
+def con_estadisticas(resultado: Any, medidor: Optional[MedidorCarga]) -> Union[Any, Tuple[Any, EstadisticasCarga]]:
+    """Devuelve el resultado, o (resultado, estadísticas) si hay medidor."""
+    if medidor is None:
+        return resultado
+    return resultado, medidor.estadisticas(resultado)
+
+
+def _pool_arrow() -> Any:
+    """Pool de memoria por defecto de pyarrow, o None si no está instalado."""
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return None
+    return pa.default_memory_pool()
@@ -0,0 +1,232 @@
+"""
+Módulo de detección y conversión de columnas de fecha.
+
+Este módulo detecta, a partir de una muestra de cada columna de texto, si
+sus valores son fechas y con qué formato (ISO 8601, '%d/%m/%Y'...), y
+convierte la columna entera con ese formato explícito: pandas no tiene que
+adivinar el formato fila a fila. Cuando los valores encajan tanto con día
+primero como con mes primero (todos los días son menores o iguales que
+12) no se elige uno en silencio: se avisa con logging.warning y la columna
+se deja como texto, salvo que se indique dia_primero.
+"""
+
+import functools
+import logging
+import re
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+from .utils import posiciones_muestra, muestra_arrow
+
+
+# Valores no vacíos de cada columna con los que se detecta el formato
+FILAS_MUESTRA_FECHAS = 1000
+
+# Fechas ISO 8601 (2024-05-01, 2024-05-01T10:30:00...); se exige el patrón
+# completo para no tomar por fechas años sueltos o códigos numéricos
+PATRON_FECHA_ISO = re.compile(r'^\d{4}-\d{2}-\d{2}([ T]\d{2}:\d{2}(:\d{2}(\.\d+)?)?)?$')
+
+# Formatos que se prueban además de ISO 8601, en orden de preferencia. Los
+# de día primero van delante de su equivalente con mes primero, que es el
+# orden habitual en los archivos en español
+FORMATOS_FECHA = (
+    '%d/%m/%Y', '%m/%d/%Y', '%d/%m/%Y %H:%M', '%m/%d/%Y %H:%M',
+    '%d/%m/%Y %H:%M:%S', '%m/%d/%Y %H:%M:%S',
+    '%d-%m-%Y', '%m-%d-%Y', '%d.%m.%Y', '%Y/%m/%d',
+    '%d/%m/%y', '%m/%d/%y', '%Y%m%d',
+)
+
+# Cualquier fecha de los formatos anteriores empieza por un dígito y tiene
+# al menos 6 caracteres; se descartan así las columnas de texto corriente
+# sin probar ningún formato
+_PATRON_CANDIDATA = re.compile(r'^\d[\d/.\-: T]{5,}$')
+
+
+def detectar_formato_fecha(serie: pd.Series, dia_primero: Optional[bool] = None,
+                           filas_muestra: int = FILAS_MUESTRA_FECHAS) -> Optional[str]:
+    """
+    Detecta el formato de fecha de una columna a partir de una muestra.
+
+    Parámetros:
+    ----------
+    serie : pd.Series
+        Columna de texto.
+    dia_primero : Optional[bool], opcional
+        Cómo resolver las fechas ambiguas como 03/04/2024: True para día
+        primero, False para mes primero. Con None (por defecto) una columna
+        ambigua se avisa con logging.warning y no se detecta.
+    filas_muestra : int, opcional
+        Valores no vacíos que se examinan, repartidos por toda la columna.
+        Si la muestra es ambigua se comprueba la columna entera antes de
+        darla por ambigua. Por defecto es 1000.
+
+    Retorna:
+    -------
+    Optional[str]
+        'ISO8601', un formato de strftime como '%d/%m/%Y', o None si la
+        columna no es de fechas o es ambigua.
+
+    Ejemplos:
+    --------
+    >>> detectar_formato_fecha(pd.Series(['25/12/2024', '01/02/2024']))
+    '%d/%m/%Y'
+    >>> detectar_formato_fecha(pd.Series(['01/02/2024']), dia_primero=False)
+    '%m/%d/%Y'
+    """
+    if not pd.api.types.is_object_dtype(serie) and not pd.api.types.is_string_dtype(serie):
+        return None
+
+    valores = serie.dropna()
+    # Repartida por toda la columna: los archivos ordenados por fecha
+    # tienen al principio solo días menores o iguales que 12
+    muestra = valores.iloc[posiciones_muestra(len(valores), filas_muestra)]
+    encaja_columna = None if len(muestra) == len(valores) else functools.partial(_encaja, valores)
+    return _detectar_en_muestra(muestra, serie.name, dia_primero, encaja_columna)
+
+
+def _detectar_en_muestra(muestra: pd.Series, nombre: Any, dia_primero: Optional[bool],
+                         encaja_columna: Optional[Callable[[str], bool]]) -> Optional[str]:
+    """
+    Detecta el formato con la muestra; si es ambigua entre día y mes
+    primero, decide con encaja_columna (si el formato encaja con la
+    columna entera), salvo que la muestra sea la columna entera (None).
+    """
+    if muestra.empty or not all(isinstance(valor, str) for valor in muestra):
+        return None
+
+    if muestra.str.match(PATRON_FECHA_ISO).all():
+        return 'ISO8601'
+    if not muestra.str.match(_PATRON_CANDIDATA).all():
+        return None
+
+    validos = [formato for formato in FORMATOS_FECHA if _encaja(muestra, formato)]
+    if not validos:
+        return None
+    if len(validos) == 1:
+        return validos[0]
+
+    # Varios formatos encajan: si solo difieren en el orden de día y mes
+    # la muestra es ambigua y se decide con la columna entera
+    dia_primero_validos = [formato for formato in validos if _es_dia_primero(formato)]
+    mes_primero_validos = [formato for formato in validos if not _es_dia_primero(formato)]
+    if dia_primero_validos and mes_primero_validos and encaja_columna is not None:
+        dia_primero_validos = [formato for formato in dia_primero_validos if encaja_columna(formato)]
+        mes_primero_validos = [formato for formato in mes_primero_validos if encaja_columna(formato)]
+        if not dia_primero_validos or not mes_primero_validos:
+            validos = dia_primero_validos + mes_primero_validos
+            return validos[0] if validos else None
+    if dia_primero_validos and mes_primero_validos:
+        if dia_primero is None:
+            logging.warning(
+                f"La columna '{nombre}' tiene fechas ambiguas: encajan con "
+                f"'{dia_primero_validos[0]}' y con '{mes_primero_validos[0]}'. "
+                f"Se deja como texto; indica dia_primero=True o dia_primero=False para convertirla."
+            )
+            return None
+        return dia_primero_validos[0] if dia_primero else mes_primero_validos[0]
+    return validos[0]
+
+
+def _encaja(muestra: pd.Series, formato: str) -> bool:
+    """True si todos los valores de la muestra se leen con el formato."""
+    try:
+        pd.to_datetime(muestra, format=formato)
+    except (ValueError, TypeError):
+        return False
+    return True
+
+
+def _encaja_arrow(valores: Any, formato: str) -> bool:
+    """True si todos los valores de un array de texto de pyarrow se leen con el formato."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    try:
+        pc.strptime(valores, format=formato, unit='ns')
+    except (pa.ArrowInvalid, ValueError):
+        return False
+    return True
+
+
+def _es_dia_primero(formato: str) -> bool:
+    """True si el formato tiene el día delante del mes ('%d/%m/%Y')."""
+    return '%d' in formato and '%m' in formato and formato.index('%d') < formato.index('%m')
+
+
+def convertir_fechas(df: pd.DataFrame, dia_primero: Optional[bool] = None,
+                     filas_muestra: int = FILAS_MUESTRA_FECHAS) -> Tuple[pd.DataFrame, Dict[str, str]]:
+    """
+    Convierte a datetime las columnas de texto que contienen fechas.
+
+    El formato se detecta una vez por columna con detectar_formato_fecha()
+    y la columna entera se convierte con ese formato explícito. Si algún
+    valor fuera de la muestra no encaja, la columna se deja como texto y
+    se avisa con logging.warning.
+
+    Retorna:
+    -------
+    Tuple[pd.DataFrame, Dict[str, str]]
+        El DataFrame (el mismo objeto, con las columnas convertidas) y el
+        formato de cada columna convertida.
+
+    Ejemplos:
+    --------
+    >>> df, formatos = convertir_fechas(df)
+    >>> formatos
+    {'fecha_alta': '%d/%m/%Y'}
+    """
+    formatos = {}
+    for columna in df.columns:
+        formato = detectar_formato_fecha(df[columna], dia_primero, filas_muestra)
+        if formato is None:
+            continue
+        try:
+            df[columna] = pd.to_datetime(df[columna], format=formato)
+        except (ValueError, TypeError) as e:
+            _avisar_conversion_fallida(columna, formato, e)
+            continue
+        formatos[columna] = formato
+    return df, formatos
+
+
+def convertir_fechas_arrow(tabla: Any, dia_primero: Optional[bool] = None,
+                           filas_muestra: int = FILAS_MUESTRA_FECHAS) -> Tuple[Any, Dict[str, str]]:
+    """
+    Igual que convertir_fechas() para una pyarrow.Table: el formato se
+    detecta con la misma muestra repartida por la columna (y, si es
+    ambigua, con la columna entera) y la conversión la hace
+    pyarrow.compute sin pasar por pandas.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    formatos = {}
+    for indice, campo in enumerate(tabla.schema):
+        if not pa.types.is_string(campo.type) and not pa.types.is_large_string(campo.type):
+            continue
+        columna = tabla.column(indice)
+        valores = columna.drop_null()
+        muestra = muestra_arrow(valores, filas_muestra, campo.name)
+        encaja_columna = None if len(muestra) == len(valores) else functools.partial(_encaja_arrow, valores)
+        formato = _detectar_en_muestra(muestra, campo.name, dia_primero, encaja_columna)
+        if formato is None:
+            continue
+        try:
+            if formato == 'ISO8601':
+                convertida = pc.cast(columna, pa.timestamp('ns'))
+            else:
+                convertida = pc.strptime(columna, format=formato, unit='ns')
+        except (pa.ArrowInvalid, ValueError) as e:
+            _avisar_conversion_fallida(campo.name, formato, e)
+            continue
+        tabla = tabla.set_column(indice, campo.name, convertida)
+        formatos[campo.name] = formato
+    return tabla, formatos
+
+
+def _avisar_conversion_fallida(columna: Any, formato: str, e: Exception) -> None:
+    """Avisa de una columna cuya muestra era de fechas pero el resto no encaja."""
+    logging.warning(
+        f"La columna '{columna}' parecía de fechas con formato '{formato}' pero no todos sus "
+        f"valores encajan; se deja como texto. Error: {str(e)}"
+    )
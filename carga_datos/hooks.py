@@ -0,0 +1,48 @@
+"""
+Módulo de hooks de trazas para las funciones de carga.
+
+El registro de hooks es el de hooks.py de la librería, compartido con
+normalizacion_texto: un hook registrado aquí recibe también los eventos
+de las normalizaciones (se distinguen por EventoTraza.funcion). Este
+módulo solo define los atributos de los eventos de las cargas.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+try:
+    from ..hooks import EVENTOS, EventoTraza, HookTraza, registrar_hook, eliminar_hook, hay_hooks, crear_trazar
+except ImportError:
+    # carga_datos importado como paquete de primer nivel (p. ej. en los tests)
+    from hooks import EVENTOS, EventoTraza, HookTraza, registrar_hook, eliminar_hook, hay_hooks, crear_trazar
+
+from .utils import describir_origen
+
+__all__ = ["EVENTOS", "EventoTraza", "HookTraza", "registrar_hook", "eliminar_hook", "hay_hooks", "trazar"]
+
+
+def _atributos_inicio(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Origen de la carga y parámetros con nombre de tipo simple."""
+    ruta = args[0] if args else kwargs.get('ruta')
+    atributos: Dict[str, Any] = {
+        'origen': str(ruta) if isinstance(ruta, (str, Path)) else describir_origen(ruta)
+    }
+    for clave, valor in kwargs.items():
+        if clave != 'ruta' and (valor is None or isinstance(valor, (str, int, float, bool))):
+            atributos[clave] = valor
+    return atributos
+
+
+def _atributos_fin(resultado: Any) -> Dict[str, Any]:
+    """Filas y columnas del resultado, si es un DataFrame o una tabla."""
+    if isinstance(resultado, tuple):
+        # (resultado, EstadisticasCarga) con devolver_estadisticas=True
+        resultado = resultado[0]
+    forma = getattr(resultado, 'shape', None)
+    if forma is None:
+        return {}
+    return {'filas': forma[0], 'columnas': forma[1]}
+
+
+# Decorador que emite los eventos de traza de una función de carga
+trazar = crear_trazar(_atributos_inicio, _atributos_fin)
@@ -0,0 +1,664 @@
+"""
+Módulo para estimar la memoria necesaria antes de cargar un archivo.
+
+Este módulo contiene funciones que calculan cuánta memoria ocuparía un
+archivo una vez cargado como DataFrame, sin llegar a cargarlo completo,
+para poder rechazar o fragmentar la carga antes de agotar la memoria.
+"""
+
+import gzip
+import io
+import struct
+from pathlib import Path
+from typing import Any, BinaryIO, List, NamedTuple, Optional, Tuple, Union
+
+import pandas as pd
+
+from .utils import buffer_arrow, abrir_fuente_arrow, abrir_tabla_arrow, leer_muestra_lineas
+
+
+# Bytes leídos del inicio de un CSV para calcular el factor de expansión
+BYTES_MUESTRA_CSV: int = 1024 * 1024
+
+# Filas leídas del inicio de una hoja Excel para calcular el coste por fila
+FILAS_MUESTRA_XLSX: int = 200
+
+# Coste aproximado en memoria de cada valor de texto en una columna object
+# (cabecera del objeto str de Python más el puntero en el array de pandas)
+SOBRECOSTE_TEXTO: int = 57
+
+# Extensiones con las que pandas infiere la compresión de un CSV
+EXTENSIONES_COMPRESION = {
+    '.gz': 'gzip',
+    '.zst': 'zstd',
+    '.bz2': 'bz2',
+    '.xz': 'xz',
+    '.zip': 'zip',
+}
+
+
+class EstimacionMemoria(NamedTuple):
+    """
+    Resultado de estimar la memoria de un archivo cargado como DataFrame.
+
+    Atributos:
+    ---------
+    bytes_estimados : int
+        Memoria total estimada del DataFrame resultante.
+    bytes_por_fila : float
+        Memoria estimada por fila, usada para dimensionar fragmentos.
+    """
+    bytes_estimados: int
+    bytes_por_fila: float
+
+
+def estimar_memoria_csv(ruta: Union[str, Path, BinaryIO], sep: str = ",",
+                        encoding: str = "utf-8",
+                        compression: Optional[str] = 'infer') -> Optional[EstimacionMemoria]:
+    """
+    Estima la memoria que ocupará un CSV cargado como DataFrame.
+
+    Parsea una muestra del inicio del archivo (hasta BYTES_MUESTRA_CSV bytes,
+    cortada en el último salto de línea), calcula el factor de expansión
+    entre bytes en disco y bytes en memoria y lo aplica al tamaño total.
+
+    Para los CSV comprimidos con gzip el tamaño total es el tamaño sin
+    comprimir que guarda el pie del gzip (módulo 4 GiB, como define el
+    formato). Con otras compresiones no se estima.
+
+    Parámetros:
+    ----------
+    ruta : Union[str, Path, BinaryIO]
+        Ruta del archivo CSV o flujo binario posicionable. La posición del
+        flujo se restaura después de leer la muestra.
+    sep : str, opcional
+        Separador del archivo. Por defecto es ','.
+    encoding : str, opcional
+        Codificación del archivo. Por defecto es 'utf-8'.
+    compression : Optional[str], opcional
+        Compresión del archivo, como en cargar_csv. Por defecto es 'infer'.
+
+    Retorna:
+    -------
+    Optional[EstimacionMemoria]
+        La estimación, o None si la muestra no se puede leer o parsear
+        o la compresión no permite conocer el tamaño sin comprimir
+        (la carga real se encargará de informar del error).
+
+    Ejemplos:
+    --------
+    >>> estimacion = estimar_memoria_csv("datos.csv", sep=";")
+    >>> estimacion.bytes_estimados
+    52428800
+    """
+    if compression == 'infer':
+        compression = (EXTENSIONES_COMPRESION.get(Path(ruta).suffix.lower())
+                       if isinstance(ruta, (str, Path)) else None)
+    if compression == 'gzip':
+        return _estimar_memoria_csv_gzip(ruta, sep, encoding)
+    if compression is not None:
+        return None
+
+    try:
+        if isinstance(ruta, (str, Path)):
+            tamano = Path(ruta).stat().st_size
+            with open(ruta, 'rb') as archivo:
+                muestra = archivo.read(BYTES_MUESTRA_CSV)
+        else:
+            posicion = ruta.tell()
+            tamano = ruta.seek(0, io.SEEK_END) - posicion
+            ruta.seek(posicion)
+            muestra = ruta.read(BYTES_MUESTRA_CSV)
+            ruta.seek(posicion)
+    except Exception:
+        return None
+
+    return _estimar_desde_muestra(muestra, tamano, sep, encoding)
+
+
+def _estimar_memoria_csv_gzip(ruta: Union[str, Path, BinaryIO], sep: str,
+                              encoding: str) -> Optional[EstimacionMemoria]:
+    """
+    Estima la memoria de un CSV comprimido con gzip usando el tamaño sin
+    comprimir de su pie (ISIZE) y una muestra descomprimida del inicio.
+    """
+    posicion = None if isinstance(ruta, (str, Path)) else ruta.tell()
+    archivo = open(ruta, 'rb') if posicion is None else ruta
+    try:
+        archivo.seek(-4, io.SEEK_END)
+        tamano = struct.unpack('<I', archivo.read(4))[0]
+        archivo.seek(0 if posicion is None else posicion)
+        muestra = gzip.GzipFile(fileobj=archivo).read(BYTES_MUESTRA_CSV)
+    except Exception:
+        return None
+    finally:
+        if posicion is None:
+            archivo.close()
+        else:
+            ruta.seek(posicion)
+
+    return _estimar_desde_muestra(muestra, tamano, sep, encoding)
+
+
+def _estimar_desde_muestra(muestra: bytes, tamano: int, sep: str,
+                           encoding: str) -> Optional[EstimacionMemoria]:
+    """
+    Parsea la muestra de un CSV y extrapola su coste en memoria a `tamano` bytes.
+    """
+    try:
+        if tamano > len(muestra):
+            # Descartar la última línea incompleta de la muestra
+            muestra = muestra[:muestra.rfind(b'\n') + 1]
+        df_muestra = pd.read_csv(io.BytesIO(muestra), sep=sep, encoding=encoding)
+    except Exception:
+        return None
+
+    if df_muestra.empty or not muestra:
+        return None
+
+    bytes_muestra = int(df_muestra.memory_usage(deep=True, index=True).sum())
+    factor_expansion = bytes_muestra / len(muestra)
+    return EstimacionMemoria(
+        bytes_estimados=int(tamano * factor_expansion),
+        bytes_por_fila=bytes_muestra / len(df_muestra)
+    )
+
+
+def estimar_memoria_parquet(ruta: Union[str, Path, BinaryIO],
+                            columns: Optional[List[str]] = None) -> Optional[EstimacionMemoria]:
+    """
+    Estima la memoria que ocupará un Parquet cargado como DataFrame.
+
+    Usa el tamaño sin comprimir de cada columna que figura en el pie
+    (footer) del archivo, sin leer los datos. A las columnas de texto
+    (BYTE_ARRAY) se les suma SOBRECOSTE_TEXTO bytes por valor, ya que
+    pandas las materializa como objetos str de Python.
+
+    Parámetros:
+    ----------
+    ruta : Union[str, Path, BinaryIO]
+        Ruta del archivo Parquet o flujo binario posicionable.
+    columns : Optional[List[str]], opcional
+        Columnas que se van a cargar. Si es None, se cuentan todas.
+
+    Retorna:
+    -------
+    Optional[EstimacionMemoria]
+        La estimación, o None si el pie del archivo no se puede leer.
+
+    Ejemplos:
+    --------
+    >>> estimar_memoria_parquet("datos.parquet", columns=["nombre"]).bytes_estimados
+    1048576
+    """
+    try:
+        import pyarrow.parquet as pq
+        metadatos = pq.ParquetFile(buffer_arrow(ruta)).metadata
+    except Exception:
+        return None
+
+    total = 0
+    for indice_grupo in range(metadatos.num_row_groups):
+        grupo = metadatos.row_group(indice_grupo)
+        for indice_columna in range(grupo.num_columns):
+            columna = grupo.column(indice_columna)
+            nombre_raiz = columna.path_in_schema.split('.')[0]
+            if columns is not None and nombre_raiz not in columns:
+                continue
+            total += columna.total_uncompressed_size
+            if columna.physical_type == 'BYTE_ARRAY':
+                total += columna.num_values * SOBRECOSTE_TEXTO
+
+    filas = metadatos.num_rows
+    return EstimacionMemoria(
+        bytes_estimados=total,
+        bytes_por_fila=total / filas if filas else 0.0
+    )
+
+
+def estimar_memoria_feather(ruta: Union[str, Path, BinaryIO],
+                            columns: Optional[List[str]] = None) -> Optional[EstimacionMemoria]:
+    """
+    Estima la memoria que ocupará un archivo Arrow IPC/Feather como DataFrame.
+
+    Lee solo los metadatos de cada lote (sin descomprimir sus datos): las
+    filas de cada lote y el tamaño de los buffers de cada columna, que en
+    los archivos comprimidos con LZ4 o ZSTD es el tamaño sin comprimir que
+    precede a cada buffer. A las columnas de texto se les suma
+    SOBRECOSTE_TEXTO bytes por valor, igual que en estimar_memoria_parquet.
+    Los diccionarios se cuentan enteros aunque su columna no se cargue.
+
+    Parámetros:
+    ----------
+    ruta : Union[str, Path, BinaryIO]
+        Ruta del archivo o flujo binario posicionable.
+    columns : Optional[List[str]], opcional
+        Columnas que se van a cargar. Si es None, se cuentan todas.
+
+    Retorna:
+    -------
+    Optional[EstimacionMemoria]
+        La estimación, o None si el archivo no se puede abrir.
+
+    Ejemplos:
+    --------
+    >>> estimar_memoria_feather("etapa_1.arrow").bytes_estimados
+    8388608
+    """
+    posicion = None if isinstance(ruta, (str, Path)) else ruta.tell()
+    origen = Path(ruta) if posicion is None else ruta
+    try:
+        import pyarrow as pa
+        fuente, magia = abrir_fuente_arrow(origen)
+        if magia.startswith(b'FEA1'):
+            # Feather V1 no admite compresión: la tabla mapeada no copia datos
+            tabla = abrir_tabla_arrow(origen)
+            esquema, filas = tabla.schema, tabla.num_rows
+            tamanos = [columna.nbytes for columna in tabla.columns]
+        else:
+            esquema, filas, tamanos = _leer_metadatos_ipc(fuente, archivo=magia == b'ARROW1')
+        indices = range(len(esquema)) if columns is None else [esquema.get_field_index(c) for c in columns]
+        if -1 in indices:
+            return None
+    except Exception:
+        return None
+    finally:
+        if posicion is not None:
+            ruta.seek(posicion)
+
+    total = sum(tamanos[indice] for indice in indices) + sum(tamanos[len(esquema):])
+    for indice in indices:
+        tipo = esquema.field(indice).type
+        if pa.types.is_string(tipo) or pa.types.is_large_string(tipo):
+            total += filas * SOBRECOSTE_TEXTO
+
+    return EstimacionMemoria(
+        bytes_estimados=total,
+        bytes_por_fila=total / filas if filas else 0.0
+    )
+
+
+def _leer_metadatos_ipc(fuente: Any, archivo: bool) -> Tuple[Any, int, List[int]]:
+    """
+    Recorre los mensajes de un Arrow IPC sin descomprimir sus datos.
+
+    Retorna el esquema, el total de filas y el tamaño sin comprimir de los
+    buffers de cada columna del esquema, más un último elemento con el de
+    los diccionarios. Si algún tipo no permite repartir los buffers por
+    columna, todos se cuentan en el último elemento.
+    """
+    import pyarrow.ipc as ipc
+
+    if archivo:
+        # 'ARROW1' y dos bytes de relleno preceden al flujo de mensajes
+        fuente.seek(fuente.tell() + 8)
+    lector = ipc.MessageReader.open_stream(fuente)
+    esquema = ipc.read_schema(lector.read_next_message())
+    por_columna = _buffers_por_columna(esquema)
+    tamanos = [0] * (len(esquema) + 1)
+    filas = 0
+
+    while True:
+        try:
+            mensaje = lector.read_next_message()
+        except StopIteration:
+            break
+        if mensaje.type not in ('record batch', 'dictionary'):
+            continue
+        filas_lote, buffers = _tamanos_buffers(mensaje)
+        if mensaje.type == 'dictionary' or por_columna is None:
+            tamanos[-1] += sum(buffers)
+            filas += filas_lote if mensaje.type == 'record batch' else 0
+            continue
+        filas += filas_lote
+        inicio = 0
+        for indice, cantidad in enumerate(por_columna):
+            tamanos[indice] += sum(buffers[inicio:inicio + cantidad])
+            inicio += cantidad
+    return esquema, filas, tamanos
+
+
+def _buffers_por_columna(esquema: Any) -> Optional[List[int]]:
+    """Número de buffers IPC de cada columna, o None si algún tipo no se reconoce."""
+    cantidades = [_buffers_tipo(campo.type) for campo in esquema]
+    return None if None in cantidades else cantidades
+
+
+def _buffers_tipo(tipo: Any) -> Optional[int]:
+    """
+    Número de buffers que ocupa un tipo (con sus hijos) en un lote IPC, en
+    el orden del formato columnar de Arrow.
+    """
+    import pyarrow as pa
+
+    if isinstance(tipo, pa.ExtensionType):
+        return _buffers_tipo(tipo.storage_type)
+    if pa.types.is_null(tipo):
+        return 0
+    if pa.types.is_dictionary(tipo):
+        # Solo los índices: los valores van en mensajes de diccionario
+        return 2
+    if pa.types.is_string(tipo) or pa.types.is_large_string(tipo) \
+            or pa.types.is_binary(tipo) or pa.types.is_large_binary(tipo):
+        return 3
+    hijos = [tipo.field(i).type for i in range(tipo.num_fields)]
+    if pa.types.is_list(tipo) or pa.types.is_large_list(tipo) or pa.types.is_map(tipo):
+        propios = 2
+    elif pa.types.is_fixed_size_list(tipo) or pa.types.is_struct(tipo) or pa.types.is_union(tipo):
+        propios = 2 if pa.types.is_union(tipo) and tipo.mode == 'dense' else 1
+    elif not hijos and _es_ancho_fijo(tipo):
+        return 2
+    else:
+        # Vistas de texto, run-end encoded...: buffers variables
+        return None
+    cantidades = [_buffers_tipo(hijo) for hijo in hijos]
+    return None if None in cantidades else propios + sum(cantidades)
+
+
+def _es_ancho_fijo(tipo: Any) -> bool:
+    """El tipo ocupa un ancho fijo en bits (numéricos, booleanos, fechas...)."""
+    try:
+        return tipo.bit_width > 0
+    except ValueError:
+        return False
+
+
+def _tamanos_buffers(mensaje: Any) -> Tuple[int, List[int]]:
+    """
+    Filas y tamaño sin comprimir de cada buffer de un mensaje de lote o de
+    diccionario, leídos de sus metadatos (flatbuffer Message del formato
+    IPC) sin descomprimir el cuerpo: con compresión, cada buffer empieza
+    por su tamaño sin comprimir como int64 (-1 si no se comprimió).
+    """
+    metadatos = mensaje.metadata.to_pybytes()
+    cuerpo = mensaje.body
+    raiz = _referencia_flatbuffer(metadatos, 0)
+    lote = _referencia_flatbuffer(metadatos, _campo_flatbuffer(metadatos, raiz, 2))
+    if mensaje.type == 'dictionary':
+        # DictionaryBatch: id, data (el RecordBatch), isDelta
+        lote = _referencia_flatbuffer(metadatos, _campo_flatbuffer(metadatos, lote, 1))
+
+    campo_filas = _campo_flatbuffer(metadatos, lote, 0)
+    filas = struct.unpack_from('<q', metadatos, campo_filas)[0] if campo_filas else 0
+    comprimido = _campo_flatbuffer(metadatos, lote, 3) is not None
+
+    tamanos = []
+    campo_buffers = _campo_flatbuffer(metadatos, lote, 2)
+    if campo_buffers is not None:
+        vector = _referencia_flatbuffer(metadatos, campo_buffers)
+        for i in range(struct.unpack_from('<I', metadatos, vector)[0]):
+            desplazamiento, longitud = struct.unpack_from('<qq', metadatos, vector + 4 + 16 * i)
+            if comprimido and longitud >= 8:
+                sin_comprimir = struct.unpack_from('<q', cuerpo, desplazamiento)[0]
+                longitud = longitud - 8 if sin_comprimir == -1 else sin_comprimir
+            tamanos.append(longitud)
+    return filas, tamanos
+
+
+def _campo_flatbuffer(datos: bytes, tabla: int, campo: int) -> Optional[int]:
+    """Posición del campo de una tabla flatbuffer, o None si no está presente."""
+    vtable = tabla - struct.unpack_from('<i', datos, tabla)[0]
+    tamano_vtable = struct.unpack_from('<H', datos, vtable)[0]
+    if 4 + 2 * campo >= tamano_vtable:
+        return None
+    desplazamiento = struct.unpack_from('<H', datos, vtable + 4 + 2 * campo)[0]
+    return tabla + desplazamiento if desplazamiento else None
+
+
+def _referencia_flatbuffer(datos: bytes, posicion: int) -> int:
+    """Sigue el desplazamiento (uoffset_t) guardado en posicion."""
+    return posicion + struct.unpack_from('<I', datos, posicion)[0]
+
+
+def estimar_memoria_xlsx(ruta: Union[str, Path, BinaryIO], sheet_name: Union[str, int] = 0,
+                         header: Optional[int] = 0) -> Optional[EstimacionMemoria]:
+    """
+    Estima la memoria que ocupará una hoja Excel cargada como DataFrame.
+
+    Carga las primeras FILAS_MUESTRA_XLSX filas de la hoja para medir el
+    coste en memoria por fila y lo multiplica por el número de filas que
+    declara la dimensión de la hoja.
+
+    Parámetros:
+    ----------
+    ruta : Union[str, Path, BinaryIO]
+        Ruta del archivo Excel o flujo binario posicionable. La posición del
+        flujo se restaura después de leer la muestra.
+    sheet_name : Union[str, int], opcional
+        Nombre o índice de la hoja. Por defecto es 0 (primera hoja).
+    header : Optional[int], opcional
+        Fila de encabezado, como en cargar_xlsx. Por defecto es 0.
+
+    Retorna:
+    -------
+    Optional[EstimacionMemoria]
+        La estimación, o None si la hoja no se puede leer.
+
+    Ejemplos:
+    --------
+    >>> estimar_memoria_xlsx("datos.xlsx", sheet_name="Ventas").bytes_por_fila
+    212.0
+    """
+    posicion = None if isinstance(ruta, (str, Path)) else ruta.tell()
+    try:
+        import openpyxl
+        libro = openpyxl.load_workbook(ruta, read_only=True)
+        try:
+            hoja = libro[sheet_name] if isinstance(sheet_name, str) else libro.worksheets[sheet_name]
+            filas_totales = hoja.max_row or 0
+        finally:
+            libro.close()
+        if posicion is not None:
+            ruta.seek(posicion)
+        df_muestra = pd.read_excel(ruta, sheet_name=sheet_name, header=header,
+                                   nrows=FILAS_MUESTRA_XLSX, engine='openpyxl')
+    except Exception:
+        return None
+    finally:
+        if posicion is not None:
+            ruta.seek(posicion)
+
+    if df_muestra.empty:
+        return None
+
+    bytes_por_fila = df_muestra.memory_usage(deep=True, index=True).sum() / len(df_muestra)
+    return EstimacionMemoria(
+        bytes_estimados=int(bytes_por_fila * filas_totales),
+        bytes_por_fila=bytes_por_fila
+    )
+
+
+def estimar_memoria_ancho_fijo(ruta: Union[str, Path, BinaryIO],
+                               anchos: List[int]) -> Optional[EstimacionMemoria]:
+    """
+    Estima la memoria que ocupará un archivo de ancho fijo como DataFrame.
+
+    Toma la longitud de la primera línea como longitud de registro para
+    calcular las filas, y cuenta cada campo como texto: su ancho más
+    SOBRECOSTE_TEXTO bytes. Las columnas que acaban siendo numéricas
+    ocupan menos, así que la estimación es una cota superior.
+
+    Parámetros:
+    ----------
+    ruta : Union[str, Path, BinaryIO]
+        Ruta del archivo o flujo binario posicionable. La posición del
+        flujo se restaura después de leer la primera línea.
+    anchos : List[int]
+        Ancho en bytes de cada columna que se va a cargar.
+
+    Retorna:
+    -------
+    Optional[EstimacionMemoria]
+        La estimación, o None si el archivo no se puede leer.
+
+    Ejemplos:
+    --------
+    >>> estimar_memoria_ancho_fijo("extracto.txt", [8, 30, 12]).bytes_por_fila
+    221.0
+    """
+    posicion = None if isinstance(ruta, (str, Path)) else ruta.tell()
+    try:
+        if posicion is None:
+            tamano = Path(ruta).stat().st_size
+            with open(ruta, 'rb') as archivo:
+                linea = archivo.readline(BYTES_MUESTRA_CSV)
+        else:
+            linea = ruta.readline(BYTES_MUESTRA_CSV)
+            tamano = ruta.seek(0, io.SEEK_END) - posicion
+    except Exception:
+        return None
+    finally:
+        if posicion is not None:
+            ruta.seek(posicion)
+
+    if not linea:
+        return None
+
+    bytes_por_fila = float(sum(anchos) + len(anchos) * SOBRECOSTE_TEXTO)
+    filas = tamano / len(linea)
+    return EstimacionMemoria(
+        bytes_estimados=int(bytes_por_fila * filas),
+        bytes_por_fila=bytes_por_fila
+    )
+
+
+def estimar_memoria_jsonl(ruta: Union[str, Path, BinaryIO],
+                          esquema: Optional[Any] = None) -> Optional[EstimacionMemoria]:
+    """
+    Estima la memoria que ocupará un archivo JSON Lines como DataFrame.
+
+    Parsea con pyarrow.json las líneas completas de los primeros
+    BYTES_MUESTRA_CSV bytes, mide el tamaño de sus buffers Arrow (más
+    SOBRECOSTE_TEXTO bytes por valor de texto) y lo extrapola al tamaño del
+    archivo a partir de los bytes que ocupa cada línea de la muestra.
+
+    Parámetros:
+    ----------
+    ruta : Union[str, Path, BinaryIO]
+        Ruta del archivo o flujo binario posicionable. La posición del
+        flujo se restaura después de leer la muestra.
+    esquema : Optional[pyarrow.Schema], opcional
+        Esquema con solo las columnas que se van a cargar. Si es None, se
+        cuentan todas.
+
+    Retorna:
+    -------
+    Optional[EstimacionMemoria]
+        La estimación, o None si la muestra no se puede leer.
+
+    Ejemplos:
+    --------
+    >>> estimar_memoria_jsonl("eventos.jsonl").bytes_por_fila
+    184.0
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.json as pj
+        origen = Path(ruta) if isinstance(ruta, (str, Path)) else ruta
+        muestra = leer_muestra_lineas(origen, BYTES_MUESTRA_CSV)
+        tamano = origen.stat().st_size if isinstance(origen, Path) else _tamano_restante(origen)
+        opciones = pj.ParseOptions(explicit_schema=esquema, unexpected_field_behavior='ignore') \
+            if esquema is not None else pj.ParseOptions()
+        tabla = pj.read_json(pa.BufferReader(muestra), parse_options=opciones)
+    except Exception:
+        return None
+
+    if tabla.num_rows == 0:
+        return None
+
+    total = tabla.nbytes
+    for campo in tabla.schema:
+        if pa.types.is_string(campo.type) or pa.types.is_large_string(campo.type):
+            total += tabla.num_rows * SOBRECOSTE_TEXTO
+
+    bytes_por_fila = total / tabla.num_rows
+    filas = tamano / (len(muestra) / tabla.num_rows)
+    return EstimacionMemoria(
+        bytes_estimados=int(bytes_por_fila * filas),
+        bytes_por_fila=bytes_por_fila
+    )
+
+
+def _tamano_restante(flujo: BinaryIO) -> int:
+    """Bytes que quedan por leer en un flujo posicionable, sin moverlo."""
+    posicion = flujo.tell()
+    try:
+        return flujo.seek(0, io.SEEK_END) - posicion
+    finally:
+        flujo.seek(posicion)
+
+
+def supera_limite_memoria(estimacion: Optional[EstimacionMemoria],
+                          limite_memoria: Optional[int]) -> bool:
+    """
+    Comprueba si la estimación de memoria supera el límite configurado.
+
+    Parámetros:
+    ----------
+    estimacion : Optional[EstimacionMemoria]
+        Estimación calculada con alguna de las funciones estimar_memoria_*.
+    limite_memoria : Optional[int]
+        Límite en bytes. Si es None no hay límite.
+
+    Retorna:
+    -------
+    bool
+        True si la estimación supera el límite, False en caso contrario
+        o si no hay estimación disponible.
+    """
+    if limite_memoria is None or estimacion is None:
+        return False
+    return estimacion.bytes_estimados > limite_memoria
+
+
+def error_limite_memoria(estimacion: EstimacionMemoria, limite_memoria: int,
+                         ruta: Union[str, Path]) -> ValueError:
+    """
+    Construye el ValueError que se lanza cuando una carga supera el límite.
+
+    Mantiene el mismo mensaje que los cargadores usan ante un MemoryError,
+    añadiendo la estimación y el límite para facilitar el diagnóstico.
+
+    Parámetros:
+    ----------
+    estimacion : EstimacionMemoria
+        Estimación que superó el límite.
+    limite_memoria : int
+        Límite en bytes.
+    ruta : Union[str, Path]
+        Ruta del archivo (para el mensaje).
+
+    Retorna:
+    -------
+    ValueError
+        La excepción lista para lanzar.
+    """
+    return ValueError(
+        f"El archivo '{ruta}' es demasiado grande para cargar en memoria. "
+        f"Estimación: {estimacion.bytes_estimados / 1024 ** 2:.1f} MB, "
+        f"límite: {limite_memoria / 1024 ** 2:.1f} MB."
+    )
+
+
+def filas_por_fragmento(estimacion: EstimacionMemoria, limite_memoria: int) -> int:
+    """
+    Calcula cuántas filas caben en cada fragmento sin superar el límite.
+
+    Cada fragmento se dimensiona a una cuarta parte del límite para dejar
+    margen a las copias temporales que hace pandas al parsear.
+
+    Parámetros:
+    ----------
+    estimacion : EstimacionMemoria
+        Estimación del archivo completo.
+    limite_memoria : int
+        Límite en bytes.
+
+    Retorna:
+    -------
+    int
+        Número de filas por fragmento (al menos 1).
+    """
+    if estimacion.bytes_por_fila <= 0:
+        return 1
+    return max(1, int(limite_memoria / 4 / estimacion.bytes_por_fila))
@@ -0,0 +1,245 @@
+"""
+Módulo de números con formato regional (1.234,56).
+
+Este módulo define los formatos regionales de los números (separador
+decimal y de miles), detecta a partir de una muestra qué columnas de texto
+son en realidad números con uno de esos formatos y las convierte a int o
+float con pyarrow.compute, sin recorrer los valores en Python.
+"""
+
+import logging
+import re
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+import pandas as pd
+
+from .utils import posiciones_muestra, muestra_arrow
+
+
+# Valores no vacíos de cada columna con los que se detecta el formato
+FILAS_MUESTRA_NUMEROS = 1000
+
+
+class FormatoNumerico(NamedTuple):
+    """
+    Separadores de un formato regional de números.
+
+    Atributos:
+    ---------
+    decimal : str
+        Separador decimal (',' en '1.234,56').
+    miles : Optional[str]
+        Separador de miles ('.' en '1.234,56'), o None si no se usa.
+    """
+    decimal: str
+    miles: Optional[str]
+
+
+# Formatos regionales admitidos en el parámetro locale
+LOCALES = {
+    'es': FormatoNumerico(decimal=',', miles='.'),
+    'de': FormatoNumerico(decimal=',', miles='.'),
+    'fr': FormatoNumerico(decimal=',', miles=' '),
+    'en': FormatoNumerico(decimal='.', miles=','),
+}
+
+
+def resolver_formato_numerico(decimal: Optional[str], miles: Optional[str],
+                              locale: Optional[str]) -> Optional[FormatoNumerico]:
+    """
+    Combina decimal, miles y locale en un FormatoNumerico. Los separadores
+    indicados explícitamente tienen prioridad sobre los del locale.
+
+    Retorna:
+    -------
+    Optional[FormatoNumerico]
+        El formato, o None si no se indicó ninguno de los tres.
+
+    Errores:
+    -------
+    - Lanza TypeError si decimal o miles no son un único carácter, son
+      iguales, o locale no es uno de LOCALES.
+
+    Ejemplos:
+    --------
+    >>> resolver_formato_numerico(None, None, 'es')
+    FormatoNumerico(decimal=',', miles='.')
+    >>> resolver_formato_numerico(',', None, None)
+    FormatoNumerico(decimal=',', miles=None)
+    """
+    for nombre, valor in (('decimal', decimal), ('miles', miles)):
+        if valor is not None and (not isinstance(valor, str) or len(valor) != 1):
+            raise TypeError(f"El parámetro '{nombre}' debe ser un único carácter o None")
+    if locale is not None and locale not in LOCALES:
+        raise TypeError(f"El parámetro 'locale' debe ser uno de: {', '.join(repr(c) for c in LOCALES)}")
+
+    if decimal is None and miles is None and locale is None:
+        return None
+
+    preset = LOCALES[locale] if locale is not None else FormatoNumerico('.', None)
+    formato = FormatoNumerico(decimal if decimal is not None else preset.decimal,
+                              miles if miles is not None else preset.miles)
+    if formato.decimal == formato.miles:
+        raise TypeError("Los parámetros 'decimal' y 'miles' deben ser distintos")
+    return formato
+
+
+def _patron(formato: FormatoNumerico) -> 're.Pattern[str]':
+    """Expresión regular de un número completo con el formato."""
+    decimal = re.escape(formato.decimal)
+    if formato.miles is None:
+        return re.compile(rf'^-?\d+({decimal}\d+)?$')
+    miles = re.escape(formato.miles)
+    return re.compile(rf'^-?(\d{{1,3}}({miles}\d{{3}})+|\d+)({decimal}\d+)?$')
+
+
+def detectar_formato_numerico(serie: pd.Series, preferido: Optional[FormatoNumerico] = None,
+                              filas_muestra: int = FILAS_MUESTRA_NUMEROS) -> Optional[FormatoNumerico]:
+    """
+    Detecta si una columna de texto contiene números con formato regional.
+
+    Solo se examinan columnas de texto: las que pandas ya leyó como
+    números no lo necesitan. Cuando los valores encajan con varios
+    formatos (por ejemplo '1,234' es 1,234 en español y 1234 en inglés) se
+    usa el preferido; si no hay preferido, se avisa con logging.warning y
+    la columna se deja como texto.
+
+    Parámetros:
+    ----------
+    serie : pd.Series
+        Columna de texto.
+    preferido : Optional[FormatoNumerico], opcional
+        Formato con el que resolver las ambigüedades (el del locale).
+    filas_muestra : int, opcional
+        Valores no vacíos que se examinan, repartidos por toda la columna.
+        Por defecto es 1000.
+
+    Retorna:
+    -------
+    Optional[FormatoNumerico]
+        El formato detectado, o None si la columna no es numérica o es
+        ambigua.
+
+    Ejemplos:
+    --------
+    >>> detectar_formato_numerico(pd.Series(['1.234,56', '12,5']))
+    FormatoNumerico(decimal=',', miles='.')
+    """
+    if not pd.api.types.is_object_dtype(serie) and not pd.api.types.is_string_dtype(serie):
+        return None
+
+    valores = serie.dropna()
+    valores = valores.iloc[posiciones_muestra(len(valores), filas_muestra)]
+    if valores.empty or not all(isinstance(valor, str) for valor in valores):
+        return None
+
+    candidatos = list(dict.fromkeys([preferido, *LOCALES.values()]))
+    validos = [formato for formato in candidatos
+               if formato is not None and valores.str.match(_patron(formato)).all()]
+    if not validos:
+        return None
+    # Si todos los formatos válidos comparten el decimal, los valores no
+    # tienen ningún separador de miles que los distinga y se convierten igual
+    if preferido in validos or len({formato.decimal for formato in validos}) == 1:
+        return validos[0]
+
+    logging.warning(
+        f"La columna '{serie.name}' tiene números ambiguos: encajan con decimal "
+        f"'{validos[0].decimal}' y con decimal '{validos[1].decimal}'. Se deja como texto; "
+        f"indica locale, decimal o miles para convertirla."
+    )
+    return None
+
+
+def convertir_numeros(df: pd.DataFrame, preferido: Optional[FormatoNumerico] = None,
+                      filas_muestra: int = FILAS_MUESTRA_NUMEROS) -> Tuple[pd.DataFrame, Dict[str, FormatoNumerico]]:
+    """
+    Convierte a int o float las columnas de texto con números regionales.
+
+    El formato se detecta una vez por columna con
+    detectar_formato_numerico() y la columna entera se convierte con
+    pyarrow.compute (quitar miles, cambiar el decimal por '.' y convertir
+    el tipo). Las columnas sin parte decimal quedan como int64, o como
+    float64 si tienen vacíos, igual que al inferir pandas. Si algún valor
+    fuera de la muestra no encaja, la columna se deja como texto y se
+    avisa con logging.warning.
+
+    Retorna:
+    -------
+    Tuple[pd.DataFrame, Dict[str, FormatoNumerico]]
+        El DataFrame (el mismo objeto, con las columnas convertidas) y el
+        formato de cada columna convertida.
+
+    Ejemplos:
+    --------
+    >>> df, formatos = convertir_numeros(df, LOCALES['es'])
+    >>> df['importe'].dtype
+    dtype('float64')
+    """
+    import pyarrow as pa
+
+    formatos = {}
+    for columna in df.columns:
+        formato = detectar_formato_numerico(df[columna], preferido, filas_muestra)
+        if formato is None:
+            continue
+        try:
+            convertida = _convertir_arrow(pa.array(df[columna], type=pa.string(), from_pandas=True), formato)
+        except (pa.ArrowInvalid, ValueError) as e:
+            _avisar_conversion_fallida(columna, formato, e)
+            continue
+        df[columna] = convertida.to_numpy(zero_copy_only=False)
+        formatos[columna] = formato
+    return df, formatos
+
+
+def convertir_numeros_arrow(tabla: Any, preferido: Optional[FormatoNumerico] = None,
+                            filas_muestra: int = FILAS_MUESTRA_NUMEROS) -> Tuple[Any, Dict[str, FormatoNumerico]]:
+    """
+    Igual que convertir_numeros() para una pyarrow.Table, con la misma
+    muestra repartida por la columna y sin pasar por pandas salvo para
+    examinarla.
+    """
+    import pyarrow as pa
+
+    formatos = {}
+    for indice, campo in enumerate(tabla.schema):
+        if not pa.types.is_string(campo.type) and not pa.types.is_large_string(campo.type):
+            continue
+        columna = tabla.column(indice)
+        muestra = muestra_arrow(columna.drop_null(), filas_muestra, campo.name)
+        formato = detectar_formato_numerico(muestra, preferido, filas_muestra)
+        if formato is None:
+            continue
+        try:
+            convertida = _convertir_arrow(columna, formato)
+        except (pa.ArrowInvalid, ValueError) as e:
+            _avisar_conversion_fallida(campo.name, formato, e)
+            continue
+        tabla = tabla.set_column(indice, campo.name, convertida)
+        formatos[campo.name] = formato
+    return tabla, formatos
+
+
+def _convertir_arrow(columna: Any, formato: FormatoNumerico) -> Any:
+    """Convierte un array de texto de pyarrow con el formato a int64 o float64."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if formato.miles is not None:
+        columna = pc.replace_substring(columna, formato.miles, '')
+    if formato.decimal != '.':
+        columna = pc.replace_substring(columna, formato.decimal, '.')
+
+    tiene_decimales = pc.any(pc.match_substring(columna, '.')).as_py()
+    if tiene_decimales or columna.null_count > 0:
+        return pc.cast(columna, pa.float64())
+    return pc.cast(columna, pa.int64())
+
+
+def _avisar_conversion_fallida(columna: Any, formato: FormatoNumerico, e: Exception) -> None:
+    """Avisa de una columna cuya muestra era numérica pero el resto no encaja."""
+    logging.warning(
+        f"La columna '{columna}' parecía numérica con decimal '{formato.decimal}' y miles "
+        f"'{formato.miles}' pero no todos sus valores encajan; se deja como texto. Error: {str(e)}"
+    )
@@ -0,0 +1,228 @@
+"""
+Módulo para informar del progreso de una carga mientras se ejecuta.
+
+Este módulo contiene el registro ProgresoCarga que reciben los callbacks
+de progreso de los cargadores, y las piezas que lo alimentan: un contador
+de bytes y filas que limita la frecuencia de los avisos, y un lector que
+cuenta los bytes que pasan por él. Solo se usan si se pasa un callback,
+de modo que las cargas sin progreso no tienen ningún coste añadido.
+"""
+
+import io
+import time
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, List, NamedTuple, Optional, Tuple, Union
+
+
+# Segundos mínimos entre dos avisos consecutivos al callback
+INTERVALO_PROGRESO: float = 0.5
+
+# Filas por bloque al leer un CSV con pandas cuando se pide progreso
+FILAS_BLOQUE_PROGRESO: int = 100_000
+
+
+class ProgresoCarga(NamedTuple):
+    """
+    Estado de una carga en curso, tal como lo recibe el callback de progreso.
+
+    Atributos:
+    ---------
+    bytes_leidos : int
+        Bytes leídos del origen hasta ahora (comprimidos, si lo está).
+    bytes_totales : Optional[int]
+        Tamaño total del origen en bytes, o None si no se conoce.
+    filas : int
+        Filas parseadas hasta ahora.
+    segundos : float
+        Segundos transcurridos desde el inicio de la carga.
+    filas_por_segundo : float
+        Velocidad media de parseo desde el inicio.
+    terminado : bool
+        True en el último aviso, cuando la carga ha terminado.
+    """
+    bytes_leidos: int
+    bytes_totales: Optional[int]
+    filas: int
+    segundos: float
+    filas_por_segundo: float
+    terminado: bool
+
+
+CallbackProgreso = Callable[[ProgresoCarga], None]
+
+
+class SeguimientoProgreso:
+    """
+    Acumula los bytes leídos y las filas parseadas de una carga y avisa al
+    callback como mucho una vez cada INTERVALO_PROGRESO segundos, más un
+    aviso final con terminado=True.
+
+    Parámetros:
+    ----------
+    callback : CallbackProgreso
+        Función que recibe cada ProgresoCarga.
+    bytes_totales : Optional[int]
+        Tamaño total del origen, si se conoce.
+
+    Ejemplos:
+    --------
+    >>> seguimiento = SeguimientoProgreso(print, bytes_totales=1024)
+    >>> seguimiento.avanzar(bytes_leidos=512, filas=10)
+    >>> seguimiento.terminar()
+    ProgresoCarga(bytes_leidos=512, bytes_totales=1024, filas=10, ...)
+    """
+
+    def __init__(self, callback: CallbackProgreso, bytes_totales: Optional[int] = None):
+        self.callback = callback
+        self.bytes_totales = bytes_totales
+        self.bytes_leidos = 0
+        self.filas = 0
+        self.inicio = time.perf_counter()
+        self._ultimo_aviso = self.inicio
+
+    def avanzar(self, bytes_leidos: int = 0, filas: int = 0) -> None:
+        """Suma bytes y filas y avisa al callback si ha pasado el intervalo."""
+        self.bytes_leidos += bytes_leidos
+        self.filas += filas
+        ahora = time.perf_counter()
+        if ahora - self._ultimo_aviso >= INTERVALO_PROGRESO:
+            self._avisar(ahora, terminado=False)
+
+    def terminar(self, filas: Optional[int] = None) -> None:
+        """Envía el aviso final. Si se indica, filas sustituye al recuento."""
+        if filas is not None:
+            self.filas = filas
+        self._avisar(time.perf_counter(), terminado=True)
+
+    def _avisar(self, ahora: float, terminado: bool) -> None:
+        self._ultimo_aviso = ahora
+        segundos = ahora - self.inicio
+        self.callback(ProgresoCarga(
+            bytes_leidos=self.bytes_leidos,
+            bytes_totales=self.bytes_totales,
+            filas=self.filas,
+            segundos=segundos,
+            filas_por_segundo=self.filas / segundos if segundos > 0 else 0.0,
+            terminado=terminado
+        ))
+
+
+class LectorConProgreso(io.RawIOBase):
+    """
+    Flujo binario de solo lectura que cuenta los bytes que se leen a
+    través de él y los suma a un SeguimientoProgreso y, si se pide
+    estadísticas, cronometra cada lectura para un MedidorCarga.
+
+    Delega seek y tell en el flujo original para que los lectores que
+    necesitan posicionarse (zipfile para Excel) sigan funcionando. Como
+    zipfile vuelve atrás y relee partes del archivo, al seguimiento solo
+    se suman los bytes que no se habían leído antes: el progreso nunca
+    pasa del tamaño del origen.
+
+    Parámetros:
+    ----------
+    archivo : BinaryIO
+        Flujo binario original.
+    seguimiento : Optional[SeguimientoProgreso]
+        Seguimiento al que se suman los bytes leídos.
+    cerrar : bool, opcional
+        Si es True, cerrar este lector cierra también el flujo original.
+    medidor : Optional[MedidorCarga], opcional
+        Medidor al que se suman los bytes y el tiempo de cada lectura.
+    """
+
+    def __init__(self, archivo: BinaryIO, seguimiento: Optional[SeguimientoProgreso],
+                 cerrar: bool = False, medidor: Optional[Any] = None):
+        self._archivo = archivo
+        self._seguimiento = seguimiento
+        self._cerrar = cerrar
+        self._medidor = medidor
+        self._posicion = archivo.tell() if archivo.seekable() else 0
+        # Tramos [inicio, fin) ya leídos, disjuntos; en una lectura
+        # secuencial hay uno solo
+        self._leidos: List[Tuple[int, int]] = []
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return self._archivo.seekable()
+
+    def seek(self, posicion: int, desde: int = io.SEEK_SET) -> int:
+        self._posicion = self._archivo.seek(posicion, desde)
+        return self._posicion
+
+    def tell(self) -> int:
+        return self._archivo.tell()
+
+    def readinto(self, b) -> int:
+        if self._medidor is None:
+            leidos = self._archivo.readinto(b)
+        else:
+            inicio = time.perf_counter()
+            leidos = self._archivo.readinto(b)
+            self._medidor.registrar_lectura(leidos or 0, time.perf_counter() - inicio)
+        if leidos and self._seguimiento is not None:
+            self._seguimiento.avanzar(bytes_leidos=self._sumar_tramo(self._posicion, self._posicion + leidos))
+        self._posicion += leidos or 0
+        return leidos
+
+    def _sumar_tramo(self, inicio: int, fin: int) -> int:
+        """Añade el tramo [inicio, fin) a los leídos y devuelve sus bytes nuevos."""
+        nuevos = fin - inicio
+        restantes = []
+        for tramo_inicio, tramo_fin in self._leidos:
+            if tramo_fin < inicio or tramo_inicio > fin:
+                restantes.append((tramo_inicio, tramo_fin))
+                continue
+            nuevos -= min(tramo_fin, fin) - max(tramo_inicio, inicio)
+            inicio, fin = min(tramo_inicio, inicio), max(tramo_fin, fin)
+        restantes.append((inicio, fin))
+        self._leidos = sorted(restantes)
+        return nuevos
+
+    def close(self) -> None:
+        if self._cerrar and not self.closed:
+            self._archivo.close()
+        super().close()
+
+
+def abrir_con_progreso(origen: Union[Path, BinaryIO], seguimiento: Optional[SeguimientoProgreso] = None,
+                       medidor: Optional[Any] = None) -> LectorConProgreso:
+    """
+    Abre una ruta (o envuelve un flujo) con un LectorConProgreso.
+
+    Parámetros:
+    ----------
+    origen : Union[Path, BinaryIO]
+        Origen devuelto por resolver_origen().
+    seguimiento : Optional[SeguimientoProgreso], opcional
+        Seguimiento al que se suman los bytes leídos.
+    medidor : Optional[MedidorCarga], opcional
+        Medidor al que se suman los bytes y el tiempo de cada lectura.
+
+    Retorna:
+    -------
+    LectorConProgreso
+        Lector que cuenta los bytes. Si se abrió una ruta, cerrarlo cierra
+        el archivo; los flujos del usuario no se cierran.
+    """
+    if isinstance(origen, Path):
+        return LectorConProgreso(open(origen, 'rb'), seguimiento, cerrar=True, medidor=medidor)
+    return LectorConProgreso(origen, seguimiento, medidor=medidor)
+
+
+def tamano_origen(origen: Union[Path, BinaryIO]) -> Optional[int]:
+    """
+    Devuelve el tamaño en bytes de una ruta o de lo que queda por leer de
+    un flujo posicionable, o None si no se puede saber.
+    """
+    try:
+        if isinstance(origen, Path):
+            return origen.stat().st_size
+        posicion = origen.tell()
+        tamano = origen.seek(0, io.SEEK_END) - posicion
+        origen.seek(posicion)
+        return tamano
+    except (OSError, AttributeError):
+        return None
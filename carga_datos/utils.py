@@ -5,10 +5,29 @@ Este módulo contiene funciones auxiliares que son utilizadas
 por múltiples módulos de carga de datos.
 """
 
+import io
 from pathlib import Path
-from typing import Union
+from typing import TYPE_CHECKING, Any, BinaryIO, Iterator, List, Optional, Tuple, Union
 import logging
 
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+
+
+# Tipos de objetos en memoria que se aceptan como origen de datos
+TIPOS_BUFFER = (bytes, bytearray, memoryview)
+
+# Orígenes de datos que aceptan los cargadores
+OrigenDatos = Union[str, Path, bytes, bytearray, memoryview, BinaryIO]
+
+# Tipos de resultado que pueden pedir los cargadores con el parámetro salida
+SALIDAS = ('pandas', 'arrow', 'lotes')
+
+# Lo que devuelve un cargador según salida y si_excede_memoria
+ResultadoCarga = Union['pd.DataFrame', Iterator['pd.DataFrame'], 'pa.Table', 'pa.RecordBatchReader']
+
 
 def procesar_ruta(ruta: Union[str, Path]) -> Path:
     """
@@ -75,4 +94,484 @@ def manejar_excepcion_inesperada(excepcion: Exception, nombre_funcion: str) -> N
     """
     exception_name = type(excepcion).__name__
     logging.warning(f"Excepción inesperada en {nombre_funcion}: {exception_name}: {str(excepcion)}")
-    raise excepcion
\ No newline at end of file
+    raise excepcion
+
+
+def validar_limite_memoria(limite_memoria: Optional[int], si_excede_memoria: str) -> None:
+    """
+    Valida los parámetros de presupuesto de memoria comunes a los cargadores.
+    
+    Parámetros:
+    ----------
+    limite_memoria : Optional[int]
+        Límite de memoria en bytes, o None para no limitar.
+    si_excede_memoria : str
+        Acción si se supera el límite ('error' o 'fragmentos').
+    
+    Errores:
+    -------
+    - Lanza TypeError si limite_memoria no es int o None, o si
+      si_excede_memoria no es una de las opciones válidas.
+    - Lanza ValueError si limite_memoria no es positivo.
+    
+    Ejemplos:
+    --------
+    >>> validar_limite_memoria(None, 'error')
+    >>> validar_limite_memoria(0, 'error')
+    Traceback (most recent call last):
+    ...
+    ValueError: El parámetro 'limite_memoria' debe ser mayor que 0
+    """
+    if limite_memoria is not None:
+        if isinstance(limite_memoria, bool) or not isinstance(limite_memoria, int):
+            raise TypeError("El parámetro 'limite_memoria' debe ser int o None")
+        if limite_memoria <= 0:
+            raise ValueError("El parámetro 'limite_memoria' debe ser mayor que 0")
+    
+    if si_excede_memoria not in ['error', 'fragmentos']:
+        raise TypeError("El parámetro 'si_excede_memoria' debe ser uno de: 'error', 'fragmentos'")
+
+
+def validar_progreso(progreso: Any) -> None:
+    """
+    Valida el parámetro progreso común a los cargadores.
+    
+    Parámetros:
+    ----------
+    progreso : Any
+        Callback de progreso o None.
+    
+    Errores:
+    -------
+    - Lanza TypeError si progreso no es callable ni None.
+    """
+    if progreso is not None and not callable(progreso):
+        raise TypeError("El parámetro 'progreso' debe ser callable o None")
+
+
+def validar_salida(salida: str) -> None:
+    """
+    Valida el parámetro salida común a los cargadores.
+    
+    Parámetros:
+    ----------
+    salida : str
+        Tipo de resultado pedido: 'pandas', 'arrow' o 'lotes'.
+    
+    Errores:
+    -------
+    - Lanza TypeError si salida no es una de las opciones válidas.
+    
+    Ejemplos:
+    --------
+    >>> validar_salida('arrow')
+    >>> validar_salida('polars')
+    Traceback (most recent call last):
+    ...
+    TypeError: El parámetro 'salida' debe ser uno de: 'pandas', 'arrow', 'lotes'
+    """
+    if salida not in SALIDAS:
+        raise TypeError("El parámetro 'salida' debe ser uno de: 'pandas', 'arrow', 'lotes'")
+
+
+def validar_devolver_estadisticas(devolver_estadisticas: Any) -> None:
+    """
+    Valida el parámetro devolver_estadisticas común a los cargadores.
+    
+    Parámetros:
+    ----------
+    devolver_estadisticas : Any
+        Indicador de si se quieren las estadísticas de la carga.
+    
+    Errores:
+    -------
+    - Lanza TypeError si devolver_estadisticas no es bool.
+    """
+    if not isinstance(devolver_estadisticas, bool):
+        raise TypeError("El parámetro 'devolver_estadisticas' debe ser bool")
+
+
+def validar_detectar_fechas(detectar_fechas: Any, dia_primero: Any) -> None:
+    """
+    Valida los parámetros detectar_fechas y dia_primero de cargar_csv y
+    cargar_xlsx.
+    
+    Errores:
+    -------
+    - Lanza TypeError si detectar_fechas no es bool o dia_primero no es
+      bool ni None.
+    """
+    if not isinstance(detectar_fechas, bool):
+        raise TypeError("El parámetro 'detectar_fechas' debe ser bool")
+    if dia_primero is not None and not isinstance(dia_primero, bool):
+        raise TypeError("El parámetro 'dia_primero' debe ser bool o None")
+
+
+def es_buffer(origen: Any) -> bool:
+    """
+    Indica si el origen es un buffer en memoria o un flujo binario legible.
+    
+    Parámetros:
+    ----------
+    origen : Any
+        El objeto a comprobar.
+    
+    Retorna:
+    -------
+    bool
+        True si es bytes, bytearray, memoryview o un objeto con método read()
+        (io.BytesIO, archivo abierto en modo binario, SpooledTemporaryFile...).
+    
+    Ejemplos:
+    --------
+    >>> es_buffer(b"a,b\n1,2")
+    True
+    >>> es_buffer(io.BytesIO(b"a,b\n1,2"))
+    True
+    >>> es_buffer("datos.csv")
+    False
+    """
+    if isinstance(origen, TIPOS_BUFFER):
+        return True
+    return not isinstance(origen, (str, Path)) and callable(getattr(origen, 'read', None))
+
+
+def abrir_buffer(origen: Any) -> BinaryIO:
+    """
+    Convierte un buffer en memoria o flujo binario en un flujo legible y posicionable.
+    
+    Los bytes se envuelven en io.BytesIO sin copiarlos. Los flujos que ya se
+    pueden posicionar (seek) se devuelven tal cual; los que no (por ejemplo
+    un socket o un pipe) se leen completos en memoria, porque la detección
+    de formato y la lectura de Parquet/Excel necesitan acceso aleatorio.
+    
+    Parámetros:
+    ----------
+    origen : Any
+        bytes, bytearray, memoryview o flujo binario legible.
+    
+    Retorna:
+    -------
+    BinaryIO
+        Flujo binario posicionable.
+    
+    Errores:
+    -------
+    - Lanza TypeError si el flujo devuelve texto en lugar de bytes.
+    """
+    if isinstance(origen, TIPOS_BUFFER):
+        return io.BytesIO(origen)
+    
+    if isinstance(origen, io.TextIOBase):
+        raise TypeError("El parámetro 'ruta' debe ser un flujo binario, no de texto (abre el archivo con 'rb')")
+    
+    seekable = getattr(origen, 'seekable', None)
+    if callable(seekable) and seekable():
+        return origen
+    
+    contenido = origen.read()
+    if not isinstance(contenido, TIPOS_BUFFER):
+        raise TypeError("El parámetro 'ruta' debe ser un flujo binario, no de texto (abre el archivo con 'rb')")
+    return io.BytesIO(contenido)
+
+
+def describir_origen(origen: Any) -> str:
+    """
+    Devuelve un nombre legible de un buffer para usar en mensajes de error.
+    
+    Parámetros:
+    ----------
+    origen : Any
+        Buffer o flujo binario.
+    
+    Retorna:
+    -------
+    str
+        El atributo name del flujo si es un str, o '<buffer en memoria>'.
+    
+    Ejemplos:
+    --------
+    >>> describir_origen(b"a,b")
+    '<buffer en memoria>'
+    >>> describir_origen(open("datos.csv", "rb"))
+    'datos.csv'
+    """
+    nombre = getattr(origen, 'name', None)
+    if isinstance(nombre, str):
+        return nombre
+    return '<buffer en memoria>'
+
+
+def resolver_origen(ruta: Any) -> Tuple[Union[Path, BinaryIO], Union[str, Path]]:
+    """
+    Valida el origen de datos de un cargador y lo prepara para leerlo.
+    
+    Si es una ruta, la procesa con procesar_ruta() y comprueba que exista y
+    sea un archivo. Si es un buffer o flujo binario, lo prepara con
+    abrir_buffer().
+    
+    Parámetros:
+    ----------
+    ruta : Any
+        Ruta (str o Path), buffer en memoria o flujo binario.
+    
+    Retorna:
+    -------
+    Tuple[Union[Path, BinaryIO], Union[str, Path]]
+        El origen listo para leer y el nombre a usar en los mensajes de error.
+    
+    Errores:
+    -------
+    - Lanza TypeError si el parámetro no es de un tipo soportado.
+    - Lanza FileNotFoundError si la ruta no existe.
+    - Lanza ValueError si la ruta no es un archivo.
+    
+    Ejemplos:
+    --------
+    >>> resolver_origen("datos.csv")
+    (PosixPath('datos.csv'), 'datos.csv')
+    >>> origen, nombre = resolver_origen(b"a,b\n1,2")
+    >>> nombre
+    '<buffer en memoria>'
+    """
+    if es_buffer(ruta):
+        return abrir_buffer(ruta), describir_origen(ruta)
+    
+    ruta_archivo = procesar_ruta(ruta)
+    
+    if not ruta_archivo.exists():
+        raise FileNotFoundError(f"El archivo '{ruta}' no existe.")
+    
+    if not ruta_archivo.is_file():
+        raise ValueError(f"La ruta '{ruta}' no es un archivo válido.")
+    
+    return ruta_archivo, ruta
+
+
+def buffer_arrow(origen: Union[Path, BinaryIO]) -> Any:
+    """
+    Prepara un origen para que pyarrow lo lea sin copias intermedias.
+    
+    Un io.BytesIO se expone como pyarrow.BufferReader sobre su memoria
+    interna (sin copiarla). Las rutas y el resto de flujos se devuelven
+    tal cual, ya que pyarrow los lee directamente.
+    
+    Parámetros:
+    ----------
+    origen : Union[Path, BinaryIO]
+        Origen devuelto por resolver_origen().
+    
+    Retorna:
+    -------
+    Any
+        pyarrow.BufferReader, Path o el flujo original.
+    """
+    if isinstance(origen, io.BytesIO):
+        import pyarrow as pa
+        return pa.BufferReader(pa.py_buffer(origen.getbuffer()[origen.tell():]))
+    return origen
+
+
+def leer_muestra_lineas(origen: Union[Path, BinaryIO], bytes_muestra: int) -> bytes:
+    """
+    Lee hasta bytes_muestra bytes del principio del origen, recortados al
+    último salto de línea para no partir ningún registro. Si no hay ningún
+    salto de línea se devuelve todo lo leído. La posición de los flujos se
+    restaura después de leer.
+    
+    Parámetros:
+    ----------
+    origen : Union[Path, BinaryIO]
+        Origen devuelto por resolver_origen().
+    bytes_muestra : int
+        Máximo de bytes que se leen.
+    
+    Retorna:
+    -------
+    bytes
+        Las líneas completas de la muestra.
+    """
+    if isinstance(origen, Path):
+        with open(origen, 'rb') as archivo:
+            muestra = archivo.read(bytes_muestra)
+    else:
+        posicion = origen.tell()
+        try:
+            muestra = origen.read(bytes_muestra)
+        finally:
+            origen.seek(posicion)
+    
+    corte = muestra.rfind(b'\n')
+    return muestra[:corte + 1] if corte >= 0 else muestra
+
+
+def abrir_fuente_arrow(origen: Union[Path, BinaryIO]) -> Tuple[Any, bytes]:
+    """
+    Prepara un archivo Arrow IPC o Feather para leerlo con pyarrow.
+
+    Las rutas se abren con pyarrow.memory_map y los io.BytesIO con
+    buffer_arrow(), de modo que ni los datos ni los mensajes se copian.
+
+    Retorna:
+    -------
+    Tuple[Any, bytes]
+        La fuente de pyarrow, en la posición de inicio, y sus 6 primeros
+        bytes: b'ARROW1' en el formato de archivo IPC (Feather V2),
+        b'FEA1..' en Feather V1 y cualquier otra cosa en el de flujo IPC.
+    """
+    import pyarrow as pa
+
+    if isinstance(origen, Path):
+        fuente = pa.memory_map(str(origen), 'r')
+    else:
+        fuente = buffer_arrow(origen)
+
+    posicion = fuente.tell()
+    magia = fuente.read(6)
+    fuente.seek(posicion)
+    return fuente, magia
+
+
+def abrir_tabla_arrow(origen: Union[Path, BinaryIO]) -> Any:
+    """
+    Abre un archivo Arrow IPC o Feather como pyarrow.Table sin deserializarlo.
+    
+    Las rutas se abren con pyarrow.memory_map, de modo que los datos de un
+    archivo sin comprimir no se copian: la tabla apunta directamente a las
+    páginas del archivo mapeado. Los io.BytesIO se leen con buffer_arrow().
+    Se reconocen el formato de archivo IPC (Feather V2, 'ARROW1'), el de
+    flujo IPC y Feather V1 ('FEA1').
+    
+    Parámetros:
+    ----------
+    origen : Union[Path, BinaryIO]
+        Origen devuelto por resolver_origen().
+    
+    Retorna:
+    -------
+    Any
+        pyarrow.Table con el contenido del archivo.
+    
+    Errores:
+    -------
+    - Propaga los errores de pyarrow (ImportError, ArrowInvalid, OSError...)
+      para que cada cargador los traduzca.
+    """
+    import pyarrow.ipc as ipc
+    
+    fuente, magia = abrir_fuente_arrow(origen)
+    if magia == b'ARROW1':
+        return ipc.open_file(fuente).read_all()
+    if magia.startswith(b'FEA1'):
+        import pyarrow.feather as feather
+        return feather.read_table(fuente)
+    return ipc.open_stream(fuente).read_all()
+
+
+def abrir_lotes_arrow(origen: Union[Path, BinaryIO], columns: Optional[List[str]] = None,
+                      filas: Optional[int] = None) -> 'pa.RecordBatchReader':
+    """
+    Abre un archivo Arrow IPC o Feather como RecordBatchReader que lee los
+    lotes de uno en uno.
+
+    A diferencia de abrir_tabla_arrow(), cada lote del archivo se lee (y,
+    si está comprimido con LZ4 o ZSTD, se descomprime) al pedirlo, así que
+    solo el lote en curso ocupa memoria. Feather V1 no admite compresión y
+    se lee mapeado como tabla.
+
+    Parámetros:
+    ----------
+    origen : Union[Path, BinaryIO]
+        Origen devuelto por resolver_origen().
+    columns : Optional[List[str]], opcional
+        Columnas a seleccionar en cada lote. Si es None, todas.
+    filas : Optional[int], opcional
+        Máximo de filas por lote. Si es None se usan los lotes del archivo.
+
+    Errores:
+    -------
+    - Lanza KeyError si alguna columna no existe (al abrir, no al leer).
+    - Propaga los errores de pyarrow al abrir y al leer los lotes.
+    """
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    fuente, magia = abrir_fuente_arrow(origen)
+    if magia == b'ARROW1':
+        lector = ipc.open_file(fuente)
+        esquema = lector.schema
+        lotes: Iterator['pa.RecordBatch'] = (lector.get_batch(i) for i in range(lector.num_record_batches))
+    elif magia.startswith(b'FEA1'):
+        import pyarrow.feather as feather
+        tabla = feather.read_table(fuente)
+        esquema, lotes = tabla.schema, iter(tabla.to_batches())
+    else:
+        lector = ipc.open_stream(fuente)
+        esquema, lotes = lector.schema, iter(lector)
+
+    if columns is not None:
+        esquema = pa.schema([esquema.field(columna) for columna in columns], metadata=esquema.metadata)
+    return pa.RecordBatchReader.from_batches(esquema, _recortar_lotes(lotes, columns, filas))
+
+
+def _recortar_lotes(lotes: Iterator['pa.RecordBatch'], columns: Optional[List[str]],
+                    filas: Optional[int]) -> Iterator['pa.RecordBatch']:
+    """Selecciona las columnas de cada lote y lo parte en trozos de como máximo filas filas (sin copias)."""
+    for lote in lotes:
+        if columns is not None:
+            lote = lote.select(columns)
+        if filas is None:
+            yield lote
+            continue
+        for inicio in range(0, lote.num_rows, filas):
+            yield lote.slice(inicio, filas)
+
+
+def tabla_a_lotes(tabla: 'pa.Table', filas: Optional[int] = None) -> 'pa.RecordBatchReader':
+    """
+    Expone una pyarrow.Table como RecordBatchReader sin copiar sus datos.
+    
+    Parámetros:
+    ----------
+    tabla : pa.Table
+        Tabla ya cargada.
+    filas : Optional[int], opcional
+        Máximo de filas por lote. Si es None se usan los lotes de la tabla.
+    
+    Retorna:
+    -------
+    pa.RecordBatchReader
+        Lector de lotes sobre la tabla.
+    """
+    import pyarrow as pa
+    return pa.RecordBatchReader.from_batches(tabla.schema, tabla.to_batches(max_chunksize=filas))
+
+
+def es_tabla_vacia(tabla: 'pa.Table') -> bool:
+    """
+    Indica si una pyarrow.Table está vacía con el mismo criterio que
+    DataFrame.empty (sin filas o sin columnas).
+    """
+    return tabla.num_rows == 0 or tabla.num_columns == 0
+
+
+def posiciones_muestra(total: int, filas_muestra: int) -> 'np.ndarray':
+    """
+    Posiciones de una muestra de filas_muestra valores repartida por toda
+    una columna de total valores (todas si caben). Los archivos ordenados
+    (por fecha, por importe...) tienen al principio solo valores parecidos.
+    """
+    import numpy as np
+    if total <= filas_muestra:
+        return np.arange(total)
+    return np.linspace(0, total - 1, filas_muestra).astype(int)
+
+
+def muestra_arrow(valores: Any, filas_muestra: int, nombre: Any) -> 'pd.Series':
+    """
+    Muestra repartida de un array de texto de pyarrow sin nulos, como
+    pd.Series de object para los detectores de formato de pandas.
+    """
+    import pandas as pd
+    muestra = valores.take(posiciones_muestra(len(valores), filas_muestra))
+    return pd.Series(muestra.to_pylist(), name=nombre, dtype=object)
@@ -0,0 +1,174 @@
+"""
+Hooks de trazas para toda la librería.
+
+Este módulo permite registrar funciones que reciben un EventoTraza al
+empezar ('inicio'), terminar ('fin') o fallar ('error') cada carga de
+carga_datos y cada normalización de normalizacion_texto, para conectar
+OpenTelemetry, Prometheus o cualquier otro sistema de métricas sin
+envolver las llamadas. Mientras no haya ningún hook registrado, cada
+llamada solo paga una comprobación de una variable global.
+
+Hay un único registro de hooks para toda la librería: carga_datos.hooks
+y normalizacion_texto.hooks lo reexportan y solo definen, con
+crear_trazar(), los atributos de los eventos de sus funciones.
+"""
+
+import functools
+import itertools
+import logging
+import time
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+
+# Eventos a los que se puede suscribir un hook
+EVENTOS = ('inicio', 'fin', 'error')
+
+
+class EventoTraza(NamedTuple):
+    """
+    Evento que reciben los hooks registrados con registrar_hook().
+
+    Atributos:
+    ---------
+    evento : str
+        'inicio', 'fin' o 'error'.
+    funcion : str
+        Nombre de la función trazada (por ejemplo 'cargar_csv' o
+        'quitar_acentos').
+    id_llamada : int
+        Identificador de la llamada, igual en su 'inicio' y su 'fin' o
+        'error', para emparejarlos (por ejemplo, para cerrar un span).
+    atributos : Dict[str, Any]
+        Los parámetros con nombre de tipo simple y los atributos propios
+        de cada módulo: 'origen' en las cargas ('filas' y 'columnas' en
+        'fin') y 'longitud' en las normalizaciones ('longitud_resultado'
+        en 'fin').
+    segundos : Optional[float]
+        Duración de la llamada en 'fin' y 'error'; None en 'inicio'.
+    error : Optional[BaseException]
+        La excepción en 'error'; None en el resto.
+    """
+    evento: str
+    funcion: str
+    id_llamada: int
+    atributos: Dict[str, Any]
+    segundos: Optional[float]
+    error: Optional[BaseException]
+
+
+HookTraza = Callable[[EventoTraza], None]
+
+_hooks: Dict[str, Tuple[HookTraza, ...]] = {evento: () for evento in EVENTOS}
+_hay_hooks: bool = False
+_ids_llamada = itertools.count(1)
+
+
+def registrar_hook(evento: str, fn: HookTraza) -> None:
+    """
+    Registra una función para un evento ('inicio', 'fin' o 'error') de
+    todas las cargas y normalizaciones.
+
+    Parámetros:
+    ----------
+    evento : str
+        'inicio', 'fin' o 'error'.
+    fn : Callable[[EventoTraza], None]
+        Función que recibe cada EventoTraza. Si lanza una excepción, se
+        registra con logging.warning y la llamada continúa.
+
+    Errores:
+    -------
+    - Lanza TypeError si evento no es válido o fn no es callable.
+
+    Ejemplos:
+    --------
+    >>> from libreria_jarko import registrar_hook
+    >>> registrar_hook('fin', lambda e: metricas[e.funcion].observe(e.segundos))
+    """
+    global _hay_hooks
+    _validar_evento(evento)
+    if not callable(fn):
+        raise TypeError("El parámetro 'fn' debe ser callable")
+
+    _hooks[evento] = _hooks[evento] + (fn,)
+    _hay_hooks = True
+
+
+def eliminar_hook(evento: str, fn: HookTraza) -> None:
+    """
+    Elimina un hook registrado con registrar_hook(). Si no estaba
+    registrado, no hace nada.
+
+    Errores:
+    -------
+    - Lanza TypeError si evento no es válido.
+    """
+    global _hay_hooks
+    _validar_evento(evento)
+    _hooks[evento] = tuple(hook for hook in _hooks[evento] if hook != fn)
+    _hay_hooks = any(_hooks.values())
+
+
+def hay_hooks() -> bool:
+    """Indica si hay algún hook registrado."""
+    return _hay_hooks
+
+
+def crear_trazar(atributos_inicio: Callable[[Tuple[Any, ...], Dict[str, Any]], Dict[str, Any]],
+                 atributos_fin: Callable[[Any], Dict[str, Any]]) -> Callable[[Callable], Callable]:
+    """
+    Crea el decorador trazar de un módulo a partir de las funciones que
+    calculan los atributos de 'inicio' (con args y kwargs) y los que se
+    añaden en 'fin' (con el resultado).
+
+    Sin hooks registrados, las funciones decoradas se llaman directamente
+    tras comprobar una única variable global.
+    """
+    def trazar(funcion: Callable) -> Callable:
+        @functools.wraps(funcion)
+        def envoltura(*args: Any, **kwargs: Any) -> Any:
+            if not _hay_hooks:
+                return funcion(*args, **kwargs)
+            return _llamar_con_hooks(funcion, args, kwargs, atributos_inicio, atributos_fin)
+        return envoltura
+    return trazar
+
+
+def _llamar_con_hooks(funcion: Callable, args: Tuple[Any, ...], kwargs: Dict[str, Any],
+                      atributos_inicio: Callable, atributos_fin: Callable) -> Any:
+    """Llama a la función emitiendo 'inicio' y después 'fin' o 'error'."""
+    nombre = funcion.__name__
+    id_llamada = next(_ids_llamada)
+    atributos = atributos_inicio(args, kwargs)
+
+    _emitir(EventoTraza('inicio', nombre, id_llamada, atributos, None, None))
+    inicio = time.perf_counter()
+    try:
+        resultado = funcion(*args, **kwargs)
+    except BaseException as e:
+        _emitir(EventoTraza('error', nombre, id_llamada, atributos,
+                            time.perf_counter() - inicio, e))
+        raise
+
+    segundos = time.perf_counter() - inicio
+    _emitir(EventoTraza('fin', nombre, id_llamada, {**atributos, **atributos_fin(resultado)},
+                        segundos, None))
+    return resultado
+
+
+def _emitir(evento: EventoTraza) -> None:
+    """Llama a los hooks del evento; sus errores no interrumpen la llamada."""
+    for hook in _hooks[evento.evento]:
+        try:
+            hook(evento)
+        except Exception as e:
+            logging.warning(
+                f"Excepción en un hook de '{evento.evento}' de {evento.funcion}: "
+                f"{type(e).__name__}: {str(e)}"
+            )
+
+
+def _validar_evento(evento: Any) -> None:
+    """Lanza TypeError si evento no es uno de EVENTOS."""
+    if evento not in EVENTOS:
+        raise TypeError("El parámetro 'evento' debe ser uno de: 'inicio', 'fin', 'error'")
@@ -7,6 +7,13 @@ Este módulo contiene funciones para normalizar y limpiar texto:
 - Limpieza de espacios
 - Normalización de caracteres extraños
 - Función integral de normalización
+- Normalización de columnas de pandas (valores únicos)
+- Normalización de columnas de Arrow con pyarrow.compute
+- Normalización de arrays de NumPy de ancho fijo con una tabla por carácter
+- Normalizador con la configuración validada y compilada una vez
+- Normalización de listas de textos por bloques unidos (normalizar_lote)
+- Hooks de trazas (registrar_hook)
+- Caché LRU opcional de resultados (configurar_cache)
 """
 
 from .quitar_acentos import quitar_acentos
@@ -14,6 +21,13 @@ from .convertir_case import convertir_a_minusculas, convertir_a_mayusculas
 from .limpiar_espacios import limpiar_espacios
 from .normalizar_caracteres import normalizar_caracteres
 from .normalizar_texto import normalizar_texto
+from .normalizar_serie import normalizar_serie, normalizar_dataframe
+from .normalizar_arrow import normalizar_arrow, normalizar_tabla_arrow
+from .normalizar_numpy import normalizar_array
+from .normalizador import Normalizador
+from .normalizar_lote import normalizar_lote
+from .hooks import registrar_hook, eliminar_hook
+from .cache import configurar_cache, limpiar_cache, estadisticas_cache, EstadisticasCache
 
 __all__ = [
     "quitar_acentos",
@@ -21,5 +35,18 @@ __all__ = [
     "convertir_a_mayusculas",
     "limpiar_espacios",
     "normalizar_caracteres",
-    "normalizar_texto"
+    "normalizar_texto",
+    "normalizar_serie",
+    "normalizar_dataframe",
+    "normalizar_arrow",
+    "normalizar_tabla_arrow",
+    "normalizar_array",
+    "normalizar_lote",
+    "Normalizador",
+    "registrar_hook",
+    "eliminar_hook",
+    "configurar_cache",
+    "limpiar_cache",
+    "estadisticas_cache",
+    "EstadisticasCache"
 ]
\ No newline at end of file
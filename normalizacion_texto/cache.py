@@ -0,0 +1,193 @@
+"""
+Módulo de caché de resultados de las funciones de normalización.
+
+Este módulo contiene una caché LRU acotada y segura entre hilos que
+guarda el resultado de normalizar_texto() y de cada normalizador para
+cada texto y combinación de opciones. Está desactivada por defecto: se
+activa con configurar_cache(maximo) y, mientras está desactivada, cada
+llamada solo paga una comprobación de una variable global.
+
+Es útil con columnas muy repetitivas (unos miles de ciudades o empresas
+distintas repetidas en millones de filas). estadisticas_cache() da la
+tasa de aciertos para dimensionarla.
+"""
+
+import functools
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, NamedTuple, Optional, Tuple
+
+
+class EstadisticasCache(NamedTuple):
+    """
+    Estado de la caché de normalización.
+
+    Atributos:
+    ---------
+    aciertos : int
+        Llamadas resueltas con un resultado guardado.
+    fallos : int
+        Llamadas que se calcularon y se guardaron.
+    entradas : int
+        Resultados guardados ahora.
+    maximo : int
+        Número máximo de resultados guardados; 0 si está desactivada.
+    """
+    aciertos: int
+    fallos: int
+    entradas: int
+    maximo: int
+
+    @property
+    def tasa_aciertos(self) -> float:
+        """Fracción de llamadas que fueron aciertos (0.0 si no hay ninguna)."""
+        total = self.aciertos + self.fallos
+        return self.aciertos / total if total else 0.0
+
+
+_resultados: 'OrderedDict[Hashable, str]' = OrderedDict()
+_cerrojo = threading.Lock()
+# Marca, por hilo, que se está calculando un resultado para la caché: las
+# funciones memoizadas a las que llama (normalizar_texto llama a los
+# normalizadores) no guardan sus resultados intermedios
+_calculando = threading.local()
+_maximo: int = 0
+_aciertos: int = 0
+_fallos: int = 0
+
+
+def configurar_cache(maximo: Optional[int]) -> None:
+    """
+    Activa la caché con un número máximo de resultados, o la desactiva.
+
+    Cambiar el tamaño conserva los resultados más recientes que quepan y
+    pone a cero las estadísticas.
+
+    Parámetros:
+    ----------
+    maximo : Optional[int]
+        Número máximo de resultados guardados entre todas las funciones.
+        0 o None la desactivan y la vacían.
+
+    Errores:
+    -------
+    - Lanza TypeError si maximo no es un entero.
+    - Lanza ValueError si maximo es negativo.
+
+    Ejemplos:
+    --------
+    >>> configurar_cache(100_000)
+    >>> df['ciudad'] = df['ciudad'].map(normalizar_texto)
+    >>> estadisticas_cache().tasa_aciertos
+    0.998
+    >>> configurar_cache(None)
+    """
+    global _maximo, _aciertos, _fallos
+    if maximo is None:
+        maximo = 0
+    if not isinstance(maximo, int) or isinstance(maximo, bool):
+        raise TypeError("El parámetro 'maximo' debe ser un entero o None")
+    if maximo < 0:
+        raise ValueError("El parámetro 'maximo' no puede ser negativo")
+
+    with _cerrojo:
+        _maximo = maximo
+        while len(_resultados) > maximo:
+            _resultados.popitem(last=False)
+        _aciertos = _fallos = 0
+
+
+def limpiar_cache() -> None:
+    """Vacía la caché y pone a cero las estadísticas, sin cambiar su tamaño."""
+    global _aciertos, _fallos
+    with _cerrojo:
+        _resultados.clear()
+        _aciertos = _fallos = 0
+
+
+def estadisticas_cache() -> EstadisticasCache:
+    """Aciertos, fallos, entradas y tamaño máximo de la caché."""
+    with _cerrojo:
+        return EstadisticasCache(_aciertos, _fallos, len(_resultados), _maximo)
+
+
+def memoizar(funcion: Callable[..., str]) -> Callable[..., str]:
+    """
+    Decorador que guarda en la caché el resultado de una función de
+    normalización.
+
+    La clave es la función, el texto y una forma inmutable de las
+    opciones (los diccionarios, como reemplazos_personalizados, se
+    congelan en tuplas de pares en su orden). Solo se guardan las llamadas
+    con un texto de tipo str y opciones que se pueden congelar; el resto,
+    y todas mientras la caché está desactivada, llaman a la función
+    directamente, igual que las llamadas que se hacen mientras se calcula
+    otro resultado de la caché. Los errores no se guardan.
+    """
+    nombre = funcion.__qualname__
+
+    @functools.wraps(funcion)
+    def envoltura(*args: Any, **kwargs: Any) -> str:
+        if not _maximo or getattr(_calculando, 'activo', False):
+            return funcion(*args, **kwargs)
+
+        clave = _clave(nombre, args, kwargs)
+        if clave is None:
+            return funcion(*args, **kwargs)
+        return _obtener_o_calcular(clave, funcion, args, kwargs)
+    return envoltura
+
+
+def _obtener_o_calcular(clave: Hashable, funcion: Callable[..., str],
+                        args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> str:
+    """Devuelve el resultado guardado o lo calcula (fuera del cerrojo) y lo guarda."""
+    global _aciertos, _fallos
+    with _cerrojo:
+        resultado = _resultados.get(clave)
+        if resultado is not None:
+            _resultados.move_to_end(clave)
+            _aciertos += 1
+            return resultado
+
+    _calculando.activo = True
+    try:
+        resultado = funcion(*args, **kwargs)
+    finally:
+        _calculando.activo = False
+
+    with _cerrojo:
+        _fallos += 1
+        if _maximo:
+            _resultados[clave] = resultado
+            _resultados.move_to_end(clave)
+            while len(_resultados) > _maximo:
+                _resultados.popitem(last=False)
+    return resultado
+
+
+def _clave(nombre: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Optional[Hashable]:
+    """Clave de la llamada, o None si el texto no es str o alguna opción no se puede congelar."""
+    texto = args[0] if args else kwargs.get('texto')
+    if type(texto) is not str:
+        return None
+
+    clave = (
+        nombre,
+        tuple(_congelar(valor) for valor in args),
+        tuple(sorted((nombre_opcion, _congelar(valor)) for nombre_opcion, valor in kwargs.items())),
+    )
+    try:
+        hash(clave)
+    except TypeError:
+        return None
+    return clave
+
+
+def _congelar(valor: Any) -> Any:
+    """
+    Forma inmutable de una opción. Incluye el tipo, para que True y 1 (que
+    son iguales como claves) no compartan resultado.
+    """
+    if isinstance(valor, dict):
+        return dict, tuple((_congelar(clave), _congelar(elemento)) for clave, elemento in valor.items())
+    return type(valor), valor
@@ -7,8 +7,10 @@ y minúsculas de forma robusta.
 
 from typing import Any
 from .utils import validar_entrada_texto, manejar_excepcion_texto
+from .hooks import trazar
 
 
+@trazar
 def convertir_a_minusculas(texto: Any) -> str:
     """
     Convierte todo el texto a minúsculas.
@@ -45,6 +47,7 @@ def convertir_a_minusculas(texto: Any) -> str:
         manejar_excepcion_texto(e, 'convertir_a_minusculas', texto_validado)
 
 
+@trazar
 def convertir_a_mayusculas(texto: Any) -> str:
     """
     Convierte todo el texto a mayúsculas.
@@ -0,0 +1,37 @@
+"""
+Módulo de hooks de trazas para las funciones de normalización.
+
+El registro de hooks es el de hooks.py de la librería, compartido con
+carga_datos: un hook registrado aquí recibe también los eventos de las
+cargas (se distinguen por EventoTraza.funcion). Este módulo solo define
+los atributos de los eventos de las normalizaciones.
+"""
+
+from typing import Any, Dict, Tuple
+
+try:
+    from ..hooks import EVENTOS, EventoTraza, HookTraza, registrar_hook, eliminar_hook, hay_hooks, crear_trazar
+except ImportError:
+    # normalizacion_texto importado como paquete de primer nivel (p. ej. en los tests)
+    from hooks import EVENTOS, EventoTraza, HookTraza, registrar_hook, eliminar_hook, hay_hooks, crear_trazar
+
+__all__ = ["EVENTOS", "EventoTraza", "HookTraza", "registrar_hook", "eliminar_hook", "hay_hooks", "trazar"]
+
+
+def _atributos_inicio(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Longitud del texto y parámetros con nombre de tipo simple."""
+    texto = args[0] if args else kwargs.get('texto')
+    atributos: Dict[str, Any] = {'longitud': len(texto) if isinstance(texto, str) else None}
+    for clave, valor in kwargs.items():
+        if clave != 'texto' and (valor is None or isinstance(valor, (str, int, float, bool))):
+            atributos[clave] = valor
+    return atributos
+
+
+def _atributos_fin(resultado: Any) -> Dict[str, Any]:
+    """Longitud del texto resultante."""
+    return {'longitud_resultado': len(resultado) if isinstance(resultado, str) else None}
+
+
+# Decorador que emite los eventos de traza de una función de normalización
+trazar = crear_trazar(_atributos_inicio, _atributos_fin)
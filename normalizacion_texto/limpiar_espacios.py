@@ -8,8 +8,16 @@ tabulaciones, saltos de línea y otros caracteres de espaciado.
 import re
 from typing import Any
 from .utils import validar_entrada_texto, manejar_excepcion_texto
+from .hooks import trazar
+from .cache import memoizar
 
 
+# Un espacio después de ( [ { o antes de , ; : . ! ? ) ] }
+_ESPACIO_JUNTO_A_PUNTUACION = re.compile(r'(?<=[(\[{]) | (?=[,.;:!?)\]}])')
+
+
+@trazar
+@memoizar
 def limpiar_espacios(texto: Any) -> str:
     """
     Limpia espacios en blanco extra del texto.
@@ -47,23 +55,28 @@ def limpiar_espacios(texto: Any) -> str:
     texto_validado = validar_entrada_texto(texto, 'limpiar_espacios')
     
     try:
-        # 1. Eliminar espacios al inicio y final
-        texto_limpio = texto_validado.strip()
-        
-        # 2. Convertir tabulaciones, saltos de línea y otros espacios en blanco a espacios simples
-        texto_limpio = re.sub(r'\s+', ' ', texto_limpio)
-        
-        # 3. Limpiar espacios alrededor de signos de puntuación comunes
-        # Espacios antes de: , ; : . ! ? ) ] }
-        texto_limpio = re.sub(r'\s+([,.;:!?)\]}])', r'\1', texto_limpio)
-        
-        # Espacios después de: ( [ {
-        texto_limpio = re.sub(r'([(\[{])\s+', r'\1', texto_limpio)
-        
-        # Múltiples espacios consecutivos a uno solo (por si quedaron)
-        texto_limpio = re.sub(r' {2,}', ' ', texto_limpio)
-        
-        return texto_limpio
+        return aplicar_limpiar_espacios(texto_validado)
         
     except Exception as e:
-        manejar_excepcion_texto(e, 'limpiar_espacios', texto_validado)
\ No newline at end of file
+        manejar_excepcion_texto(e, 'limpiar_espacios', texto_validado)
+
+
+def aplicar_limpiar_espacios(texto: str, separador: str = '') -> str:
+    """
+    Limpia los espacios de un texto ya validado, sin trazas.
+
+    str.split() sin argumentos y ' '.join() quitan los espacios del inicio
+    y el final y reducen cada tramo de espacios en blanco a un espacio (la
+    definición de espacio en blanco de str.split() es la misma que la de
+    \\s). Después una sola expresión regular compilada quita los espacios
+    que quedan antes de la puntuación de cierre y después de la de
+    apertura.
+
+    Con separador (un carácter que no es espacio ni puntuación), el texto
+    son varios textos unidos con él y cada uno se limpia como si fuera
+    independiente: también se quitan los espacios junto al separador.
+    """
+    texto = ' '.join(texto.split())
+    if separador:
+        texto = texto.replace(' ' + separador, separador).replace(separador + ' ', separador)
+    return _ESPACIO_JUNTO_A_PUNTUACION.sub('', texto)
@@ -0,0 +1,247 @@
+"""
+Módulo con el objeto Normalizador.
+
+Normalizador valida una configuración de normalizar_texto() una sola vez
+y compila sus pasos: la normalización de caracteres y la eliminación de
+acentos se combinan en una única tabla de str.translate que se rellena a
+medida que aparecen caracteres nuevos. Cada llamada hace esa pasada, la
+conversión a minúsculas y la limpieza de espacios, sin volver a validar
+las opciones ni pasar por las funciones de cada paso.
+
+Los lotes de textos se normalizan por bloques: los textos de cada bloque
+se unen con un separador que no aparece en ellos, cada paso se aplica
+una vez al texto unido y el resultado se vuelve a separar.
+"""
+
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+from . import hooks
+from .quitar_acentos import TablaPorCaracter, aplicar_quitar_acentos
+from .limpiar_espacios import aplicar_limpiar_espacios
+from .normalizar_caracteres import (
+    compilar_reemplazos, compilar_reemplazos_por_caracter, puede_contener_claves, _combinar_reemplazos, _son_agrupables
+)
+from .normalizar_texto import normalizar_texto, validar_opciones_normalizacion
+from .normalizar_serie import normalizar_serie_con, repartir, validar_paralelo
+from .normalizar_arrow import aplicar_pasos_arrow, pasos_arrow
+from .normalizar_numpy import aplicar_tabla_codigos, tabla_codigos
+from .utils import validar_entrada_texto, manejar_excepcion_texto
+
+
+# Candidatos a separador de los textos de un bloque: caracteres de uso
+# privado, que ningún paso cambia y que no son espacios ni puntuación
+SEPARADORES_LOTE = range(0xE000, 0xF900)
+
+# Textos que se unen en cada bloque de lote()
+TEXTOS_POR_BLOQUE = 1_000
+
+
+class Normalizador:
+    """
+    Normalización de texto con una configuración fija de normalizar_texto().
+
+    Las opciones se validan al crear el objeto. Llamarlo con un texto da
+    el mismo resultado que normalizar_texto(texto, **opciones). Se puede
+    serializar con pickle (solo se guardan las opciones y los pasos se
+    vuelven a compilar al cargarlo), de modo que se puede enviar a otros
+    procesos.
+
+    Mientras haya hooks registrados con registrar_hook(), cada llamada se
+    hace con normalizar_texto() para que se emitan sus eventos.
+
+    Parámetros:
+    ----------
+    **opciones
+        Opciones de normalizar_texto() (quitar_acentos_flag,
+        convertir_minusculas, limpiar_espacios_flag,
+        normalizar_caracteres_flag, reemplazos_personalizados,
+        preservar_mayusculas).
+
+    Errores:
+    -------
+    - Lanza TypeError si alguna opción no es válida.
+
+    Ejemplos:
+    --------
+    >>> normalizador = Normalizador(preservar_mayusculas=True)
+    >>> normalizador("  José  MARÍA ")
+    'Jose MARIA'
+    >>> normalizador.lote(["Ávila", "Cádiz"])
+    ['Avila', 'Cadiz']
+    >>> df['ciudad'] = normalizador.serie(df['ciudad'], workers=4)
+    >>> normalizador.arrow(tabla.column('ciudad'))
+    >>> normalizador.array(np.array(["Ávila", "Cádiz"]))
+    """
+
+    def __init__(self, **opciones: Any) -> None:
+        validar_opciones_normalizacion(opciones)
+        self.opciones: Dict[str, Any] = dict(opciones)
+
+        caracteres = opciones.get('normalizar_caracteres_flag', True)
+        acentos = opciones.get('quitar_acentos_flag', True)
+        self._minusculas = opciones.get('convertir_minusculas', True) and not opciones.get('preservar_mayusculas', False)
+        self._limpiar = opciones.get('limpiar_espacios_flag', True)
+
+        personalizados = tuple((opciones.get('reemplazos_personalizados') or {}).items())
+        # Los textos solo se pueden unir si ningún reemplazo contiene el
+        # separador y no hay claves vacías (que insertan su valor entre
+        # cada par de caracteres)
+        self._unible = not caracteres or _son_agrupables(_combinar_reemplazos(personalizados))
+        self._excluidos: FrozenSet[str] = frozenset(''.join(
+            clave + valor for clave, valor in personalizados if isinstance(clave, str) and isinstance(valor, str)
+        ))
+        pasos: List[Callable[[str], str]] = []
+        if caracteres:
+            pasos.extend(compilar_reemplazos(personalizados))
+        if acentos:
+            pasos.append(aplicar_quitar_acentos)
+        self._pasos: Tuple[Callable[[str], str], ...] = tuple(pasos)
+
+        # Tabla combinada de caracteres y acentos, para los textos en los
+        # que no puede aparecer ninguna clave de varios caracteres
+        self._necesarios: Tuple[Tuple[str, ...], ...] = ()
+        self._tabla = None
+        por_caracter = compilar_reemplazos_por_caracter(personalizados) if caracteres else ((), ())
+        if por_caracter is not None and self._pasos:
+            self._necesarios, pasos_caracter = por_caracter
+            pasos_caracter += (aplicar_quitar_acentos,) if acentos else ()
+            self._tabla = TablaPorCaracter(lambda caracter: _aplicar_pasos(pasos_caracter, caracter))
+
+    def __call__(self, texto: Any) -> str:
+        """
+        Normaliza un texto.
+
+        Errores:
+        -------
+        - Lanza TypeError si no se puede convertir el input a string.
+        """
+        if hooks.hay_hooks():
+            return normalizar_texto(texto, **self.opciones)
+
+        texto_validado = validar_entrada_texto(texto, 'Normalizador')
+        try:
+            return self._normalizar(texto_validado)
+        except Exception as e:
+            manejar_excepcion_texto(e, 'Normalizador', texto_validado)
+
+    def lote(self, textos: Iterable[Any]) -> List[str]:
+        """
+        Normaliza cada texto de un iterable.
+
+        Los textos se validan todos antes de empezar y se normalizan por
+        bloques de TEXTOS_POR_BLOQUE: se unen con un separador, cada paso
+        se aplica una sola vez al bloque y el resultado se separa de
+        nuevo. Cada texto queda igual que normalizándolo por separado
+        (limpiar_espacios recorta cada texto, no el bloque). Mientras haya
+        hooks, o si los reemplazos tienen claves vacías, se normalizan uno
+        a uno.
+
+        Errores:
+        -------
+        - Lanza TypeError si algún valor no se puede convertir a string.
+        """
+        if hooks.hay_hooks() or not self._unible:
+            return [self(texto) for texto in textos]
+
+        validados = [validar_entrada_texto(texto, 'Normalizador') for texto in textos]
+        normalizados: List[str] = []
+        for inicio in range(0, len(validados), TEXTOS_POR_BLOQUE):
+            normalizados.extend(self._normalizar_bloque(validados[inicio:inicio + TEXTOS_POR_BLOQUE]))
+        return normalizados
+
+    def serie(self, serie: Any, workers: Optional[int] = None, paralelo: str = 'procesos') -> Any:
+        """
+        Normaliza una pd.Series igual que normalizar_serie(), normalizando
+        cada valor distinto una sola vez, repartidos entre workers
+        procesos o hilos si se indica.
+
+        Errores:
+        -------
+        - Lanza TypeError si serie no es una pd.Series o workers o
+          paralelo no son válidos.
+        """
+        import pandas as pd
+
+        if not isinstance(serie, pd.Series):
+            raise TypeError("El parámetro 'serie' debe ser una pd.Series")
+        validar_paralelo(workers, paralelo)
+
+        if workers is None or workers == 1:
+            return normalizar_serie_con(serie, self)
+        with repartir(self, workers, paralelo) as reparto:
+            return normalizar_serie_con(serie, self, reparto)
+
+    def arrow(self, columna: Any) -> Any:
+        """
+        Normaliza un pa.Array o pa.ChunkedArray de texto igual que
+        normalizar_arrow(), con kernels de pyarrow.compute.
+
+        Errores:
+        -------
+        - Lanza TypeError si columna no es un array de Arrow de texto.
+        """
+        return aplicar_pasos_arrow(columna, pasos_arrow(self.opciones))
+
+    def array(self, textos: Any) -> Any:
+        """
+        Normaliza un np.ndarray de dtype 'U' igual que normalizar_array(),
+        con una tabla por código de carácter.
+
+        Errores:
+        -------
+        - Lanza TypeError si textos no es un array de dtype 'U'.
+        """
+        return aplicar_tabla_codigos(textos, tabla_codigos(self.opciones), self)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return self.opciones
+
+    def __setstate__(self, opciones: Dict[str, Any]) -> None:
+        self.__init__(**opciones)
+
+    def __repr__(self) -> str:
+        opciones = ', '.join(f"{nombre}={valor!r}" for nombre, valor in self.opciones.items())
+        return f"Normalizador({opciones})"
+
+    def _normalizar_bloque(self, textos: Sequence[str]) -> List[str]:
+        """
+        Normaliza textos ya validados unidos con el primer separador que no
+        aparece en ellos ni en los reemplazos, o uno a uno si no hay ninguno.
+        """
+        for codigo in SEPARADORES_LOTE:
+            separador = chr(codigo)
+            if separador in self._excluidos:
+                continue
+            unido = separador.join(textos)
+            if unido.count(separador) == len(textos) - 1:
+                try:
+                    return self._normalizar(unido, separador).split(separador)
+                except Exception as e:
+                    manejar_excepcion_texto(e, 'Normalizador', unido)
+        return [self._normalizar(texto) for texto in textos]
+
+    def _normalizar(self, texto: str, separador: str = '') -> str:
+        """
+        Aplica los pasos compilados a un texto ya validado, o a varios
+        unidos con separador.
+        """
+        if self._tabla is not None and not puede_contener_claves(self._necesarios, texto):
+            texto = self._tabla.traducir(texto, self._aplicar_pasos)
+        else:
+            texto = self._aplicar_pasos(texto)
+
+        if self._minusculas:
+            texto = texto.lower()
+        if self._limpiar:
+            texto = aplicar_limpiar_espacios(texto, separador)
+        return texto
+
+    def _aplicar_pasos(self, texto: str) -> str:
+        """Normaliza caracteres y quita acentos paso a paso, sin la tabla combinada."""
+        return _aplicar_pasos(self._pasos, texto)
+
+
+def _aplicar_pasos(pasos: Iterable[Callable[[str], str]], texto: str) -> str:
+    """Aplica los pasos en orden."""
+    for paso in pasos:
+        texto = paso(texto)
+    return texto
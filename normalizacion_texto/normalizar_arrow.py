@@ -0,0 +1,374 @@
+"""
+Módulo de normalización de columnas de Arrow.
+
+Este módulo aplica normalizar_texto() a arrays de Arrow (pa.Array,
+pa.ChunkedArray o columnas de una pa.Table) con kernels de
+pyarrow.compute, sin convertir los valores a objetos str de Python:
+replace_substring y replace_substring_regex para los reemplazos de
+caracteres y los espacios, utf8_normalize para quitar acentos y
+utf8_lower para las minúsculas. El resultado es el mismo que el de
+normalizar_texto() con cada valor, y los nulos se conservan.
+
+Donde un kernel no da exactamente el resultado de Python, solo se pasan
+a Python las filas afectadas: utf8_lower no aplica la sigma final ni las
+minúsculas de varios caracteres (la de 'İ'), así que las filas con esos
+caracteres se convierten con str.lower(). Los reemplazos personalizados
+con claves vacías o que no son str se aplican en Python a toda la columna.
+
+pyarrow se importa al llamar a las funciones, de modo que el resto de
+normalizacion_texto sigue sin depender de él.
+"""
+
+import functools
+import sys
+import unicodedata
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from .quitar_acentos import CARACTERES_ESPECIALES
+from .normalizar_caracteres import (
+    CARACTERES_CONTROL, compilar_reemplazos, _combinar_reemplazos, _son_agrupables
+)
+from .normalizar_texto import validar_opciones_normalizacion
+
+
+# Caracteres que rodean a los espacios que limpiar_espacios() elimina
+APERTURAS = '([{'
+CIERRES = ',.;:!?)]}'
+
+# Tamaño de la caché de pasos compilados por configuración
+MAXIMO_PASOS_COMPILADOS = 128
+
+PasoArrow = Callable[[Any], Any]
+
+
+def normalizar_arrow(columna: Any, **opciones: Any) -> Any:
+    """
+    Normaliza un array de texto de Arrow con kernels de pyarrow.compute.
+
+    Cada valor queda igual que con normalizar_texto(valor, **opciones),
+    pero los pasos se aplican a la columna entera sin crear objetos str
+    de Python. Los pasos se compilan una vez por configuración y los que
+    no pueden cambiar nada (p. ej. quitar acentos en un bloque ASCII) se
+    omiten tras una comprobación.
+
+    Parámetros:
+    ----------
+    columna : pa.Array o pa.ChunkedArray
+        Valores de tipo string o large_string. Los nulos se conservan.
+    **opciones
+        Opciones de normalizar_texto(). Se validan una sola vez.
+
+    Retorna:
+    -------
+    pa.Array o pa.ChunkedArray
+        Del mismo tipo y, si es un ChunkedArray, con los mismos bloques.
+
+    Errores:
+    -------
+    - Lanza TypeError si columna no es un array de Arrow de texto o
+      alguna opción no es válida.
+
+    Ejemplos:
+    --------
+    >>> normalizar_arrow(pa.array(["  José  MARÍA ", None]))
+    ['jose maria', None]
+    >>> tabla = pq.read_table("clientes.parquet")
+    >>> normalizar_arrow(tabla.column("ciudad"), preservar_mayusculas=True)
+    """
+    validar_opciones_normalizacion(opciones)
+    return aplicar_pasos_arrow(columna, pasos_arrow(opciones))
+
+
+def normalizar_tabla_arrow(tabla: Any, columnas: Optional[Sequence[str]] = None, **opciones: Any) -> Any:
+    """
+    Normaliza varias columnas de una pa.Table con normalizar_arrow().
+
+    Parámetros:
+    ----------
+    tabla : pa.Table
+        Tabla de entrada. No se modifica.
+    columnas : Sequence[str], opcional
+        Columnas a normalizar. Si es None (por defecto) se normalizan las
+        de tipo string y large_string.
+    **opciones
+        Opciones de normalizar_texto().
+
+    Retorna:
+    -------
+    pa.Table
+        Tabla con las columnas normalizadas y el mismo esquema.
+
+    Errores:
+    -------
+    - Lanza TypeError si tabla no es una pa.Table, columnas no es una
+      lista de nombres, alguna columna no es de texto o alguna opción no
+      es válida.
+    - Lanza ValueError si alguna columna no existe en la tabla.
+
+    Ejemplos:
+    --------
+    >>> tabla = cargar_parquet("clientes.parquet", salida='arrow')
+    >>> normalizar_tabla_arrow(tabla, ['nombre', 'ciudad'])
+    """
+    import pyarrow as pa
+
+    if not isinstance(tabla, pa.Table):
+        raise TypeError("El parámetro 'tabla' debe ser una pa.Table")
+    if columnas is not None and (isinstance(columnas, str) or not isinstance(columnas, (list, tuple))):
+        raise TypeError("El parámetro 'columnas' debe ser una lista de columnas o None")
+    validar_opciones_normalizacion(opciones)
+
+    if columnas is None:
+        columnas = [campo.name for campo in tabla.schema if _es_texto(campo.type)]
+    faltan = [columna for columna in columnas if columna not in tabla.column_names]
+    if faltan:
+        raise ValueError(f"Las columnas {faltan} no existen en la tabla")
+
+    pasos = pasos_arrow(opciones)
+    for columna in columnas:
+        indice = tabla.column_names.index(columna)
+        tabla = tabla.set_column(indice, tabla.schema.field(indice), aplicar_pasos_arrow(tabla.column(indice), pasos))
+    return tabla
+
+
+def pasos_arrow(opciones: Dict[str, Any]) -> Tuple[PasoArrow, ...]:
+    """Pasos de Arrow de unas opciones de normalizar_texto() ya validadas."""
+    return _compilar_pasos(
+        opciones.get('normalizar_caracteres_flag', True),
+        opciones.get('quitar_acentos_flag', True),
+        opciones.get('convertir_minusculas', True) and not opciones.get('preservar_mayusculas', False),
+        opciones.get('limpiar_espacios_flag', True),
+        tuple((opciones.get('reemplazos_personalizados') or {}).items()),
+    )
+
+
+def aplicar_pasos_arrow(columna: Any, pasos: Sequence[PasoArrow]) -> Any:
+    """
+    Aplica los pasos a un pa.Array o, bloque a bloque, a un pa.ChunkedArray.
+
+    Errores:
+    -------
+    - Lanza TypeError si columna no es un array de Arrow de texto.
+    """
+    import pyarrow as pa
+
+    if not isinstance(columna, (pa.Array, pa.ChunkedArray)):
+        raise TypeError("El parámetro 'columna' debe ser un pa.Array o un pa.ChunkedArray")
+    if not _es_texto(columna.type):
+        raise TypeError(f"El parámetro 'columna' debe ser de tipo string o large_string, no {columna.type}")
+
+    if isinstance(columna, pa.Array):
+        return _aplicar_pasos(pasos, columna)
+    return pa.chunked_array([_aplicar_pasos(pasos, bloque) for bloque in columna.chunks], type=columna.type)
+
+
+@functools.lru_cache(maxsize=MAXIMO_PASOS_COMPILADOS)
+def _compilar_pasos(caracteres: bool, acentos: bool, minusculas: bool, limpiar: bool,
+                    personalizados: Tuple[Tuple[str, str], ...]) -> Tuple[PasoArrow, ...]:
+    """Compila los pasos de Arrow de una configuración, en el orden de normalizar_texto()."""
+    pasos: List[PasoArrow] = []
+    if caracteres:
+        reemplazos = _combinar_reemplazos(personalizados)
+        if _son_agrupables(reemplazos):
+            pasos.append(functools.partial(_reemplazar, _agrupar_reemplazos(reemplazos), _patron_claves(reemplazos)))
+            pasos.append(functools.partial(_quitar_caracteres, _clase(CARACTERES_CONTROL)))
+        else:
+            pasos.append(functools.partial(_en_python, functools.partial(_aplicar_pasos, compilar_reemplazos(personalizados))))
+    if acentos:
+        pasos.append(_quitar_acentos)
+    if minusculas:
+        pasos.append(_convertir_a_minusculas)
+    if limpiar:
+        pasos.append(_limpiar_espacios)
+    return tuple(pasos)
+
+
+def _aplicar_pasos(pasos: Sequence[Callable[[Any], Any]], valor: Any) -> Any:
+    """Aplica los pasos en orden."""
+    for paso in pasos:
+        valor = paso(valor)
+    return valor
+
+
+def _es_texto(tipo: Any) -> bool:
+    """El tipo de Arrow es string o large_string."""
+    import pyarrow as pa
+    return pa.types.is_string(tipo) or pa.types.is_large_string(tipo)
+
+
+def _agrupar_reemplazos(reemplazos: Dict[str, str]) -> Tuple[Tuple[Tuple[str, ...], str], ...]:
+    """
+    Agrupa los reemplazos consecutivos de un carácter con el mismo valor,
+    que se aplican con una clase de caracteres en una sola pasada. Un
+    reemplazo entra en el grupo si el valor no contiene ninguna de sus
+    claves, de modo que el resultado es el mismo que aplicarlos uno a uno.
+    """
+    grupos: List[Tuple[List[str], str]] = []
+    for clave, valor in reemplazos.items():
+        claves = grupos[-1][0] if grupos else []
+        if (grupos and grupos[-1][1] == valor and len(clave) == 1 and all(len(anterior) == 1 for anterior in claves)
+                and not any(caracter in valor for caracter in [*claves, clave])):
+            claves.append(clave)
+        else:
+            grupos.append(([clave], valor))
+    return tuple((tuple(claves), valor) for claves, valor in grupos)
+
+
+def _patron_claves(reemplazos: Dict[str, str]) -> str:
+    """Expresión regular de RE2 que encuentra cualquiera de las claves."""
+    return '|'.join(_literal(clave) for clave in reemplazos)
+
+
+def _literal(texto: str) -> str:
+    """Texto como literal de RE2, con los caracteres que no son alfanuméricos ASCII escapados."""
+    return ''.join(caracter if caracter.isascii() and caracter.isalnum() else f'\\x{{{ord(caracter):x}}}'
+                   for caracter in texto)
+
+
+def _clase(caracteres: str) -> str:
+    """Clase de caracteres de RE2 con los caracteres dados, con los consecutivos en rangos."""
+    rangos: List[List[int]] = []
+    for codigo in sorted(set(map(ord, caracteres))):
+        if rangos and rangos[-1][1] == codigo - 1:
+            rangos[-1][1] = codigo
+        else:
+            rangos.append([codigo, codigo])
+    return '[' + ''.join(_literal(chr(inicio)) if inicio == fin else f'{_literal(chr(inicio))}-{_literal(chr(fin))}'
+                         for inicio, fin in rangos) + ']'
+
+
+def _reemplazar(grupos: Tuple[Tuple[Tuple[str, ...], str], ...], patron: str, array: Any) -> Any:
+    """Aplica los grupos de reemplazos en orden a las filas que contienen alguna clave."""
+    import pyarrow.compute as pc
+
+    mascara = pc.match_substring_regex(array, pattern=patron)
+    return _en_filas(mascara, functools.partial(_reemplazar_grupos, grupos), array)
+
+
+def _reemplazar_grupos(grupos: Tuple[Tuple[Tuple[str, ...], str], ...], array: Any) -> Any:
+    """Aplica los grupos de reemplazos en orden."""
+    import pyarrow.compute as pc
+
+    for claves, valor in grupos:
+        if len(claves) == 1:
+            array = pc.replace_substring(array, pattern=claves[0], replacement=valor)
+        else:
+            array = _sustituir(_clase(''.join(claves)), valor.replace('\\', '\\\\'), array)
+    return array
+
+
+def _quitar_caracteres(clase: str, array: Any) -> Any:
+    """Elimina los caracteres de la clase."""
+    return _sustituir(clase, '', array)
+
+
+def _sustituir(patron: str, reemplazo: str, array: Any) -> Any:
+    """
+    replace_substring_regex en las filas en las que hay alguna coincidencia:
+    buscar cuesta bastante menos por fila que reemplazar.
+    """
+    import pyarrow.compute as pc
+
+    mascara = pc.match_substring_regex(array, pattern=patron)
+    return _en_filas(mascara, functools.partial(pc.replace_substring_regex, pattern=patron, replacement=reemplazo), array)
+
+
+def _quitar_acentos(array: Any) -> Any:
+    """
+    Quita los acentos como _quitar_acentos_nfd(): reemplaza los
+    CARACTERES_ESPECIALES, normaliza a NFD y elimina las marcas 'Mn'
+    (las de unicodedata; las de RE2 pueden ser de otra versión de
+    Unicode).
+    """
+    import pyarrow.compute as pc
+
+    # Las filas ASCII no tienen acentos ni caracteres especiales
+    return _en_filas(pc.invert(pc.string_is_ascii(array)), _quitar_acentos_nfd, array)
+
+
+def _quitar_acentos_nfd(array: Any) -> Any:
+    """Quita los acentos de todas las filas."""
+    import pyarrow.compute as pc
+
+    array = _reemplazar(_GRUPOS_ESPECIALES, _PATRON_ESPECIALES, array)
+    array = pc.utf8_normalize(array, form='NFD')
+    return _sustituir(_patrones_unicode()[2], '', array)
+
+
+def _convertir_a_minusculas(array: Any) -> Any:
+    """utf8_lower, con str.lower() en las filas en las que difieren."""
+    import pyarrow.compute as pc
+
+    minusculas = pc.utf8_lower(array)
+    return _corregir_filas(array, minusculas, _patrones_unicode()[1], str.lower)
+
+
+def _limpiar_espacios(array: Any) -> Any:
+    """
+    Limpia los espacios como limpiar_espacios(): une los espacios (los de
+    str.isspace()) en uno, recorta los extremos y elimina los espacios
+    antes de los cierres y después de las aperturas.
+    """
+    import pyarrow.compute as pc
+
+    array = _sustituir(_patrones_unicode()[0], ' ', array)
+    array = pc.utf8_trim(array, characters=' ')
+    # Tras unir los espacios no hay dos seguidos, así que cada espacio se
+    # elimina o no según sus vecinos y basta una pasada para ambos casos
+    return _sustituir('(' + _clase(APERTURAS) + ') | (' + _clase(CIERRES) + ')', r'\1\2', array)
+
+
+def _en_filas(mascara: Any, transformar: Callable[[Any], Any], array: Any) -> Any:
+    """Aplica transformar solo a las filas de array marcadas en la máscara."""
+    import pyarrow.compute as pc
+
+    mascara = pc.fill_null(mascara, False)
+    filas = pc.sum(mascara).as_py() or 0
+    if filas == 0:
+        return array
+    # Con la mayoría de filas marcadas, filtrar y volver a unir cuesta más de lo que ahorra
+    if filas * 2 > len(array):
+        return transformar(array)
+    return pc.replace_with_mask(array, mascara, transformar(pc.filter(array, mascara)))
+
+
+def _corregir_filas(original: Any, resultado: Any, patron: str, convertir: Callable[[str], str]) -> Any:
+    """Sustituye en resultado las filas de original que contienen el patrón por convertir(valor)."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    mascara = pc.fill_null(pc.match_substring_regex(original, pattern=patron), False)
+    if not pc.any(mascara).as_py():
+        return resultado
+    corregidos = [convertir(valor) for valor in pc.filter(original, mascara).to_pylist()]
+    return pc.replace_with_mask(resultado, mascara, pa.array(corregidos, type=original.type))
+
+
+def _en_python(convertir: Callable[[str], str], array: Any) -> Any:
+    """Aplica convertir a cada valor no nulo en Python."""
+    import pyarrow as pa
+    return pa.array([None if valor is None else convertir(valor) for valor in array.to_pylist()], type=array.type)
+
+
+@functools.lru_cache(maxsize=None)
+def _patrones_unicode() -> Tuple[str, str, str]:
+    """
+    Patrones de RE2 con propiedades de Unicode calculadas con unicodedata,
+    ya que las de RE2 y utf8proc pueden ser de otra versión de Unicode:
+
+    - Secuencias de espacios de str.isspace() que no son un solo ' '.
+    - Caracteres cuyo str.lower() no es el de utf8_lower: la sigma, que
+      al final de palabra es 'ς', y los que se convierten en varios.
+    - Marcas 'Mn'.
+
+    Se calculan la primera vez que se usan.
+    """
+    caracteres = [chr(codigo) for codigo in range(sys.maxunicode + 1)]
+    espacios = ''.join(caracter for caracter in caracteres if caracter.isspace())
+    minusculas = 'Σ' + ''.join(caracter for caracter in caracteres if len(caracter.lower()) != 1)
+    marcas = ''.join(caracter for caracter in caracteres if unicodedata.category(caracter) == 'Mn')
+    secuencias = f"{_clase(espacios.replace(' ', ''))}{_clase(espacios)}*| {_clase(espacios)}+"
+    return secuencias, _clase(minusculas), _clase(marcas)
+
+
+_GRUPOS_ESPECIALES = _agrupar_reemplazos(CARACTERES_ESPECIALES)
+_PATRON_ESPECIALES = _patron_claves(CARACTERES_ESPECIALES)
@@ -3,11 +3,21 @@ Módulo para normalización de caracteres especiales.
 
 Este módulo contiene funciones para normalizar caracteres especiales,
 símbolos extraños y reemplazarlos por equivalentes ASCII más comunes.
+
+Los reemplazos no se aplican uno a uno: se compilan en pasos de
+str.translate (claves de un carácter) y de una expresión regular con las
+claves alternadas (claves de varios caracteres). Los pasos de los
+reemplazos por defecto se compilan al importar el módulo y los de cada
+diccionario de reemplazos personalizados la primera vez que se usa.
 """
 
+import functools
+import operator
 import re
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from .utils import validar_entrada_texto, manejar_excepcion_texto
+from .hooks import trazar
+from .cache import memoizar
 
 
 # Diccionario de reemplazos para caracteres especiales comunes
@@ -58,12 +68,33 @@ REEMPLAZOS_CARACTERES: Dict[str, str] = {
 }
 
 
+# Caracteres de control que se eliminan al final (todos salvo \t, \n y \r)
+CARACTERES_CONTROL = ''.join(chr(codigo) for codigo in [*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F])
+
+# Las tablas de translate con todas las claves por debajo de este código son
+# listas indexadas por código, más rápidas que un dict; el resto son dict
+LIMITE_TABLA_DENSA = 0x3000
+
+# Tamaño de la caché de pasos compilados por diccionario de reemplazos personalizados
+MAXIMO_REEMPLAZOS_COMPILADOS = 128
+
+PasoReemplazo = Callable[[str], str]
+
+
+@trazar
+@memoizar
 def normalizar_caracteres(texto: Any, reemplazos_personalizados: Optional[Dict[str, str]] = None) -> str:
     """
     Normaliza caracteres especiales y extraños a equivalentes ASCII.
     
     Reemplaza caracteres especiales comunes (comillas tipográficas, guiones largos,
     espacios especiales, etc.) por sus equivalentes ASCII más simples.
+
+    El resultado es el mismo que aplicar cada reemplazo con str.replace en
+    orden y después quitar los caracteres de control, pero los reemplazos
+    se aplican en unas pocas pasadas precompiladas. Los reemplazos por
+    defecto se compilan al importar el módulo: para cambiarlos, usa
+    reemplazos_personalizados en lugar de modificar REEMPLAZOS_CARACTERES.
     
     Parámetros:
     ----------
@@ -101,22 +132,219 @@ def normalizar_caracteres(texto: Any, reemplazos_personalizados: Optional[Dict[s
             raise TypeError("El parámetro 'reemplazos_personalizados' debe ser un diccionario")
     
     try:
-        texto_normalizado = texto_validado
-        
-        # Combinar reemplazos: los personalizados sobrescriben los por defecto
-        reemplazos_finales = REEMPLAZOS_CARACTERES.copy()
         if reemplazos_personalizados:
-            reemplazos_finales.update(reemplazos_personalizados)
-        
-        # Aplicar todos los reemplazos
-        for caracter_original, caracter_reemplazo in reemplazos_finales.items():
-            texto_normalizado = texto_normalizado.replace(caracter_original, caracter_reemplazo)
-        
-        # Limpiar caracteres de control que puedan haber quedado
-        # Mantener solo caracteres imprimibles y espacios básicos
-        texto_normalizado = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', texto_normalizado)
-        
+            pasos = compilar_reemplazos(tuple(reemplazos_personalizados.items()))
+        else:
+            pasos = _PASOS_POR_DEFECTO
+
+        texto_normalizado = texto_validado
+        for paso in pasos:
+            texto_normalizado = paso(texto_normalizado)
         return texto_normalizado
         
     except Exception as e:
-        manejar_excepcion_texto(e, 'normalizar_caracteres', texto_validado)
\ No newline at end of file
+        manejar_excepcion_texto(e, 'normalizar_caracteres', texto_validado)
+
+
+@functools.lru_cache(maxsize=MAXIMO_REEMPLAZOS_COMPILADOS)
+def compilar_reemplazos(personalizados: Tuple[Tuple[str, str], ...] = ()) -> Tuple[PasoReemplazo, ...]:
+    """
+    Compila REEMPLAZOS_CARACTERES combinado con unos reemplazos
+    personalizados en los pasos que aplica normalizar_caracteres().
+
+    Los reemplazos se recorren en el orden del diccionario combinado y se
+    agrupan mientras agruparlos no cambie el resultado respecto a
+    aplicarlos uno a uno: las claves de un carácter van a una tabla de
+    str.translate siempre que ningún valor anterior del grupo contenga la
+    clave, y las de varios caracteres a una expresión regular alternada
+    siempre que las claves no se solapen entre sí y ningún valor del
+    grupo contenga caracteres de las claves siguientes. La eliminación de
+    los caracteres de control se añade a la última tabla cuando es
+    posible.
+
+    Si cada clave de varios caracteres tiene caracteres que ningún valor
+    produce, la clave solo puede aparecer en textos que ya los contienen.
+    Para el resto de textos se usan los pasos compilados sin esas claves,
+    que suelen quedar en una sola tabla. El resultado se guarda en caché
+    por diccionario.
+
+    Parámetros:
+    ----------
+    personalizados : Tuple[Tuple[str, str], ...]
+        Los items() de reemplazos_personalizados, en orden.
+
+    Retorna:
+    -------
+    Tuple[Callable[[str], str], ...]
+        Pasos que se aplican en orden al texto.
+    """
+    reemplazos = _combinar_reemplazos(personalizados)
+    if not _son_agrupables(reemplazos):
+        # Claves vacías o no str: se aplican como antes, uno a uno
+        return (functools.partial(_reemplazar_en_orden, tuple(reemplazos.items())),
+                _paso_translate(dict.fromkeys(CARACTERES_CONTROL, '')))
+
+    pasos = _agrupar_pasos(reemplazos)
+    por_caracter = compilar_reemplazos_por_caracter(personalizados)
+    if por_caracter is None or not por_caracter[0]:
+        return pasos
+    necesarios, sencillos = por_caracter
+    return (functools.partial(_aplicar_segun_claves, necesarios, sencillos, pasos),)
+
+
+@functools.lru_cache(maxsize=MAXIMO_REEMPLAZOS_COMPILADOS)
+def compilar_reemplazos_por_caracter(
+    personalizados: Tuple[Tuple[str, str], ...] = ()
+) -> Optional[Tuple[Tuple[Tuple[str, ...], ...], Tuple[PasoReemplazo, ...]]]:
+    """
+    Compila los pasos de normalizar_caracteres() que convierten el texto
+    carácter a carácter, para combinarlos con otras tablas de translate.
+
+    Parámetros:
+    ----------
+    personalizados : Tuple[Tuple[str, str], ...]
+        Los items() de reemplazos_personalizados, en orden.
+
+    Retorna:
+    -------
+    Optional[Tuple[Tuple[Tuple[str, ...], ...], Tuple[Callable[[str], str], ...]]]
+        (necesarios, pasos). Los pasos dan el mismo resultado que
+        compilar_reemplazos() en los textos para los que
+        puede_contener_claves(necesarios, texto) es False. None si los
+        reemplazos no se pueden aplicar carácter a carácter.
+    """
+    reemplazos = _combinar_reemplazos(personalizados)
+    if not _son_agrupables(reemplazos):
+        return None
+
+    multiples = [clave for clave in reemplazos if len(clave) > 1]
+    if not multiples:
+        return (), _agrupar_pasos(reemplazos)
+
+    producidos = set(''.join(reemplazos.values()))
+    necesarios = tuple(tuple(sorted(set(clave) - producidos)) for clave in multiples)
+    if not all(necesarios):
+        return None
+    sencillos = {clave: valor for clave, valor in reemplazos.items() if len(clave) == 1}
+    return necesarios, _agrupar_pasos(sencillos)
+
+
+def puede_contener_claves(necesarios: Tuple[Tuple[str, ...], ...], texto: str) -> bool:
+    """
+    Indica si alguna clave de varios caracteres puede aparecer en el
+    texto, es decir, si contiene todos sus caracteres necesarios.
+    """
+    return any(all(caracter in texto for caracter in caracteres) for caracteres in necesarios)
+
+
+def _combinar_reemplazos(personalizados: Tuple[Tuple[str, str], ...]) -> Dict[str, str]:
+    """REEMPLAZOS_CARACTERES con los reemplazos personalizados por encima."""
+    reemplazos = REEMPLAZOS_CARACTERES.copy()
+    reemplazos.update(personalizados)
+    return reemplazos
+
+
+def _son_agrupables(reemplazos: Dict[Any, Any]) -> bool:
+    """Los reemplazos se pueden agrupar si claves y valores son str y no hay claves vacías."""
+    return all(isinstance(clave, str) and clave and isinstance(valor, str)
+               for clave, valor in reemplazos.items())
+
+
+def _agrupar_pasos(reemplazos: Dict[str, str]) -> Tuple[PasoReemplazo, ...]:
+    """Agrupa los reemplazos en pasos y añade la eliminación de los caracteres de control."""
+    grupos: List[Dict[str, str]] = []
+    for clave, valor in reemplazos.items():
+        if not grupos or not _admite(grupos[-1], clave, valor):
+            grupos.append({})
+        grupos[-1][clave] = valor
+
+    pasos = [_compilar_grupo(grupo) for grupo in grupos[:-1]]
+    ultimo = grupos[-1] if grupos else {}
+    if _es_tabla(ultimo) and not any(set(valor) & set(CARACTERES_CONTROL) for valor in ultimo.values()):
+        pasos.append(_paso_translate({**dict.fromkeys(CARACTERES_CONTROL, ''), **ultimo}))
+    else:
+        pasos.append(_compilar_grupo(ultimo))
+        pasos.append(_paso_translate(dict.fromkeys(CARACTERES_CONTROL, '')))
+    return tuple(pasos)
+
+
+def _aplicar_segun_claves(necesarios: Tuple[Tuple[str, ...], ...], sencillos: Tuple[PasoReemplazo, ...],
+                          completos: Tuple[PasoReemplazo, ...], texto: str) -> str:
+    """
+    Aplica los pasos completos si alguna clave de varios caracteres puede
+    aparecer en el texto (contiene todos sus caracteres necesarios) y los
+    pasos sin esas claves en caso contrario.
+    """
+    pasos = completos if puede_contener_claves(necesarios, texto) else sencillos
+    for paso in pasos:
+        texto = paso(texto)
+    return texto
+
+
+def _admite(grupo: Dict[str, str], clave: str, valor: str) -> bool:
+    """Indica si clave puede aplicarse en la misma pasada que el grupo sin cambiar el resultado."""
+    if _es_tabla(grupo):
+        # Tabla de translate: ningún valor anterior debe producir la clave
+        return len(clave) == 1 and not any(clave in anterior for anterior in grupo.values())
+    # Expresión regular: claves sin solapes y valores que no formen la clave con el texto de alrededor
+    return (len(clave) > 1
+            and not any(_se_solapan(clave, anterior) for anterior in grupo)
+            and all(anterior and not set(clave) & set(anterior) for anterior in grupo.values()))
+
+
+def _es_tabla(grupo: Dict[str, str]) -> bool:
+    """Un grupo con claves de un carácter se aplica con str.translate."""
+    return all(len(clave) == 1 for clave in grupo)
+
+
+def _se_solapan(a: str, b: str) -> bool:
+    """Indica si dos claves pueden compartir caracteres en una misma aparición."""
+    if a in b or b in a:
+        return True
+    return any(a.endswith(b[:i]) or b.endswith(a[:i]) for i in range(1, min(len(a), len(b))))
+
+
+def _compilar_grupo(grupo: Dict[str, str]) -> PasoReemplazo:
+    """Paso de str.translate, str.replace o expresión regular alternada para un grupo."""
+    if _es_tabla(grupo):
+        return _paso_translate(grupo)
+    if len(grupo) == 1:
+        [(clave, valor)] = grupo.items()
+        return operator.methodcaller('replace', clave, valor)
+    patron = re.compile('|'.join(re.escape(clave) for clave in sorted(grupo, key=len, reverse=True)))
+    return functools.partial(patron.sub, lambda coincidencia: grupo[coincidencia.group()])
+
+
+def _reemplazar_en_orden(reemplazos: Tuple[Tuple[Any, Any], ...], texto: str) -> str:
+    """Aplica los reemplazos uno a uno con str.replace."""
+    for caracter_original, caracter_reemplazo in reemplazos:
+        texto = texto.replace(caracter_original, caracter_reemplazo)
+    return texto
+
+
+def _paso_translate(grupo: Dict[str, str]) -> PasoReemplazo:
+    """
+    Paso de str.translate para claves de un carácter. Antes de traducir se
+    busca con una clase de caracteres si el texto contiene alguna clave,
+    de modo que el texto que no tiene ninguna se devuelve sin recorrerlo
+    carácter a carácter.
+    """
+    tabla: Any = {ord(clave): valor for clave, valor in grupo.items()}
+    if max(tabla) < LIMITE_TABLA_DENSA:
+        densa: List[Any] = list(range(max(tabla) + 1))
+        for codigo, valor in tabla.items():
+            densa[codigo] = valor
+        tabla = densa
+    patron = re.compile('[' + ''.join(re.escape(clave) for clave in grupo) + ']')
+    return functools.partial(_traducir, patron.search, tabla)
+
+
+def _traducir(buscar: Callable[[str], Any], tabla: Any, texto: str) -> str:
+    """Aplica la tabla de translate solo si el texto contiene alguna de sus claves."""
+    if buscar(texto) is None:
+        return texto
+    return texto.translate(tabla)
+
+
+# Pasos de los reemplazos por defecto, compilados al importar
+_PASOS_POR_DEFECTO = compilar_reemplazos()
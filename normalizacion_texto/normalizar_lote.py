@@ -0,0 +1,50 @@
+"""
+Módulo de normalización de listas de textos.
+
+Este módulo aplica normalizar_texto() a una lista de textos validando las
+opciones y la lista una sola vez. En lugar de millones de llamadas
+pequeñas a str.replace, str.translate y re.sub, los textos se unen por
+bloques con un separador que no aparece en ellos, cada paso se aplica
+una vez a cada bloque y el resultado se vuelve a separar (ver
+Normalizador.lote()).
+"""
+
+from typing import Any, List
+from .normalizador import Normalizador
+
+
+def normalizar_lote(textos: List[Any], **opciones: Any) -> List[str]:
+    """
+    Normaliza una lista de textos con normalizar_texto().
+
+    Cada texto queda igual que con normalizar_texto(texto, **opciones):
+    los pasos sensibles a los límites de cada texto, como el recorte de
+    limpiar_espacios, se aplican a cada texto por separado.
+
+    Parámetros:
+    ----------
+    textos : List[Any]
+        Textos a normalizar (lista o tupla). Los que no son str se
+        convierten a string.
+    **opciones
+        Opciones de normalizar_texto(). Se validan una sola vez.
+
+    Retorna:
+    -------
+    List[str]
+        Los textos normalizados, en el mismo orden.
+
+    Errores:
+    -------
+    - Lanza TypeError si textos no es una lista o tupla, algún texto es
+      None o no se puede convertir a string, o alguna opción no es válida.
+
+    Ejemplos:
+    --------
+    >>> normalizar_lote(["  José ", "MARÍA  (Madrid) "])
+    ['jose', 'maria (madrid)']
+    >>> normalizar_lote(nombres, preservar_mayusculas=True)
+    """
+    if not isinstance(textos, (list, tuple)):
+        raise TypeError("El parámetro 'textos' debe ser una lista o una tupla")
+    return Normalizador(**opciones).lote(textos)
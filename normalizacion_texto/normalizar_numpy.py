@@ -0,0 +1,245 @@
+"""
+Módulo de normalización de arrays de texto de NumPy.
+
+Este módulo aplica normalizar_texto() a arrays de NumPy de ancho fijo
+(dtype 'U', p. ej. nombres o códigos cortos) sin pasar por Python en la
+mayoría de valores. El buffer UCS4 del array se ve como una matriz de
+uint32 (un código por carácter) y los reemplazos de caracteres, los
+acentos y las minúsculas se aplican con un único acceso indexado a una
+tabla precalculada por código de carácter, calculada con los mismos
+pasos que normalizar_texto() para cada carácter del plano básico.
+
+Solo se normalizan en Python (con Normalizador) los valores que la
+tabla no puede convertir: los que contienen caracteres que se convierten
+en varios o en ninguno (ß → ss, € → EUR, caracteres de control), fuera
+del plano básico o que dependen de sus vecinos (la sigma final, las
+marcas combinantes que NFD reordena, las claves de varios caracteres de
+los reemplazos), y, si se limpian los espacios, los que tienen espacios
+que limpiar_espacios() cambiaría.
+
+NumPy se importa al llamar a las funciones, de modo que el resto de
+normalizacion_texto sigue sin depender de él.
+"""
+
+import functools
+import unicodedata
+from typing import Any, List, NamedTuple, Optional, Tuple
+from .quitar_acentos import _quitar_acentos_nfd
+from .normalizar_caracteres import compilar_reemplazos_por_caracter
+from .normalizar_texto import validar_opciones_normalizacion
+
+
+# Caracteres junto a los que limpiar_espacios() elimina los espacios
+APERTURAS = '([{'
+CIERRES = ',.;:!?)]}'
+
+# La tabla cubre el plano básico; el resto de caracteres van por Python
+LIMITE_TABLA = 0x10000
+
+# Tamaño de la caché de tablas compiladas por configuración
+MAXIMO_TABLAS_COMPILADAS = 16
+
+# Marcas de la tabla de tipos: el carácter no se puede convertir con la
+# tabla, o se convierte en un espacio, una apertura o un cierre
+_COMPLEJO = 1
+_ESPACIO = 2
+_APERTURA = 4
+_CIERRE = 8
+
+
+class TablaCodigos(NamedTuple):
+    """
+    Tabla por código de carácter de una configuración de normalizar_texto().
+
+    Atributos:
+    ---------
+    codigos : np.ndarray
+        uint32 de LIMITE_TABLA elementos: el código en que se convierte
+        cada carácter (0 para los complejos).
+    tipos : np.ndarray
+        uint8 con las marcas _COMPLEJO, _ESPACIO, _APERTURA y _CIERRE de
+        cada carácter.
+    necesarios : Tuple[Tuple[str, ...], ...]
+        Caracteres de cada clave de varios caracteres de los reemplazos;
+        los textos que los contienen todos van por Python.
+    limpiar : bool
+        Si se limpian los espacios.
+    """
+    codigos: Any
+    tipos: Any
+    necesarios: Tuple[Tuple[str, ...], ...]
+    limpiar: bool
+
+
+def normalizar_array(textos: Any, **opciones: Any) -> Any:
+    """
+    Normaliza un array de NumPy de texto de ancho fijo (dtype 'U').
+
+    Cada valor queda igual que con normalizar_texto(valor, **opciones).
+    Los valores que la tabla por código de carácter puede convertir se
+    convierten a la vez con un acceso indexado; el resto, en Python. La
+    tabla de cada configuración se calcula la primera vez que se usa.
+
+    Parámetros:
+    ----------
+    textos : np.ndarray
+        Array de dtype 'U' de cualquier forma.
+    **opciones
+        Opciones de normalizar_texto(). Se validan una sola vez.
+
+    Retorna:
+    -------
+    np.ndarray
+        Array de dtype 'U' con la misma forma. Es más ancho que el de
+        entrada si algún valor normalizado es más largo (ß → ss). Como en
+        cualquier array 'U', los '\x00' del final de un valor se pierden.
+
+    Errores:
+    -------
+    - Lanza TypeError si textos no es un array de dtype 'U' o alguna
+      opción no es válida.
+
+    Ejemplos:
+    --------
+    >>> normalizar_array(np.array(["  José ", "MARÍA", "Åsa"]))
+    array(['jose', 'maria', 'asa'], dtype='<U7')
+    >>> normalizar_array(codigos, normalizar_caracteres_flag=False)
+    """
+    validar_opciones_normalizacion(opciones)
+    from .normalizador import Normalizador
+    return aplicar_tabla_codigos(textos, tabla_codigos(opciones), Normalizador(**opciones))
+
+
+def tabla_codigos(opciones: Any) -> Optional[TablaCodigos]:
+    """
+    Tabla por código de carácter de unas opciones de normalizar_texto()
+    ya validadas, o None si los reemplazos no se pueden aplicar carácter
+    a carácter.
+    """
+    return _compilar_tabla(
+        opciones.get('normalizar_caracteres_flag', True),
+        opciones.get('quitar_acentos_flag', True),
+        opciones.get('convertir_minusculas', True) and not opciones.get('preservar_mayusculas', False),
+        opciones.get('limpiar_espacios_flag', True),
+        tuple((opciones.get('reemplazos_personalizados') or {}).items()),
+    )
+
+
+def aplicar_tabla_codigos(textos: Any, tabla: Optional[TablaCodigos], normalizar: Any) -> Any:
+    """
+    Convierte textos con la tabla y, los valores que no puede convertir,
+    con normalizar.
+
+    Errores:
+    -------
+    - Lanza TypeError si textos no es un array de dtype 'U'.
+    """
+    import numpy as np
+
+    if not isinstance(textos, np.ndarray) or textos.dtype.kind != 'U':
+        raise TypeError("El parámetro 'textos' debe ser un np.ndarray de dtype 'U'")
+
+    ancho = textos.dtype.itemsize // 4
+    planos = np.ascontiguousarray(textos.reshape(-1), dtype=f'U{max(ancho, 1)}')
+    codigos = planos.view(np.uint32).reshape(len(planos), max(ancho, 1))
+
+    if tabla is None:
+        complejos = np.ones(len(planos), dtype=bool)
+        convertidos = codigos.copy()
+    else:
+        convertidos, complejos = _convertir(codigos, tabla)
+
+    resultados: List[str] = [normalizar(str(texto)) for texto in planos[complejos]]
+    ancho_final = max([ancho, 1, *map(len, resultados)])
+    salida = np.zeros((len(planos), ancho_final), dtype=np.uint32)
+    salida[:, :codigos.shape[1]] = convertidos
+    if resultados:
+        salida[complejos] = np.array(resultados, dtype=f'U{ancho_final}').view(np.uint32).reshape(-1, ancho_final)
+    return salida.view(f'U{ancho_final}').reshape(textos.shape)
+
+
+def _convertir(codigos: Any, tabla: TablaCodigos) -> Tuple[Any, Any]:
+    """
+    Convierte la matriz de códigos con la tabla. Devuelve la matriz
+    convertida y la máscara de filas que hay que normalizar en Python.
+    """
+    import numpy as np
+
+    if codigos.max(initial=0) < LIMITE_TABLA:
+        indices, complejos = codigos, np.zeros(len(codigos), dtype=bool)
+    else:
+        fuera = codigos >= LIMITE_TABLA
+        indices, complejos = np.where(fuera, 0, codigos), fuera.any(axis=1)
+    convertidos = tabla.codigos[indices]
+    tipos = tabla.tipos[indices]
+    complejos |= (tipos & _COMPLEJO).any(axis=1)
+
+    # Los caracteres '\x00' antes del final no se distinguen del relleno
+    presentes = codigos != 0
+    longitudes = np.where(presentes.any(axis=1), codigos.shape[1] - presentes[:, ::-1].argmax(axis=1), 0)
+    complejos |= presentes.sum(axis=1) != longitudes
+
+    for caracteres in tabla.necesarios:
+        complejos |= np.logical_and.reduce([(codigos == ord(caracter)).any(axis=1) for caracter in caracteres])
+
+    if tabla.limpiar:
+        complejos |= _espacios_que_limpiar(tipos, longitudes)
+    return convertidos, complejos
+
+
+def _espacios_que_limpiar(tipos: Any, longitudes: Any) -> Any:
+    """
+    Filas en las que limpiar_espacios() cambiaría algo: espacios al
+    principio o al final, dos seguidos o junto a aperturas y cierres. Los
+    caracteres de espacio distintos de ' ' ya son complejos en la tabla.
+    """
+    import numpy as np
+
+    espacios = (tipos & _ESPACIO).astype(bool)
+    cambian = espacios[:, 0].copy()
+    filas = np.flatnonzero(longitudes)
+    cambian[filas] |= espacios[filas, longitudes[filas] - 1]
+    if tipos.shape[1] > 1:
+        # Un espacio seguido de un espacio o un cierre, o una apertura seguida de un espacio
+        siguientes = tipos[:, 1:]
+        cambian |= ((espacios[:, :-1] & ((siguientes & (_ESPACIO | _CIERRE)) != 0))
+                    | (((tipos[:, :-1] & _APERTURA) != 0) & espacios[:, 1:])).any(axis=1)
+    return cambian
+
+
+@functools.lru_cache(maxsize=MAXIMO_TABLAS_COMPILADAS)
+def _compilar_tabla(caracteres: bool, acentos: bool, minusculas: bool, limpiar: bool,
+                    personalizados: Tuple[Tuple[str, str], ...]) -> Optional[TablaCodigos]:
+    """
+    Calcula la tabla de una configuración convirtiendo cada carácter del
+    plano básico con los pasos de normalizar_texto().
+    """
+    import numpy as np
+
+    por_caracter = compilar_reemplazos_por_caracter(personalizados) if caracteres else ((), ())
+    if por_caracter is None:
+        return None
+    necesarios, pasos = por_caracter
+
+    codigos = np.zeros(LIMITE_TABLA, dtype=np.uint32)
+    tipos = np.zeros(LIMITE_TABLA, dtype=np.uint8)
+    for codigo in range(1, LIMITE_TABLA):
+        convertido = chr(codigo)
+        for paso in pasos:
+            convertido = paso(convertido)
+        if acentos:
+            convertido = _quitar_acentos_nfd(convertido)
+        # NFD reordena las marcas combinantes que se conservan y str.lower()
+        # convierte la sigma según sus vecinos
+        if any(unicodedata.combining(caracter) for caracter in convertido) or (minusculas and 'Σ' in convertido):
+            tipos[codigo] = _COMPLEJO
+            continue
+        if minusculas:
+            convertido = convertido.lower()
+        if len(convertido) != 1 or ord(convertido) >= LIMITE_TABLA or (limpiar and convertido.isspace() and convertido != ' '):
+            tipos[codigo] = _COMPLEJO
+            continue
+        codigos[codigo] = ord(convertido)
+        tipos[codigo] = ((_ESPACIO if convertido == ' ' else 0) | (_APERTURA if convertido in APERTURAS else 0)
+                         | (_CIERRE if convertido in CIERRES else 0))
+    return TablaCodigos(codigos, tipos, necesarios, limpiar)
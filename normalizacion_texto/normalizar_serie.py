@@ -0,0 +1,343 @@
+"""
+Módulo de normalización de columnas de pandas.
+
+Este módulo aplica normalizar_texto() a una Series o a varias columnas de
+un DataFrame normalizando cada valor distinto una sola vez: la columna se
+factoriza, se normalizan los valores únicos y el resultado se reparte con
+los códigos. En las columnas categóricas solo se normalizan las
+categorías. Los nulos (None, NaN, pd.NA) se conservan.
+
+Con workers=N los valores únicos se reparten en bloques entre N procesos
+(o hilos, para CPython sin GIL). Los bloques van y vuelven como arrays de
+Arrow, que se serializan como buffers contiguos en lugar de como listas
+de objetos.
+
+pandas se importa al llamar a las funciones, de modo que el resto de
+normalizacion_texto sigue sin depender de él.
+"""
+
+import contextlib
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from .normalizar_texto import normalizar_texto, validar_opciones_normalizacion
+from .utils import validar_entrada_texto
+
+
+# Motores para workers: procesos o hilos (para CPython sin GIL)
+MOTORES_PARALELOS = ('procesos', 'hilos')
+
+# Por debajo de este número de valores únicos no compensa repartir
+MINIMO_VALORES_PARALELO = 10_000
+
+# Bloques por worker, para equilibrar la carga entre ellos
+BLOQUES_POR_WORKER = 4
+
+# Normalizador de cada proceso del pool, fijado al crearlo
+_normalizador_proceso: Optional[Callable[[str], str]] = None
+
+
+def normalizar_serie(serie: Any, workers: Optional[int] = None, paralelo: str = 'procesos',
+                     **opciones: Any) -> Any:
+    """
+    Normaliza todos los valores de una pd.Series con normalizar_texto().
+
+    Cada valor distinto se normaliza una sola vez, por lo que el coste
+    depende del número de valores únicos y no del de filas. Las opciones
+    se validan una vez antes de empezar.
+
+    Parámetros:
+    ----------
+    serie : pd.Series
+        Columna a normalizar. Los valores que no son texto se convierten a
+        string, igual que en normalizar_texto().
+    workers : Optional[int], opcional
+        Número de procesos o hilos entre los que repartir los valores
+        únicos. None o 1 (por defecto) normalizan en este hilo. Solo se
+        reparte a partir de MINIMO_VALORES_PARALELO valores únicos.
+    paralelo : str, opcional
+        'procesos' (por defecto) o 'hilos'. Los hilos solo aceleran en
+        CPython sin GIL (free-threaded).
+    **opciones
+        Opciones de normalizar_texto() (quitar_acentos_flag,
+        convertir_minusculas, reemplazos_personalizados, ...).
+
+    Retorna:
+    -------
+    pd.Series
+        Nueva serie con el mismo índice y nombre. Los nulos se mantienen.
+        Una serie categórica sigue siendo categórica (las categorías que
+        coincidan tras normalizar se fusionan) y una de tipo string
+        conserva su tipo; el resto quedan como object.
+
+    Errores:
+    -------
+    - Lanza TypeError si serie no es una pd.Series, alguna opción no es
+      válida, workers no es un entero positivo o paralelo no es
+      'procesos' ni 'hilos'.
+
+    Ejemplos:
+    --------
+    >>> normalizar_serie(pd.Series(["  José ", None, "JOSÉ"]))
+    0    jose
+    1    None
+    2    jose
+    dtype: object
+    >>> normalizar_serie(ciudades, preservar_mayusculas=True)
+    >>> normalizar_serie(direcciones, workers=8)
+    """
+    import pandas as pd
+
+    if not isinstance(serie, pd.Series):
+        raise TypeError("El parámetro 'serie' debe ser una pd.Series")
+    validar_opciones_normalizacion(opciones)
+    validar_paralelo(workers, paralelo)
+
+    if workers is None or workers == 1:
+        return normalizar_serie_con(serie, lambda valor: normalizar_texto(valor, **opciones))
+
+    from .normalizador import Normalizador
+    normalizador = Normalizador(**opciones)
+    with repartir(normalizador, workers, paralelo) as reparto:
+        return normalizar_serie_con(serie, normalizador, reparto)
+
+
+def normalizar_serie_con(serie: Any, normalizar: Callable[[Any], str],
+                         reparto: Optional['Reparto'] = None) -> Any:
+    """
+    Aplica normalizar a cada valor distinto de una pd.Series ya validada,
+    como normalizar_serie(). Con un reparto, los valores únicos se
+    normalizan en sus workers.
+    """
+    import pandas as pd
+
+    if isinstance(serie.dtype, pd.CategoricalDtype):
+        return _normalizar_categorica(serie, normalizar, reparto)
+
+    codigos, unicos = _factorizar(serie)
+    if len(unicos) == 0:
+        return serie.copy()
+
+    valores = _normalizar_unicos(unicos, normalizar, reparto).take(codigos)
+    nulos = codigos == -1
+    if nulos.any():
+        valores[nulos] = serie.to_numpy(dtype=object)[nulos]
+
+    tipo = serie.dtype if isinstance(serie.dtype, pd.StringDtype) else object
+    return pd.Series(valores, index=serie.index, name=serie.name, dtype=tipo)
+
+
+def normalizar_dataframe(df: Any, columnas: Optional[Sequence[Any]] = None, workers: Optional[int] = None,
+                         paralelo: str = 'procesos', **opciones: Any) -> Any:
+    """
+    Normaliza varias columnas de un DataFrame con normalizar_serie().
+
+    Parámetros:
+    ----------
+    df : pd.DataFrame
+        DataFrame de entrada. No se modifica.
+    columnas : Sequence, opcional
+        Columnas a normalizar. Si es None (por defecto) se normalizan las
+        de texto: object, string y category.
+    workers, paralelo :
+        Igual que en normalizar_serie(). Todas las columnas se reparten
+        en el mismo pool.
+    **opciones
+        Opciones de normalizar_texto().
+
+    Retorna:
+    -------
+    pd.DataFrame
+        Copia del DataFrame con las columnas normalizadas.
+
+    Errores:
+    -------
+    - Lanza TypeError si df no es un pd.DataFrame, columnas no es una
+      lista de columnas, alguna opción no es válida o workers o
+      paralelo no son válidos.
+    - Lanza ValueError si alguna columna no existe en el DataFrame.
+
+    Ejemplos:
+    --------
+    >>> normalizar_dataframe(clientes, ['nombre', 'ciudad'])
+    >>> normalizar_dataframe(clientes, quitar_acentos_flag=False)
+    """
+    import pandas as pd
+
+    if not isinstance(df, pd.DataFrame):
+        raise TypeError("El parámetro 'df' debe ser un pd.DataFrame")
+    if columnas is not None and (isinstance(columnas, str) or not isinstance(columnas, (list, tuple, pd.Index))):
+        raise TypeError("El parámetro 'columnas' debe ser una lista de columnas o None")
+    validar_opciones_normalizacion(opciones)
+    validar_paralelo(workers, paralelo)
+
+    if columnas is None:
+        columnas = list(df.select_dtypes(include=['object', 'string', 'category']).columns)
+    faltan = [columna for columna in columnas if columna not in df.columns]
+    if faltan:
+        raise ValueError(f"Las columnas {faltan} no existen en el DataFrame")
+
+    resultado = df.copy(deep=False)
+    if workers is None or workers == 1:
+        for columna in columnas:
+            resultado[columna] = normalizar_serie(df[columna], **opciones)
+        return resultado
+
+    from .normalizador import Normalizador
+    normalizador = Normalizador(**opciones)
+    with repartir(normalizador, workers, paralelo) as reparto:
+        for columna in columnas:
+            resultado[columna] = normalizar_serie_con(df[columna], normalizador, reparto)
+    return resultado
+
+
+def validar_paralelo(workers: Any, paralelo: Any) -> None:
+    """
+    Valida los parámetros workers y paralelo.
+
+    Errores:
+    -------
+    - Lanza TypeError si workers no es None ni un entero positivo o
+      paralelo no es 'procesos' ni 'hilos'.
+    """
+    if workers is not None and (not isinstance(workers, int) or isinstance(workers, bool) or workers < 1):
+        raise TypeError("El parámetro 'workers' debe ser un entero positivo o None")
+    if paralelo not in MOTORES_PARALELOS:
+        raise TypeError("El parámetro 'paralelo' debe ser uno de: 'procesos', 'hilos'")
+
+
+class Reparto:
+    """
+    Pool de procesos o hilos que normaliza valores únicos por bloques.
+
+    En procesos, cada proceso recibe el normalizador una vez al crearse y
+    los bloques de valores van y vuelven como pa.Array de large_string;
+    si un bloque no se puede codificar en UTF-8 (surrogates sueltos), va
+    como lista.
+    """
+
+    def __init__(self, ejecutor: Any, workers: int, paralelo: str, normalizar: Callable[[Any], str]):
+        self.ejecutor = ejecutor
+        self.workers = workers
+        self.paralelo = paralelo
+        self.normalizar = normalizar
+
+    def normalizar_valores(self, valores: List[Any]) -> List[Any]:
+        """Normaliza los valores repartidos en bloques y devuelve los resultados en orden."""
+        tamano = -(-len(valores) // (self.workers * BLOQUES_POR_WORKER))
+        bloques = [valores[inicio:inicio + tamano] for inicio in range(0, len(valores), tamano)]
+
+        if self.paralelo == 'hilos':
+            normalizar = self.normalizar
+            resultados = self.ejecutor.map(lambda bloque: [normalizar(valor) for valor in bloque], bloques)
+            return [valor for bloque in resultados for valor in bloque]
+
+        textos = [[valor if isinstance(valor, str) else validar_entrada_texto(valor, 'normalizar_serie')
+                   for valor in bloque] for bloque in bloques]
+        normalizados: List[Any] = []
+        for bloque in self.ejecutor.map(_normalizar_bloque, map(_a_arrow, textos)):
+            normalizados.extend(bloque.to_pylist() if not isinstance(bloque, list) else bloque)
+        return normalizados
+
+
+@contextlib.contextmanager
+def repartir(normalizador: Callable[[Any], str], workers: int, paralelo: str) -> Iterator[Reparto]:
+    """
+    Crea el pool de workers para normalizador y lo cierra al salir.
+
+    El normalizador tiene que poder serializarse con pickle para usar
+    procesos (Normalizador lo cumple).
+    """
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    if paralelo == 'hilos':
+        ejecutor = ThreadPoolExecutor(max_workers=workers)
+    else:
+        ejecutor = ProcessPoolExecutor(max_workers=workers, initializer=_iniciar_proceso,
+                                       initargs=(normalizador,))
+    with ejecutor:
+        yield Reparto(ejecutor, workers, paralelo, normalizador)
+
+
+def _factorizar(serie: Any) -> Tuple[Any, Any]:
+    """
+    Códigos y valores únicos de una pd.Series, con -1 para los nulos.
+
+    pd.factorize compara los str de object solo hasta el primer '\x00', así
+    que fusiona '\x00José' con '\x00MARÍA' y con ''. Se comprueba que cada
+    valor sea igual a su único y, si no, se factoriza con un dict.
+    """
+    import numpy as np
+    import pandas as pd
+
+    codigos, unicos = pd.factorize(serie, use_na_sentinel=True)
+    unicos = np.asarray(unicos, dtype=object)
+    valores = serie.to_numpy(dtype=object)
+    validos = codigos != -1
+    if (unicos.take(codigos[validos]) == valores[validos]).all():
+        return codigos, unicos
+
+    posiciones: Dict[Any, int] = {}
+    nulos = pd.isna(valores)
+    codigos = np.array([-1 if nulo else posiciones.setdefault(valor, len(posiciones))
+                        for valor, nulo in zip(valores, nulos)], dtype=np.intp)
+    unicos = np.empty(len(posiciones), dtype=object)
+    for posicion, valor in enumerate(posiciones):
+        unicos[posicion] = valor
+    return codigos, unicos
+
+
+def _normalizar_categorica(serie: Any, normalizar: Callable[[Any], str],
+                           reparto: Optional[Reparto] = None) -> Any:
+    """Normaliza las categorías y fusiona las que coinciden tras normalizar."""
+    import numpy as np
+    import pandas as pd
+
+    if len(serie.cat.categories) == 0:
+        return serie.copy()
+
+    normalizadas = _normalizar_unicos(serie.cat.categories, normalizar, reparto)
+    # Código nuevo de cada categoría original (con un dict: ver _factorizar)
+    posiciones: Dict[Any, int] = {}
+    nuevos = np.array([posiciones.setdefault(valor, len(posiciones)) for valor in normalizadas], dtype=np.intp)
+    categorias = list(posiciones)
+    codigos = serie.cat.codes.to_numpy()
+    codigos = np.where(codigos >= 0, nuevos.take(codigos), -1)
+
+    categorica = pd.Categorical.from_codes(codigos, categories=categorias, ordered=serie.cat.ordered)
+    return pd.Series(categorica, index=serie.index, name=serie.name)
+
+
+def _normalizar_unicos(unicos: Any, normalizar: Callable[[Any], str],
+                       reparto: Optional[Reparto] = None) -> Any:
+    """Array object con normalizar aplicado a cada valor único."""
+    import numpy as np
+
+    normalizados = np.empty(len(unicos), dtype=object)
+    if reparto is not None and len(unicos) >= MINIMO_VALORES_PARALELO:
+        normalizados[:] = reparto.normalizar_valores(list(unicos))
+        return normalizados
+
+    for posicion, valor in enumerate(unicos):
+        normalizados[posicion] = normalizar(valor)
+    return normalizados
+
+
+def _iniciar_proceso(normalizador: Callable[[str], str]) -> None:
+    """Fija el normalizador de un proceso del pool."""
+    global _normalizador_proceso
+    _normalizador_proceso = normalizador
+
+
+def _normalizar_bloque(bloque: Any) -> Any:
+    """Normaliza un bloque en un proceso del pool: pa.Array o lista de str."""
+    textos = bloque if isinstance(bloque, list) else bloque.to_pylist()
+    return _a_arrow([_normalizador_proceso(texto) for texto in textos])
+
+
+def _a_arrow(textos: List[str]) -> Any:
+    """pa.Array large_string con los textos, o la lista si no se pueden codificar en UTF-8."""
+    import pyarrow as pa
+
+    try:
+        return pa.array(textos, type=pa.large_string())
+    except (pa.ArrowException, UnicodeEncodeError):
+        return textos
@@ -11,8 +11,54 @@ from .convertir_case import convertir_a_minusculas, convertir_a_mayusculas
 from .limpiar_espacios import limpiar_espacios
 from .normalizar_caracteres import normalizar_caracteres
 from .utils import validar_entrada_texto, manejar_excepcion_texto
+from .hooks import trazar
+from .cache import memoizar
 
 
+# Opciones booleanas de normalizar_texto()
+OPCIONES_BOOLEANAS = (
+    'quitar_acentos_flag',
+    'convertir_minusculas',
+    'limpiar_espacios_flag',
+    'normalizar_caracteres_flag',
+    'preservar_mayusculas',
+)
+
+
+def validar_opciones_normalizacion(opciones: Dict[str, Any]) -> None:
+    """
+    Valida las opciones con nombre de normalizar_texto().
+
+    La usan normalizar_texto() en cada llamada y las funciones que aplican
+    la misma normalización a muchos valores, que validan las opciones una
+    sola vez.
+
+    Parámetros:
+    ----------
+    opciones : Dict[str, Any]
+        Opciones por nombre, sin el texto. Las que falten toman su valor
+        por defecto.
+
+    Errores:
+    -------
+    - Lanza TypeError si alguna opción no existe, un flag no es bool o
+      reemplazos_personalizados no es un diccionario.
+    """
+    for nombre in opciones:
+        if nombre not in OPCIONES_BOOLEANAS and nombre != 'reemplazos_personalizados':
+            raise TypeError(f"La opción '{nombre}' no es una opción de normalizar_texto")
+
+    for nombre in OPCIONES_BOOLEANAS:
+        if nombre in opciones and not isinstance(opciones[nombre], bool):
+            raise TypeError(f"El parámetro '{nombre}' debe ser bool")
+
+    reemplazos = opciones.get('reemplazos_personalizados')
+    if reemplazos is not None and not isinstance(reemplazos, dict):
+        raise TypeError("El parámetro 'reemplazos_personalizados' debe ser un diccionario")
+
+
+@trazar
+@memoizar
 def normalizar_texto(
     texto: Any,
     quitar_acentos_flag: bool = True,
@@ -71,26 +117,14 @@ def normalizar_texto(
     # Validar entrada principal
     texto_validado = validar_entrada_texto(texto, 'normalizar_texto')
 
-    # Validar parámetros booleanos
-    if not isinstance(quitar_acentos_flag, bool):
-        raise TypeError("El parámetro 'quitar_acentos_flag' debe ser bool")
-
-    if not isinstance(convertir_minusculas, bool):
-        raise TypeError("El parámetro 'convertir_minusculas' debe ser bool")
-
-    if not isinstance(limpiar_espacios_flag, bool):
-        raise TypeError("El parámetro 'limpiar_espacios_flag' debe ser bool")
-
-    if not isinstance(normalizar_caracteres_flag, bool):
-        raise TypeError("El parámetro 'normalizar_caracteres_flag' debe ser bool")
-
-    if not isinstance(preservar_mayusculas, bool):
-        raise TypeError("El parámetro 'preservar_mayusculas' debe ser bool")
-
-    # Validar reemplazos personalizados
-    if reemplazos_personalizados is not None:
-        if not isinstance(reemplazos_personalizados, dict):
-            raise TypeError("El parámetro 'reemplazos_personalizados' debe ser un diccionario")
+    validar_opciones_normalizacion({
+        'quitar_acentos_flag': quitar_acentos_flag,
+        'convertir_minusculas': convertir_minusculas,
+        'limpiar_espacios_flag': limpiar_espacios_flag,
+        'normalizar_caracteres_flag': normalizar_caracteres_flag,
+        'preservar_mayusculas': preservar_mayusculas,
+        'reemplazos_personalizados': reemplazos_personalizados,
+    })
 
     try:
         texto_resultado = texto_validado
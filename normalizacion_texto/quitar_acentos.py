@@ -3,11 +3,19 @@ Módulo para quitar acentos y caracteres diacríticos.
 
 Este módulo contiene funciones para eliminar acentos, tildes y otros
 caracteres diacríticos del texto, convirtiéndolos a su equivalente ASCII.
+
+La conversión se hace con una sola llamada a str.translate sobre una
+tabla por código de carácter que se rellena a medida que aparecen
+caracteres nuevos.
 """
 
+import re
+import threading
 import unicodedata
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional, Pattern
 from .utils import validar_entrada_texto, manejar_excepcion_texto
+from .hooks import trazar
+from .cache import memoizar
 
 
 # Diccionario de caracteres especiales que no se descomponen con NFD
@@ -27,6 +35,44 @@ CARACTERES_ESPECIALES: Dict[str, str] = {
 }
 
 
+class TablaPorCaracter(dict):
+    """
+    Tabla de str.translate que calcula la conversión de cada código de
+    carácter con convertir la primera vez que se pide y la guarda.
+
+    Las marcas combinantes que no son 'Mn' se conservan, y NFD las
+    reordena respecto a las marcas vecinas, algo que una tabla carácter a
+    carácter no puede reproducir. Los caracteres cuya conversión las
+    contiene se recogen en el patrón reordenables, para procesar sin la
+    tabla el texto que los contiene. El patrón se amplía bajo un cerrojo,
+    de modo que la tabla se puede usar desde varios hilos.
+    """
+
+    def __init__(self, convertir: Callable[[str], str]) -> None:
+        super().__init__()
+        self.convertir = convertir
+        self.reordenables: Optional[Pattern[str]] = None
+        self._cerrojo = threading.Lock()
+
+    def __missing__(self, codigo: int) -> str:
+        reemplazo = self.convertir(chr(codigo))
+        if any(unicodedata.combining(caracter) for caracter in reemplazo):
+            with self._cerrojo:
+                anteriores = self.reordenables.pattern[1:-1] if self.reordenables else ''
+                self.reordenables = re.compile('[' + anteriores + re.escape(chr(codigo)) + ']')
+        self[codigo] = reemplazo
+        return reemplazo
+
+    def traducir(self, texto: str, sin_tabla: Callable[[str], str]) -> str:
+        """Aplica la tabla al texto, o sin_tabla si contiene caracteres reordenables."""
+        traducido = texto.translate(self)
+        if self.reordenables and self.reordenables.search(texto):
+            return sin_tabla(texto)
+        return traducido
+
+
+@trazar
+@memoizar
 def quitar_acentos(texto: Any) -> str:
     """
     Quita acentos y caracteres diacríticos del texto.
@@ -34,6 +80,9 @@ def quitar_acentos(texto: Any) -> str:
     Convierte caracteres como á, é, í, ó, ú, ñ, ç a sus equivalentes
     sin acentos: a, e, i, o, u, n, c. También maneja caracteres especiales
     como Ø, Æ, ß que no se descomponen automáticamente.
+
+    El texto ASCII se devuelve sin cambios; el resto se convierte con una
+    sola pasada de str.translate.
     
     Parámetros:
     ----------
@@ -66,23 +115,40 @@ def quitar_acentos(texto: Any) -> str:
     texto_validado = validar_entrada_texto(texto, 'quitar_acentos')
     
     try:
-        # Primero aplicar reemplazos para caracteres especiales
-        texto_procesado = texto_validado
-        for caracter_especial, reemplazo in CARACTERES_ESPECIALES.items():
-            texto_procesado = texto_procesado.replace(caracter_especial, reemplazo)
-        
-        # Normalizar a NFD (Normalization Form Decomposed)
-        # Esto separa los caracteres base de sus diacríticos
-        texto_normalizado = unicodedata.normalize('NFD', texto_procesado)
-        
-        # Filtrar solo caracteres que NO sean marcas diacríticas
-        # 'Mn' = Nonspacing_Mark (acentos, tildes, etc.)
-        texto_sin_acentos = ''.join(
-            caracter for caracter in texto_normalizado
-            if unicodedata.category(caracter) != 'Mn'
-        )
-        
-        return texto_sin_acentos
+        return aplicar_quitar_acentos(texto_validado)
         
     except Exception as e:
-        manejar_excepcion_texto(e, 'quitar_acentos', texto_validado)
\ No newline at end of file
+        manejar_excepcion_texto(e, 'quitar_acentos', texto_validado)
+
+
+def aplicar_quitar_acentos(texto: str) -> str:
+    """Quita los acentos de un texto ya validado, sin trazas."""
+    # El texto ASCII no tiene acentos ni caracteres especiales
+    if texto.isascii():
+        return texto
+    return _TABLA_ACENTOS.traducir(texto, _quitar_acentos_nfd)
+
+
+def _quitar_acentos_nfd(texto: str) -> str:
+    """
+    Quita los acentos reemplazando los caracteres especiales, normalizando
+    a NFD y descartando las marcas diacríticas. Da el valor de cada
+    carácter en la tabla de quitar_acentos().
+    """
+    # Primero aplicar reemplazos para caracteres especiales
+    for caracter_especial, reemplazo in CARACTERES_ESPECIALES.items():
+        texto = texto.replace(caracter_especial, reemplazo)
+
+    # Normalizar a NFD (Normalization Form Decomposed)
+    # Esto separa los caracteres base de sus diacríticos
+    texto_normalizado = unicodedata.normalize('NFD', texto)
+
+    # Filtrar solo caracteres que NO sean marcas diacríticas
+    # 'Mn' = Nonspacing_Mark (acentos, tildes, etc.)
+    return ''.join(
+        caracter for caracter in texto_normalizado
+        if unicodedata.category(caracter) != 'Mn'
+    )
+
+
+_TABLA_ACENTOS = TablaPorCaracter(_quitar_acentos_nfd)
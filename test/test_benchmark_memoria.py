@@ -0,0 +1,92 @@
+import pytest
+import pandas as pd
+from pathlib import Path
+import tempfile
+import json
+import os
+import sys
+
+# Agregar el directorio padre al path para importar el módulo
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from benchmarks.generadores import generar_dataframe, generar_feather, generar_texto
+from benchmarks.benchmark_memoria import (
+    preparar_casos, medir_caso, comprobar_presupuestos, main, resource
+)
+
+
+class TestBenchmarkMemoria:
+    """Tests para el benchmark de memoria (con tamaños mínimos)"""
+
+    def setup_method(self):
+        """Configurar directorio de test antes de cada test"""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        """Limpiar archivos de test después de cada test"""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def test_generar_texto_y_feather(self):
+        """Test: el texto tiene la longitud pedida y el Feather se recupera"""
+        ruta = generar_texto(self.temp_dir, caracteres=1000)
+        assert len(ruta.read_text(encoding='utf-8')) == 1000
+
+        df = generar_dataframe(filas=10, columnas=3)
+        pd.testing.assert_frame_equal(pd.read_feather(generar_feather(self.temp_dir, df)), df)
+
+    def test_preparar_casos(self):
+        """Test: un caso por cargador y modo de salida, y uno de normalizar_texto"""
+        casos = preparar_casos(Path(self.temp_dir), filas=20, columnas=3, caracteres_texto=500,
+                               formatos=('csv', 'feather', 'texto'))
+        nombres = [caso.nombre for caso in casos]
+
+        assert 'cargar_csv[salida=lotes]' in nombres
+        assert 'cargar_feather[salida=arrow]' in nombres
+        assert 'normalizar_texto[caracteres=500]' in nombres
+        assert casos[0].parametros == {'salida': 'pandas'}
+
+    @pytest.mark.skipif(resource is None, reason="el RSS máximo requiere el módulo resource")
+    def test_medir_caso(self):
+        """Test: se mide con tracemalloc y con el RSS de un subproceso"""
+        (caso,) = preparar_casos(Path(self.temp_dir), filas=2000, columnas=4, formatos=('csv',))[:1]
+        medidas = medir_caso(caso)
+
+        assert medidas['funcion'] == 'cargar_csv'
+        assert medidas['tracemalloc'] > 0
+        assert medidas['rss'] is not None and medidas['rss'] >= 0
+        assert medidas['ratio_tracemalloc'] == medidas['tracemalloc'] / medidas['bytes_archivo']
+
+    def test_comprobar_presupuestos(self):
+        """Test: presupuesto por caso, por función y general; el RSS tiene prioridad"""
+        resultados = {'resultados': {
+            'cargar_csv[salida=lotes]': {'funcion': 'cargar_csv', 'ratio_rss': 2.0, 'ratio_tracemalloc': 0.5},
+            'cargar_csv[salida=pandas]': {'funcion': 'cargar_csv', 'ratio_rss': 4.0, 'ratio_tracemalloc': 3.0},
+            'cargar_parquet[salida=pandas]': {'funcion': 'cargar_parquet', 'ratio_rss': None,
+                                              'ratio_tracemalloc': 7.0},
+            'normalizar_texto[caracteres=500]': {'funcion': 'normalizar_texto', 'ratio_rss': 5.0,
+                                                 'ratio_tracemalloc': 40.0},
+        }}
+        presupuestos = {'cargar_csv': 5, 'cargar_csv[salida=lotes]': 1.5}
+
+        excedidos = comprobar_presupuestos(resultados, presupuestos, ratio_maximo=6)
+        assert [excedido.nombre for excedido in excedidos] == [
+            'cargar_csv[salida=lotes]', 'cargar_parquet[salida=pandas]'
+        ]
+        assert excedidos[1].ratio == 7.0 and excedidos[1].presupuesto == 6
+
+        # Sin ratio_maximo, el caso sin presupuesto no se comprueba
+        assert len(comprobar_presupuestos(resultados, presupuestos)) == 1
+
+    def test_main_guarda_json_y_falla_si_se_supera(self):
+        """Test: la línea de comandos guarda JSON y devuelve 1 si se supera un presupuesto"""
+        salida = os.path.join(self.temp_dir, "memoria.json")
+        presupuestos = os.path.join(self.temp_dir, "presupuestos.json")
+        Path(presupuestos).write_text(json.dumps({'normalizar_texto': 1000}), encoding='utf-8')
+        argumentos = ['--formatos', 'texto', '--caracteres-texto', '2000', '--sin-rss',
+                      '--directorio', self.temp_dir]
+
+        assert main(argumentos + ['--presupuestos', presupuestos, '--salida', salida]) == 0
+        resultados = json.loads(Path(salida).read_text(encoding='utf-8'))
+        assert resultados['resultados']['normalizar_texto[caracteres=2000]']['rss'] is None
+
+        assert main(argumentos + ['--ratio-maximo', '0.001']) == 1
@@ -0,0 +1,107 @@
+import pytest
+import pandas as pd
+from pathlib import Path
+import tempfile
+import json
+import os
+import sys
+
+# Agregar el directorio padre al path para importar el módulo
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from benchmarks.generadores import generar_dataframe, generar_csv
+from benchmarks.benchmark_carga import (
+    preparar_casos, medir_caso, comparar_con_linea_base, nombre_caso, main
+)
+
+
+class TestBenchmarks:
+    """Tests para los generadores y el benchmark de carga (con tamaños mínimos)"""
+
+    def setup_method(self):
+        """Configurar directorio de test antes de cada test"""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        """Limpiar archivos de test después de cada test"""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def test_generar_dataframe(self):
+        """Test: filas, columnas y proporción de texto configurables y deterministas"""
+        df = generar_dataframe(filas=50, columnas=5, proporcion_texto=0.4, semilla=1)
+
+        assert df.shape == (50, 5)
+        assert list(df.columns) == ['texto_0', 'texto_1', 'entero_2', 'decimal_3', 'entero_4']
+        assert df['texto_0'].dtype == object
+        pd.testing.assert_frame_equal(df, generar_dataframe(filas=50, columnas=5,
+                                                            proporcion_texto=0.4, semilla=1))
+
+    def test_generar_dataframe_parametros_invalidos(self):
+        """Test error: proporción fuera de rango"""
+        with pytest.raises(ValueError, match="debe estar entre 0 y 1"):
+            generar_dataframe(filas=10, proporcion_texto=1.5)
+
+    def test_generar_csv_comprimido(self):
+        """Test: la extensión refleja la compresión y el contenido se recupera"""
+        df = generar_dataframe(filas=20, columnas=3)
+        ruta = generar_csv(self.temp_dir, df, 'gzip')
+
+        assert ruta.name == 'datos.csv.gz'
+        pd.testing.assert_frame_equal(pd.read_csv(ruta), df)
+
+    def test_preparar_y_medir_casos(self):
+        """Test: se generan casos por modo de salida y se miden"""
+        casos = preparar_casos(Path(self.temp_dir), filas=30, columnas=3,
+                               compresiones_csv=(), formatos=('csv', 'parquet'))
+        nombres = [caso.nombre for caso in casos]
+
+        assert 'cargar_csv[salida=lotes,compresion=ninguna]' in nombres
+        assert 'cargar_archivo[formato=parquet,compresion=snappy]' in nombres
+
+        medidas = medir_caso(casos[0], repeticiones=2, calentamiento=0)
+        assert medidas['filas'] == 30
+        assert medidas['segundos_min'] <= medidas['segundos_mediana'] <= medidas['segundos_max']
+
+    def test_comparar_con_linea_base(self):
+        """Test: solo los casos comunes más lentos que la tolerancia son regresiones"""
+        lento = nombre_caso('cargar_csv', salida='pandas')
+        igual = nombre_caso('cargar_csv', salida='arrow')
+        linea_base = {'resultados': {lento: {'segundos_mediana': 1.0},
+                                     igual: {'segundos_mediana': 1.0}}}
+        actual = {'resultados': {lento: {'segundos_mediana': 1.5},
+                                 igual: {'segundos_mediana': 1.1},
+                                 'nuevo': {'segundos_mediana': 9.0}}}
+
+        regresiones = comparar_con_linea_base(actual, linea_base, tolerancia=0.25)
+        assert [regresion.nombre for regresion in regresiones] == [lento]
+        assert regresiones[0].ratio == pytest.approx(1.5)
+
+    def test_main_guarda_json_y_detecta_regresion(self):
+        """Test: la línea de comandos guarda JSON y devuelve 1 ante una regresión"""
+        salida = os.path.join(self.temp_dir, "resultados.json")
+        argumentos = ['--filas', '20', '--columnas', '2', '--formatos', 'csv', '--compresion',
+                      '--repeticiones', '1', '--directorio', self.temp_dir]
+
+        assert main(argumentos + ['--salida', salida]) == 0
+        resultados = json.loads(Path(salida).read_text(encoding='utf-8'))
+        assert resultados['metadatos']['parametros']['filas'] == 20
+
+        # Una línea base imposible de igualar
+        for medidas in resultados['resultados'].values():
+            medidas['segundos_mediana'] = 1e-9
+        Path(salida).write_text(json.dumps(resultados), encoding='utf-8')
+        assert main(argumentos + ['--comparar', salida]) == 1
+
+    def test_benchmark_texto_sin_diferencias(self):
+        """Test: direcciones deterministas y limpiar_espacios igual que la referencia"""
+        from benchmarks.generadores import generar_direcciones
+        from benchmarks.benchmark_texto import buscar_diferencias, main as main_texto
+        from normalizacion_texto import limpiar_espacios
+
+        direcciones = generar_direcciones(500, semilla=2)
+        assert direcciones == generar_direcciones(500, semilla=2)
+        assert any('\t' in direccion or '\u00a0' in direccion for direccion in direcciones)
+        assert buscar_diferencias(direcciones, limpiar_espacios) == []
+        assert buscar_diferencias(["a  ,b"], str.strip) == ["a  ,b"]
+
+        assert main_texto(['--direcciones', '50', '--repeticiones', '1']) == 0
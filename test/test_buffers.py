@@ -0,0 +1,164 @@
+import pytest
+import pandas as pd
+from pathlib import Path
+import tempfile
+import io
+import os
+import sys
+
+# Agregar el directorio padre al path para importar el módulo
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from carga_datos import cargar_csv, cargar_parquet, cargar_xlsx, cargar_archivo
+from carga_datos.utils import es_buffer, abrir_buffer, describir_origen
+
+
+class FlujoNoPosicionable(io.RawIOBase):
+    """Flujo binario de solo lectura sin seek (como un socket o un pipe)"""
+
+    def __init__(self, contenido: bytes):
+        self._contenido = io.BytesIO(contenido)
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return False
+
+    def readinto(self, b):
+        datos = self._contenido.read(len(b))
+        b[:len(datos)] = datos
+        return len(datos)
+
+
+class TestBuffers:
+    """Tests para la carga desde buffers en memoria y flujos binarios"""
+
+    def setup_method(self):
+        """Configurar contenidos de test antes de cada test"""
+        self.temp_dir = tempfile.mkdtemp()
+
+        self.df_ejemplo = pd.DataFrame({
+            'nombre': ['Juan', 'Ana', 'Carlos'],
+            'edad': [25, 30, 35],
+        })
+
+        self.csv_bytes = "nombre;edad\nJuan;25\nAna;30\nCarlos;35\n".encode('utf-8')
+
+        buffer_parquet = io.BytesIO()
+        self.df_ejemplo.to_parquet(buffer_parquet)
+        self.parquet_bytes = buffer_parquet.getvalue()
+
+        buffer_xlsx = io.BytesIO()
+        self.df_ejemplo.to_excel(buffer_xlsx, index=False)
+        self.xlsx_bytes = buffer_xlsx.getvalue()
+
+    def teardown_method(self):
+        """Limpiar archivos de test después de cada test"""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    # Tests de utilidades
+    def test_es_buffer(self):
+        """Test: es_buffer reconoce bytes, memoryview y flujos, no rutas"""
+        assert es_buffer(b"datos")
+        assert es_buffer(bytearray(b"datos"))
+        assert es_buffer(memoryview(b"datos"))
+        assert es_buffer(io.BytesIO(b"datos"))
+        assert not es_buffer("datos.csv")
+        assert not es_buffer(Path("datos.csv"))
+        assert not es_buffer(123)
+
+    def test_abrir_buffer_no_posicionable(self):
+        """Test: los flujos sin seek se leen en memoria"""
+        flujo = abrir_buffer(FlujoNoPosicionable(b"abc"))
+        assert flujo.seekable()
+        assert flujo.read() == b"abc"
+
+    def test_abrir_buffer_flujo_texto(self):
+        """Test error: un flujo de texto no es válido"""
+        with pytest.raises(TypeError, match="debe ser un flujo binario"):
+            abrir_buffer(io.StringIO("nombre,edad"))
+
+    def test_describir_origen(self):
+        """Test: nombre legible de un buffer para mensajes de error"""
+        assert describir_origen(b"datos") == '<buffer en memoria>'
+        flujo = io.BytesIO(b"datos")
+        flujo.name = "subida.csv"
+        assert describir_origen(flujo) == "subida.csv"
+
+    # Tests de los cargadores
+    def test_cargar_csv_bytes(self):
+        """Test: cargar_csv acepta bytes"""
+        df = cargar_csv(self.csv_bytes, sep=";")
+        pd.testing.assert_frame_equal(df, self.df_ejemplo)
+
+    def test_cargar_csv_memoryview_y_bytesio(self):
+        """Test: cargar_csv acepta memoryview y io.BytesIO"""
+        df_vista = cargar_csv(memoryview(self.csv_bytes), sep=";")
+        df_flujo = cargar_csv(io.BytesIO(self.csv_bytes), sep=";")
+        assert df_vista.equals(self.df_ejemplo)
+        assert df_flujo.equals(self.df_ejemplo)
+
+    def test_cargar_csv_flujo_no_posicionable(self):
+        """Test: cargar_csv acepta flujos binarios sin seek"""
+        df = cargar_csv(FlujoNoPosicionable(self.csv_bytes), sep=";")
+        assert df.equals(self.df_ejemplo)
+
+    def test_cargar_csv_buffer_vacio(self):
+        """Test error: buffer vacío con mensaje que no incluye el contenido"""
+        with pytest.raises(ValueError, match="El archivo '<buffer en memoria>' está vacío"):
+            cargar_csv(b"")
+
+    def test_cargar_csv_buffer_con_limite_memoria(self):
+        """Test: el límite de memoria también se estima sobre buffers"""
+        with pytest.raises(ValueError, match="es demasiado grande para cargar en memoria"):
+            cargar_csv(io.BytesIO(self.csv_bytes), sep=";", limite_memoria=10)
+
+    def test_cargar_parquet_bytes_sin_copia(self):
+        """Test: cargar_parquet lee bytes y BytesIO a través de pyarrow.BufferReader"""
+        df_bytes = cargar_parquet(self.parquet_bytes)
+        df_flujo = cargar_parquet(io.BytesIO(self.parquet_bytes), columns=['nombre'])
+
+        pd.testing.assert_frame_equal(df_bytes, self.df_ejemplo)
+        assert list(df_flujo.columns) == ['nombre']
+
+    def test_cargar_parquet_buffer_invalido(self):
+        """Test error: buffer que no es Parquet"""
+        with pytest.raises(ValueError, match="no es un archivo Parquet válido"):
+            cargar_parquet(b"esto no es parquet")
+
+    def test_cargar_parquet_archivo_abierto(self):
+        """Test: cargar_parquet acepta un archivo abierto en modo binario"""
+        ruta = os.path.join(self.temp_dir, "datos.parquet")
+        self.df_ejemplo.to_parquet(ruta)
+        with open(ruta, 'rb') as archivo:
+            df = cargar_parquet(archivo)
+        pd.testing.assert_frame_equal(df, self.df_ejemplo)
+
+    def test_cargar_xlsx_bytes(self):
+        """Test: cargar_xlsx acepta bytes"""
+        df = cargar_xlsx(self.xlsx_bytes)
+        pd.testing.assert_frame_equal(df, self.df_ejemplo)
+
+    def test_tipo_ruta_invalido(self):
+        """Test error: tipos no soportados siguen lanzando TypeError"""
+        with pytest.raises(TypeError, match="El parámetro 'ruta' debe ser str o Path"):
+            cargar_csv(["no", "es", "buffer"])  # type: ignore
+
+    # Tests de cargar_archivo
+    def test_cargar_archivo_detecta_formato_por_contenido(self):
+        """Test: sin nombre, cargar_archivo detecta el formato por el contenido"""
+        assert cargar_archivo(self.parquet_bytes).equals(self.df_ejemplo)
+        assert cargar_archivo(self.xlsx_bytes).equals(self.df_ejemplo)
+        assert cargar_archivo(self.csv_bytes, sep=";").equals(self.df_ejemplo)
+
+    def test_cargar_archivo_usa_nombre_del_flujo(self):
+        """Test: cargar_archivo usa la extensión del atributo name si la hay"""
+        flujo = io.BytesIO(self.csv_bytes)
+        flujo.name = "subida.CSV"
+        assert cargar_archivo(flujo, sep=";").equals(self.df_ejemplo)
+
+    def test_cargar_archivo_formato_no_detectado(self):
+        """Test error: contenido binario no reconocido"""
+        with pytest.raises(ValueError, match="No se pudo detectar el formato"):
+            cargar_archivo(b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR')
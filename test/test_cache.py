@@ -0,0 +1,111 @@
+import pytest
+import threading
+import sys
+from pathlib import Path
+
+# Agregar el directorio padre al path para importar el módulo
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from normalizacion_texto import (
+    normalizar_texto, quitar_acentos, limpiar_espacios, normalizar_caracteres,
+    configurar_cache, limpiar_cache, estadisticas_cache
+)
+
+
+class TestCacheNormalizacion:
+    """Tests para la caché LRU de las funciones de normalización"""
+
+    def setup_method(self):
+        """Activar una caché pequeña y vacía antes de cada test"""
+        configurar_cache(4)
+        limpiar_cache()
+
+    def teardown_method(self):
+        """Desactivar la caché después de cada test"""
+        configurar_cache(None)
+
+    def test_desactivada_por_defecto(self):
+        """Test: sin configurar_cache no se guarda nada"""
+        configurar_cache(None)
+        normalizar_texto("José")
+        normalizar_texto("José")
+        estadisticas = estadisticas_cache()
+        assert (estadisticas.aciertos, estadisticas.fallos, estadisticas.entradas, estadisticas.maximo) == (0, 0, 0, 0)
+
+    def test_aciertos_y_tasa(self):
+        """Test: las llamadas repetidas son aciertos y dan el mismo resultado"""
+        assert [normalizar_texto(ciudad) for ciudad in ["Málaga", "Cádiz", "Málaga", "Málaga"]] == \
+            ["malaga", "cadiz", "malaga", "malaga"]
+
+        estadisticas = estadisticas_cache()
+        assert (estadisticas.aciertos, estadisticas.fallos) == (2, 2)
+        assert estadisticas.tasa_aciertos == 0.5
+        # Los normalizadores a los que llama normalizar_texto no guardan resultados intermedios
+        assert estadisticas.entradas == 2
+
+    def test_opciones_forman_parte_de_la_clave(self):
+        """Test: distintas opciones y reemplazos no comparten resultado"""
+        assert normalizar_texto("José") == "jose"
+        assert normalizar_texto("José", preservar_mayusculas=True) == "Jose"
+        assert normalizar_texto("José", reemplazos_personalizados={"José": "Pepe"}) == "pepe"
+        assert normalizar_texto("José", reemplazos_personalizados={"José": "Juan"}) == "juan"
+        assert normalizar_texto("José", reemplazos_personalizados={"José": "Pepe"}) == "pepe"
+        assert estadisticas_cache().aciertos == 1
+
+    def test_opciones_no_validas_no_se_confunden(self):
+        """Test: 1 no comparte resultado con True y sigue fallando la validación"""
+        normalizar_texto("José", convertir_minusculas=True)
+        with pytest.raises(TypeError):
+            normalizar_texto("José", convertir_minusculas=1)
+
+    def test_tamano_acotado_lru(self):
+        """Test: se descarta el resultado usado hace más tiempo"""
+        for texto in ["a ", "b ", "c ", "d "]:
+            limpiar_espacios(texto)
+        limpiar_espacios("a ")          # 'a ' pasa a ser el más reciente
+        limpiar_espacios("e ")          # se descarta 'b '
+
+        assert estadisticas_cache().entradas == 4
+        aciertos = estadisticas_cache().aciertos
+        limpiar_espacios("a ")
+        limpiar_espacios("b ")
+        assert estadisticas_cache().aciertos == aciertos + 1
+
+    def test_cada_funcion_con_su_clave(self):
+        """Test: el mismo texto en funciones distintas no comparte resultado"""
+        assert quitar_acentos("“Ñu”") == "“Nu”"
+        assert normalizar_caracteres("“Ñu”") == '"Ñu"'
+        assert estadisticas_cache().aciertos == 0
+
+    def test_entradas_no_str_no_se_guardan(self):
+        """Test: los textos que no son str y los errores no entran en la caché"""
+        assert quitar_acentos(123) == "123"
+        with pytest.raises(TypeError):
+            quitar_acentos(None)
+        assert estadisticas_cache().entradas == 0
+
+    def test_configurar_cache_no_valido(self):
+        """Test error: tamaño que no es entero o negativo"""
+        with pytest.raises(TypeError):
+            configurar_cache("100")
+        with pytest.raises(ValueError):
+            configurar_cache(-1)
+
+    def test_hilos(self):
+        """Test: varias hebras a la vez obtienen resultados correctos"""
+        configurar_cache(50)
+        errores = []
+
+        def trabajar(semilla):
+            for i in range(500):
+                texto = f"Ciudad Ñ {(i * semilla) % 80}"
+                if normalizar_texto(texto) != f"ciudad n {(i * semilla) % 80}":
+                    errores.append(texto)
+
+        hilos = [threading.Thread(target=trabajar, args=(semilla,)) for semilla in range(1, 9)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+
+        assert errores == []
+        assert estadisticas_cache().entradas <= 50
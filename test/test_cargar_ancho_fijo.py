@@ -0,0 +1,128 @@
+import pytest
+import pandas as pd
+from pathlib import Path
+import tempfile
+import io
+import importlib
+import os
+import sys
+
+# Agregar el directorio padre al path para importar el módulo
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from carga_datos import cargar_ancho_fijo, cargar_archivo
+
+
+class TestCargarAnchoFijo:
+    """Tests para la función cargar_ancho_fijo"""
+
+    def setup_method(self):
+        """Configurar archivos de test antes de cada test"""
+        self.temp_dir = tempfile.mkdtemp()
+
+        self.columnas = {'cuenta': (0, 4), 'nombre': (4, 14), 'saldo': (14, 22)}
+        self.contenido = ("0001Ana       0001.50\n"
+                          "0002José      -0012.5\n"
+                          "0003          00000.0\n")
+        self.extracto = os.path.join(self.temp_dir, "extracto.txt")
+        with open(self.extracto, 'w', encoding='latin1', newline='') as archivo:
+            archivo.write(self.contenido)
+
+    def teardown_method(self):
+        """Limpiar archivos de test después de cada test"""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def test_cargar_ancho_fijo_exitoso(self):
+        """Test: columnas recortadas, sin espacios, vacíos como nulos y tipos numéricos"""
+        df = cargar_ancho_fijo(self.extracto, self.columnas, encoding='latin1')
+
+        assert list(df.columns) == ['cuenta', 'nombre', 'saldo']
+        assert df['cuenta'].tolist() == [1, 2, 3] and df['cuenta'].dtype == 'int64'
+        assert df['nombre'].tolist()[:2] == ['Ana', 'José'] and pd.isna(df['nombre'].iloc[2])
+        assert df['saldo'].tolist() == [1.5, -12.5, 0.0]
+
+    def test_lineas_de_distinta_longitud(self):
+        """Test: líneas recortadas por la derecha, \\r\\n y líneas vacías"""
+        contenido = b"cabecera\r\n0001Ana\r\n\r\n0002Eva       0000003\r\n"
+        df = cargar_ancho_fijo(contenido, self.columnas, saltar_filas=1)
+
+        assert df['nombre'].tolist() == ['Ana', 'Eva']
+        assert pd.isna(df['saldo'].iloc[0]) and df['saldo'].iloc[1] == 3
+
+    def test_utf8_y_ebcdic(self):
+        """Test: las posiciones son bytes; UTF-8 y codificaciones de un byte como cp037"""
+        columnas = {'a': (0, 6), 'b': (6, 7)}
+        assert cargar_ancho_fijo("Ñandú 1".encode('cp037'), columnas, encoding='cp037')['a'][0] == 'Ñandú'
+        assert cargar_ancho_fijo("Ñandú1".encode('utf-8'), {'a': (0, 7), 'b': (7, 8)})['a'][0] == 'Ñandú'
+
+    def test_salida_arrow_y_lotes(self):
+        """Test: pyarrow.Table y RecordBatchReader con los mismos tipos"""
+        import pyarrow as pa
+        tabla = cargar_ancho_fijo(self.extracto, self.columnas, encoding='latin1', salida='arrow')
+        assert tabla.schema.field('cuenta').type == pa.int64()
+        assert tabla.column('saldo').to_pylist() == [1.5, -12.5, 0.0]
+
+        lotes = cargar_ancho_fijo(self.extracto, self.columnas, encoding='latin1', salida='lotes')
+        assert lotes.read_all().equals(tabla)
+
+    def test_fragmentos(self, monkeypatch):
+        """Test: con el límite superado se itera por bloques con los tipos del primero"""
+        modulo = importlib.import_module('carga_datos.cargar_ancho_fijo')
+        monkeypatch.setattr(modulo, 'filas_por_fragmento', lambda estimacion, limite: 2)
+
+        fragmentos = list(cargar_ancho_fijo(self.extracto, self.columnas, encoding='latin1',
+                                            limite_memoria=1, si_excede_memoria='fragmentos'))
+        assert [len(f) for f in fragmentos] == [2, 1]
+        assert fragmentos[1]['saldo'].dtype == 'float64'
+
+        with pytest.raises(ValueError, match="demasiado grande"):
+            cargar_ancho_fijo(self.extracto, self.columnas, limite_memoria=1)
+
+    def test_tipo_distinto_en_otro_bloque(self, monkeypatch):
+        """Test error: un bloque posterior con texto en una columna numérica"""
+        modulo = importlib.import_module('carga_datos.cargar_ancho_fijo')
+        monkeypatch.setattr(modulo, 'FILAS_BLOQUE_ANCHO_FIJO', 1)
+        contenido = b"0001\n000X\n"
+
+        lotes = cargar_ancho_fijo(contenido, {'cuenta': (0, 4)}, salida='lotes')
+        with pytest.raises(ValueError, match="no encajan con el tipo int64"):
+            lotes.read_all()
+
+    def test_buffer_y_cargar_archivo(self):
+        """Test: buffers en memoria y la extensión .fwf en cargar_archivo"""
+        datos = self.contenido.encode('latin1')
+        assert len(cargar_ancho_fijo(io.BytesIO(datos), self.columnas, encoding='latin1')) == 3
+
+        fwf = os.path.join(self.temp_dir, "extracto.fwf")
+        with open(fwf, 'wb') as archivo:
+            archivo.write(datos)
+        df = cargar_archivo(fwf, especificacion_columnas=self.columnas, encoding='latin1')
+        assert df['cuenta'].tolist() == [1, 2, 3]
+
+    def test_errores_de_archivo(self):
+        """Test error: archivo inexistente, vacío o con otra codificación"""
+        with pytest.raises(FileNotFoundError, match="El archivo .* no existe"):
+            cargar_ancho_fijo("inexistente.txt", self.columnas)
+
+        vacio = os.path.join(self.temp_dir, "vacio.txt")
+        open(vacio, 'wb').close()
+        with pytest.raises(ValueError, match="está vacío"):
+            cargar_ancho_fijo(vacio, self.columnas)
+
+        with pytest.raises(ValueError, match="Error de codificación"):
+            cargar_ancho_fijo(self.extracto, self.columnas)  # latin1 leído como UTF-8
+        with pytest.raises(ValueError, match="no es válida o no está disponible"):
+            cargar_ancho_fijo(self.extracto, self.columnas, encoding='no-existe')
+
+    def test_validaciones(self):
+        """Test error: especificación, encoding y saltar_filas incorrectos"""
+        with pytest.raises(TypeError, match="El parámetro 'ruta' debe ser str o Path"):
+            cargar_ancho_fijo(123, self.columnas)  # type: ignore
+        with pytest.raises(TypeError, match="'especificacion_columnas' debe ser un dict no vacío"):
+            cargar_ancho_fijo(self.extracto, [(0, 4)])  # type: ignore
+        with pytest.raises(TypeError, match="Las posiciones de la columna 'a'"):
+            cargar_ancho_fijo(self.extracto, {'a': (4, 2)})
+        with pytest.raises(TypeError, match="El parámetro 'saltar_filas' debe ser un entero"):
+            cargar_ancho_fijo(self.extracto, self.columnas, saltar_filas=-1)
+        with pytest.raises(TypeError, match="codificación de un byte por carácter"):
+            cargar_ancho_fijo(self.extracto, self.columnas, encoding='utf-16')
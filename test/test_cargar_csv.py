@@ -539,4 +539,17 @@ class TestCargarCsv:
                 llamada_args = mock_warning.call_args[0][0]
                 assert "Excepción inesperada en cargar_csv" in llamada_args
                 assert "RuntimeError" in llamada_args
-                assert "Error inesperado simulado" in llamada_args 
\ No newline at end of file
+                assert "Error inesperado simulado" in llamada_args 
+
+    def test_csv_compression_explicita(self):
+        """Test: compression permite leer un gzip sin extensión .gz"""
+        import gzip
+        archivo_gzip = os.path.join(self.temp_dir, "exportacion.dat")
+        with gzip.open(archivo_gzip, 'wt', encoding='utf-8') as f:
+            f.write("nombre,edad\nJuan,25\n")
+
+        df = cargar_csv(archivo_gzip, compression='gzip')
+        assert list(df.columns) == ['nombre', 'edad']
+
+        with pytest.raises(TypeError, match="El parámetro 'compression' debe ser str o None"):
+            cargar_csv(self.csv_valido, compression=1)  # type: ignore
@@ -0,0 +1,162 @@
+import pytest
+import pandas as pd
+from pathlib import Path
+import tempfile
+import io
+import importlib
+import os
+import sys
+import unittest.mock as mock
+
+# Agregar el directorio padre al path para importar el módulo
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from carga_datos import cargar_feather, cargar_archivo
+
+
+class TestCargarFeather:
+    """Tests para la función cargar_feather"""
+
+    def setup_method(self):
+        """Configurar archivos de test antes de cada test"""
+        self.temp_dir = tempfile.mkdtemp()
+
+        self.df_ejemplo = pd.DataFrame({
+            'nombre': ['Juan', 'Ana', 'Carlos'],
+            'edad': [25, 30, 35],
+            'ciudad': ['Madrid', 'Barcelona', 'Valencia'],
+            'activo': [True, False, True]
+        })
+
+        # Feather V2 (formato de archivo Arrow IPC)
+        self.feather_valido = os.path.join(self.temp_dir, "test_valido.feather")
+        self.df_ejemplo.to_feather(self.feather_valido)
+
+        # Formato de flujo Arrow IPC
+        import pyarrow as pa
+        self.flujo_ipc = os.path.join(self.temp_dir, "test_flujo.ipc")
+        tabla = pa.Table.from_pandas(self.df_ejemplo, preserve_index=False)
+        with pa.ipc.new_stream(self.flujo_ipc, tabla.schema) as escritor:
+            escritor.write_table(tabla)
+
+    def teardown_method(self):
+        """Limpiar archivos de test después de cada test"""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def test_archivo_feather_no_existe(self):
+        """Test error: archivo feather no existe"""
+        with pytest.raises(FileNotFoundError, match="El archivo .* no existe"):
+            cargar_feather("archivo_inexistente.feather")
+
+    def test_tipo_ruta_feather_invalido(self):
+        """Test error: tipo de ruta inválido para feather"""
+        with pytest.raises(TypeError, match="El parámetro 'ruta' debe ser str o Path"):
+            cargar_feather(123)  # type: ignore
+
+    def test_tipo_columns_invalido(self):
+        """Test error: tipo de columns inválido"""
+        with pytest.raises(TypeError, match="El parámetro 'columns' debe ser lista o None"):
+            cargar_feather(self.feather_valido, columns="nombre")  # type: ignore
+
+        with pytest.raises(TypeError, match="Todos los elementos de 'columns' deben ser strings"):
+            cargar_feather(self.feather_valido, columns=["nombre", 1])  # type: ignore
+
+    def test_archivo_no_es_feather(self):
+        """Test error: archivo que no es Arrow IPC/Feather"""
+        archivo_falso = os.path.join(self.temp_dir, "falso.feather")
+        with open(archivo_falso, 'w') as f:
+            f.write("esto no es un archivo arrow")
+
+        with pytest.raises(ValueError, match="no es un archivo Arrow IPC/Feather válido"):
+            cargar_feather(archivo_falso)
+
+    def test_feather_vacio(self):
+        """Test error: archivo de 0 bytes"""
+        archivo_vacio = os.path.join(self.temp_dir, "vacio.feather")
+        open(archivo_vacio, 'wb').close()
+
+        with pytest.raises(ValueError, match="está vacío"):
+            cargar_feather(archivo_vacio)
+
+    def test_feather_bien_formado_completo(self):
+        """Test: Feather V2 bien formado"""
+        df = cargar_feather(self.feather_valido)
+        pd.testing.assert_frame_equal(df, self.df_ejemplo)
+
+    def test_flujo_ipc(self):
+        """Test: formato de flujo Arrow IPC"""
+        df = cargar_feather(Path(self.flujo_ipc))
+        pd.testing.assert_frame_equal(df, self.df_ejemplo)
+
+    def test_feather_columnas_especificas(self):
+        """Test: carga solo las columnas pedidas"""
+        df = cargar_feather(self.feather_valido, columns=['nombre', 'edad'])
+        pd.testing.assert_frame_equal(df, self.df_ejemplo[['nombre', 'edad']])
+
+    def test_feather_columnas_inexistentes(self):
+        """Test error: columnas que no existen"""
+        with pytest.raises(ValueError, match="Una o más columnas especificadas no existen"):
+            cargar_feather(self.feather_valido, columns=['no_existe'])
+
+    def test_feather_usa_memory_map(self):
+        """Test: las rutas se abren mapeadas en memoria"""
+        import pyarrow as pa
+        with mock.patch('pyarrow.memory_map', wraps=pa.memory_map) as mock_memory_map:
+            cargar_feather(self.feather_valido)
+            mock_memory_map.assert_called_once_with(self.feather_valido, 'r')
+
+    def test_feather_bytes_y_bytesio(self):
+        """Test: acepta buffers en memoria"""
+        with open(self.feather_valido, 'rb') as f:
+            contenido = f.read()
+
+        pd.testing.assert_frame_equal(cargar_feather(contenido), self.df_ejemplo)
+        pd.testing.assert_frame_equal(cargar_feather(io.BytesIO(contenido)), self.df_ejemplo)
+
+    def test_feather_archivo_grande_memoria(self):
+        """Test error: MemoryError al construir el DataFrame"""
+        cargar_feather_mod = importlib.import_module('carga_datos.cargar_feather')
+        with mock.patch.object(cargar_feather_mod, 'abrir_tabla_arrow', side_effect=MemoryError("Sin memoria")):
+            with pytest.raises(ValueError, match="es demasiado grande para cargar en memoria"):
+                cargar_feather(self.feather_valido)
+
+    def test_feather_fragmentos(self):
+        """Test: con limite_memoria y 'fragmentos' devuelve un iterador"""
+        df_grande = pd.DataFrame({'id': range(5000), 'valor': [i * 0.5 for i in range(5000)]})
+        ruta = os.path.join(self.temp_dir, "grande.arrow")
+        df_grande.to_feather(ruta)
+
+        fragmentos = list(cargar_feather(ruta, limite_memoria=20_000, si_excede_memoria='fragmentos'))
+        assert len(fragmentos) > 1
+        pd.testing.assert_frame_equal(pd.concat(fragmentos, ignore_index=True), df_grande)
+
+        with pytest.raises(ValueError, match="es demasiado grande para cargar en memoria"):
+            cargar_feather(ruta, limite_memoria=20_000)
+
+    def test_feather_fragmentos_comprimido_lote_a_lote(self):
+        """Test: con 'fragmentos' un archivo LZ4 o un flujo IPC se leen lote a lote, sin leer la tabla entera"""
+        import pyarrow as pa
+        import pyarrow.ipc as ipc
+        df_grande = pd.DataFrame({'id': range(5000), 'texto': [f"fila {i}" for i in range(5000)]})
+        ruta = os.path.join(self.temp_dir, "grande.feather")
+        df_grande.to_feather(ruta, compression='lz4', chunksize=1000)
+        ruta_flujo = os.path.join(self.temp_dir, "grande.arrows")
+        with ipc.new_stream(ruta_flujo, pa.Schema.from_pandas(df_grande, preserve_index=False),
+                            options=ipc.IpcWriteOptions(compression='zstd')) as escritor:
+            escritor.write_table(pa.Table.from_pandas(df_grande, preserve_index=False), max_chunksize=1000)
+
+        leer_tabla = mock.Mock(side_effect=AssertionError("no se debe leer la tabla entera"))
+        with mock.patch.object(importlib.import_module('carga_datos.cargar_feather'), 'abrir_tabla_arrow', leer_tabla), \
+                mock.patch.object(importlib.import_module('carga_datos.memoria'), 'abrir_tabla_arrow', leer_tabla):
+            for origen in (ruta, ruta_flujo):
+                fragmentos = list(cargar_feather(origen, columns=['texto'], limite_memoria=20_000,
+                                                 si_excede_memoria='fragmentos'))
+                assert len(fragmentos) > 5 and max(len(fragmento) for fragmento in fragmentos) <= 1000
+                pd.testing.assert_frame_equal(pd.concat(fragmentos, ignore_index=True), df_grande[['texto']])
+
+    def test_cargar_archivo_extensiones_arrow(self):
+        """Test: cargar_archivo reconoce .arrow, .feather y .ipc"""
+        for extension in ['.arrow', '.FEATHER', '.ipc']:
+            ruta = os.path.join(self.temp_dir, f"etapa{extension}")
+            self.df_ejemplo.to_feather(ruta)
+            pd.testing.assert_frame_equal(cargar_archivo(ruta), self.df_ejemplo)
@@ -0,0 +1,114 @@
+import pytest
+from pathlib import Path
+import tempfile
+import io
+import importlib
+import json
+import os
+import sys
+
+# Agregar el directorio padre al path para importar el módulo
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from carga_datos import cargar_jsonl, cargar_archivo
+
+
+class TestCargarJsonl:
+    """Tests para la función cargar_jsonl"""
+
+    def setup_method(self):
+        """Configurar archivos de test antes de cada test"""
+        self.temp_dir = tempfile.mkdtemp()
+
+        self.eventos = [
+            {'tipo': 'alta', 'usuario': {'id': 1, 'nombre': 'Ana', 'tags': ['a']}, 'carga': 'x' * 50},
+            {'tipo': 'baja', 'usuario': {'id': 2, 'nombre': 'Juan', 'tags': []}, 'carga': 'y' * 50},
+            {'tipo': 'alta', 'usuario': {'id': 3, 'nombre': 'Eva', 'tags': ['b', 'c']}, 'carga': 'z' * 50},
+        ]
+        self.contenido = ''.join(json.dumps(evento) + '\n' for evento in self.eventos).encode('utf-8')
+        self.jsonl = os.path.join(self.temp_dir, "eventos.jsonl")
+        with open(self.jsonl, 'wb') as archivo:
+            archivo.write(self.contenido)
+
+    def teardown_method(self):
+        """Limpiar archivos de test después de cada test"""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def test_cargar_jsonl_exitoso(self):
+        """Test: una fila por línea, anidados como dict y listas como listas"""
+        df = cargar_jsonl(self.jsonl)
+
+        assert list(df.columns) == ['tipo', 'usuario', 'carga']
+        assert df['tipo'].tolist() == ['alta', 'baja', 'alta']
+        assert df['usuario'].iloc[0]['nombre'] == 'Ana'
+        assert list(df['usuario'].iloc[2]['tags']) == ['b', 'c']
+
+    def test_proyeccion_de_columnas(self):
+        """Test: solo se construyen las columnas y los campos anidados pedidos"""
+        import pyarrow as pa
+        tabla = cargar_jsonl(self.jsonl, columns=['usuario.id', 'tipo'], salida='arrow')
+
+        assert tabla.column_names == ['usuario', 'tipo']
+        assert tabla.schema.field('usuario').type == pa.struct([('id', pa.int64())])
+
+        df = cargar_jsonl(self.jsonl, columns=['usuario', 'usuario.id'])
+        assert set(df['usuario'].iloc[0]) == {'id', 'nombre', 'tags'}
+
+    def test_lotes_por_bloques(self, monkeypatch):
+        """Test: bloques alineados a salto de línea con el esquema del primero"""
+        modulo = importlib.import_module('carga_datos.cargar_jsonl')
+        monkeypatch.setattr(modulo, 'BYTES_BLOQUE_JSON', 10)
+
+        lotes = cargar_jsonl(self.jsonl, columns=['tipo'], salida='lotes')
+        tabla = lotes.read_all()
+        assert tabla.column('tipo').to_pylist() == ['alta', 'baja', 'alta']
+        assert tabla.num_columns == 1
+
+        avisos = []
+        df = cargar_jsonl(io.BytesIO(self.contenido), progreso=avisos.append)
+        assert len(df) == 3 and avisos[-1].terminado and avisos[-1].filas == 3
+
+    def test_fragmentos(self, monkeypatch):
+        """Test: con el límite superado se itera por fragmentos"""
+        modulo = importlib.import_module('carga_datos.cargar_jsonl')
+        monkeypatch.setattr(modulo, 'filas_por_fragmento', lambda estimacion, limite: 2)
+
+        fragmentos = list(cargar_jsonl(self.jsonl, limite_memoria=1, si_excede_memoria='fragmentos'))
+        assert sum(len(f) for f in fragmentos) == 3 and max(len(f) for f in fragmentos) <= 2
+
+        with pytest.raises(ValueError, match="demasiado grande"):
+            cargar_jsonl(self.jsonl, limite_memoria=1)
+
+    def test_cargar_archivo_jsonl_y_ndjson(self):
+        """Test: cargar_archivo reconoce .jsonl y .ndjson"""
+        ndjson = os.path.join(self.temp_dir, "eventos.NDJSON")
+        with open(ndjson, 'wb') as archivo:
+            archivo.write(self.contenido)
+
+        assert len(cargar_archivo(self.jsonl)) == 3
+        assert cargar_archivo(ndjson, columns=['tipo']).shape == (3, 1)
+
+    def test_errores_de_archivo(self):
+        """Test error: inexistente, vacío, JSON inválido, tipos cambiantes y columnas inexistentes"""
+        with pytest.raises(FileNotFoundError, match="El archivo .* no existe"):
+            cargar_jsonl("inexistente.jsonl")
+
+        with pytest.raises(ValueError, match="está vacío"):
+            cargar_jsonl(b"")
+        with pytest.raises(ValueError, match="está vacío"):
+            cargar_jsonl(b"", salida='lotes')
+        with pytest.raises(ValueError, match="no es un archivo JSON Lines válido"):
+            cargar_jsonl(b'{"a": 1}\n{no es json}\n')
+        with pytest.raises(ValueError, match="cambia de tipo entre líneas"):
+            cargar_jsonl(b'{"a": 1}\n{"a": "x"}\n')
+        with pytest.raises(ValueError, match="no existen en el archivo"):
+            cargar_jsonl(self.jsonl, columns=['tipo.id'])
+
+    def test_validaciones(self):
+        """Test error: tipos de parámetros incorrectos"""
+        with pytest.raises(TypeError, match="El parámetro 'ruta' debe ser str o Path"):
+            cargar_jsonl(123)  # type: ignore
+        with pytest.raises(TypeError, match="El parámetro 'columns' debe ser lista o None"):
+            cargar_jsonl(self.jsonl, columns="tipo")  # type: ignore
+        with pytest.raises(TypeError, match="El parámetro 'salida' debe ser uno de"):
+            cargar_jsonl(self.jsonl, salida="json")  # type: ignore
@@ -0,0 +1,146 @@
+import pandas as pd
+from pathlib import Path
+import gzip
+import zipfile
+import tempfile
+import io
+import os
+import sys
+
+# Agregar el directorio padre al path para importar el módulo
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from carga_datos import cargar_archivo
+from carga_datos.deteccion import (
+    detectar_formato, detectar_compresion, detectar_origen, leer_cabecera, es_texto, FormatoDetectado
+)
+
+
+class TestDeteccion:
+    """Tests para la detección de formato por contenido"""
+
+    def setup_method(self):
+        """Configurar archivos de test antes de cada test"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.df_ejemplo = pd.DataFrame({'nombre': ['Juan', 'Ana'], 'edad': [25, 30]})
+
+        self.parquet = os.path.join(self.temp_dir, "datos.parquet")
+        self.df_ejemplo.to_parquet(self.parquet)
+
+        self.xlsx = os.path.join(self.temp_dir, "datos.xlsx")
+        self.df_ejemplo.to_excel(self.xlsx, index=False)
+
+        self.csv_gz = os.path.join(self.temp_dir, "datos.csv.gz")
+        with gzip.open(self.csv_gz, 'wt', encoding='utf-8') as f:
+            f.write("nombre,edad\nJuan,25\nAna,30\n")
+
+    def teardown_method(self):
+        """Limpiar archivos de test después de cada test"""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def test_leer_cabecera_ruta(self):
+        """Test: leer_cabecera lee los primeros bytes de un archivo"""
+        assert leer_cabecera(self.parquet, 4) == b'PAR1'
+
+    def test_leer_cabecera_restaura_posicion(self):
+        """Test: leer_cabecera no mueve la posición del flujo"""
+        flujo = io.BytesIO(b"0123456789")
+        flujo.seek(2)
+        assert leer_cabecera(flujo, 3) == b"234"
+        assert flujo.tell() == 2
+
+    def test_detectar_parquet(self):
+        """Test: detecta Parquet por su número mágico"""
+        assert detectar_formato(leer_cabecera(self.parquet)) == 'parquet'
+
+    def test_detectar_xlsx(self):
+        """Test: detecta Excel (zip) por su número mágico"""
+        assert detectar_formato(leer_cabecera(self.xlsx)) == 'xlsx'
+
+    def test_detectar_csv(self):
+        """Test: el texto plano se detecta como CSV"""
+        assert detectar_formato(b"nombre,edad\nJuan,25\n") == 'csv'
+        assert detectar_formato("nombre;ciudad\nJosé;Córdoba\n".encode('latin1')) == 'csv'
+        assert detectar_formato(b"") == 'csv'
+
+    def test_detectar_binario_desconocido(self):
+        """Test: un binario desconocido no se detecta"""
+        assert detectar_formato(b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR') is None
+
+    def test_es_texto_utf8_cortado(self):
+        """Test: un carácter UTF-8 cortado al final de la cabecera sigue siendo texto"""
+        texto = "ciudad\nCórdoba".encode('utf-8')
+        assert es_texto(texto[:-6])  # corta la 'ó' por la mitad
+
+    def test_detectar_compresion(self):
+        """Test: detecta gzip y zstd por su número mágico"""
+        assert detectar_compresion(leer_cabecera(self.csv_gz)) == 'gzip'
+        assert detectar_compresion(b'\x28\xb5\x2f\xfd\x00') == 'zstd'
+        assert detectar_compresion(b"nombre,edad") is None
+
+    def test_detectar_arrow(self):
+        """Test: detecta Arrow IPC (archivo y flujo) y Feather V1"""
+        assert detectar_formato(b'ARROW1\x00\x00') == 'arrow'
+        assert detectar_formato(b'FEA1\x00\x00') == 'arrow'
+        assert detectar_formato(b'\xff\xff\xff\xff\x10\x00') == 'arrow'
+
+    def test_detectar_origen_gzip(self):
+        """Test: dentro de un gzip se inspecciona el contenido descomprimido"""
+        assert detectar_origen(self.csv_gz) == FormatoDetectado('csv', 'gzip')
+
+        binario = io.BytesIO(gzip.compress(b'\x89PNG\r\n\x1a\n\x00\x00'))
+        assert detectar_origen(binario) == FormatoDetectado(None, 'gzip')
+
+    def test_detectar_origen_zip_sin_hojas(self):
+        """Test: un zip sin entradas 'xl/' no se considera Excel"""
+        ruta_zip = os.path.join(self.temp_dir, "documento.zip")
+        with zipfile.ZipFile(ruta_zip, 'w') as archivo_zip:
+            archivo_zip.writestr("content.xml", "<documento/>")
+
+        assert detectar_origen(self.xlsx) == FormatoDetectado('xlsx', None)
+        assert detectar_origen(ruta_zip) == FormatoDetectado(None, None)
+
+    # Tests de cargar_archivo con detección por contenido
+    def test_cargar_archivo_extension_desconocida(self):
+        """Test: un Parquet con una extensión no soportada se carga como Parquet"""
+        mal_nombrado = os.path.join(self.temp_dir, "en_realidad_parquet.dat")
+        self.df_ejemplo.to_parquet(mal_nombrado)
+
+        assert cargar_archivo(mal_nombrado).equals(self.df_ejemplo)
+
+    def test_cargar_archivo_extension_equivocada(self):
+        """Test: un Parquet con extensión .csv se carga como Parquet"""
+        mal_nombrado = os.path.join(self.temp_dir, "en_realidad_parquet.csv")
+        self.df_ejemplo.to_parquet(mal_nombrado)
+
+        assert cargar_archivo(mal_nombrado).equals(self.df_ejemplo)
+
+    def test_cargar_archivo_texto_usa_extension(self):
+        """Test: si el contenido es texto, decide la extensión"""
+        ruta_jsonl = os.path.join(self.temp_dir, "datos.jsonl")
+        self.df_ejemplo.to_json(ruta_jsonl, orient='records', lines=True)
+
+        assert cargar_archivo(ruta_jsonl).equals(self.df_ejemplo)
+
+    def test_cargar_archivo_sin_extension_binario(self):
+        """Test: un archivo binario sin extensión se carga por su contenido"""
+        sin_extension = os.path.join(self.temp_dir, "entrega_0423")
+        self.df_ejemplo.to_excel(sin_extension, index=False, engine='openpyxl')
+
+        assert cargar_archivo(sin_extension).equals(self.df_ejemplo)
+
+    def test_cargar_archivo_csv_gzip(self):
+        """Test: un CSV comprimido con gzip se descomprime al cargarlo"""
+        sin_extension = os.path.join(self.temp_dir, "exportacion")
+        with open(self.csv_gz, 'rb') as origen, open(sin_extension, 'wb') as destino:
+            destino.write(origen.read())
+
+        assert cargar_archivo(self.csv_gz).equals(self.df_ejemplo)
+        assert cargar_archivo(sin_extension).equals(self.df_ejemplo)
+
+    def test_cargar_archivo_arrow_mal_nombrado(self):
+        """Test: un Arrow IPC con extensión .csv se carga con cargar_feather"""
+        ruta_arrow = os.path.join(self.temp_dir, "etapa_1.csv")
+        self.df_ejemplo.to_feather(ruta_arrow)
+
+        assert cargar_archivo(ruta_arrow).equals(self.df_ejemplo)
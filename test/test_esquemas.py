@@ -0,0 +1,168 @@
+import pytest
+import pandas as pd
+from pathlib import Path
+import tempfile
+import json
+import io
+import os
+import sys
+
+# Agregar el directorio padre al path para importar el módulo
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from carga_datos import cargar_csv, cargar_archivo, RegistroEsquemas, EsquemaCsv, inferir_esquema
+from carga_datos.esquemas import huella_cabecera
+
+
+class TestEsquemas:
+    """Tests para el registro de esquemas de CSV"""
+
+    def setup_method(self):
+        """Configurar archivos de test antes de cada test"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.registro = RegistroEsquemas(os.path.join(self.temp_dir, "registro", "esquemas.json"))
+
+        # Día 1: 'vacia' no tiene valores y 'id' no tiene vacíos
+        self.dia1 = self.escribir("dia1.csv",
+                                  "id;fecha;importe;vacia;nombre\n"
+                                  "1;2024-05-01;10.5;;Ana\n"
+                                  "2;2024-05-02;3.25;;Juan\n")
+        # Día 2: 'vacia' trae texto e 'id' trae un vacío
+        self.dia2 = self.escribir("dia2.csv",
+                                  "id;fecha;importe;vacia;nombre\n"
+                                  "3;2024-05-03;1.5;nota;Eva\n"
+                                  ";2024-05-04;2;;Luis\n")
+
+    def teardown_method(self):
+        """Limpiar archivos de test después de cada test"""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def escribir(self, nombre, contenido):
+        """Escribe un CSV en el directorio temporal y devuelve su ruta"""
+        ruta = os.path.join(self.temp_dir, nombre)
+        with open(ruta, 'w', encoding='utf-8') as archivo:
+            archivo.write(contenido)
+        return ruta
+
+    def test_inferir_esquema(self):
+        """Test: enteros como Int64, vacías como object y fechas ISO detectadas"""
+        esquema = inferir_esquema(self.dia1, sep=";")
+
+        assert esquema.columnas == ('id', 'fecha', 'importe', 'vacia', 'nombre')
+        assert esquema.tipos == {'id': 'Int64', 'importe': 'float64', 'vacia': 'object', 'nombre': 'object'}
+        assert esquema.fechas == {'fecha': 'ISO8601'}
+        assert esquema.huella == huella_cabecera(list(esquema.columnas))
+
+    def test_tipos_estables_entre_dias(self):
+        """Test: con el esquema, los tipos del día 2 son los del día 1"""
+        esquema = inferir_esquema(self.dia1, sep=";")
+        df1 = cargar_csv(self.dia1, sep=";", esquema=esquema)
+        df2 = cargar_csv(self.dia2, sep=";", esquema=esquema)
+
+        pd.testing.assert_series_equal(df1.dtypes, df2.dtypes)
+        assert str(df2['id'].dtype) == 'Int64' and df2['id'].isna().sum() == 1
+        assert pd.api.types.is_datetime64_any_dtype(df2['fecha'])
+        assert df2['vacia'].tolist()[0] == 'nota'
+
+    def test_esquema_con_salida_arrow_y_lotes(self):
+        """Test: el esquema se aplica también con pyarrow.csv"""
+        import pyarrow as pa
+        esquema = inferir_esquema(self.dia1, sep=";")
+
+        tabla = cargar_csv(self.dia2, sep=";", esquema=esquema, salida='arrow')
+        assert tabla.schema.field('id').type == pa.int64()
+        assert tabla.schema.field('vacia').type == pa.string()
+        assert tabla.schema.field('fecha').type == pa.timestamp('ns')
+
+        lotes = cargar_csv(self.dia1, sep=";", esquema=esquema, salida='lotes')
+        assert lotes.read_all().schema.field('vacia').type == pa.string()
+
+    def test_cambio_de_columnas(self):
+        """Test error: faltan o sobran columnas respecto al esquema"""
+        esquema = inferir_esquema(self.dia1, sep=";")
+        cambiado = self.escribir("cambiado.csv", "id;fecha;total;vacia;nombre\n1;2024-05-01;1;;Ana\n")
+
+        for salida in ('pandas', 'arrow', 'lotes'):
+            with pytest.raises(ValueError, match=r"faltan \['importe'\], sobran \['total'\]"):
+                cargar_csv(cambiado, sep=";", esquema=esquema, salida=salida)
+
+    def test_valores_que_no_encajan(self):
+        """Test error: un valor de otro tipo o una fecha con otro formato"""
+        esquema = inferir_esquema(self.dia1, sep=";")
+        texto_en_id = self.escribir("texto.csv", "id;fecha;importe;vacia;nombre\nabc;2024-05-01;1;;Ana\n")
+        otra_fecha = self.escribir("fecha.csv", "id;fecha;importe;vacia;nombre\n1;01/05/2024;1;;Ana\n")
+
+        for salida in ('pandas', 'arrow'):
+            with pytest.raises(ValueError, match="hay valores que no encajan con su tipo"):
+                cargar_csv(texto_en_id, sep=";", esquema=esquema, salida=salida)
+        with pytest.raises(ValueError, match=r"las columnas \['fecha'\] no tienen fechas"):
+            cargar_csv(otra_fecha, sep=";", esquema=esquema)
+
+    def test_registro_por_clave(self):
+        """Test: se infiere la primera vez, se guarda en JSON y después se reutiliza"""
+        esquema = self.registro.esquema_para(self.dia1, clave="ventas", sep=";")
+        assert self.registro.ruta.exists()
+        contenido = json.loads(self.registro.ruta.read_text(encoding='utf-8'))
+        assert contenido['esquemas']['ventas']['tipos']['vacia'] == 'object'
+
+        # El día 2 no se vuelve a inferir: 'vacia' sigue siendo object
+        assert self.registro.esquema_para(self.dia2, clave="ventas", sep=";") == esquema
+        assert RegistroEsquemas(self.registro.ruta).obtener("ventas") == esquema
+
+        self.registro.eliminar("ventas")
+        assert self.registro.obtener("ventas") is None
+
+    def test_registro_por_huella_y_buffer(self):
+        """Test: sin clave se usa la huella de la cabecera; el buffer se puede cargar después"""
+        buffer = io.BytesIO(b"a,b\n1,x\n2,y\n")
+        esquema = self.registro.esquema_para(buffer)
+
+        assert self.registro.obtener(huella_cabecera(['a', 'b'])) == esquema
+        df = cargar_csv(buffer, esquema=esquema)
+        assert str(df['a'].dtype) == 'Int64' and len(df) == 2
+
+    def test_registro_por_huella_flujo_no_posicionable(self):
+        """Test: un flujo sin seek se lee una vez para la huella y la inferencia"""
+        class FlujoNoPosicionable(io.RawIOBase):
+            def __init__(self, contenido):
+                self._contenido = io.BytesIO(contenido)
+
+            def readable(self):
+                return True
+
+            def seekable(self):
+                return False
+
+            def readinto(self, b):
+                datos = self._contenido.read(len(b))
+                b[:len(datos)] = datos
+                return len(datos)
+
+        esquema = self.registro.esquema_para(FlujoNoPosicionable(b"a,b\n1,x\n2,y\n"))
+        assert esquema.columnas == ('a', 'b') and esquema.tipos['a'] == 'Int64'
+        assert self.registro.obtener(huella_cabecera(['a', 'b'])) == esquema
+
+
+        """Test: cargar_archivo reenvía esquema a cargar_csv"""
+        esquema = inferir_esquema(self.dia1, sep=";")
+        df = cargar_archivo(self.dia2, sep=";", esquema=esquema)
+        assert str(df['id'].dtype) == 'Int64'
+
+    def test_validaciones(self):
+        """Test error: tipos incorrectos y registro corrupto"""
+        with pytest.raises(TypeError, match="El parámetro 'esquema' debe ser EsquemaCsv o None"):
+            cargar_csv(self.dia1, esquema={'id': 'int64'})
+        with pytest.raises(TypeError, match="El parámetro 'clave' debe ser un str no vacío"):
+            self.registro.obtener("")
+        with pytest.raises(TypeError, match="El parámetro 'filas_muestra' debe ser un entero positivo"):
+            inferir_esquema(self.dia1, filas_muestra=0)
+
+        self.registro.ruta.parent.mkdir(parents=True)
+        self.registro.ruta.write_text("{no es json", encoding='utf-8')
+        with pytest.raises(ValueError, match="no es un JSON válido"):
+            self.registro.obtener("ventas")
+
+    def test_esquema_desde_dict(self):
+        """Test: a_dict/desde_dict conservan el esquema"""
+        esquema = EsquemaCsv(('a',), {'a': 'Int64'}, {}, huella_cabecera(['a']))
+        assert EsquemaCsv.desde_dict(json.loads(json.dumps(esquema.a_dict()))) == esquema
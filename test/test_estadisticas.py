@@ -0,0 +1,173 @@
+import pytest
+import pandas as pd
+from pathlib import Path
+import tempfile
+import tracemalloc
+import gzip
+import io
+import os
+import sys
+
+# Agregar el directorio padre al path para importar el módulo
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from carga_datos import cargar_csv, cargar_parquet, cargar_xlsx, cargar_feather, cargar_archivo
+from carga_datos.estadisticas import EstadisticasCarga, MedidorCarga
+
+
+class TestEstadisticas:
+    """Tests para las estadísticas de carga (devolver_estadisticas=True)"""
+
+    def setup_method(self):
+        """Configurar archivos de test antes de cada test"""
+        self.temp_dir = tempfile.mkdtemp()
+
+        self.df_ejemplo = pd.DataFrame({
+            'id': range(2000),
+            'nombre': [f"cliente_{i}" for i in range(2000)],
+            'importe': [i * 1.5 for i in range(2000)],
+        })
+
+        self.csv = os.path.join(self.temp_dir, "datos.csv")
+        self.df_ejemplo.to_csv(self.csv, index=False)
+
+        self.parquet = os.path.join(self.temp_dir, "datos.parquet")
+        self.df_ejemplo.to_parquet(self.parquet)
+
+        self.xlsx = os.path.join(self.temp_dir, "datos.xlsx")
+        self.df_ejemplo.head(100).to_excel(self.xlsx, index=False)
+
+        self.feather = os.path.join(self.temp_dir, "datos.feather")
+        self.df_ejemplo.to_feather(self.feather)
+
+    def teardown_method(self):
+        """Limpiar archivos de test después de cada test"""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def comprobar_coherencia(self, estadisticas):
+        """Comprueba invariantes comunes a cualquier EstadisticasCarga"""
+        assert isinstance(estadisticas, EstadisticasCarga)
+        for campo in ('segundos_validacion', 'segundos_io', 'segundos_parseo', 'segundos_conversion'):
+            assert getattr(estadisticas, campo) >= 0
+        suma_fases = (estadisticas.segundos_validacion + estadisticas.segundos_io
+                      + estadisticas.segundos_parseo + estadisticas.segundos_conversion)
+        assert suma_fases <= estadisticas.segundos_totales + 1e-6
+
+    def test_sin_estadisticas_no_cambia_resultado(self):
+        """Test: por defecto se devuelve solo el resultado"""
+        assert isinstance(cargar_csv(self.csv), pd.DataFrame)
+
+    def test_cargar_csv_estadisticas(self):
+        """Test: cargar_csv devuelve (DataFrame, EstadisticasCarga)"""
+        df, estadisticas = cargar_csv(self.csv, devolver_estadisticas=True)
+
+        pd.testing.assert_frame_equal(df, self.df_ejemplo)
+        self.comprobar_coherencia(estadisticas)
+        assert estadisticas.motor == 'pandas'
+        assert estadisticas.bytes_leidos == os.path.getsize(self.csv)
+        assert (estadisticas.filas, estadisticas.columnas) == (2000, 3)
+        assert estadisticas.memoria_pico > 0
+        assert estadisticas.segundos_parseo > 0
+
+    def test_cargar_csv_gzip_inferido(self):
+        """Test: con estadísticas se sigue infiriendo la compresión por extensión"""
+        ruta_gz = os.path.join(self.temp_dir, "datos.csv.gz")
+        with gzip.open(ruta_gz, 'wt', encoding='utf-8') as f:
+            self.df_ejemplo.to_csv(f, index=False)
+
+        df, estadisticas = cargar_csv(ruta_gz, devolver_estadisticas=True)
+        pd.testing.assert_frame_equal(df, self.df_ejemplo)
+        assert estadisticas.bytes_leidos == os.path.getsize(ruta_gz)
+
+    def test_cargar_csv_arrow_y_progreso(self):
+        """Test: estadísticas con salida='arrow' y combinadas con progreso"""
+        tabla, estadisticas = cargar_csv(self.csv, salida='arrow', devolver_estadisticas=True)
+        assert estadisticas.motor == 'pyarrow.csv'
+        assert estadisticas.filas == tabla.num_rows == 2000
+
+        avisos = []
+        df, estadisticas = cargar_csv(self.csv, progreso=avisos.append, devolver_estadisticas=True)
+        assert avisos[-1].bytes_leidos == estadisticas.bytes_leidos == os.path.getsize(self.csv)
+
+    def test_cargar_parquet_separa_conversion(self):
+        """Test: cargar_parquet separa la decodificación de la conversión a pandas"""
+        df, estadisticas = cargar_parquet(self.parquet, devolver_estadisticas=True)
+
+        pd.testing.assert_frame_equal(df, self.df_ejemplo)
+        self.comprobar_coherencia(estadisticas)
+        assert estadisticas.motor == 'pyarrow.parquet'
+        assert estadisticas.segundos_conversion > 0
+        assert estadisticas.bytes_leidos >= os.path.getsize(self.parquet) // 2
+
+    def test_cargar_parquet_bytesio(self):
+        """Test: un io.BytesIO cuenta como leído sin E/S"""
+        contenido = Path(self.parquet).read_bytes()
+        df, estadisticas = cargar_parquet(io.BytesIO(contenido), devolver_estadisticas=True)
+        assert estadisticas.bytes_leidos == len(contenido)
+        assert estadisticas.segundos_io == 0
+
+    def test_cargar_xlsx_estadisticas(self):
+        """Test: cargar_xlsx informa del engine como motor"""
+        df, estadisticas = cargar_xlsx(self.xlsx, devolver_estadisticas=True)
+        self.comprobar_coherencia(estadisticas)
+        assert estadisticas.motor == 'openpyxl'
+        assert estadisticas.filas == 100
+        assert estadisticas.bytes_leidos > 0
+
+    def test_cargar_feather_estadisticas(self):
+        """Test: cargar_feather cuenta el archivo mapeado como leído"""
+        df, estadisticas = cargar_feather(self.feather, devolver_estadisticas=True)
+        self.comprobar_coherencia(estadisticas)
+        assert estadisticas.motor == 'pyarrow.ipc'
+        assert estadisticas.bytes_leidos == os.path.getsize(self.feather)
+        assert estadisticas.segundos_io == 0
+
+    def test_fragmentos_sin_filas(self):
+        """Test: con un iterador de fragmentos no se conocen filas ni columnas"""
+        fragmentos, estadisticas = cargar_csv(self.csv, limite_memoria=1000,
+                                              si_excede_memoria='fragmentos',
+                                              devolver_estadisticas=True)
+        assert sum(len(f) for f in fragmentos) == 2000
+        assert estadisticas.filas is None and estadisticas.columnas is None
+        assert estadisticas.memoria_pico is None
+
+    def test_cargar_archivo_suma_deteccion(self):
+        """Test: cargar_archivo incluye la detección en la validación"""
+        df, estadisticas = cargar_archivo(self.parquet, devolver_estadisticas=True)
+        self.comprobar_coherencia(estadisticas)
+        assert estadisticas.motor == 'pyarrow.parquet'
+        assert estadisticas.segundos_validacion > 0
+
+    def test_tracemalloc_activo_se_respeta(self):
+        """Test: si tracemalloc ya estaba activo no se detiene"""
+        tracemalloc.start()
+        try:
+            cargar_csv(self.csv, devolver_estadisticas=True)
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+
+    def test_error_detiene_tracemalloc(self):
+        """Test: un error durante la carga no deja tracemalloc activo"""
+        corrupto = os.path.join(self.temp_dir, "corrupto.parquet")
+        Path(corrupto).write_bytes(b"esto no es parquet")
+
+        with pytest.raises(ValueError, match="no es un archivo Parquet válido"):
+            cargar_parquet(corrupto, devolver_estadisticas=True)
+        assert not tracemalloc.is_tracing()
+
+    def test_medidor_fases(self):
+        """Test: el parseo es el tiempo de lectura que no es E/S"""
+        medidor = MedidorCarga('pandas')
+        medidor.segundos['lectura'] = 1.0
+        medidor.registrar_lectura(100, 0.25)
+
+        estadisticas = medidor.estadisticas(self.df_ejemplo)
+        assert estadisticas.segundos_io == 0.25
+        assert estadisticas.segundos_parseo == 0.75
+        assert estadisticas.bytes_leidos == 100
+
+    def test_devolver_estadisticas_tipo_invalido(self):
+        """Test error: devolver_estadisticas debe ser bool"""
+        with pytest.raises(TypeError, match="El parámetro 'devolver_estadisticas' debe ser bool"):
+            cargar_csv(self.csv, devolver_estadisticas="si")  # type: ignore
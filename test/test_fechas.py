@@ -0,0 +1,123 @@
+import pytest
+import pandas as pd
+from pathlib import Path
+import tempfile
+import logging
+import os
+import sys
+
+# Agregar el directorio padre al path para importar el módulo
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from carga_datos import cargar_csv, cargar_xlsx, inferir_esquema
+from carga_datos.fechas import detectar_formato_fecha, convertir_fechas
+
+
+class TestFechas:
+    """Tests para la detección y conversión de columnas de fecha"""
+
+    def setup_method(self):
+        """Configurar archivos de test antes de cada test"""
+        self.temp_dir = tempfile.mkdtemp()
+
+        self.df_ejemplo = pd.DataFrame({
+            'alta': ['25/12/2024', '01/02/2024', '13/03/2023'],
+            'iso': ['2024-12-25', '2024-02-01 10:30:00', '2023-03-13'],
+            'ambigua': ['03/04/2024', '01/02/2024', '05/06/2023'],
+            'nombre': ['Ana', 'Juan', 'Eva'],
+            'codigo': ['12/AB', '13/CD', '14/EF'],
+        })
+        self.csv = os.path.join(self.temp_dir, "altas.csv")
+        self.df_ejemplo.to_csv(self.csv, sep=";", index=False)
+
+    def teardown_method(self):
+        """Limpiar archivos de test después de cada test"""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def test_detectar_formato(self):
+        """Test: ISO 8601, día primero y columnas que no son fechas"""
+        assert detectar_formato_fecha(self.df_ejemplo['alta']) == '%d/%m/%Y'
+        assert detectar_formato_fecha(self.df_ejemplo['iso']) == 'ISO8601'
+        assert detectar_formato_fecha(pd.Series(['12/31/2024', '01/15/2024'])) == '%m/%d/%Y'
+        assert detectar_formato_fecha(pd.Series(['31.12.2024 ', None])) is None
+        assert detectar_formato_fecha(self.df_ejemplo['nombre']) is None
+        assert detectar_formato_fecha(self.df_ejemplo['codigo']) is None
+        assert detectar_formato_fecha(pd.Series([1, 2, 3])) is None
+
+    def test_ambiguedad_se_avisa(self, caplog):
+        """Test: con día y mes intercambiables no se elige en silencio"""
+        with caplog.at_level(logging.WARNING):
+            assert detectar_formato_fecha(self.df_ejemplo['ambigua']) is None
+        assert "fechas ambiguas" in caplog.text and "dia_primero" in caplog.text
+
+        assert detectar_formato_fecha(self.df_ejemplo['ambigua'], dia_primero=True) == '%d/%m/%Y'
+        assert detectar_formato_fecha(self.df_ejemplo['ambigua'], dia_primero=False) == '%m/%d/%Y'
+
+    def test_muestra_ambigua_se_resuelve_con_la_columna(self):
+        """Test: una muestra solo con días <= 12 se decide con la columna entera"""
+        serie = pd.Series(['01/02/2024'] * 50 + ['25/02/2024'])
+        assert detectar_formato_fecha(serie, filas_muestra=10) == '%d/%m/%Y'
+
+    def test_convertir_fechas(self, caplog):
+        """Test: se convierten las columnas detectadas; si el resto no encaja se avisa"""
+        df = pd.DataFrame({'f': ['2024-01-01'] * 3 + ['ayer'] + ['2024-01-01'] * 2,
+                           'g': ['31/01/2024', '01/02/2024'] * 3})
+        with caplog.at_level(logging.WARNING):
+            df, formatos = convertir_fechas(df, filas_muestra=3)
+
+        assert formatos == {'g': '%d/%m/%Y'}
+        assert df['g'].iloc[0] == pd.Timestamp(2024, 1, 31)
+        assert df['f'].dtype == object
+        assert "parecía de fechas" in caplog.text
+
+    def test_cargar_csv_detectar_fechas(self):
+        """Test: cargar_csv convierte las fechas con salida pandas y arrow"""
+        import pyarrow as pa
+        df = cargar_csv(self.csv, sep=";", detectar_fechas=True, dia_primero=True)
+
+        assert pd.api.types.is_datetime64_any_dtype(df['alta'])
+        assert pd.api.types.is_datetime64_any_dtype(df['iso'])
+        assert df['ambigua'].iloc[0] == pd.Timestamp(2024, 4, 3)
+        assert df['nombre'].dtype == object
+
+        tabla = cargar_csv(self.csv, sep=";", detectar_fechas=True, salida='arrow')
+        assert tabla.schema.field('alta').type == pa.timestamp('ns')
+        assert tabla.schema.field('ambigua').type == pa.string()
+
+        # Sin detectar_fechas no cambia nada
+        assert cargar_csv(self.csv, sep=";")['alta'].dtype == object
+
+    def test_cargar_csv_arrow_muestra_repartida(self):
+        """Test: con salida arrow la muestra también se reparte por la columna ordenada"""
+        import pyarrow as pa
+        dias = pd.date_range('2024-01-01', periods=40).strftime('%d/%m/%Y')
+        csv = os.path.join(self.temp_dir, "ordenadas.csv")
+        pd.DataFrame({'fecha': dias.repeat(100)}).to_csv(csv, index=False)
+
+        tabla = cargar_csv(csv, detectar_fechas=True, salida='arrow')
+        assert tabla.schema.field('fecha').type == pa.timestamp('ns')
+        assert tabla.column('fecha')[-1].as_py() == pd.Timestamp(2024, 2, 9)
+
+    def test_cargar_xlsx_detectar_fechas(self):
+        """Test: cargar_xlsx convierte las fechas guardadas como texto"""
+        xlsx = os.path.join(self.temp_dir, "altas.xlsx")
+        self.df_ejemplo.to_excel(xlsx, index=False)
+
+        df = cargar_xlsx(xlsx, detectar_fechas=True)
+        assert pd.api.types.is_datetime64_any_dtype(df['alta'])
+        assert df['ambigua'].dtype == object
+
+    def test_esquema_guarda_el_formato(self):
+        """Test: inferir_esquema guarda el formato detectado de cada columna de fecha"""
+        esquema = inferir_esquema(self.csv, sep=";", dia_primero=False)
+        assert esquema.fechas == {'alta': '%d/%m/%Y', 'iso': 'ISO8601', 'ambigua': '%m/%d/%Y'}
+
+        df = cargar_csv(self.csv, sep=";", esquema=esquema)
+        assert df['ambigua'].iloc[0] == pd.Timestamp(2024, 3, 4)
+
+    def test_validaciones(self):
+        """Test error: detectar_fechas y dia_primero de tipo incorrecto"""
+        with pytest.raises(TypeError, match="El parámetro 'detectar_fechas' debe ser bool"):
+            cargar_csv(self.csv, detectar_fechas="si")
+        with pytest.raises(TypeError, match="El parámetro 'dia_primero' debe ser bool o None"):
+            cargar_xlsx(self.csv, dia_primero=1)
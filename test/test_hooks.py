@@ -0,0 +1,139 @@
+import pytest
+import pandas as pd
+from pathlib import Path
+import tempfile
+import logging
+import io
+import os
+import sys
+
+# Agregar el directorio padre al path para importar el módulo
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from carga_datos import cargar_csv, cargar_archivo
+from carga_datos import hooks as hooks_carga
+from normalizacion_texto import quitar_acentos, normalizar_texto
+from normalizacion_texto import hooks as hooks_texto
+
+
+class TestHooks:
+    """Tests para los hooks de trazas de cargas y normalizaciones"""
+
+    def setup_method(self):
+        """Configurar archivos de test antes de cada test"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.csv = os.path.join(self.temp_dir, "datos.csv")
+        pd.DataFrame({'nombre': ['Juan', 'Ana'], 'edad': [25, 30]}).to_csv(self.csv, index=False)
+
+        self.eventos = []
+        self.registrados = []
+
+    def teardown_method(self):
+        """Eliminar los hooks y limpiar archivos después de cada test"""
+        import shutil
+        for modulo, evento, fn in self.registrados:
+            modulo.eliminar_hook(evento, fn)
+        shutil.rmtree(self.temp_dir)
+
+    def registrar(self, modulo, evento, fn=None):
+        """Registra un hook que se eliminará en teardown"""
+        fn = fn or self.eventos.append
+        modulo.registrar_hook(evento, fn)
+        self.registrados.append((modulo, evento, fn))
+
+    def test_sin_hooks_no_hay_eventos(self):
+        """Test: sin hooks registrados no se comprueba nada más"""
+        assert not hooks_carga.hay_hooks()
+        assert not hooks_texto.hay_hooks()
+        assert cargar_csv.__wrapped__.__name__ == 'cargar_csv'
+
+    def test_eventos_carga(self):
+        """Test: una carga emite 'inicio' y 'fin' con atributos"""
+        for evento in ('inicio', 'fin'):
+            self.registrar(hooks_carga, evento)
+
+        cargar_csv(self.csv, sep=",")
+
+        inicio, fin = self.eventos
+        assert (inicio.evento, fin.evento) == ('inicio', 'fin')
+        assert inicio.funcion == fin.funcion == 'cargar_csv'
+        assert inicio.id_llamada == fin.id_llamada
+        assert inicio.atributos == {'origen': self.csv, 'sep': ","}
+        assert inicio.segundos is None
+        assert fin.atributos['filas'] == 2 and fin.atributos['columnas'] == 2
+        assert fin.segundos >= 0
+
+    def test_cargar_archivo_anida_eventos(self):
+        """Test: cargar_archivo y el cargador que elige emiten sus propios eventos"""
+        self.registrar(hooks_carga, 'inicio')
+        cargar_archivo(io.BytesIO(b"a,b\n1,2\n"))
+
+        assert [e.funcion for e in self.eventos] == ['cargar_archivo', 'cargar_csv']
+        assert self.eventos[0].atributos['origen'] == '<buffer en memoria>'
+
+    def test_evento_error(self):
+        """Test: un error emite 'error' con la excepción y se propaga"""
+        self.registrar(hooks_carga, 'error')
+        self.registrar(hooks_carga, 'fin')
+
+        with pytest.raises(FileNotFoundError):
+            cargar_csv(os.path.join(self.temp_dir, "no_existe.csv"))
+
+        assert len(self.eventos) == 1
+        assert self.eventos[0].evento == 'error'
+        assert isinstance(self.eventos[0].error, FileNotFoundError)
+
+    def test_eventos_normalizacion(self):
+        """Test: las normalizaciones emiten eventos con la longitud del texto"""
+        self.registrar(hooks_texto, 'fin')
+        assert quitar_acentos("José") == "Jose"
+
+        (fin,) = self.eventos
+        assert fin.funcion == 'quitar_acentos'
+        assert fin.atributos == {'longitud': 4, 'longitud_resultado': 4}
+
+    def test_normalizar_texto_incluye_pasos(self):
+        """Test: normalizar_texto emite también los eventos de cada paso"""
+        self.registrar(hooks_texto, 'inicio')
+        normalizar_texto("  José  ", limpiar_espacios_flag=False)
+
+        assert [e.funcion for e in self.eventos] == [
+            'normalizar_texto', 'normalizar_caracteres', 'quitar_acentos', 'convertir_a_minusculas'
+        ]
+        assert self.eventos[0].atributos['limpiar_espacios_flag'] is False
+
+    def test_hook_que_falla_no_interrumpe(self, caplog):
+        """Test: una excepción en un hook se registra y la llamada continúa"""
+        def hook_roto(evento):
+            raise RuntimeError("exportador caído")
+
+        self.registrar(hooks_texto, 'inicio', hook_roto)
+        with caplog.at_level(logging.WARNING):
+            assert quitar_acentos("ñ") == "n"
+        assert "exportador caído" in caplog.text
+
+    def test_eliminar_hook(self):
+        """Test: tras eliminar el último hook vuelve el camino rápido"""
+        hooks_texto.registrar_hook('fin', self.eventos.append)
+        assert hooks_texto.hay_hooks()
+        hooks_texto.eliminar_hook('fin', self.eventos.append)
+        assert not hooks_texto.hay_hooks()
+
+        quitar_acentos("á")
+        assert self.eventos == []
+
+    def test_registro_compartido(self):
+        """Test: cargas y normalizaciones comparten un único registro de hooks"""
+        assert hooks_carga.registrar_hook is hooks_texto.registrar_hook
+        self.registrar(hooks_carga, 'fin')
+
+        cargar_csv(self.csv)
+        quitar_acentos("á")
+
+        assert [e.funcion for e in self.eventos] == ['cargar_csv', 'quitar_acentos']
+
+    def test_validaciones(self):
+        """Test error: evento desconocido o hook no callable"""
+        with pytest.raises(TypeError, match="El parámetro 'evento' debe ser uno de"):
+            hooks_carga.registrar_hook('final', print)
+        with pytest.raises(TypeError, match="El parámetro 'fn' debe ser callable"):
+            hooks_texto.registrar_hook('fin', "no callable")
@@ -1,4 +1,6 @@
 import pytest
+import random
+import re
 import sys
 from pathlib import Path
 
@@ -167,4 +169,24 @@ class TestLimpiarEspacios:
     def test_limpiar_texto_con_numeros_y_espacios(self):
         """Test con números y espacios mixtos"""
         resultado = limpiar_espacios("  123   +   456   =   579  ")
-        assert resultado == "123 + 456 = 579"
\ No newline at end of file
+        assert resultado == "123 + 456 = 579"
+
+    def test_igual_que_cuatro_pasadas_de_re_sub(self):
+        """Test: mismo resultado que las pasadas de re.sub, con todos los espacios en blanco Unicode"""
+        def referencia(texto):
+            texto = re.sub(r'\s+', ' ', texto.strip())
+            texto = re.sub(r'\s+([,.;:!?)\]}])', r'\1', texto)
+            texto = re.sub(r'([(\[{])\s+', r'\1', texto)
+            return re.sub(r' {2,}', ' ', texto)
+
+        espacios = [chr(codigo) for codigo in range(sys.maxunicode + 1)
+                    if re.match(r'\s', chr(codigo)) or chr(codigo).isspace()]
+        for espacio in espacios:
+            texto = f"{espacio}a{espacio}({espacio}b{espacio},{espacio}c {espacio}){espacio}"
+            assert limpiar_espacios(texto) == referencia(texto), hex(ord(espacio))
+
+        generador = random.Random(3)
+        alfabeto = list("ab ,.;:!?()[]{}¿¡") + espacios
+        for _ in range(2000):
+            texto = ''.join(generador.choices(alfabeto, k=generador.randint(0, 25)))
+            assert limpiar_espacios(texto) == referencia(texto), ascii(texto)
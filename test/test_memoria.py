@@ -0,0 +1,213 @@
+import pytest
+import pandas as pd
+from pathlib import Path
+import tempfile
+import os
+import sys
+import unittest.mock as mock
+
+# Agregar el directorio padre al path para importar el módulo
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from carga_datos import cargar_csv, cargar_parquet, cargar_xlsx, cargar_archivo
+from carga_datos.memoria import (
+    EstimacionMemoria,
+    estimar_memoria_csv,
+    estimar_memoria_parquet,
+    estimar_memoria_feather,
+    estimar_memoria_xlsx,
+    supera_limite_memoria,
+    filas_por_fragmento,
+    SOBRECOSTE_TEXTO,
+)
+
+
+class TestMemoria:
+    """Tests para la estimación de memoria y el límite de memoria de los cargadores"""
+
+    def setup_method(self):
+        """Configurar archivos de test antes de cada test"""
+        self.temp_dir = tempfile.mkdtemp()
+
+        self.df_ejemplo = pd.DataFrame({
+            'id': range(2000),
+            'nombre': [f"cliente_{i}" for i in range(2000)],
+            'importe': [i * 1.5 for i in range(2000)],
+        })
+
+        self.csv_grande = os.path.join(self.temp_dir, "grande.csv")
+        self.df_ejemplo.to_csv(self.csv_grande, index=False)
+
+        self.parquet_grande = os.path.join(self.temp_dir, "grande.parquet")
+        self.df_ejemplo.to_parquet(self.parquet_grande, row_group_size=500)
+
+        self.xlsx_grande = os.path.join(self.temp_dir, "grande.xlsx")
+        self.df_ejemplo.head(300).to_excel(self.xlsx_grande, index=False)
+
+    def teardown_method(self):
+        """Limpiar archivos de test después de cada test"""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    # Tests de estimación
+    def test_estimar_memoria_csv_orden_magnitud(self):
+        """Test: la estimación del CSV está en el orden de magnitud real"""
+        estimacion = estimar_memoria_csv(self.csv_grande)
+        real = self.df_ejemplo.memory_usage(deep=True, index=True).sum()
+
+        assert isinstance(estimacion, EstimacionMemoria)
+        assert real / 2 < estimacion.bytes_estimados < real * 2
+        assert estimacion.bytes_por_fila > 0
+
+    def test_estimar_memoria_csv_archivo_invalido(self):
+        """Test: si la muestra no se puede parsear, no hay estimación"""
+        archivo_binario = os.path.join(self.temp_dir, "binario.csv")
+        with open(archivo_binario, 'wb') as f:
+            f.write(b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR')
+
+        assert estimar_memoria_csv(archivo_binario) is None
+
+    def test_estimar_memoria_csv_gzip(self):
+        """Test: un CSV gzip se estima con su tamaño sin comprimir"""
+        import gzip
+        csv_gz = os.path.join(self.temp_dir, "grande.csv.gz")
+        with open(self.csv_grande, 'rb') as origen, gzip.open(csv_gz, 'wb') as destino:
+            destino.write(origen.read())
+
+        sin_comprimir = estimar_memoria_csv(self.csv_grande)
+        comprimido = estimar_memoria_csv(csv_gz)
+
+        assert comprimido.bytes_estimados == sin_comprimir.bytes_estimados
+        assert estimar_memoria_csv(csv_gz, compression='bz2') is None
+
+    def test_estimar_memoria_parquet_usa_pie(self):
+        """Test: la estimación del Parquet se calcula sin leer los datos"""
+        with mock.patch('pandas.read_parquet') as mock_read_parquet:
+            estimacion = estimar_memoria_parquet(self.parquet_grande)
+            mock_read_parquet.assert_not_called()
+
+        real = self.df_ejemplo.memory_usage(deep=True, index=True).sum()
+        assert real / 3 < estimacion.bytes_estimados < real * 3
+
+    def test_estimar_memoria_parquet_columnas(self):
+        """Test: estimar solo algunas columnas reduce la estimación"""
+        total = estimar_memoria_parquet(self.parquet_grande)
+        solo_id = estimar_memoria_parquet(self.parquet_grande, columns=['id'])
+
+        assert solo_id.bytes_estimados < total.bytes_estimados
+
+    def test_estimar_memoria_parquet_invalido(self):
+        """Test: un archivo que no es Parquet no tiene estimación"""
+        archivo_falso = os.path.join(self.temp_dir, "falso.parquet")
+        with open(archivo_falso, 'w') as f:
+            f.write("esto no es parquet")
+
+        assert estimar_memoria_parquet(archivo_falso) is None
+
+    def test_estimar_memoria_feather_sin_descomprimir(self):
+        """Test: la estimación de un Feather comprimido sale de los metadatos y coincide con la tabla"""
+        import pyarrow as pa
+        import pyarrow.ipc as ipc
+        tabla = pa.Table.from_pandas(self.df_ejemplo, preserve_index=False)
+        ruta = os.path.join(self.temp_dir, "grande.feather")
+        ruta_flujo = os.path.join(self.temp_dir, "grande.arrows")
+        self.df_ejemplo.to_feather(ruta, compression='lz4', chunksize=500)
+        with ipc.new_stream(ruta_flujo, tabla.schema, options=ipc.IpcWriteOptions(compression='zstd')) as escritor:
+            escritor.write_table(tabla, max_chunksize=500)
+
+        for origen in (ruta, ruta_flujo):
+            with mock.patch('carga_datos.memoria.abrir_tabla_arrow') as mock_abrir:
+                total = estimar_memoria_feather(origen)
+                solo_id = estimar_memoria_feather(origen, columns=['id'])
+                mock_abrir.assert_not_called()
+
+            texto = tabla.num_rows * SOBRECOSTE_TEXTO
+            assert abs(total.bytes_estimados - (tabla.nbytes + texto)) < 1024
+            assert abs(solo_id.bytes_estimados - tabla.column('id').nbytes) < 1024
+        assert estimar_memoria_feather(ruta, columns=['no_existe']) is None
+
+    def test_estimar_memoria_xlsx(self):
+        """Test: la estimación del Excel usa el número de filas de la hoja"""
+        estimacion = estimar_memoria_xlsx(self.xlsx_grande)
+
+        assert estimacion is not None
+        assert estimacion.bytes_estimados >= estimacion.bytes_por_fila * 300
+
+    def test_supera_limite_memoria(self):
+        """Test: comparación de la estimación con el límite"""
+        estimacion = EstimacionMemoria(bytes_estimados=1000, bytes_por_fila=10.0)
+
+        assert supera_limite_memoria(estimacion, 999)
+        assert not supera_limite_memoria(estimacion, 1000)
+        assert not supera_limite_memoria(estimacion, None)
+        assert not supera_limite_memoria(None, 10)
+
+    def test_filas_por_fragmento(self):
+        """Test: los fragmentos ocupan una cuarta parte del límite"""
+        estimacion = EstimacionMemoria(bytes_estimados=100_000, bytes_por_fila=10.0)
+
+        assert filas_por_fragmento(estimacion, 4000) == 100
+        assert filas_por_fragmento(estimacion, 1) == 1
+
+    # Tests de los cargadores con límite de memoria
+    def test_cargar_csv_supera_limite_error(self):
+        """Test: cargar_csv rechaza el archivo antes de cargarlo si supera el límite"""
+        with mock.patch('pandas.read_csv', wraps=pd.read_csv) as mock_read_csv:
+            with pytest.raises(ValueError, match="es demasiado grande para cargar en memoria"):
+                cargar_csv(self.csv_grande, limite_memoria=1024)
+            # Solo se parseó la muestra, nunca el archivo completo
+            assert all(llamada.args[0] != Path(self.csv_grande) for llamada in mock_read_csv.call_args_list)
+
+    def test_cargar_csv_supera_limite_fragmentos(self):
+        """Test: cargar_csv devuelve fragmentos si se pide al superar el límite"""
+        fragmentos = cargar_csv(self.csv_grande, limite_memoria=40_000, si_excede_memoria='fragmentos')
+
+        assert not isinstance(fragmentos, pd.DataFrame)
+        lista = list(fragmentos)
+        assert len(lista) > 1
+        pd.testing.assert_frame_equal(pd.concat(lista, ignore_index=True), self.df_ejemplo)
+
+    def test_cargar_csv_dentro_del_limite(self):
+        """Test: con un límite holgado la carga es normal"""
+        df = cargar_csv(self.csv_grande, limite_memoria=1024 ** 3, si_excede_memoria='fragmentos')
+
+        assert isinstance(df, pd.DataFrame)
+        assert len(df) == 2000
+
+    def test_cargar_parquet_supera_limite_error(self):
+        """Test: cargar_parquet rechaza el archivo si supera el límite"""
+        with pytest.raises(ValueError, match="es demasiado grande para cargar en memoria"):
+            cargar_parquet(self.parquet_grande, limite_memoria=1024)
+
+    def test_cargar_parquet_supera_limite_fragmentos(self):
+        """Test: cargar_parquet devuelve fragmentos si se pide al superar el límite"""
+        fragmentos = list(cargar_parquet(
+            self.parquet_grande, columns=['id', 'nombre'],
+            limite_memoria=40_000, si_excede_memoria='fragmentos'
+        ))
+
+        assert len(fragmentos) > 1
+        resultado = pd.concat(fragmentos, ignore_index=True)
+        pd.testing.assert_frame_equal(resultado, self.df_ejemplo[['id', 'nombre']])
+
+    def test_cargar_xlsx_supera_limite_error(self):
+        """Test: cargar_xlsx rechaza el archivo si supera el límite"""
+        with pytest.raises(ValueError, match="es demasiado grande para cargar en memoria"):
+            cargar_xlsx(self.xlsx_grande, limite_memoria=1024)
+
+    def test_cargar_archivo_pasa_limite_memoria(self):
+        """Test: cargar_archivo reenvía limite_memoria a la función de carga"""
+        with pytest.raises(ValueError, match="es demasiado grande para cargar en memoria"):
+            cargar_archivo(self.parquet_grande, limite_memoria=1024)
+
+    def test_limite_memoria_tipo_invalido(self):
+        """Test error: limite_memoria debe ser int positivo"""
+        with pytest.raises(TypeError, match="El parámetro 'limite_memoria' debe ser int o None"):
+            cargar_csv(self.csv_grande, limite_memoria="1GB")  # type: ignore
+
+        with pytest.raises(ValueError, match="El parámetro 'limite_memoria' debe ser mayor que 0"):
+            cargar_parquet(self.parquet_grande, limite_memoria=0)
+
+    def test_si_excede_memoria_invalido(self):
+        """Test error: si_excede_memoria debe ser una opción válida"""
+        with pytest.raises(TypeError, match="El parámetro 'si_excede_memoria' debe ser uno de"):
+            cargar_csv(self.csv_grande, si_excede_memoria="swap")  # type: ignore
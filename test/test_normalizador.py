@@ -0,0 +1,86 @@
+import pytest
+import pickle
+import random
+import sys
+from pathlib import Path
+
+# Agregar el directorio padre al path para importar el módulo
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from normalizacion_texto import Normalizador, normalizar_texto, registrar_hook, eliminar_hook
+from normalizacion_texto.normalizar_caracteres import REEMPLAZOS_CARACTERES
+
+
+CONFIGURACIONES = [
+    {},
+    {'preservar_mayusculas': True},
+    {'quitar_acentos_flag': False},
+    {'normalizar_caracteres_flag': False},
+    {'normalizar_caracteres_flag': False, 'quitar_acentos_flag': False},
+    {'limpiar_espacios_flag': False, 'convertir_minusculas': False},
+    {'reemplazos_personalizados': {"José": "Pepe", "€": "euros"}},
+    {'reemplazos_personalizados': {"ab": "b", "é": "́", "c": "\x00"}},
+]
+
+
+class TestNormalizador:
+    """Tests para la clase Normalizador"""
+
+    def test_igual_que_normalizar_texto(self):
+        """Test: mismo resultado que normalizar_texto con cada configuración"""
+        generador = random.Random(7)
+        alfabeto = list(''.join(REEMPLAZOS_CARACTERES)) + list("abcJoséÅñß  \t\n,.(:\x01᭄〮́Σ") + ["José"]
+        for opciones in CONFIGURACIONES:
+            normalizador = Normalizador(**opciones)
+            for _ in range(300):
+                texto = ''.join(generador.choices(alfabeto, k=generador.randint(0, 20)))
+                assert normalizador(texto) == normalizar_texto(texto, **opciones), (opciones, ascii(texto))
+
+    def test_opciones_se_validan_al_crear(self):
+        """Test: las opciones no válidas fallan al crear el objeto"""
+        with pytest.raises(TypeError):
+            Normalizador(convertir_minusculas="si")
+        with pytest.raises(TypeError):
+            Normalizador(opcion_inexistente=True)
+        with pytest.raises(TypeError):
+            Normalizador(reemplazos_personalizados=["a"])
+
+    def test_texto_none(self):
+        """Test: None lanza TypeError como en normalizar_texto"""
+        with pytest.raises(TypeError):
+            Normalizador()(None)
+
+    def test_lote(self):
+        """Test: lote normaliza cada elemento de un iterable"""
+        normalizador = Normalizador(preservar_mayusculas=True)
+        assert normalizador.lote(iter(["  José ", "ÁVILA", 12])) == ["Jose", "AVILA", "12"]
+        assert normalizador.lote([]) == []
+
+    def test_pickle(self):
+        """Test: se puede serializar y sigue normalizando igual"""
+        normalizador = Normalizador(reemplazos_personalizados={"José": "Pepe"}, convertir_minusculas=False)
+        copia = pickle.loads(pickle.dumps(normalizador))
+
+        assert copia.opciones == normalizador.opciones
+        assert copia("  José  —  Núñez ") == normalizador("  José  —  Núñez ") == "Pepe - Nunez"
+
+    def test_emite_hooks(self):
+        """Test: con hooks registrados se emiten los eventos de normalizar_texto"""
+        eventos = []
+        registrar_hook('fin', eventos.append)
+        try:
+            assert Normalizador()(" Á ") == "a"
+        finally:
+            eliminar_hook('fin', eventos.append)
+        assert 'normalizar_texto' in [evento.funcion for evento in eventos]
+
+    def test_serie(self):
+        """Test: serie da lo mismo que normalizar_serie"""
+        pd = pytest.importorskip("pandas")
+        from normalizacion_texto import normalizar_serie
+
+        serie = pd.Series(["  José ", None, "JOSÉ", "Ñandú"], name='nombre')
+        resultado = Normalizador().serie(serie)
+        assert resultado.equals(normalizar_serie(serie))
+
+        with pytest.raises(TypeError):
+            Normalizador().serie(["José"])
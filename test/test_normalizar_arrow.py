@@ -0,0 +1,98 @@
+import pytest
+import pyarrow as pa
+import random
+import sys
+from pathlib import Path
+
+# Agregar el directorio padre al path para importar el módulo
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from normalizacion_texto import Normalizador, normalizar_arrow, normalizar_tabla_arrow, normalizar_texto
+from normalizacion_texto.normalizar_caracteres import REEMPLAZOS_CARACTERES
+from normalizacion_texto.quitar_acentos import CARACTERES_ESPECIALES
+
+
+CONFIGURACIONES = [
+    {},
+    {'preservar_mayusculas': True},
+    {'quitar_acentos_flag': False},
+    {'normalizar_caracteres_flag': False},
+    {'limpiar_espacios_flag': False, 'convertir_minusculas': False},
+    {'reemplazos_personalizados': {"José": "Pepe", "€": "euros", "\\": "\\1"}},
+    {'reemplazos_personalizados': {"a": "b", "b": "c", "1": "x", "2": "x", "Z": "xZ"}},
+    {'reemplazos_personalizados': {"": "-"}},
+]
+
+ALFABETO = (list(''.join(REEMPLAZOS_CARACTERES)) + list(''.join(CARACTERES_ESPECIALES))
+            + list("abcZ12 \t\n\r\x0b\x1c\x85　 ,.;:!?()[]{}\\\x00\x07\x7fáÑç")
+            + list("ΣΑσςİIﬁ᭄〮́̈ःŉ한") + ["José", "ΟΔΟΣ "])
+
+
+class TestNormalizarArrow:
+    """Tests para normalizar_arrow y normalizar_tabla_arrow"""
+
+    @pytest.mark.parametrize("opciones", CONFIGURACIONES)
+    def test_igual_que_normalizar_texto(self, opciones):
+        """Test: cada valor queda igual que con normalizar_texto"""
+        generador = random.Random(11)
+        textos = [''.join(generador.choices(ALFABETO, k=generador.randint(0, 20))) for _ in range(3000)]
+
+        resultado = normalizar_arrow(pa.array(textos), **opciones).to_pylist()
+
+        assert resultado == [normalizar_texto(texto, **opciones) for texto in textos]
+
+    def test_todos_los_caracteres(self):
+        """Test: igual que normalizar_texto con cada carácter del plano básico"""
+        textos = [f"x{chr(codigo)}Σ {chr(codigo)}" for codigo in range(0x10000) if not 0xD800 <= codigo < 0xE000]
+
+        assert normalizar_arrow(pa.array(textos)).to_pylist() == [normalizar_texto(texto) for texto in textos]
+
+    def test_sigma_final_y_mayusculas(self):
+        """Test: minúsculas de Python donde utf8_lower difiere"""
+        columna = pa.array(["ΟΔΟΣ ΑΘΗΝΑΣ", "İstanbul", "  JOSÉ  (MARÍA) ,"])
+
+        assert normalizar_arrow(columna).to_pylist() == ["οδος αθηνας", "istanbul", "jose (maria),"]
+        assert normalizar_arrow(columna, quitar_acentos_flag=False).to_pylist() == \
+            ["οδος αθηνας", "i\u0307stanbul", "josé (maría),"]
+
+    def test_conserva_tipo_bloques_y_nulos(self):
+        """Test: un ChunkedArray large_string conserva sus bloques y los nulos"""
+        columna = pa.chunked_array([["  José ", None], [], ["ASCII  x", None]], type=pa.large_string())
+
+        resultado = normalizar_arrow(columna)
+
+        assert resultado.type == pa.large_string()
+        assert [len(bloque) for bloque in resultado.chunks] == [2, 0, 2]
+        assert resultado.to_pylist() == ["jose", None, "ascii x", None]
+
+    def test_normalizador_arrow(self):
+        """Test: Normalizador.arrow da el mismo resultado que normalizar_arrow"""
+        columna = pa.array(["  José  MARÍA —", None, "Ñu"])
+        normalizador = Normalizador(preservar_mayusculas=True)
+
+        assert normalizador.arrow(columna).equals(normalizar_arrow(columna, preservar_mayusculas=True))
+        assert normalizador.arrow(columna).to_pylist() == ["Jose MARIA -", None, "Nu"]
+
+    def test_tabla(self):
+        """Test: por defecto solo se normalizan las columnas de texto"""
+        tabla = pa.table({'nombre': ["  José ", None], 'edad': [30, 40], 'ciudad': ["CÁDIZ", "Ávila"]})
+
+        resultado = normalizar_tabla_arrow(tabla)
+
+        assert resultado.schema == tabla.schema
+        assert resultado.to_pydict() == {'nombre': ["jose", None], 'edad': [30, 40], 'ciudad': ["cadiz", "avila"]}
+        assert normalizar_tabla_arrow(tabla, ['ciudad']).column('nombre').to_pylist() == ["  José ", None]
+
+    def test_errores(self):
+        """Test error: entradas y opciones no válidas"""
+        with pytest.raises(TypeError, match="pa.Array o un pa.ChunkedArray"):
+            normalizar_arrow(["José"])
+        with pytest.raises(TypeError, match="string o large_string"):
+            normalizar_arrow(pa.array([1, 2]))
+        with pytest.raises(TypeError):
+            normalizar_arrow(pa.array(["José"]), convertir_minusculas="si")
+        with pytest.raises(TypeError, match="pa.Table"):
+            normalizar_tabla_arrow({'a': ["x"]})
+        with pytest.raises(ValueError, match="no existen"):
+            normalizar_tabla_arrow(pa.table({'a': ["x"]}), ['b'])
+        with pytest.raises(TypeError, match="string o large_string"):
+            normalizar_tabla_arrow(pa.table({'a': [1]}), ['a'])
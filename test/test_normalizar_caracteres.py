@@ -1,10 +1,22 @@
 import pytest
+import random
+import re
 import sys
 from pathlib import Path
 
 # Agregar el directorio padre al path para importar el módulo
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from normalizacion_texto import normalizar_caracteres
+from normalizacion_texto.normalizar_caracteres import REEMPLAZOS_CARACTERES, compilar_reemplazos
+
+
+def normalizar_caracteres_en_orden(texto, reemplazos_personalizados=None):
+    """Implementación de referencia: cada reemplazo con str.replace y después la limpieza de control"""
+    reemplazos = REEMPLAZOS_CARACTERES.copy()
+    reemplazos.update(reemplazos_personalizados or {})
+    for original, reemplazo in reemplazos.items():
+        texto = texto.replace(original, reemplazo)
+    return re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', texto)
 
 
 class TestNormalizarCaracteres:
@@ -178,4 +190,32 @@ class TestNormalizarCaracteres:
     def test_normalizar_comas_especiales(self):
         """Test normalizando comas especiales tipográficas"""
         resultado = normalizar_caracteres("Texto‚ con comas„ especiales")
-        assert resultado == 'Texto, con comas" especiales'
\ No newline at end of file
+        assert resultado == 'Texto, con comas" especiales'
+
+    def test_igual_que_reemplazar_en_orden(self):
+        """Test: mismo resultado que aplicar los reemplazos uno a uno, también con reemplazos que se encadenan"""
+        generador = random.Random(42)
+        alfabeto = list(''.join(REEMPLAZOS_CARACTERES)) + list('abcEUR ."\'\n\t\x00\x01\x7f') + ['José', 'Jo']
+        personalizados = [
+            None,
+            {"José": "Jose", "María": "Maria"},
+            {"€": "EUROS", "\x01": "<1>"},
+            {"EUR": "euros", "E": "e"},         # se encadenan con el valor de '€'
+            {"ab": "b", "bc": "X", "a": ""},    # claves que se solapan y un valor vacío
+            {"c": "\x00a", "\x00ab": "Z"},      # valores con caracteres de control
+        ]
+        for reemplazos in personalizados:
+            for _ in range(300):
+                texto = ''.join(generador.choices(alfabeto, k=generador.randint(0, 30)))
+                assert normalizar_caracteres(texto, reemplazos) == normalizar_caracteres_en_orden(texto, reemplazos)
+
+    def test_reemplazos_compilados_en_cache(self):
+        """Test: los pasos se compilan una vez por diccionario de reemplazos"""
+        reemplazos = {"José": "Jose", "María": "Maria"}
+        normalizar_caracteres("José", reemplazos)
+        aciertos = compilar_reemplazos.cache_info().hits
+        assert normalizar_caracteres("María", dict(reemplazos)) == "Maria"
+        assert compilar_reemplazos.cache_info().hits == aciertos + 1
+
+        # Sin reemplazos personalizados: una tabla de translate y la clave de varios caracteres
+        assert len(compilar_reemplazos()) <= 3
@@ -0,0 +1,75 @@
+import pytest
+import importlib
+import random
+import sys
+from pathlib import Path
+
+# Agregar el directorio padre al path para importar el módulo
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from normalizacion_texto import normalizar_lote, normalizar_texto, registrar_hook, eliminar_hook
+from normalizacion_texto.normalizar_caracteres import REEMPLAZOS_CARACTERES
+
+
+CONFIGURACIONES = [
+    {},
+    {'preservar_mayusculas': True},
+    {'quitar_acentos_flag': False},
+    {'normalizar_caracteres_flag': False},
+    {'limpiar_espacios_flag': False, 'convertir_minusculas': False},
+    {'reemplazos_personalizados': {"José": "Pepe", "€": "euros", "": "x"}},
+    {'reemplazos_personalizados': {"ab": "b", "é": "́", "c": "\x00"}},
+    {'reemplazos_personalizados': {"": "-"}},
+    {'reemplazos_personalizados': {"\ue000": "x", "y": "\ue001"}},
+]
+
+ALFABETO = (list(''.join(REEMPLAZOS_CARACTERES))
+            + list("abcJoséÅñßΣΑİ  \t\n,.;:()[]{}\x01᭄〮́") + ["José", "ΟΔΟΣ", "   ", "\ue000"])
+
+
+class TestNormalizarLote:
+    """Tests para normalizar_lote"""
+
+    @pytest.mark.parametrize("opciones", CONFIGURACIONES)
+    def test_igual_que_normalizar_texto(self, monkeypatch, opciones):
+        """Test: cada texto queda igual que con normalizar_texto, también en los límites de bloque"""
+        monkeypatch.setattr(importlib.import_module('normalizacion_texto.normalizador'), 'TEXTOS_POR_BLOQUE', 7)
+        generador = random.Random(3)
+        textos = [''.join(generador.choices(ALFABETO, k=generador.randint(0, 6))) for _ in range(2000)]
+
+        assert normalizar_lote(textos, **opciones) == [normalizar_texto(texto, **opciones) for texto in textos]
+
+    def test_limites_entre_textos(self):
+        """Test: el recorte de espacios y la sigma final se aplican a cada texto"""
+        textos = ["  José ", " ", "", "( ", " )", "ΟΔΟΣ", "Σ", "a\n", ":b"]
+
+        assert normalizar_lote(textos) == ["jose", "", "", "(", ")", "οδος", "σ", "a", ":b"]
+
+    def test_separador_en_los_textos(self):
+        """Test: se usa otro separador si el primero aparece en los textos"""
+        textos = ["\ue000 á", "b\ue001", "\ue002Ć"]
+
+        assert normalizar_lote(textos) == [normalizar_texto(texto) for texto in textos]
+
+    def test_tupla_vacia_y_no_str(self):
+        """Test: tuplas, listas vacías y valores que no son str"""
+        assert normalizar_lote(("  José ", 12, 3.5)) == ["jose", "12", "3.5"]
+        assert normalizar_lote([]) == []
+
+    def test_emite_hooks(self):
+        """Test: con hooks registrados cada texto pasa por normalizar_texto"""
+        eventos = []
+        registrar_hook('fin', eventos.append)
+        try:
+            assert normalizar_lote([" Á ", "B"]) == ["a", "b"]
+        finally:
+            eliminar_hook('fin', eventos.append)
+        assert [evento.funcion for evento in eventos].count('normalizar_texto') == 2
+
+    def test_errores(self):
+        """Test error: textos que no son lista, valores None y opciones no válidas"""
+        with pytest.raises(TypeError, match="lista o una tupla"):
+            normalizar_lote("José")
+        with pytest.raises(TypeError):
+            normalizar_lote(["José", None])
+        with pytest.raises(TypeError):
+            normalizar_lote(["José"], convertir_minusculas="si")
@@ -0,0 +1,82 @@
+import pytest
+import numpy as np
+import random
+import sys
+from pathlib import Path
+
+# Agregar el directorio padre al path para importar el módulo
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from normalizacion_texto import Normalizador, normalizar_array, normalizar_texto
+from normalizacion_texto.normalizar_caracteres import REEMPLAZOS_CARACTERES
+from normalizacion_texto.quitar_acentos import CARACTERES_ESPECIALES
+
+
+CONFIGURACIONES = [
+    {},
+    {'preservar_mayusculas': True},
+    {'quitar_acentos_flag': False},
+    {'normalizar_caracteres_flag': False},
+    {'limpiar_espacios_flag': False, 'convertir_minusculas': False},
+    {'reemplazos_personalizados': {"José": "Pepe", "€": "euros"}},
+    {'reemplazos_personalizados': {"a": "b", "b": "c", "Ñ": "NY", "ab": "X"}},
+    {'reemplazos_personalizados': {"": "-"}},
+]
+
+ALFABETO = (list(''.join(REEMPLAZOS_CARACTERES)) + list(''.join(CARACTERES_ESPECIALES))
+            + list("abcZ12 \t\n\x0b\x1c\x85　 ,.;:!?()[]{}\x07\x7fáÑç")
+            + list("ΣΑσςİﬁ᭄〮́ः한\ud800𝔘") + ["José", "ΟΔΟΣ "])
+
+
+class TestNormalizarArray:
+    """Tests para normalizar_array"""
+
+    @pytest.mark.parametrize("opciones", CONFIGURACIONES)
+    def test_igual_que_normalizar_texto(self, opciones):
+        """Test: cada valor queda igual que con normalizar_texto"""
+        generador = random.Random(5)
+        textos = [''.join(generador.choices(ALFABETO, k=generador.randint(0, 8))) for _ in range(3000)]
+        textos += [''.join(generador.choices("abcÁé ,(", k=generador.randint(0, 8))) for _ in range(3000)]
+
+        resultado = normalizar_array(np.array(textos), **opciones).tolist()
+
+        assert resultado == [normalizar_texto(texto, **opciones) for texto in textos]
+
+    def test_todos_los_caracteres(self):
+        """Test: igual que normalizar_texto con cada carácter del plano básico"""
+        textos = [f"x{chr(codigo)}Σ {chr(codigo)}" for codigo in range(1, 0x10000)]
+
+        assert normalizar_array(np.array(textos)).tolist() == [normalizar_texto(texto) for texto in textos]
+
+    def test_forma_y_ancho(self):
+        """Test: se conserva la forma y el ancho crece con las expansiones"""
+        textos = np.array([["  José ", "Straße"], ["", "€"]])
+
+        resultado = normalizar_array(textos)
+
+        assert resultado.shape == (2, 2)
+        assert resultado.tolist() == [["jose", "strasse"], ["", "eur"]]
+        assert resultado.dtype == np.dtype('U7')
+        assert normalizar_array(np.array(["ß"])).dtype == np.dtype('U2')
+
+    def test_orden_de_bytes_y_vistas(self):
+        """Test: arrays big-endian y vistas no contiguas"""
+        textos = np.array(["ÁVILA", "x", "Cádiz", "y"], dtype='>U5')
+
+        assert normalizar_array(textos[::2]).tolist() == ["avila", "cadiz"]
+
+    def test_normalizador_array(self):
+        """Test: Normalizador.array da el mismo resultado que normalizar_array"""
+        textos = np.array(["  José  MARÍA —", "Ñu"])
+        normalizador = Normalizador(preservar_mayusculas=True)
+
+        assert normalizador.array(textos).tolist() == ["Jose MARIA -", "Nu"]
+        assert normalizador.array(textos).tolist() == normalizar_array(textos, preservar_mayusculas=True).tolist()
+
+    def test_errores(self):
+        """Test error: entradas y opciones no válidas"""
+        with pytest.raises(TypeError, match="dtype 'U'"):
+            normalizar_array(["José"])
+        with pytest.raises(TypeError, match="dtype 'U'"):
+            normalizar_array(np.array([b"Jose"]))
+        with pytest.raises(TypeError):
+            normalizar_array(np.array(["José"]), convertir_minusculas="si")
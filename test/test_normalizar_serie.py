@@ -0,0 +1,124 @@
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Agregar el directorio padre al path para importar el módulo
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from normalizacion_texto import normalizar_serie, normalizar_dataframe, normalizar_texto
+
+
+class TestNormalizarSerie:
+    """Tests para normalizar_serie y normalizar_dataframe"""
+
+    def test_normalizar_serie_igual_que_escalar(self):
+        """Test: mismo resultado que normalizar_texto valor a valor, con índice y nombre"""
+        serie = pd.Series(["  José ", "JOSÉ", "Ñandú —azul", "JOSÉ", 25], index=[10, 11, 12, 13, 14], name='nombre')
+        resultado = normalizar_serie(serie)
+
+        assert resultado.tolist() == [normalizar_texto(valor) for valor in serie]
+        assert resultado.index.tolist() == [10, 11, 12, 13, 14] and resultado.name == 'nombre'
+
+    def test_cada_valor_unico_una_vez(self, monkeypatch):
+        """Test: normalizar_texto se llama una vez por valor distinto, no por fila"""
+        import importlib
+        modulo = importlib.import_module('normalizacion_texto.normalizar_serie')
+        llamadas = []
+        monkeypatch.setattr(modulo, 'normalizar_texto',
+                            lambda valor, **opciones: llamadas.append(valor) or normalizar_texto(valor, **opciones))
+
+        normalizar_serie(pd.Series(["Ávila", "Cádiz", "Ávila"] * 1000))
+        assert sorted(llamadas) == ["Cádiz", "Ávila"]
+
+    def test_nulos_se_conservan(self):
+        """Test: None, NaN y pd.NA no lanzan TypeError y se mantienen"""
+        resultado = normalizar_serie(pd.Series(["Á", None, np.nan, "B "]))
+        assert resultado[0] == "a" and resultado[1] is None and np.isnan(resultado[2]) and resultado[3] == "b"
+
+        texto = normalizar_serie(pd.Series(["Á", pd.NA], dtype="string"))
+        assert texto.dtype == "string" and texto[0] == "a" and texto[1] is pd.NA
+
+        assert normalizar_serie(pd.Series([None, None])).isna().all()
+
+    def test_valores_con_nul(self):
+        """Test: los valores que solo difieren tras un '\\x00' no se fusionan"""
+        serie = pd.Series(["\x00José", "\x00MARÍA", "ok", "", "a", "a\x00b", None])
+        esperado = [normalizar_texto(valor) for valor in serie[:-1]] + [None]
+
+        assert normalizar_serie(serie).tolist() == esperado
+        assert normalizar_serie(serie.astype("string")).tolist()[:-1] == esperado[:-1]
+        assert normalizar_serie(serie, workers=2, paralelo="hilos").tolist() == esperado
+
+        categorica = pd.Series(pd.Categorical.from_codes([0, 1, 0], categories=["\x00A", "\x00b"]))
+        assert normalizar_serie(categorica, normalizar_caracteres_flag=False).tolist() == ["\x00a", "\x00b", "\x00a"]
+
+    def test_categorica(self):
+        """Test: se normalizan las categorías y se fusionan las que coinciden"""
+        serie = pd.Series(["Málaga", "MALAGA", None, "Jaén"], dtype="category")
+        resultado = normalizar_serie(serie)
+
+        assert isinstance(resultado.dtype, pd.CategoricalDtype)
+        assert list(resultado.cat.categories) == ["jaen", "malaga"]
+        assert resultado.tolist()[:2] == ["malaga", "malaga"] and pd.isna(resultado[2])
+
+    def test_opciones(self):
+        """Test: las opciones se pasan a normalizar_texto y se validan una vez"""
+        serie = pd.Series(["José ©", "María"])
+        assert normalizar_serie(serie, preservar_mayusculas=True,
+                                reemplazos_personalizados={"©": "(c)"}).tolist() == ["Jose (c)", "Maria"]
+
+        with pytest.raises(TypeError, match="'quitar_acentos_flag' debe ser bool"):
+            normalizar_serie(serie, quitar_acentos_flag="si")
+        with pytest.raises(TypeError, match="'minusculas' no es una opción de normalizar_texto"):
+            normalizar_serie(serie, minusculas=True)
+        with pytest.raises(TypeError, match="debe ser una pd.Series"):
+            normalizar_serie(["José"])
+
+    def test_normalizar_dataframe(self):
+        """Test: columnas indicadas o, por defecto, todas las de texto; sin modificar el original"""
+        df = pd.DataFrame({'nombre': ["JOSÉ", "Ana"], 'ciudad': pd.Series(["Ávila", "Ávila"], dtype="category"),
+                           'edad': [30, 40]})
+
+        resultado = normalizar_dataframe(df, ['nombre'])
+        assert resultado['nombre'].tolist() == ["jose", "ana"] and df['nombre'].tolist() == ["JOSÉ", "Ana"]
+        assert resultado['ciudad'].tolist() == ["Ávila", "Ávila"]
+
+        todas = normalizar_dataframe(df)
+        assert todas['ciudad'].tolist() == ["avila", "avila"] and todas['edad'].tolist() == [30, 40]
+
+        with pytest.raises(ValueError, match="no existen en el DataFrame"):
+            normalizar_dataframe(df, ['apellido'])
+        with pytest.raises(TypeError, match="'columnas' debe ser una lista"):
+            normalizar_dataframe(df, 'nombre')
+
+    @pytest.mark.parametrize("paralelo", ["procesos", "hilos"])
+    def test_workers_igual_que_secuencial(self, monkeypatch, paralelo):
+        """Test: repartir los valores únicos entre workers da el mismo resultado y orden"""
+        import importlib
+        modulo = importlib.import_module('normalizacion_texto.normalizar_serie')
+        monkeypatch.setattr(modulo, 'MINIMO_VALORES_PARALELO', 10)
+
+        serie = pd.Series([f"  Ciudad Ñ {i % 97} —" for i in range(500)] + [None, 7, "\ud800 Á"])
+        esperado = normalizar_serie(serie)
+
+        assert normalizar_serie(serie, workers=2, paralelo=paralelo).tolist() == esperado.tolist()
+
+        categorica = serie.dropna().astype(str).astype("category")
+        resultado, esperado = normalizar_serie(categorica, workers=2, paralelo=paralelo), normalizar_serie(categorica)
+        # equals() no sirve: pandas no puede hashear categorías con surrogates
+        assert list(resultado.cat.categories) == list(esperado.cat.categories)
+        assert resultado.tolist() == esperado.tolist()
+
+        df = pd.DataFrame({'a': serie, 'b': serie[::-1].to_numpy()})
+        assert normalizar_dataframe(df, workers=2, paralelo=paralelo).equals(normalizar_dataframe(df))
+
+    def test_workers_no_validos(self):
+        """Test error: workers no positivo o motor paralelo desconocido"""
+        serie = pd.Series(["José"])
+        with pytest.raises(TypeError, match="'workers' debe ser un entero positivo"):
+            normalizar_serie(serie, workers=0)
+        with pytest.raises(TypeError, match="'paralelo' debe ser uno de"):
+            normalizar_serie(serie, workers=2, paralelo="gpu")
+        with pytest.raises(TypeError, match="'workers' debe ser un entero positivo"):
+            normalizar_dataframe(pd.DataFrame({'a': ["x"]}), workers="4")
@@ -0,0 +1,122 @@
+import pytest
+import pandas as pd
+from pathlib import Path
+import tempfile
+import logging
+import os
+import sys
+
+# Agregar el directorio padre al path para importar el módulo
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from carga_datos import cargar_csv
+from carga_datos.numeros import (
+    LOCALES, FormatoNumerico, resolver_formato_numerico, detectar_formato_numerico, convertir_numeros
+)
+
+
+class TestNumeros:
+    """Tests para los números con formato regional"""
+
+    def setup_method(self):
+        """Configurar archivos de test antes de cada test"""
+        self.temp_dir = tempfile.mkdtemp()
+
+        self.csv_es = os.path.join(self.temp_dir, "ventas_es.csv")
+        with open(self.csv_es, 'w', encoding='utf-8') as archivo:
+            archivo.write("producto;importe;unidades;codigo\n"
+                          "Mesa;1.234,56;1.200;A-1\n"
+                          "Silla;12,5;3;B-2\n"
+                          "Lámpara;-0,75;10;C-3\n")
+
+    def teardown_method(self):
+        """Limpiar archivos de test después de cada test"""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def test_resolver_formato(self):
+        """Test: locale como atajo; decimal y miles explícitos tienen prioridad"""
+        assert resolver_formato_numerico(None, None, None) is None
+        assert resolver_formato_numerico(None, None, 'es') == FormatoNumerico(',', '.')
+        assert resolver_formato_numerico(None, "'", 'es') == FormatoNumerico(',', "'")
+        assert resolver_formato_numerico(',', None, None) == FormatoNumerico(',', None)
+
+    def test_detectar_formato(self):
+        """Test: formatos regionales y columnas que no son números"""
+        assert detectar_formato_numerico(pd.Series(['1.234,56', '12,5'])) == LOCALES['es']
+        assert detectar_formato_numerico(pd.Series(['1,234.56', '12.5'])) == LOCALES['en']
+        assert detectar_formato_numerico(pd.Series(['1 234,56', '7'])) == LOCALES['fr']
+        assert detectar_formato_numerico(pd.Series(['A-1', '12,5'])) is None
+        assert detectar_formato_numerico(pd.Series(['1.2.3'])) is None
+        assert detectar_formato_numerico(pd.Series([1.5, 2.0])) is None
+
+    def test_ambiguedad_se_avisa(self, caplog):
+        """Test: '1,234' encaja con decimal ',' y con miles ','; no se elige en silencio"""
+        serie = pd.Series(['1,234', '5,678'], name='total')
+        with caplog.at_level(logging.WARNING):
+            assert detectar_formato_numerico(serie) is None
+        assert "números ambiguos" in caplog.text and "locale" in caplog.text
+
+        assert detectar_formato_numerico(serie, LOCALES['es']) == LOCALES['es']
+        assert detectar_formato_numerico(serie, LOCALES['en']) == LOCALES['en']
+
+    def test_convertir_numeros(self, caplog):
+        """Test: enteros a int64, decimales o vacíos a float64; si el resto no encaja se avisa"""
+        df = pd.DataFrame({'a': ['1.000', '2.500', '3', '4'],
+                           'b': ['1,5', None, '2', '3'],
+                           'c': ['1,5', 'n/d', '2,5', '3']})
+        with caplog.at_level(logging.WARNING):
+            df, formatos = convertir_numeros(df, LOCALES['es'], filas_muestra=2)
+
+        assert df['a'].tolist() == [1000, 2500, 3, 4] and df['a'].dtype == 'int64'
+        assert df['b'].dtype == 'float64' and df['b'].iloc[0] == 1.5 and pd.isna(df['b'].iloc[1])
+        assert df['c'].dtype == object
+        assert set(formatos) == {'a', 'b'}
+        assert "parecía numérica" in caplog.text
+
+    def test_cargar_csv_locale(self):
+        """Test: locale='es' lo aplica el parser con salida pandas y arrow"""
+        import pyarrow as pa
+        df = cargar_csv(self.csv_es, sep=";", locale="es")
+
+        assert df['importe'].tolist() == [1234.56, 12.5, -0.75]
+        assert df['unidades'].tolist() == [1200, 3, 10]
+        assert df['codigo'].dtype == object
+
+        tabla = cargar_csv(self.csv_es, sep=";", locale="es", salida='arrow')
+        assert tabla.column('importe').to_pylist() == [1234.56, 12.5, -0.75]
+        assert tabla.schema.field('unidades').type == pa.int64()
+        assert tabla.schema.field('codigo').type == pa.string()
+
+        # Solo el separador decimal: el de miles se deja sin tratar
+        df = cargar_csv(self.csv_es, sep=";", decimal=",")
+        assert df['importe'].dtype == object and df['unidades'].dtype == object
+
+    def test_cargar_csv_detectar_numeros(self):
+        """Test: detectar_numeros convierte las columnas sin indicar el formato"""
+        df = cargar_csv(self.csv_es, sep=";", detectar_numeros=True)
+        assert df['importe'].tolist() == [1234.56, 12.5, -0.75]
+        assert df['codigo'].dtype == object
+
+        # Sin parámetros no cambia nada
+        assert cargar_csv(self.csv_es, sep=";")['importe'].dtype == object
+
+    def test_cargar_csv_arrow_muestra_repartida(self):
+        """Test: con salida arrow la muestra se reparte por la columna, no solo el principio"""
+        csv = os.path.join(self.temp_dir, "ordenado.csv")
+        with open(csv, 'w', encoding='utf-8') as archivo:
+            archivo.write("importe;codigo\n" + "1.000;a\n" * 2000 + "1.234,56;b\n" * 2000)
+
+        tabla = cargar_csv(csv, sep=";", detectar_numeros=True, salida='arrow')
+        assert tabla.column('importe')[0].as_py() == 1000
+        assert tabla.column('importe')[-1].as_py() == 1234.56
+
+    def test_validaciones(self):
+        """Test error: separadores, locale y detectar_numeros incorrectos"""
+        with pytest.raises(TypeError, match="El parámetro 'decimal' debe ser un único carácter o None"):
+            cargar_csv(self.csv_es, decimal=",,")
+        with pytest.raises(TypeError, match="El parámetro 'locale' debe ser uno de"):
+            cargar_csv(self.csv_es, locale="es_ES")
+        with pytest.raises(TypeError, match="deben ser distintos"):
+            cargar_csv(self.csv_es, decimal=".", locale="es")
+        with pytest.raises(TypeError, match="El parámetro 'detectar_numeros' debe ser bool"):
+            cargar_csv(self.csv_es, detectar_numeros="si")
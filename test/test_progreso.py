@@ -0,0 +1,171 @@
+import pytest
+import pandas as pd
+from pathlib import Path
+import tempfile
+import io
+import importlib
+import os
+import sys
+import unittest.mock as mock
+
+# Agregar el directorio padre al path para importar el módulo
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from carga_datos import cargar_csv, cargar_parquet, cargar_xlsx, cargar_feather, cargar_archivo
+from carga_datos.progreso import ProgresoCarga, SeguimientoProgreso, LectorConProgreso
+import carga_datos.progreso as progreso_mod
+
+
+class TestProgreso:
+    """Tests para los callbacks de progreso de los cargadores"""
+
+    def setup_method(self):
+        """Configurar archivos de test antes de cada test"""
+        self.temp_dir = tempfile.mkdtemp()
+
+        self.df_ejemplo = pd.DataFrame({
+            'id': range(3000),
+            'nombre': [f"cliente_{i}" for i in range(3000)],
+        })
+
+        self.csv = os.path.join(self.temp_dir, "datos.csv")
+        self.df_ejemplo.to_csv(self.csv, index=False)
+
+        self.parquet = os.path.join(self.temp_dir, "datos.parquet")
+        self.df_ejemplo.to_parquet(self.parquet, row_group_size=1000)
+
+        self.xlsx = os.path.join(self.temp_dir, "datos.xlsx")
+        self.df_ejemplo.head(200).to_excel(self.xlsx, index=False)
+
+        self.feather = os.path.join(self.temp_dir, "datos.feather")
+        self.df_ejemplo.to_feather(self.feather)
+
+        self.avisos = []
+
+    def teardown_method(self):
+        """Limpiar archivos de test después de cada test"""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    # Tests de las piezas de seguimiento
+    def test_seguimiento_limita_frecuencia(self):
+        """Test: los avisos intermedios respetan INTERVALO_PROGRESO"""
+        seguimiento = SeguimientoProgreso(self.avisos.append, bytes_totales=100)
+        for _ in range(1000):
+            seguimiento.avanzar(bytes_leidos=1, filas=1)
+        seguimiento.terminar()
+
+        # Bucle de microsegundos: solo el aviso final
+        assert len(self.avisos) == 1
+        final = self.avisos[-1]
+        assert isinstance(final, ProgresoCarga)
+        assert final.terminado
+        assert final.bytes_leidos == 1000
+        assert final.filas == 1000
+        assert final.filas_por_segundo > 0
+
+    def test_lector_cuenta_bytes(self):
+        """Test: LectorConProgreso cuenta los bytes y delega seek/tell"""
+        seguimiento = SeguimientoProgreso(self.avisos.append)
+        lector = LectorConProgreso(io.BytesIO(b"0123456789"), seguimiento)
+
+        assert lector.read(4) == b"0123"
+        lector.seek(8)
+        assert lector.tell() == 8
+        assert lector.read() == b"89"
+        assert seguimiento.bytes_leidos == 6
+
+    def test_lector_no_cuenta_relecturas(self):
+        """Test: volver atrás y releer no suma bytes al progreso"""
+        seguimiento = SeguimientoProgreso(self.avisos.append)
+        lector = LectorConProgreso(io.BytesIO(b"0123456789"), seguimiento)
+
+        lector.seek(6)
+        assert lector.read() == b"6789"
+        lector.seek(0)
+        assert lector.read() == b"0123456789"
+        lector.seek(2)
+        assert lector.read(3) == b"234"
+        assert seguimiento.bytes_leidos == 10
+
+    # Tests de los cargadores
+    def test_csv_informa_filas_y_bytes(self):
+        """Test: cargar_csv informa de bytes y filas, con avisos intermedios"""
+        cargar_csv_mod = importlib.import_module('carga_datos.cargar_csv')
+        with mock.patch.object(progreso_mod, 'INTERVALO_PROGRESO', 0), \
+                mock.patch.object(cargar_csv_mod, 'FILAS_BLOQUE_PROGRESO', 1000):
+            df = cargar_csv(self.csv, progreso=self.avisos.append)
+
+        pd.testing.assert_frame_equal(df, self.df_ejemplo)
+        filas_intermedias = [aviso.filas for aviso in self.avisos if not aviso.terminado]
+        assert 1000 in filas_intermedias and 2000 in filas_intermedias
+        final = self.avisos[-1]
+        assert final.terminado
+        assert final.filas == 3000
+        assert final.bytes_leidos == final.bytes_totales == os.path.getsize(self.csv)
+
+    def test_csv_arrow_con_progreso(self):
+        """Test: el progreso también funciona con salida='arrow'"""
+        tabla = cargar_csv(self.csv, salida='arrow', progreso=self.avisos.append)
+
+        assert tabla.num_rows == 3000
+        assert self.avisos[-1].filas == 3000
+
+    def test_parquet_informa_por_grupo_de_filas(self):
+        """Test: cargar_parquet informa tras cada grupo de filas"""
+        with mock.patch.object(progreso_mod, 'INTERVALO_PROGRESO', 0):
+            df = cargar_parquet(self.parquet, progreso=self.avisos.append)
+
+        pd.testing.assert_frame_equal(df, self.df_ejemplo)
+        assert [aviso.filas for aviso in self.avisos] == [1000, 2000, 3000, 3000]
+        assert self.avisos[-1].bytes_leidos == self.avisos[-1].bytes_totales
+
+    def test_xlsx_informa_bytes_y_filas_finales(self):
+        """Test: cargar_xlsx cuenta bytes al leer y las filas en el aviso final"""
+        df = cargar_xlsx(self.xlsx, progreso=self.avisos.append)
+
+        assert len(df) == 200
+        final = self.avisos[-1]
+        assert final.terminado
+        assert final.filas == 200
+        assert final.bytes_leidos > 0
+
+    def test_xlsx_progreso_no_pasa_del_total(self):
+        """Test: zipfile relee partes del xlsx pero el progreso no supera el 100%"""
+        with mock.patch.object(progreso_mod, 'INTERVALO_PROGRESO', 0):
+            cargar_xlsx(self.xlsx, progreso=self.avisos.append)
+
+        total = os.path.getsize(self.xlsx)
+        assert all(aviso.bytes_totales == total for aviso in self.avisos)
+        assert all(aviso.bytes_leidos <= total for aviso in self.avisos)
+        assert self.avisos[-1].bytes_leidos > total // 2
+
+    def test_feather_aviso_final(self):
+        """Test: cargar_feather envía un aviso final"""
+        cargar_feather(self.feather, progreso=self.avisos.append)
+
+        assert self.avisos[-1].filas == 3000
+        assert self.avisos[-1].terminado
+
+    def test_cargar_archivo_reenvia_progreso(self):
+        """Test: cargar_archivo pasa progreso a la función de carga"""
+        cargar_archivo(self.parquet, progreso=self.avisos.append)
+        assert self.avisos[-1].filas == 3000
+
+    def test_sin_progreso_no_envuelve_el_archivo(self):
+        """Test: sin callback la carga usa la ruta original, sin lector intermedio"""
+        with mock.patch('pandas.read_csv', wraps=pd.read_csv) as mock_read_csv:
+            cargar_csv(self.csv)
+            assert isinstance(mock_read_csv.call_args.args[0], Path)
+
+    def test_progreso_error_se_traduce(self):
+        """Test error: los errores de carga con progreso se traducen igual"""
+        archivo_vacio = os.path.join(self.temp_dir, "vacio.csv")
+        open(archivo_vacio, 'w').close()
+
+        with pytest.raises(ValueError, match="está vacío"):
+            cargar_csv(archivo_vacio, progreso=self.avisos.append)
+
+    def test_progreso_tipo_invalido(self):
+        """Test error: progreso debe ser callable"""
+        with pytest.raises(TypeError, match="El parámetro 'progreso' debe ser callable o None"):
+            cargar_parquet(self.parquet, progreso="consola")  # type: ignore
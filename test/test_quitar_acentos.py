@@ -1,10 +1,13 @@
 import pytest
+import random
 import sys
+import unicodedata
 from pathlib import Path
 
 # Agregar el directorio padre al path para importar el módulo
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from normalizacion_texto import quitar_acentos
+from normalizacion_texto.quitar_acentos import CARACTERES_ESPECIALES
 
 
 class TestQuitarAcentos:
@@ -122,4 +125,44 @@ class TestQuitarAcentos:
         # Algunos caracteres especiales que combinan múltiples marcas
         texto = "e\u0301\u0302"  # e con acento agudo y circunflejo
         resultado = quitar_acentos(texto)
-        assert resultado == "e"
\ No newline at end of file
+        assert resultado == "e"
+
+
+def quitar_acentos_nfd(texto):
+    """Implementación de referencia: reemplazos especiales, NFD y descartar las marcas 'Mn'"""
+    for caracter_especial, reemplazo in CARACTERES_ESPECIALES.items():
+        texto = texto.replace(caracter_especial, reemplazo)
+    return ''.join(
+        caracter for caracter in unicodedata.normalize('NFD', texto)
+        if unicodedata.category(caracter) != 'Mn'
+    )
+
+
+class TestQuitarAcentosTabla:
+    """Tests de equivalencia de la tabla de translate con NFD"""
+
+    def test_igual_que_nfd_en_todo_el_bmp(self):
+        """Test exhaustivo: cada carácter del BMP, solo y entre texto, da lo mismo que NFD"""
+        for codigo in range(0x10000):
+            caracter = chr(codigo)
+            assert quitar_acentos(caracter) == quitar_acentos_nfd(caracter), hex(codigo)
+            texto = f"a{caracter}é"
+            assert quitar_acentos(texto) == quitar_acentos_nfd(texto), hex(codigo)
+
+    def test_igual_que_nfd_con_marcas_combinadas(self):
+        """Test: secuencias aleatorias de letras y marcas combinantes"""
+        generador = random.Random(42)
+        alfabeto = list("aeAOñÅæßǾ̧́̈͏᭄꥓〮〯 ") + ['\U0001d165', '\U0001d15e']
+        for _ in range(2000):
+            texto = ''.join(generador.choices(alfabeto, k=generador.randint(1, 12)))
+            assert quitar_acentos(texto) == quitar_acentos_nfd(texto), ascii(texto)
+
+    def test_marcas_que_nfd_reordena(self):
+        """Test: marcas conservadas que NFD reordena se procesan con NFD completo"""
+        texto = "a\u302e\u1b44"
+        assert quitar_acentos(texto) == unicodedata.normalize('NFD', texto) == "a\u1b44\u302e"
+
+    def test_texto_ascii_sin_cambios(self):
+        """Test: el texto ASCII se devuelve tal cual"""
+        texto = "Hola mundo 123 !?"
+        assert quitar_acentos(texto) is texto
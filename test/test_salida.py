@@ -0,0 +1,137 @@
+import pytest
+import pandas as pd
+import pyarrow as pa
+from pathlib import Path
+import tempfile
+import gzip
+import os
+import sys
+
+# Agregar el directorio padre al path para importar el módulo
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from carga_datos import cargar_csv, cargar_parquet, cargar_xlsx, cargar_feather, cargar_archivo
+
+
+class TestSalida:
+    """Tests para el parámetro salida ('pandas', 'arrow', 'lotes') de los cargadores"""
+
+    def setup_method(self):
+        """Configurar archivos de test antes de cada test"""
+        self.temp_dir = tempfile.mkdtemp()
+
+        self.df_ejemplo = pd.DataFrame({
+            'nombre': ['Juan', 'Ana', 'Carlos'],
+            'edad': [25, 30, 35],
+        })
+        self.tabla_ejemplo = pa.Table.from_pandas(self.df_ejemplo, preserve_index=False)
+
+        self.csv = os.path.join(self.temp_dir, "datos.csv")
+        self.df_ejemplo.to_csv(self.csv, sep=";", index=False)
+
+        self.parquet = os.path.join(self.temp_dir, "datos.parquet")
+        self.df_ejemplo.to_parquet(self.parquet)
+
+        self.xlsx = os.path.join(self.temp_dir, "datos.xlsx")
+        self.df_ejemplo.to_excel(self.xlsx, index=False)
+
+        self.feather = os.path.join(self.temp_dir, "datos.feather")
+        self.df_ejemplo.to_feather(self.feather)
+
+    def teardown_method(self):
+        """Limpiar archivos de test después de cada test"""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def _sin_metadatos(self, tabla):
+        """Quita los metadatos de pandas para comparar solo datos y tipos"""
+        return tabla.replace_schema_metadata(None)
+
+    def test_salida_arrow_todos_los_cargadores(self):
+        """Test: salida='arrow' devuelve una pyarrow.Table equivalente"""
+        tablas = [
+            cargar_csv(self.csv, sep=";", salida='arrow'),
+            cargar_parquet(self.parquet, salida='arrow'),
+            cargar_xlsx(self.xlsx, salida='arrow'),
+            cargar_feather(self.feather, salida='arrow'),
+        ]
+        for tabla in tablas:
+            assert isinstance(tabla, pa.Table)
+            assert self._sin_metadatos(tabla).equals(self.tabla_ejemplo.replace_schema_metadata(None))
+
+    def test_salida_lotes_todos_los_cargadores(self):
+        """Test: salida='lotes' devuelve un RecordBatchReader"""
+        lectores = [
+            cargar_csv(self.csv, sep=";", salida='lotes'),
+            cargar_parquet(self.parquet, salida='lotes'),
+            cargar_xlsx(self.xlsx, salida='lotes'),
+            cargar_feather(self.feather, salida='lotes'),
+        ]
+        for lector in lectores:
+            assert isinstance(lector, pa.RecordBatchReader)
+            assert lector.read_all().to_pandas().equals(self.df_ejemplo)
+
+    def test_salida_arrow_no_usa_pandas(self):
+        """Test: con salida='arrow' el CSV y el Parquet no pasan por pandas"""
+        import unittest.mock as mock
+        with mock.patch('pandas.read_csv') as mock_read_csv, \
+                mock.patch('pandas.read_parquet') as mock_read_parquet:
+            cargar_csv(self.csv, sep=";", salida='arrow')
+            cargar_parquet(self.parquet, salida='arrow')
+            mock_read_csv.assert_not_called()
+            mock_read_parquet.assert_not_called()
+
+    def test_salida_arrow_columnas_parquet(self):
+        """Test: columns se respeta con salida='arrow' y 'lotes'"""
+        assert cargar_parquet(self.parquet, columns=['edad'], salida='arrow').column_names == ['edad']
+        assert cargar_parquet(self.parquet, columns=['edad'], salida='lotes').schema.names == ['edad']
+
+        with pytest.raises(ValueError, match="Una o más columnas especificadas no existen"):
+            cargar_parquet(self.parquet, columns=['no_existe'], salida='lotes')
+
+    def test_salida_arrow_csv_gzip(self):
+        """Test: salida='arrow' descomprime igual que la carga con pandas"""
+        csv_gz = os.path.join(self.temp_dir, "datos.csv.gz")
+        with open(self.csv, 'rb') as origen, gzip.open(csv_gz, 'wb') as destino:
+            destino.write(origen.read())
+
+        assert cargar_csv(csv_gz, sep=";", salida='arrow').num_rows == 3
+        assert cargar_archivo(csv_gz, sep=";", salida='arrow').num_rows == 3
+
+    def test_salida_arrow_csv_vacio(self):
+        """Test error: CSV vacío con salida='arrow'"""
+        csv_vacio = os.path.join(self.temp_dir, "vacio.csv")
+        open(csv_vacio, 'w').close()
+
+        with pytest.raises(ValueError, match="está vacío"):
+            cargar_csv(csv_vacio, salida='arrow')
+
+    def test_salida_arrow_separador_multiple(self):
+        """Test error: pyarrow.csv solo admite separadores de un carácter"""
+        with pytest.raises(ValueError, match="el separador debe ser de un solo carácter"):
+            cargar_csv(self.csv, sep="::", salida='arrow')
+
+    def test_salida_arrow_fragmentos(self):
+        """Test: al superar el límite con 'fragmentos' se devuelven lotes Arrow"""
+        df_grande = pd.DataFrame({'id': range(3000), 'valor': [i * 0.5 for i in range(3000)]})
+        parquet_grande = os.path.join(self.temp_dir, "grande.parquet")
+        df_grande.to_parquet(parquet_grande)
+
+        lector = cargar_parquet(parquet_grande, limite_memoria=20_000,
+                                si_excede_memoria='fragmentos', salida='arrow')
+        assert isinstance(lector, pa.RecordBatchReader)
+        lotes = list(lector)
+        assert len(lotes) > 1
+        assert sum(lote.num_rows for lote in lotes) == 3000
+
+    def test_cargar_archivo_salida(self):
+        """Test: cargar_archivo reenvía salida a la función de carga"""
+        assert isinstance(cargar_archivo(self.parquet, salida='arrow'), pa.Table)
+        assert isinstance(cargar_archivo(self.xlsx, salida='lotes'), pa.RecordBatchReader)
+
+    def test_salida_invalida(self):
+        """Test error: salida debe ser una opción válida"""
+        with pytest.raises(TypeError, match="El parámetro 'salida' debe ser uno de"):
+            cargar_csv(self.csv, salida='polars')  # type: ignore
+
+        with pytest.raises(TypeError, match="El parámetro 'salida' debe ser uno de"):
+            cargar_xlsx(self.xlsx, salida='numpy')  # type: ignore